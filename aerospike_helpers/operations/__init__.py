@@ -12,4 +12,86 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-##########################################################################
\ No newline at end of file
+##########################################################################
+'''
+Helpers for building the operations passed to
+:meth:`~aerospike.Client.operate` and :meth:`~aerospike.Client.operate_ordered`.
+'''
+from collections.abc import MutableMapping
+
+
+_OPERATION_FIELDS = (
+    # common
+    "op", "bin", "val", "index", "key", "range", "count", "rank", "return_type",
+    "inverted", "ctx",
+    # list and map
+    "list_policy", "map_policy", "value_begin", "value_end", "value_list",
+    "list_order", "sort_flags",
+    # bitwise
+    "policy", "value", "byte_size", "byte_offset", "bit_offset", "bit_size",
+    "value_byte_size", "resize_flags", "sign", "action",
+    # hll
+    "hll_policy", "index_bit_count", "mh_bit_count",
+)
+
+_OPERATION_FIELD_SET = frozenset(_OPERATION_FIELDS)
+
+
+class Operation(MutableMapping):
+    """An operation returned by the list, map, bitwise and hll helpers.
+
+    Each entry of the operation is stored in a fixed slot, which the client
+    reads directly instead of looking up string keys in a dictionary.
+    An Operation is a mapping over the slots that are set, so code that
+    inspects or changes operations as dictionaries keeps working, and
+    ``dict(operation)`` gives the equivalent dictionary. Plain dictionaries
+    are still accepted wherever an Operation is.
+
+    .. versionadded:: 6.1.0
+    """
+
+    __slots__ = _OPERATION_FIELDS
+
+    def __init__(self, op, bin_name):
+        self.op = op
+        self.bin = bin_name
+
+    def __getitem__(self, key):
+        if key in _OPERATION_FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in _OPERATION_FIELD_SET:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if key in _OPERATION_FIELD_SET:
+            try:
+                delattr(self, key)
+                return
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __iter__(self):
+        for key in _OPERATION_FIELDS:
+            if hasattr(self, key):
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def copy(self):
+        """Return a shallow copy of the operation."""
+        op = type(self).__new__(type(self))
+        for key in self:
+            setattr(op, key, getattr(self, key))
+        return op
+
+    def __repr__(self):
+        return "Operation(%r)" % dict(self)
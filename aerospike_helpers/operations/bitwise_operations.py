@@ -14,7 +14,7 @@
 # limitations under the License.
 ##########################################################################
 '''
-Helper functions to create bit operation dictionary arguments for
+Helper functions to create bit :class:`~aerospike_helpers.operations.Operation` arguments for
 the :mod:`aerospike.Client.operate` and :mod:`aerospike.Client.operate_ordered` methods of the aerospike client.
 
     .. note:: Bitwise operations require server version >= 4.6.0
@@ -172,6 +172,7 @@ Example::
 .. seealso:: `Bits (Data Types) <https://www.aerospike.com/docs/guide/bitwise.html>`_.
 '''
 import aerospike
+from aerospike_helpers.operations import Operation
 
 BIN_KEY = "bin"
 BYTE_SIZE_KEY = "byte_size"
@@ -206,16 +207,14 @@ def bit_resize(bin_name, byte_size, policy=None, resize_flags=aerospike.BIT_RESI
             default: :data:`aerospike.BIT_RESIZE_DEFAULT`
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_RESIZE,
-        BIN_KEY: bin_name,
-        POLICY_KEY: policy,
-        RESIZE_FLAGS_KEY: resize_flags,
-        BYTE_SIZE_KEY: byte_size
-    }
+    op = Operation(aerospike.OP_BIT_RESIZE, bin_name)
+    op.policy = policy
+    op.resize_flags = resize_flags
+    op.byte_size = byte_size
+    return op
 
 
 def bit_remove(bin_name, byte_offset, byte_size, policy=None):
@@ -230,16 +229,14 @@ def bit_remove(bin_name, byte_offset, byte_size, policy=None):
         policy (dict, optional): The :ref:`bit_policy policy <aerospike_bit_policies>` dictionary. default: None.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_REMOVE,
-        BIN_KEY: bin_name,
-        POLICY_KEY: policy,
-        BYTE_OFFSET_KEY: byte_offset,
-        BYTE_SIZE_KEY: byte_size
-    }
+    op = Operation(aerospike.OP_BIT_REMOVE, bin_name)
+    op.policy = policy
+    op.byte_offset = byte_offset
+    op.byte_size = byte_size
+    return op
 
 
 def bit_set(bin_name, bit_offset, bit_size, value_byte_size, value, policy=None):
@@ -256,18 +253,16 @@ def bit_set(bin_name, bit_offset, bit_size, value_byte_size, value, policy=None)
         policy (dict, optional): The :ref:`bit_policy policy <aerospike_bit_policies>` dictionary. default: None.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_SET,
-        BIN_KEY: bin_name,
-        POLICY_KEY: policy,
-        BIT_OFFSET_KEY: bit_offset,
-        BIT_SIZE_KEY: bit_size,
-        VALUE_BYTE_SIZE_KEY: value_byte_size,
-        VALUE_KEY: value
-    }
+    op = Operation(aerospike.OP_BIT_SET, bin_name)
+    op.policy = policy
+    op.bit_offset = bit_offset
+    op.bit_size = bit_size
+    op.value_byte_size = value_byte_size
+    op.value = value
+    return op
 
 
 def bit_count(bin_name, bit_offset, bit_size):
@@ -281,15 +276,13 @@ def bit_count(bin_name, bit_offset, bit_size):
         bit_size (int): How many bits will be considered for counting.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_COUNT,
-        BIN_KEY: bin_name,
-        BIT_OFFSET_KEY: bit_offset,
-        BIT_SIZE_KEY: bit_size
-    }
+    op = Operation(aerospike.OP_BIT_COUNT, bin_name)
+    op.bit_offset = bit_offset
+    op.bit_size = bit_size
+    return op
 
 
 def bit_add(bin_name, bit_offset, bit_size, value, sign, action, policy=None):
@@ -309,19 +302,17 @@ def bit_add(bin_name, bit_offset, bit_size, value, sign, action, policy=None):
         policy (dict, optional): The :ref:`bit_policy policy <aerospike_bit_policies>` dictionary. default: None.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_ADD,
-        BIN_KEY: bin_name,
-        POLICY_KEY: policy,
-        BIT_OFFSET_KEY: bit_offset,
-        BIT_SIZE_KEY: bit_size,
-        VALUE_KEY: value,
-        SIGN_KEY: sign,
-        ACTION_KEY: action
-    }
+    op = Operation(aerospike.OP_BIT_ADD, bin_name)
+    op.policy = policy
+    op.bit_offset = bit_offset
+    op.bit_size = bit_size
+    op.value = value
+    op.sign = sign
+    op.action = action
+    return op
 
 
 def bit_and(bin_name, bit_offset, bit_size, value_byte_size, value, policy=None):
@@ -339,18 +330,16 @@ def bit_and(bin_name, bit_offset, bit_size, value_byte_size, value, policy=None)
         policy (dict, optional): The :ref:`bit_policy policy <aerospike_bit_policies>` dictionary. default: None.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_AND,
-        BIN_KEY: bin_name,
-        POLICY_KEY: policy,
-        BIT_OFFSET_KEY: bit_offset,
-        BIT_SIZE_KEY: bit_size,
-        VALUE_BYTE_SIZE_KEY: value_byte_size,
-        VALUE_KEY: value
-    }
+    op = Operation(aerospike.OP_BIT_AND, bin_name)
+    op.policy = policy
+    op.bit_offset = bit_offset
+    op.bit_size = bit_size
+    op.value_byte_size = value_byte_size
+    op.value = value
+    return op
 
 
 def bit_get(bin_name, bit_offset, bit_size):
@@ -364,15 +353,13 @@ def bit_get(bin_name, bit_offset, bit_size):
         bit_size (int): How many bits to get.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_GET,
-        BIN_KEY: bin_name,
-        BIT_OFFSET_KEY: bit_offset,
-        BIT_SIZE_KEY: bit_size
-    }
+    op = Operation(aerospike.OP_BIT_GET, bin_name)
+    op.bit_offset = bit_offset
+    op.bit_size = bit_size
+    return op
 
 
 def bit_get_int(bin_name, bit_offset, bit_size, sign):
@@ -388,16 +375,14 @@ def bit_get_int(bin_name, bit_offset, bit_size, sign):
         sign (bool): True: Treat read value as signed. False: treat read value as unsigned.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_GET_INT,
-        BIN_KEY: bin_name,
-        BIT_OFFSET_KEY: bit_offset,
-        BIT_SIZE_KEY: bit_size,
-        SIGN_KEY: sign
-    }
+    op = Operation(aerospike.OP_BIT_GET_INT, bin_name)
+    op.bit_offset = bit_offset
+    op.bit_size = bit_size
+    op.sign = sign
+    return op
 
 
 def bit_insert(bin_name, byte_offset, value_byte_size, value, policy=None):
@@ -415,17 +400,15 @@ def bit_insert(bin_name, byte_offset, value_byte_size, value, policy=None):
 
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_INSERT,
-        BIN_KEY: bin_name,
-        BYTE_OFFSET_KEY: byte_offset,
-        VALUE_BYTE_SIZE_KEY: value_byte_size,
-        VALUE_KEY: value,
-        POLICY_KEY: policy
-    }
+    op = Operation(aerospike.OP_BIT_INSERT, bin_name)
+    op.byte_offset = byte_offset
+    op.value_byte_size = value_byte_size
+    op.value = value
+    op.policy = policy
+    return op
 
 
 def bit_lscan(bin_name, bit_offset, bit_size, value):
@@ -442,16 +425,14 @@ def bit_lscan(bin_name, bit_offset, bit_size, value):
         value (bool): True: look for 1, False: look for 0.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_LSCAN,
-        BIN_KEY: bin_name,
-        BIT_OFFSET_KEY: bit_offset,
-        BIT_SIZE_KEY: bit_size,
-        VALUE_KEY: value
-    }
+    op = Operation(aerospike.OP_BIT_LSCAN, bin_name)
+    op.bit_offset = bit_offset
+    op.bit_size = bit_size
+    op.value = value
+    return op
 
 
 def bit_lshift(bin_name, bit_offset, bit_size, shift, policy=None):
@@ -468,17 +449,15 @@ def bit_lshift(bin_name, bit_offset, bit_size, shift, policy=None):
         policy (dict, optional): The :ref:`bit_policy policy <aerospike_bit_policies>` dictionary. default: None.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_LSHIFT,
-        BIN_KEY: bin_name,
-        BIT_OFFSET_KEY: bit_offset,
-        BIT_SIZE_KEY: bit_size,
-        VALUE_KEY: shift,
-        POLICY_KEY: policy
-    }
+    op = Operation(aerospike.OP_BIT_LSHIFT, bin_name)
+    op.bit_offset = bit_offset
+    op.bit_size = bit_size
+    op.value = shift
+    op.policy = policy
+    return op
 
 
 def bit_not(bin_name, bit_offset, bit_size, policy=None):
@@ -494,16 +473,14 @@ def bit_not(bin_name, bit_offset, bit_size, policy=None):
         policy (dict, optional): The :ref:`bit_policy policy <aerospike_bit_policies>` dictionary. default: None.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_NOT,
-        BIN_KEY: bin_name,
-        BIT_OFFSET_KEY: bit_offset,
-        BIT_SIZE_KEY: bit_size,
-        POLICY_KEY: policy
-    }
+    op = Operation(aerospike.OP_BIT_NOT, bin_name)
+    op.bit_offset = bit_offset
+    op.bit_size = bit_size
+    op.policy = policy
+    return op
 
 
 def bit_or(bin_name, bit_offset, bit_size, value_byte_size, value, policy=None):
@@ -521,18 +498,16 @@ def bit_or(bin_name, bit_offset, bit_size, value_byte_size, value, policy=None):
         policy (dict, optional): The :ref:`bit_policy policy <aerospike_bit_policies>` dictionary. default: None.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_OR,
-        BIN_KEY: bin_name,
-        POLICY_KEY: policy,
-        BIT_OFFSET_KEY: bit_offset,
-        BIT_SIZE_KEY: bit_size,
-        VALUE_BYTE_SIZE_KEY: value_byte_size,
-        VALUE_KEY: value
-    }
+    op = Operation(aerospike.OP_BIT_OR, bin_name)
+    op.policy = policy
+    op.bit_offset = bit_offset
+    op.bit_size = bit_size
+    op.value_byte_size = value_byte_size
+    op.value = value
+    return op
 
 
 def bit_rscan(bin_name, bit_offset, bit_size, value):
@@ -549,16 +524,14 @@ def bit_rscan(bin_name, bit_offset, bit_size, value):
         value (bool): True: Look for 1, False: look for 0.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_RSCAN,
-        BIN_KEY: bin_name,
-        BIT_OFFSET_KEY: bit_offset,
-        BIT_SIZE_KEY: bit_size,
-        VALUE_KEY: value
-    }
+    op = Operation(aerospike.OP_BIT_RSCAN, bin_name)
+    op.bit_offset = bit_offset
+    op.bit_size = bit_size
+    op.value = value
+    return op
 
 
 def bit_rshift(bin_name, bit_offset, bit_size, shift, policy=None):
@@ -575,17 +548,15 @@ def bit_rshift(bin_name, bit_offset, bit_size, shift, policy=None):
         policy (dict, optional): The :ref:`bit_policy policy <aerospike_bit_policies>` dictionary. default: None.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_RSHIFT,
-        BIN_KEY: bin_name,
-        BIT_OFFSET_KEY: bit_offset,
-        BIT_SIZE_KEY: bit_size,
-        VALUE_KEY: shift,
-        POLICY_KEY: policy
-    }
+    op = Operation(aerospike.OP_BIT_RSHIFT, bin_name)
+    op.bit_offset = bit_offset
+    op.bit_size = bit_size
+    op.value = shift
+    op.policy = policy
+    return op
 
 
 def bit_subtract(bin_name, bit_offset, bit_size, value, sign, action, policy=None):
@@ -605,19 +576,17 @@ def bit_subtract(bin_name, bit_offset, bit_size, value, sign, action, policy=Non
         policy (dict, optional): The :ref:`bit_policy policy <aerospike_bit_policies>` dictionary. default: None.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_SUBTRACT,
-        BIN_KEY: bin_name,
-        POLICY_KEY: policy,
-        BIT_OFFSET_KEY: bit_offset,
-        BIT_SIZE_KEY: bit_size,
-        VALUE_KEY: value,
-        SIGN_KEY: sign,
-        ACTION_KEY: action
-    }
+    op = Operation(aerospike.OP_BIT_SUBTRACT, bin_name)
+    op.policy = policy
+    op.bit_offset = bit_offset
+    op.bit_size = bit_size
+    op.value = value
+    op.sign = sign
+    op.action = action
+    return op
 
 
 def bit_xor(bin_name, bit_offset, bit_size, value_byte_size, value, policy=None):
@@ -635,15 +604,13 @@ def bit_xor(bin_name, bit_offset, bit_size, value_byte_size, value, policy=None)
         policy (dict, optional): The :ref:`bit_policy policy <aerospike_bit_policies>` dictionary. default: None.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    return {
-        OP_KEY: aerospike.OP_BIT_XOR,
-        BIN_KEY: bin_name,
-        POLICY_KEY: policy,
-        BIT_OFFSET_KEY: bit_offset,
-        BIT_SIZE_KEY: bit_size,
-        VALUE_BYTE_SIZE_KEY: value_byte_size,
-        VALUE_KEY: value
-    }
\ No newline at end of file
+    op = Operation(aerospike.OP_BIT_XOR, bin_name)
+    op.policy = policy
+    op.bit_offset = bit_offset
+    op.bit_size = bit_size
+    op.value_byte_size = value_byte_size
+    op.value = value
+    return op
@@ -14,7 +14,7 @@
 # limitations under the License.
 ##########################################################################
 '''
-Helper functions to create HyperLogLog operation dictionary arguments for
+Helper functions to create HyperLogLog :class:`~aerospike_helpers.operations.Operation` arguments for
 the :mod:`aerospike.Client.operate` and :mod:`aerospike.Client.operate_ordered` methods of the aerospike client.
 HyperLogLog bins and operations allow for your application to form fast, reasonable approximations
 of members in the union or intersection between multiple HyperLogLog bins.
@@ -145,6 +145,7 @@ Example::
 '''
 
 import aerospike
+from aerospike_helpers.operations import Operation
 
 
 OP_KEY = "op"
@@ -168,18 +169,15 @@ def hll_add(bin_name, values, index_bit_count=None, mh_bit_count=None, policy=No
         mh_bit_count: An optional number of min hash bits. Must be bewtween 4 and 58 inclusive.
         policy (dict): An optional dictionary of :ref:`hll policy options <aerospike_hll_policies>`.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_HLL_ADD,
-        BIN_KEY: bin_name,
-        VALUE_LIST_KEY: values,
-        INDEX_BIT_COUNT_KEY: -1 if index_bit_count is None else index_bit_count,
-        MH_BIT_COUNT_KEY: -1 if mh_bit_count is None else mh_bit_count
-    }
+    op = Operation(aerospike.OP_HLL_ADD, bin_name)
+    op.value_list = values
+    op.index_bit_count = -1 if index_bit_count is None else index_bit_count
+    op.mh_bit_count = -1 if mh_bit_count is None else mh_bit_count
 
     if policy:
-        op_dict[HLL_POLICY_KEY] = policy
+        op.hll_policy = policy
 
-    return op_dict
+    return op
 
 
 def hll_describe(bin_name):
@@ -191,12 +189,9 @@ def hll_describe(bin_name):
     Args:
         bin_name (str): The name of the bin to be operated on.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_HLL_DESCRIBE,
-        BIN_KEY: bin_name,
-    }
+    op = Operation(aerospike.OP_HLL_DESCRIBE, bin_name)
 
-    return op_dict
+    return op
 
 
 def hll_fold(bin_name, index_bit_count):
@@ -210,13 +205,10 @@ def hll_fold(bin_name, index_bit_count):
         bin_name (str): The name of the bin to be operated on.
         index_bit_count: number of index bits. Must be bewtween 4 and 16 inclusive.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_HLL_FOLD,
-        BIN_KEY: bin_name,
-        INDEX_BIT_COUNT_KEY: index_bit_count
-    }
+    op = Operation(aerospike.OP_HLL_FOLD, bin_name)
+    op.index_bit_count = index_bit_count
 
-    return op_dict
+    return op
 
 
 def hll_get_count(bin_name):
@@ -227,12 +219,9 @@ def hll_get_count(bin_name):
     Args:
         bin_name (str): The name of the bin to be operated on.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_HLL_GET_COUNT,
-        BIN_KEY: bin_name,
-    }
+    op = Operation(aerospike.OP_HLL_GET_COUNT, bin_name)
 
-    return op_dict
+    return op
 
 
 def hll_get_intersect_count(bin_name, hll_list):
@@ -244,13 +233,10 @@ def hll_get_intersect_count(bin_name, hll_list):
         bin_name (str): The name of the bin to be operated on.
         hll_list (list): The HLLs to be intersected.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_HLL_GET_INTERSECT_COUNT,
-        BIN_KEY: bin_name,
-        VALUE_LIST_KEY: hll_list
-    }
+    op = Operation(aerospike.OP_HLL_GET_INTERSECT_COUNT, bin_name)
+    op.value_list = hll_list
 
-    return op_dict
+    return op
 
 
 def hll_get_similarity(bin_name, hll_list):
@@ -263,13 +249,10 @@ def hll_get_similarity(bin_name, hll_list):
         bin_name (str): The name of the bin to be operated on.
         hll_list (list): The HLLs used for similarity estimation.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_HLL_GET_SIMILARITY,
-        BIN_KEY: bin_name,
-        VALUE_LIST_KEY: hll_list
-    }
+    op = Operation(aerospike.OP_HLL_GET_SIMILARITY, bin_name)
+    op.value_list = hll_list
 
-    return op_dict
+    return op
 
 def hll_get_union(bin_name, hll_list):
     """Creates a hll_get_union operation to be used with operate, or operate_ordered.
@@ -281,13 +264,10 @@ def hll_get_union(bin_name, hll_list):
         bin_name (str): The name of the bin to be operated on.
         hll_list (list): The HLLs to be unioned.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_HLL_GET_UNION,
-        BIN_KEY: bin_name,
-        VALUE_LIST_KEY: hll_list
-    }
+    op = Operation(aerospike.OP_HLL_GET_UNION, bin_name)
+    op.value_list = hll_list
 
-    return op_dict
+    return op
 
 def hll_get_union_count(bin_name, hll_list):
     """Creates a hll_get_union_count operation to be used with operate, or operate_ordered.
@@ -299,13 +279,10 @@ def hll_get_union_count(bin_name, hll_list):
         bin_name (str): The name of the bin to be operated on.
         hll_list (list): The HLLs to be unioned.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_HLL_GET_UNION_COUNT,
-        BIN_KEY: bin_name,
-        VALUE_LIST_KEY: hll_list
-    }
+    op = Operation(aerospike.OP_HLL_GET_UNION_COUNT, bin_name)
+    op.value_list = hll_list
 
-    return op_dict
+    return op
 
 
 def hll_init(bin_name, index_bit_count=None, mh_bit_count=None, policy=None):
@@ -324,17 +301,14 @@ def hll_init(bin_name, index_bit_count=None, mh_bit_count=None, policy=None):
         mh_bit_count: An optional number of min hash bits. Must be bewtween 4 and 58 inclusive.
         policy (dict): An optional dictionary of :ref:`hll policy options <aerospike_hll_policies>`.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_HLL_INIT,
-        BIN_KEY: bin_name,
-        INDEX_BIT_COUNT_KEY: -1 if index_bit_count is None else index_bit_count,
-        MH_BIT_COUNT_KEY: -1 if mh_bit_count is None else mh_bit_count
-    }
+    op = Operation(aerospike.OP_HLL_INIT, bin_name)
+    op.index_bit_count = -1 if index_bit_count is None else index_bit_count
+    op.mh_bit_count = -1 if mh_bit_count is None else mh_bit_count
 
     if policy:
-        op_dict[HLL_POLICY_KEY] = policy
+        op.hll_policy = policy
 
-    return op_dict
+    return op
 
 
 def hll_refresh_count(bin_name):
@@ -346,12 +320,9 @@ def hll_refresh_count(bin_name):
     Args:
         bin_name (str): The name of the bin to be operated on.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_HLL_REFRESH_COUNT,
-        BIN_KEY: bin_name,
-    }
+    op = Operation(aerospike.OP_HLL_REFRESH_COUNT, bin_name)
 
-    return op_dict
+    return op
 
 def hll_set_union(bin_name, hll_list, policy=None):
     """Creates a hll_set_union operation to be used with operate, or operate_ordered.
@@ -364,13 +335,10 @@ def hll_set_union(bin_name, hll_list, policy=None):
         hll_list (list): The HLLs who's union will be set.
         policy (dict): An optional dictionary of :ref:`hll policy options <aerospike_hll_policies>`.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_HLL_SET_UNION,
-        BIN_KEY: bin_name,
-        VALUE_LIST_KEY: hll_list
-    }
+    op = Operation(aerospike.OP_HLL_SET_UNION, bin_name)
+    op.value_list = hll_list
 
     if policy:
-        op_dict[HLL_POLICY_KEY] = policy
+        op.hll_policy = policy
 
-    return op_dict
\ No newline at end of file
+    return op
\ No newline at end of file
@@ -14,7 +14,8 @@
 # limitations under the License.
 ##########################################################################
 """
-This module provides helper functions to produce dictionaries to be used with the
+This module provides helper functions to produce :class:`~aerospike_helpers.operations.Operation`
+objects to be used with the
 :mod:`aerospike.Client.operate` and :mod:`aerospike.Client.operate_ordered` methods of the aerospike module.
 
 List operations support nested CDTs through an optional ctx context argument.
@@ -24,6 +25,7 @@ List operations support nested CDTs through an optional ctx context argument.
 
 """
 import aerospike
+from aerospike_helpers.operations import Operation
 
 
 OP_KEY = "op"
@@ -55,22 +57,19 @@ def list_append(bin_name, value, policy=None, ctx=None):
         policy (dict): An optional dictionary of :ref:`list write options <aerospike_list_policies>`.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_APPEND,
-        BIN_KEY: bin_name,
-        VALUE_KEY: value
-    }
+    op = Operation(aerospike.OP_LIST_APPEND, bin_name)
+    op.val = value
 
     if policy:
-        op_dict[LIST_POLICY_KEY] = policy
+        op.list_policy = policy
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_append_items(bin_name, values, policy=None, ctx=None):
@@ -85,22 +84,19 @@ def list_append_items(bin_name, values, policy=None, ctx=None):
         policy (dict): An optional dictionary of :ref:`list write options <aerospike_list_policies>`.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_APPEND_ITEMS,
-        BIN_KEY: bin_name,
-        VALUE_KEY: values
-    }
+    op = Operation(aerospike.OP_LIST_APPEND_ITEMS, bin_name)
+    op.val = values
 
     if policy:
-        op_dict[LIST_POLICY_KEY] = policy
+        op.list_policy = policy
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 def list_insert(bin_name, index, value, policy=None, ctx=None):
     """Creates a list insert operation to be used with operate, or operate_ordered
@@ -116,23 +112,20 @@ def list_insert(bin_name, index, value, policy=None, ctx=None):
         policy (dict): An optional dictionary of :ref:`list write options <aerospike_list_policies>`.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_INSERT,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index,
-        VALUE_KEY: value
-    }
+    op = Operation(aerospike.OP_LIST_INSERT, bin_name)
+    op.index = index
+    op.val = value
 
     if policy:
-        op_dict[LIST_POLICY_KEY] = policy
+        op.list_policy = policy
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 def list_insert_items(bin_name, index, values, policy=None, ctx=None):
     """Creates a list insert items operation to be used with operate, or operate_ordered
@@ -148,23 +141,20 @@ def list_insert_items(bin_name, index, values, policy=None, ctx=None):
         policy (dict): An optional dictionary of :ref:`list write options <aerospike_list_policies>`.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_INSERT_ITEMS,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index,
-        VALUE_KEY: values
-    }
+    op = Operation(aerospike.OP_LIST_INSERT_ITEMS, bin_name)
+    op.index = index
+    op.val = values
 
     if policy:
-        op_dict[LIST_POLICY_KEY] = policy
+        op.list_policy = policy
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 def list_increment(bin_name, index, value, policy=None, ctx=None):
     """Creates a list increment operation to be used with operate, or operate_ordered
@@ -179,23 +169,20 @@ def list_increment(bin_name, index, value, policy=None, ctx=None):
         policy (dict): An optional dictionary of :ref:`list write options <aerospike_list_policies>`.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_INCREMENT,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index,
-        VALUE_KEY: value
-    }
+    op = Operation(aerospike.OP_LIST_INCREMENT, bin_name)
+    op.index = index
+    op.val = value
 
     if policy:
-        op_dict[LIST_POLICY_KEY] = policy
+        op.list_policy = policy
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_pop(bin_name, index, ctx=None):
@@ -209,19 +196,16 @@ def list_pop(bin_name, index, ctx=None):
         index (int): The index of the item to be removed.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_POP,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index
-    }
+    op = Operation(aerospike.OP_LIST_POP, bin_name)
+    op.index = index
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
     
-    return op_dict
+    return op
 
 
 def list_pop_range(bin_name, index, count, ctx=None):
@@ -237,20 +221,17 @@ def list_pop_range(bin_name, index, count, ctx=None):
         to be removed and returned
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_POP_RANGE,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index,
-        VALUE_KEY: count
-    }
+    op = Operation(aerospike.OP_LIST_POP_RANGE, bin_name)
+    op.index = index
+    op.val = count
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
     
-    return op_dict
+    return op
 
 
 def list_remove(bin_name, index, ctx=None):
@@ -263,19 +244,16 @@ def list_remove(bin_name, index, ctx=None):
         index (int): The index at which to remove the item.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict =  {
-        OP_KEY: aerospike.OP_LIST_REMOVE,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index
-    }
+    op = Operation(aerospike.OP_LIST_REMOVE, bin_name)
+    op.index = index
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
     
-    return op_dict
+    return op
 
 
 def list_remove_range(bin_name, index, count, ctx=None):
@@ -290,20 +268,17 @@ def list_remove_range(bin_name, index, count, ctx=None):
         count (int): A positive number representing the number of items to be removed.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_REMOVE_RANGE,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index,
-        VALUE_KEY: count
-    }
+    op = Operation(aerospike.OP_LIST_REMOVE_RANGE, bin_name)
+    op.index = index
+    op.val = count
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
     
-    return op_dict
+    return op
 
 
 def list_clear(bin_name, ctx=None):
@@ -316,18 +291,15 @@ def list_clear(bin_name, ctx=None):
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_CLEAR,
-        BIN_KEY: bin_name
-    }
+    op = Operation(aerospike.OP_LIST_CLEAR, bin_name)
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
     
-    return op_dict
+    return op
 
 
 def list_set(bin_name, index, value, policy=None, ctx=None):
@@ -343,22 +315,19 @@ def list_set(bin_name, index, value, policy=None, ctx=None):
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_SET,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index,
-        VALUE_KEY: value
-    }
+    op = Operation(aerospike.OP_LIST_SET, bin_name)
+    op.index = index
+    op.val = value
     if policy:
-        op_dict[LIST_POLICY_KEY] = policy
+        op.list_policy = policy
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_get(bin_name, index, ctx=None):
@@ -372,19 +341,16 @@ def list_get(bin_name, index, ctx=None):
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_GET,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index
-    }
+    op = Operation(aerospike.OP_LIST_GET, bin_name)
+    op.index = index
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
     
-    return op_dict
+    return op
 
 
 def list_get_range(bin_name, index, count, ctx=None):
@@ -399,20 +365,17 @@ def list_get_range(bin_name, index, count, ctx=None):
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_GET_RANGE,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index,
-        VALUE_KEY: count
-    }
+    op = Operation(aerospike.OP_LIST_GET_RANGE, bin_name)
+    op.index = index
+    op.val = count
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
     
-    return op_dict
+    return op
 
 
 def list_trim(bin_name, index, count, ctx=None):
@@ -427,20 +390,17 @@ def list_trim(bin_name, index, count, ctx=None):
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_TRIM,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index,
-        VALUE_KEY: count
-    }
+    op = Operation(aerospike.OP_LIST_TRIM, bin_name)
+    op.index = index
+    op.val = count
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
     
-    return op_dict
+    return op
 
 
 def list_size(bin_name, ctx=None):
@@ -453,18 +413,15 @@ def list_size(bin_name, ctx=None):
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_SIZE,
-        BIN_KEY: bin_name
-    }
+    op = Operation(aerospike.OP_LIST_SIZE, bin_name)
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
     
-    return op_dict
+    return op
 
 
 # Post 3.4.0 Operations. Require Server >= 3.16.0.1
@@ -483,20 +440,17 @@ def list_get_by_index(bin_name, index, return_type, ctx=None):
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_GET_BY_INDEX,
-        BIN_KEY: bin_name,
-        RETURN_TYPE_KEY: return_type,
-        INDEX_KEY: index
-    }
+    op = Operation(aerospike.OP_LIST_GET_BY_INDEX, bin_name)
+    op.return_type = return_type
+    op.index = index
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
     
-    return op_dict
+    return op
 
 
 def list_get_by_index_range(bin_name, index, return_type, count=None, inverted=False, ctx=None):
@@ -517,24 +471,21 @@ def list_get_by_index_range(bin_name, index, return_type, count=None, inverted=F
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_GET_BY_INDEX_RANGE,
-        BIN_KEY: bin_name,
-        RETURN_TYPE_KEY: return_type,
-        INDEX_KEY: index,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_LIST_GET_BY_INDEX_RANGE, bin_name)
+    op.return_type = return_type
+    op.index = index
+    op.inverted = inverted
 
     if count is not None:
-        op_dict[COUNT_KEY] = count
+        op.count = count
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_get_by_rank(bin_name, rank, return_type, ctx=None):
@@ -551,20 +502,17 @@ def list_get_by_rank(bin_name, rank, return_type, ctx=None):
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_GET_BY_RANK,
-        BIN_KEY: bin_name,
-        RETURN_TYPE_KEY: return_type,
-        RANK_KEY: rank
-    }
+    op = Operation(aerospike.OP_LIST_GET_BY_RANK, bin_name)
+    op.return_type = return_type
+    op.rank = rank
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
     
-    return op_dict
+    return op
 
 
 def list_get_by_rank_range(bin_name, rank, return_type, count=None, inverted=False, ctx=None):
@@ -585,24 +533,21 @@ def list_get_by_rank_range(bin_name, rank, return_type, count=None, inverted=Fal
             Default: `False`
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_GET_BY_RANK_RANGE,
-        BIN_KEY: bin_name,
-        RETURN_TYPE_KEY: return_type,
-        RANK_KEY: rank,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_LIST_GET_BY_RANK_RANGE, bin_name)
+    op.return_type = return_type
+    op.rank = rank
+    op.inverted = inverted
 
     if count is not None:
-        op_dict[COUNT_KEY] = count
+        op.count = count
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_get_by_value(bin_name, value, return_type, inverted=False, ctx=None):
@@ -620,21 +565,18 @@ def list_get_by_value(bin_name, value, return_type, inverted=False, ctx=None):
             If set to `True`, all items not equal to `value` will be selected. Default: `False`
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered.The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_GET_BY_VALUE,
-        BIN_KEY: bin_name,
-        RETURN_TYPE_KEY: return_type,
-        VALUE_KEY: value,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_LIST_GET_BY_VALUE, bin_name)
+    op.return_type = return_type
+    op.val = value
+    op.inverted = inverted
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_get_by_value_list(bin_name, value_list, return_type, inverted=False, ctx=None):
@@ -653,21 +595,18 @@ def list_get_by_value_list(bin_name, value_list, return_type, inverted=False, ct
             Default: `False`
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered.The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_GET_BY_VALUE_LIST,
-        BIN_KEY: bin_name,
-        RETURN_TYPE_KEY: return_type,
-        VALUE_LIST_KEY: value_list,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_LIST_GET_BY_VALUE_LIST, bin_name)
+    op.return_type = return_type
+    op.value_list = value_list
+    op.inverted = inverted
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_get_by_value_range(bin_name, return_type, value_begin, value_end, inverted=False, ctx=None):
@@ -689,26 +628,23 @@ def list_get_by_value_range(bin_name, return_type, value_begin, value_end, inver
             Default: `False`
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered.The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_GET_BY_VALUE_RANGE,
-        BIN_KEY: bin_name,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_LIST_GET_BY_VALUE_RANGE, bin_name)
+    op.return_type = return_type
+    op.inverted = inverted
 
     if value_begin is not None:
-        op_dict[VALUE_BEGIN_KEY] = value_begin
+        op.value_begin = value_begin
 
     if value_end is not None:
-        op_dict[VALUE_END_KEY] = value_end
+        op.value_end = value_end
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_remove_by_index(bin_name, index, return_type, ctx=None):
@@ -725,20 +661,17 @@ def list_remove_by_index(bin_name, index, return_type, ctx=None):
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_REMOVE_BY_INDEX,
-        BIN_KEY: bin_name,
-        RETURN_TYPE_KEY: return_type,
-        INDEX_KEY: index
-    }
+    op = Operation(aerospike.OP_LIST_REMOVE_BY_INDEX, bin_name)
+    op.return_type = return_type
+    op.index = index
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
     
-    return op_dict
+    return op
 
 
 def list_remove_by_index_range(bin_name, index, return_type, count=None, inverted=False, ctx=None):
@@ -759,24 +692,21 @@ def list_remove_by_index_range(bin_name, index, return_type, count=None, inverte
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_REMOVE_BY_INDEX_RANGE,
-        BIN_KEY: bin_name,
-        RETURN_TYPE_KEY: return_type,
-        INDEX_KEY: index,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_LIST_REMOVE_BY_INDEX_RANGE, bin_name)
+    op.return_type = return_type
+    op.index = index
+    op.inverted = inverted
 
     if count is not None:
-        op_dict[COUNT_KEY] = count
+        op.count = count
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_remove_by_rank(bin_name, rank, return_type, ctx=None):
@@ -793,20 +723,17 @@ def list_remove_by_rank(bin_name, rank, return_type, ctx=None):
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_REMOVE_BY_RANK,
-        BIN_KEY: bin_name,
-        RETURN_TYPE_KEY: return_type,
-        RANK_KEY: rank
-    }
+    op = Operation(aerospike.OP_LIST_REMOVE_BY_RANK, bin_name)
+    op.return_type = return_type
+    op.rank = rank
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_remove_by_rank_range(bin_name, rank, return_type, count=None, inverted=False, ctx=None):
@@ -827,24 +754,21 @@ def list_remove_by_rank_range(bin_name, rank, return_type, count=None, inverted=
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_REMOVE_BY_RANK_RANGE,
-        BIN_KEY: bin_name,
-        RETURN_TYPE_KEY: return_type,
-        RANK_KEY: rank,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_LIST_REMOVE_BY_RANK_RANGE, bin_name)
+    op.return_type = return_type
+    op.rank = rank
+    op.inverted = inverted
 
     if count is not None:
-        op_dict[COUNT_KEY] = count
+        op.count = count
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_remove_by_value(bin_name, value, return_type, inverted=False, ctx=None):
@@ -863,21 +787,18 @@ def list_remove_by_value(bin_name, value, return_type, inverted=False, ctx=None)
             Default: `False`
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered.The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_REMOVE_BY_VALUE,
-        BIN_KEY: bin_name,
-        RETURN_TYPE_KEY: return_type,
-        VALUE_KEY: value,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_LIST_REMOVE_BY_VALUE, bin_name)
+    op.return_type = return_type
+    op.val = value
+    op.inverted = inverted
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_remove_by_value_list(bin_name, value_list, return_type, inverted=False, ctx=None):
@@ -896,21 +817,18 @@ def list_remove_by_value_list(bin_name, value_list, return_type, inverted=False,
             Default: `False`
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered.The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_REMOVE_BY_VALUE_LIST,
-        BIN_KEY: bin_name,
-        RETURN_TYPE_KEY: return_type,
-        VALUE_LIST_KEY: value_list,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_LIST_REMOVE_BY_VALUE_LIST, bin_name)
+    op.return_type = return_type
+    op.value_list = value_list
+    op.inverted = inverted
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_remove_by_value_range(bin_name, return_type, value_begin=None,
@@ -934,26 +852,23 @@ def list_remove_by_value_range(bin_name, return_type, value_begin=None,
             Default: `False`
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered.The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_REMOVE_BY_VALUE_RANGE,
-        BIN_KEY: bin_name,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_LIST_REMOVE_BY_VALUE_RANGE, bin_name)
+    op.return_type = return_type
+    op.inverted = inverted
 
     if value_begin is not None:
-        op_dict[VALUE_BEGIN_KEY] = value_begin
+        op.value_begin = value_begin
 
     if value_end is not None:
-        op_dict[VALUE_END_KEY] = value_end
+        op.value_end = value_end
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_set_order(bin_name, list_order, ctx=None):
@@ -967,19 +882,16 @@ def list_set_order(bin_name, list_order, ctx=None):
             aerospike.LIST_UNORDERED .
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered.The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_SET_ORDER,
-        BIN_KEY: bin_name,
-        LIST_ORDER_KEY: list_order
-    }
+    op = Operation(aerospike.OP_LIST_SET_ORDER, bin_name)
+    op.list_order = list_order
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_sort(bin_name, sort_flags=aerospike.LIST_SORT_DEFAULT, ctx=None):
@@ -992,19 +904,16 @@ def list_sort(bin_name, sort_flags=aerospike.LIST_SORT_DEFAULT, ctx=None):
         sort_flags: Optional flags modifiying the behavior of list_sort. This should be constructed by bitwise or'ing together values from :ref:`aerospike_list_sort_flag`.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered.The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_SORT,
-        BIN_KEY: bin_name,
-        SORT_FLAGS_KEY: sort_flags
-    }
+    op = Operation(aerospike.OP_LIST_SORT, bin_name)
+    op.sort_flags = sort_flags
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_get_by_value_rank_range_relative(bin_name, value, offset, return_type, count=None,
@@ -1047,25 +956,22 @@ def list_get_by_value_rank_range_relative(bin_name, value, offset, return_type,
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered.The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_GET_BY_VALUE_RANK_RANGE_REL,
-        BIN_KEY: bin_name,
-        VALUE_KEY: value,
-        RANK_KEY: offset,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_LIST_GET_BY_VALUE_RANK_RANGE_REL, bin_name)
+    op.val = value
+    op.rank = offset
+    op.return_type = return_type
+    op.inverted = inverted
 
     if count is not None:
-        op_dict[COUNT_KEY] = count
+        op.count = count
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def list_remove_by_value_rank_range_relative(bin_name, value, offset, return_type, count=None,
@@ -1104,22 +1010,18 @@ def list_remove_by_value_rank_range_relative(bin_name, value, offset, return_typ
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered.The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_LIST_REMOVE_BY_VALUE_RANK_RANGE_REL,
-        BIN_KEY: bin_name,
-        VALUE_KEY: value,
-        RANK_KEY: offset,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-
-    }
+    op = Operation(aerospike.OP_LIST_REMOVE_BY_VALUE_RANK_RANGE_REL, bin_name)
+    op.val = value
+    op.rank = offset
+    op.return_type = return_type
+    op.inverted = inverted
     if count is not None:
-        op_dict[COUNT_KEY] = count
+        op.count = count
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
@@ -14,7 +14,7 @@
 # limitations under the License.
 ##########################################################################
 '''
-Helper functions to create map operation dictionaries arguments for.
+Helper functions to create map :class:`~aerospike_helpers.operations.Operation` arguments for
 the :mod:`aerospike.Client.operate` and :mod:`aerospike.Client.operate_ordered` methods of the aerospike client.
 
 Map operations support nested CDTs through an optional ctx context argument.
@@ -24,6 +24,7 @@ Map operations support nested CDTs through an optional ctx context argument.
 
 '''
 import aerospike
+from aerospike_helpers.operations import Operation
 
 OP_KEY = "op"
 BIN_KEY = "bin"
@@ -49,19 +50,16 @@ def map_set_policy(bin_name, policy, ctx=None):
         policy (dict): The :ref:`map_policy dictionary <aerospike_map_policies>`.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_SET_POLICY,
-        BIN_KEY: bin_name,
-        POLICY_KEY: policy
-    }
+    op = Operation(aerospike.OP_MAP_SET_POLICY, bin_name)
+    op.map_policy = policy
 
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 def map_put(bin_name, key, value, map_policy=None, ctx=None):
     """Creates a map_put operation to be used with operate or operate_ordered
@@ -77,23 +75,20 @@ def map_put(bin_name, key, value, map_policy=None, ctx=None):
             The map policy also specifies the mode used when writing items to the map. Defaults to `None`.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_PUT,
-        BIN_KEY: bin_name,
-        KEY_KEY: key,
-        VALUE_KEY: value
-    }
+    op = Operation(aerospike.OP_MAP_PUT, bin_name)
+    op.key = key
+    op.val = value
 
     if map_policy is not None:
-        op_dict[POLICY_KEY] = map_policy
+        op.map_policy = map_policy
     
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
     
-    return op_dict
+    return op
 
 
 def map_put_items(bin_name, item_dict, map_policy=None, ctx=None):
@@ -108,22 +103,19 @@ def map_put_items(bin_name, item_dict, map_policy=None, ctx=None):
             The map policy also specifies the mode used when writing items to the map. Defaults to `None`.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_PUT_ITEMS,
-        BIN_KEY: bin_name,
-        VALUE_KEY: item_dict
-    }
+    op = Operation(aerospike.OP_MAP_PUT_ITEMS, bin_name)
+    op.val = item_dict
 
     if map_policy is not None:
-        op_dict[POLICY_KEY] = map_policy
+        op.map_policy = map_policy
     
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
     
-    return op_dict
+    return op
 
 def map_increment(bin_name, key, amount, map_policy=None, ctx=None):
     """Creates a map_increment operation to be used with operate or operate_ordered
@@ -138,23 +130,20 @@ def map_increment(bin_name, key, amount, map_policy=None, ctx=None):
             The map policy also specifies the mode used when writing items to the map. Defaults to `None`.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict =  {
-        OP_KEY: aerospike.OP_MAP_INCREMENT,
-        BIN_KEY: bin_name,
-        KEY_KEY: key,
-        VALUE_KEY: amount
-    }
+    op = Operation(aerospike.OP_MAP_INCREMENT, bin_name)
+    op.key = key
+    op.val = amount
 
     if map_policy is not None:
-        op_dict[POLICY_KEY] = map_policy
+        op.map_policy = map_policy
     
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_decrement(bin_name, key, amount, map_policy=None, ctx=None):
@@ -170,23 +159,20 @@ def map_decrement(bin_name, key, amount, map_policy=None, ctx=None):
             The map policy also specifies the mode used when writing items to the map. Defaults to `None`.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_DECREMENT,
-        BIN_KEY: bin_name,
-        KEY_KEY: key,
-        VALUE_KEY: amount
-    }
+    op = Operation(aerospike.OP_MAP_DECREMENT, bin_name)
+    op.key = key
+    op.val = amount
 
     if map_policy is not None:
-        op_dict[POLICY_KEY] = map_policy
+        op.map_policy = map_policy
     
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 def map_size(bin_name, ctx=None):
     """Creates a map_size operation to be used with operate or operate_ordered
@@ -197,18 +183,15 @@ def map_size(bin_name, ctx=None):
         bin_name (str): The name of the bin containing the map.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_SIZE,
-        BIN_KEY: bin_name
-    }
+    op = Operation(aerospike.OP_MAP_SIZE, bin_name)
 
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_clear(bin_name, ctx=None):
@@ -220,18 +203,15 @@ def map_clear(bin_name, ctx=None):
         bin_name (str): The name of the bin containing the map.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_CLEAR,
-        BIN_KEY: bin_name
-    }
+    op = Operation(aerospike.OP_MAP_CLEAR, bin_name)
 
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_remove_by_key(bin_name, key, return_type, ctx=None):
@@ -246,20 +226,17 @@ def map_remove_by_key(bin_name, key, return_type, ctx=None):
             This should be one of the :ref:`map_return_types` values.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_REMOVE_BY_KEY,
-        BIN_KEY: bin_name,
-        KEY_KEY: key,
-        RETURN_TYPE_KEY: return_type
-    }
+    op = Operation(aerospike.OP_MAP_REMOVE_BY_KEY, bin_name)
+    op.key = key
+    op.return_type = return_type
 
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_remove_by_key_list(bin_name, key_list, return_type, inverted=False, ctx=None):
@@ -276,21 +253,18 @@ def map_remove_by_key_list(bin_name, key_list, return_type, inverted=False, ctx=
             and those keys specified in the key_list will be kept. Default: False
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_REMOVE_BY_KEY_LIST,
-        BIN_KEY: bin_name,
-        VALUE_KEY: key_list,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_MAP_REMOVE_BY_KEY_LIST, bin_name)
+    op.val = key_list
+    op.return_type = return_type
+    op.inverted = inverted
 
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_remove_by_key_range(bin_name, key_range_start,
@@ -310,22 +284,19 @@ def map_remove_by_key_range(bin_name, key_range_start,
             values inside of the range will be kept. Default: False
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_REMOVE_BY_KEY_RANGE,
-        BIN_KEY: bin_name,
-        KEY_KEY: key_range_start,
-        VALUE_KEY: key_range_end,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_MAP_REMOVE_BY_KEY_RANGE, bin_name)
+    op.key = key_range_start
+    op.val = key_range_end
+    op.return_type = return_type
+    op.inverted = inverted
 
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_remove_by_value(bin_name, value, return_type, inverted=False, ctx=None):
@@ -342,21 +313,18 @@ def map_remove_by_value(bin_name, value, return_type, inverted=False, ctx=None):
             Default: False
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_REMOVE_BY_VALUE,
-        BIN_KEY: bin_name,
-        VALUE_KEY: value,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_MAP_REMOVE_BY_VALUE, bin_name)
+    op.val = value
+    op.return_type = return_type
+    op.inverted = inverted
 
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_remove_by_value_list(bin_name, value_list, return_type, inverted=False, ctx=None):
@@ -373,21 +341,18 @@ def map_remove_by_value_list(bin_name, value_list, return_type, inverted=False,
             will be removed and returned.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_REMOVE_BY_VALUE_LIST,
-        BIN_KEY: bin_name,
-        VALUE_KEY: value_list,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_MAP_REMOVE_BY_VALUE_LIST, bin_name)
+    op.val = value_list
+    op.return_type = return_type
+    op.inverted = inverted
 
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_remove_by_value_range(bin_name, value_start, value_end, return_type, inverted=False, ctx=None):
@@ -406,22 +371,19 @@ def map_remove_by_value_range(bin_name, value_start, value_end, return_type, inv
             values inside of the range will be kept. Default: False
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_REMOVE_BY_VALUE_RANGE,
-        BIN_KEY: bin_name,
-        VALUE_KEY: value_start,
-        RANGE_KEY: value_end,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_MAP_REMOVE_BY_VALUE_RANGE, bin_name)
+    op.val = value_start
+    op.range = value_end
+    op.return_type = return_type
+    op.inverted = inverted
 
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_remove_by_index(bin_name, index, return_type, ctx=None):
@@ -436,20 +398,17 @@ def map_remove_by_index(bin_name, index, return_type, ctx=None):
             This should be one of the :ref:`map_return_types` values.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_REMOVE_BY_INDEX,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index,
-        RETURN_TYPE_KEY: return_type
-    }
+    op = Operation(aerospike.OP_MAP_REMOVE_BY_INDEX, bin_name)
+    op.index = index
+    op.return_type = return_type
 
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_remove_by_index_range(bin_name, index_start, remove_amt, return_type, inverted=False, ctx=None):
@@ -467,22 +426,19 @@ def map_remove_by_index_range(bin_name, index_start, remove_amt, return_type, in
             entries removed. Default: False
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_REMOVE_BY_INDEX_RANGE,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index_start,
-        VALUE_KEY: remove_amt,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_MAP_REMOVE_BY_INDEX_RANGE, bin_name)
+    op.index = index_start
+    op.val = remove_amt
+    op.return_type = return_type
+    op.inverted = inverted
 
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_remove_by_rank(bin_name, rank, return_type, ctx=None):
@@ -497,20 +453,17 @@ def map_remove_by_rank(bin_name, rank, return_type, ctx=None):
             This should be one of the :ref:`map_return_types` values.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_REMOVE_BY_RANK,
-        BIN_KEY: bin_name,
-        INDEX_KEY: rank,
-        RETURN_TYPE_KEY: return_type
-    }
+    op = Operation(aerospike.OP_MAP_REMOVE_BY_RANK, bin_name)
+    op.index = rank
+    op.return_type = return_type
 
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_remove_by_rank_range(bin_name, rank_start, remove_amt, return_type, inverted=False, ctx=None):
@@ -528,22 +481,19 @@ def map_remove_by_rank_range(bin_name, rank_start, remove_amt, return_type, inve
             and all other entries removed. Default: False.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_REMOVE_BY_RANK_RANGE,
-        BIN_KEY: bin_name,
-        INDEX_KEY: rank_start,
-        VALUE_KEY: remove_amt,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_MAP_REMOVE_BY_RANK_RANGE, bin_name)
+    op.index = rank_start
+    op.val = remove_amt
+    op.return_type = return_type
+    op.inverted = inverted
 
     if ctx is not None:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_get_by_key(bin_name, key, return_type, ctx=None):
@@ -558,20 +508,17 @@ def map_get_by_key(bin_name, key, return_type, ctx=None):
             This should be one of the :ref:`map_return_types` values.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_GET_BY_KEY,
-        BIN_KEY: bin_name,
-        KEY_KEY: key,
-        RETURN_TYPE_KEY: return_type
-    }
+    op = Operation(aerospike.OP_MAP_GET_BY_KEY, bin_name)
+    op.key = key
+    op.return_type = return_type
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_get_by_key_range(bin_name, key_range_start,
@@ -591,22 +538,19 @@ def map_get_by_key_range(bin_name, key_range_start,
             values inside of the range will be ignored. Default: False
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_GET_BY_KEY_RANGE,
-        BIN_KEY: bin_name,
-        KEY_KEY: key_range_start,
-        RANGE_KEY: key_range_end,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_MAP_GET_BY_KEY_RANGE, bin_name)
+    op.key = key_range_start
+    op.range = key_range_end
+    op.return_type = return_type
+    op.inverted = inverted
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_get_by_key_list(bin_name, key_list, return_type, inverted=False, ctx=None):
@@ -623,21 +567,18 @@ def map_get_by_key_list(bin_name, key_list, return_type, inverted=False, ctx=Non
             and those keys specified in the key_list will be ignored. Default: False
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_GET_BY_KEY_LIST,
-        BIN_KEY: bin_name,
-        VALUE_KEY: key_list,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_MAP_GET_BY_KEY_LIST, bin_name)
+    op.val = key_list
+    op.return_type = return_type
+    op.inverted = inverted
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 def map_get_by_value(bin_name, value, return_type, inverted=False, ctx=None):
     """Creates a map_get_by_value operation to be used with operate or operate_ordered
@@ -653,21 +594,18 @@ def map_get_by_value(bin_name, value, return_type, inverted=False, ctx=None):
             Default: False
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_GET_BY_VALUE,
-        BIN_KEY: bin_name,
-        VALUE_KEY: value,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_MAP_GET_BY_VALUE, bin_name)
+    op.val = value
+    op.return_type = return_type
+    op.inverted = inverted
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_get_by_value_range(bin_name, value_start, value_end, return_type, inverted=False, ctx=None):
@@ -686,22 +624,19 @@ def map_get_by_value_range(bin_name, value_start, value_end, return_type, invert
             values inside of the range will be ignored. Default: False
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_GET_BY_VALUE_RANGE,
-        BIN_KEY: bin_name,
-        VALUE_KEY: value_start,
-        RANGE_KEY: value_end,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_MAP_GET_BY_VALUE_RANGE, bin_name)
+    op.val = value_start
+    op.range = value_end
+    op.return_type = return_type
+    op.inverted = inverted
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_get_by_value_list(bin_name, key_list, return_type, inverted=False, ctx=None):
@@ -718,21 +653,18 @@ def map_get_by_value_list(bin_name, key_list, return_type, inverted=False, ctx=N
             will be returned.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_GET_BY_VALUE_LIST,
-        BIN_KEY: bin_name,
-        VALUE_KEY: key_list,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_MAP_GET_BY_VALUE_LIST, bin_name)
+    op.val = key_list
+    op.return_type = return_type
+    op.inverted = inverted
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_get_by_index(bin_name, index, return_type, ctx=None):
@@ -747,20 +679,17 @@ def map_get_by_index(bin_name, index, return_type, ctx=None):
             This should be one of the :ref:`map_return_types` values.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_GET_BY_INDEX,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index,
-        RETURN_TYPE_KEY: return_type
-    }
+    op = Operation(aerospike.OP_MAP_GET_BY_INDEX, bin_name)
+    op.index = index
+    op.return_type = return_type
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_get_by_index_range(bin_name, index_start, get_amt, return_type, inverted=False, ctx=None):
@@ -778,22 +707,19 @@ def map_get_by_index_range(bin_name, index_start, get_amt, return_type, inverted
             entries returned. Default: False
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_GET_BY_INDEX_RANGE,
-        BIN_KEY: bin_name,
-        INDEX_KEY: index_start,
-        VALUE_KEY: get_amt,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_MAP_GET_BY_INDEX_RANGE, bin_name)
+    op.index = index_start
+    op.val = get_amt
+    op.return_type = return_type
+    op.inverted = inverted
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_get_by_rank(bin_name, rank, return_type, ctx=None):
@@ -808,20 +734,17 @@ def map_get_by_rank(bin_name, rank, return_type, ctx=None):
             This should be one of the :ref:`map_return_types` values.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_GET_BY_RANK,
-        BIN_KEY: bin_name,
-        INDEX_KEY: rank,
-        RETURN_TYPE_KEY: return_type       
-    }
+    op = Operation(aerospike.OP_MAP_GET_BY_RANK, bin_name)
+    op.index = rank
+    op.return_type = return_type
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_get_by_rank_range(bin_name, rank_start, get_amt, return_type, inverted=False, ctx=None):
@@ -839,22 +762,19 @@ def map_get_by_rank_range(bin_name, rank_start, get_amt, return_type, inverted=F
             and all other entries returned. Default: False.
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
     Returns:
-        A dictionary usable in operate or operate_ordered. The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_GET_BY_RANK_RANGE,
-        BIN_KEY: bin_name,
-        INDEX_KEY: rank_start,
-        VALUE_KEY: get_amt,
-        RETURN_TYPE_KEY: return_type,
-        INVERTED_KEY: inverted
-    }
+    op = Operation(aerospike.OP_MAP_GET_BY_RANK_RANGE, bin_name)
+    op.index = rank_start
+    op.val = get_amt
+    op.return_type = return_type
+    op.inverted = inverted
 
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 def map_remove_by_value_rank_range_relative(
         bin_name, value, offset, return_type, count=None, inverted=False, ctx=None):
@@ -892,27 +812,23 @@ def map_remove_by_value_rank_range_relative(
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered.The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_REMOVE_BY_VALUE_RANK_RANGE_REL,
-        BIN_KEY: bin_name,
-        VALUE_KEY: value,
-        RANK_KEY: offset,
-        RETURN_TYPE_KEY: return_type
-
-    }
+    op = Operation(aerospike.OP_MAP_REMOVE_BY_VALUE_RANK_RANGE_REL, bin_name)
+    op.val = value
+    op.rank = offset
+    op.return_type = return_type
     if count is not None:
-        op_dict[COUNT_KEY] = count
+        op.count = count
 
     if inverted:
-        op_dict[INVERTED_KEY] = True
+        op.inverted = True
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_get_by_value_rank_range_relative(
@@ -949,27 +865,23 @@ def map_get_by_value_rank_range_relative(
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered.The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_GET_BY_VALUE_RANK_RANGE_REL,
-        BIN_KEY: bin_name,
-        VALUE_KEY: value,
-        RANK_KEY: offset,
-        RETURN_TYPE_KEY: return_type
-
-    }
+    op = Operation(aerospike.OP_MAP_GET_BY_VALUE_RANK_RANGE_REL, bin_name)
+    op.val = value
+    op.rank = offset
+    op.return_type = return_type
     if count is not None:
-        op_dict[COUNT_KEY] = count
+        op.count = count
 
     if inverted:
-        op_dict[INVERTED_KEY] = True
+        op.inverted = True
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_remove_by_key_index_range_relative(
@@ -1009,27 +921,23 @@ def map_remove_by_key_index_range_relative(
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered.The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_REMOVE_BY_KEY_INDEX_RANGE_REL,
-        BIN_KEY: bin_name,
-        KEY_KEY: key,
-        INDEX_KEY: offset,
-        RETURN_TYPE_KEY: return_type
-
-    }
+    op = Operation(aerospike.OP_MAP_REMOVE_BY_KEY_INDEX_RANGE_REL, bin_name)
+    op.key = key
+    op.index = offset
+    op.return_type = return_type
     if count is not None:
-        op_dict[COUNT_KEY] = count
+        op.count = count
 
     if inverted:
-        op_dict[INVERTED_KEY] = True
+        op.inverted = True
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
 
 
 def map_get_by_key_index_range_relative(
@@ -1069,24 +977,20 @@ def map_get_by_key_index_range_relative(
         ctx (list): An optional list of nested CDT context operations (:mod:`cdt_cdx <aerospike_helpers.cdt_ctx>` object) for use on nested CDTs.
 
     Returns:
-        A dictionary usable in operate or operate_ordered.The format of the dictionary
-        should be considered an internal detail, and subject to change.
+        An :class:`~aerospike_helpers.operations.Operation` usable in operate or operate_ordered.
+        Its entries should be considered an internal detail, and subject to change.
     """
-    op_dict = {
-        OP_KEY: aerospike.OP_MAP_GET_BY_KEY_INDEX_RANGE_REL,
-        BIN_KEY: bin_name,
-        KEY_KEY: value,
-        INDEX_KEY: offset,
-        RETURN_TYPE_KEY: return_type
-
-    }
+    op = Operation(aerospike.OP_MAP_GET_BY_KEY_INDEX_RANGE_REL, bin_name)
+    op.key = value
+    op.index = offset
+    op.return_type = return_type
     if count is not None:
-        op_dict[COUNT_KEY] = count
+        op.count = count
 
     if inverted:
-        op_dict[INVERTED_KEY] = True
+        op.inverted = True
     
     if ctx:
-        op_dict[CTX_KEY] = ctx
+        op.ctx = ctx
 
-    return op_dict
+    return op
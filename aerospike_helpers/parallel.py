@@ -0,0 +1,336 @@
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+'''
+Helpers to spread the work of a scan over several processes.
+
+Converting records to Python objects and processing them happens in a single
+interpreter, so a scan is limited to one core however many threads the C
+client uses. :func:`scan` splits the partitions of a namespace between worker
+processes, each with its own connected client. The values produced by the
+workers are handed back to the calling process through shared memory ring
+buffers rather than pipes.
+
+Example::
+
+    import aerospike
+    from aerospike_helpers import parallel
+
+    config = {"hosts": [("127.0.0.1", 3000)]}
+
+    def age(record):
+        key, meta, bins = record
+        return bins.get("age", 0)
+
+    def add(total, value):
+        return total + value
+
+    # Sum the age bin of the test.demo records with 4 processes.
+    total = parallel.scan("test", "demo", config, processes=4, fn=age, reducer=add, initial=0)
+    print(total)
+'''
+import multiprocessing
+import os
+import pickle
+import struct
+import threading
+
+import aerospike
+
+PARTITION_COUNT = 4096
+
+# Every slot of a ring starts with the payload size and a frame type.
+_HEADER = struct.Struct('<IB')
+
+# The payload continues in the next slot.
+_MORE = 0
+# The last slot of a pickled list of values.
+_VALUES = 1
+# The worker is done.
+_END = 2
+# The last slot of a pickled exception raised in the worker.
+_ERROR = 3
+
+
+class _Ring(object):
+    '''
+    Fixed size slots in shared memory, written by one worker and read by the
+    calling process. free counts the empty slots, full the written ones.
+    '''
+
+    def __init__(self, context, slots, slot_size):
+        self.slots = slots
+        self.slot_size = slot_size
+        self.buffer = context.RawArray('B', slots * slot_size)
+        self.free = context.Semaphore(slots)
+        self.full = context.Semaphore(0)
+
+
+class _RingWriter(object):
+
+    def __init__(self, ring, ready):
+        self.ring = ring
+        self.ready = ready
+        self.view = memoryview(ring.buffer).cast('B')
+        self.position = 0
+        # The scan callback runs on the threads of the C client.
+        self.lock = threading.Lock()
+
+    def send(self, frame, payload=b''):
+        payload = memoryview(payload).cast('B')
+        size = self.ring.slot_size - _HEADER.size
+
+        with self.lock:
+            while True:
+                chunk, payload = payload[:size], payload[size:]
+                last = len(payload) == 0
+
+                self.ring.free.acquire()
+                offset = self.position * self.ring.slot_size
+                _HEADER.pack_into(self.view, offset, len(chunk), frame if last else _MORE)
+                start = offset + _HEADER.size
+                self.view[start:start + len(chunk)] = chunk
+                self.position = (self.position + 1) % self.ring.slots
+                self.ring.full.release()
+                self.ready.release()
+
+                if last:
+                    break
+
+
+class _RingReader(object):
+
+    def __init__(self, ring):
+        self.ring = ring
+        self.view = memoryview(ring.buffer).cast('B')
+        self.position = 0
+        self.pending = bytearray()
+
+    def receive(self):
+        '''
+        Read the next slot, once full was acquired. Returns the frame type and
+        its payload, or None while the payload continues in the next slots.
+        '''
+        offset = self.position * self.ring.slot_size
+        size, frame = _HEADER.unpack_from(self.view, offset)
+        start = offset + _HEADER.size
+        self.pending += self.view[start:start + size]
+        self.position = (self.position + 1) % self.ring.slots
+        self.ring.free.release()
+
+        if frame == _MORE:
+            return None
+
+        payload = bytes(self.pending)
+        self.pending = bytearray()
+        return frame, payload
+
+
+def _dumps_error(exc):
+    try:
+        return pickle.dumps(exc, pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return pickle.dumps(RuntimeError(repr(exc)), pickle.HIGHEST_PROTOCOL)
+
+
+def _scan_worker(config, credentials, namespace, set_name, partition_filter, fn,
+                 policy, options, batch_size, ring, ready):
+    writer = _RingWriter(ring, ready)
+    values = []
+    errors = []
+    # The callback runs on the threads of the C client, values is only
+    # appended to and swapped out while holding the lock.
+    lock = threading.Lock()
+
+    def send(batch):
+        if batch:
+            writer.send(_VALUES, pickle.dumps(batch, pickle.HIGHEST_PROTOCOL))
+
+    def take():
+        with lock:
+            batch = values[:]
+            del values[:]
+        return batch
+
+    def callback(record):
+        try:
+            value = fn(record) if fn is not None else record
+        except Exception as exc:
+            errors.append(exc)
+            return False
+
+        if value is not None:
+            batch = None
+            with lock:
+                values.append(value)
+                if len(values) >= batch_size:
+                    batch = values[:]
+                    del values[:]
+            send(batch)
+
+    try:
+        client = aerospike.client(config)
+        client.connect(*credentials)
+        try:
+            scan = client.scan(namespace, set_name)
+            scan.foreach(callback, policy, options, partition_filter=partition_filter)
+        finally:
+            client.close()
+
+        if errors:
+            raise errors[0]
+        send(take())
+    except Exception as exc:
+        writer.send(_ERROR, _dumps_error(exc))
+        return
+
+    writer.send(_END)
+
+
+def partition_ranges(processes):
+    '''
+    Split the partitions of a namespace in processes contiguous ranges.
+
+    Args:
+        processes (int): The number of ranges.
+
+    Returns:
+        A list of partition_filter dicts, {'begin': p, 'count': n}.
+    '''
+    step, extra = divmod(PARTITION_COUNT, processes)
+    ranges = []
+    begin = 0
+
+    for i in range(processes):
+        count = step + (1 if i < extra else 0)
+        ranges.append({'begin': begin, 'count': count})
+        begin += count
+
+    return ranges
+
+
+def scan(namespace, set_name, config, processes=None, fn=None, reducer=None, initial=None,
+         user=None, password=None, policy=None, options=None, batch_size=256,
+         ring_size=4 * 1024 * 1024, slot_size=64 * 1024, context=None):
+    '''
+    Scan namespace and set_name with several worker processes, each scanning a
+    range of partitions with its own client.
+
+    Each worker calls fn with every record it reads, and hands the values fn
+    returns back to the calling process, where they are folded with reducer.
+    Values that are None are dropped, so fn may process the records itself.
+
+    Args:
+        namespace (str): The namespace to scan.
+        set_name (str): The set to scan, or None for the whole namespace.
+        config (dict): The configuration of the clients of the workers, see :meth:`aerospike.client`.
+        processes (int): The number of worker processes. Default: the number of CPUs.
+        fn (callable): Called with each record tuple in the workers, returns a picklable value.
+            Default: the record itself.
+        reducer (callable): Called as reducer(accumulator, value) in the calling process,
+            returns the new accumulator. Default: the values are returned as a list.
+        initial: The first accumulator passed to reducer.
+        user (str): The user name to connect the clients with.
+        password (str): The password of user.
+        policy (dict): The :ref:`aerospike_scan_policies` of the scans.
+        options (dict): The :ref:`aerospike_scan_options` of the scans.
+        batch_size (int): The number of values a worker pickles together.
+        ring_size (int): The bytes of shared memory of each worker's ring buffer.
+        slot_size (int): The bytes of a slot of the ring buffers, larger batches span several slots.
+        context: The :mod:`multiprocessing` context starting the workers. With the spawn
+            start method, fn must be picklable.
+
+    Returns:
+        The accumulator, or the list of values without a reducer. The values of the
+        different workers are interleaved.
+
+    Raises:
+        The exception raised by a worker, or by fn, after the other workers are stopped.
+    '''
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes < 1 or processes > PARTITION_COUNT:
+        raise ValueError('processes must be between 1 and %d' % PARTITION_COUNT)
+    if slot_size <= _HEADER.size or ring_size < slot_size:
+        raise ValueError('ring_size must hold at least one slot of slot_size bytes')
+
+    if context is None:
+        context = multiprocessing.get_context()
+
+    credentials = (user, password) if user is not None else ()
+    ready = context.Semaphore(0)
+    rings = []
+    workers = []
+
+    for partition_filter in partition_ranges(processes):
+        ring = _Ring(context, ring_size // slot_size, slot_size)
+        worker = context.Process(
+            target=_scan_worker,
+            args=(config, credentials, namespace, set_name, partition_filter, fn,
+                  policy, options, batch_size, ring, ready))
+        worker.daemon = True
+        rings.append(ring)
+        workers.append(worker)
+
+    accumulator = [] if reducer is None else initial
+    readers = [_RingReader(ring) for ring in rings]
+    running = set(range(processes))
+    turn = 0
+
+    try:
+        for worker in workers:
+            worker.start()
+
+        while running:
+            if not ready.acquire(timeout=1.0):
+                exited = [workers[i] for i in running if workers[i].exitcode is not None]
+                if not exited:
+                    continue
+                # The slots of a worker are written before it exits.
+                if not ready.acquire(False):
+                    raise RuntimeError('scan worker exited with code %d' % exited[0].exitcode)
+
+            # A slot was written to one of the rings, take them in turn.
+            for step in range(processes):
+                i = (turn + step) % processes
+                if rings[i].full.acquire(False):
+                    break
+            turn = (i + 1) % processes
+
+            message = readers[i].receive()
+            if message is None:
+                continue
+
+            frame, payload = message
+            if frame == _VALUES:
+                values = pickle.loads(payload)
+                if reducer is None:
+                    accumulator.extend(values)
+                else:
+                    for value in values:
+                        accumulator = reducer(accumulator, value)
+            elif frame == _END:
+                running.discard(i)
+            elif frame == _ERROR:
+                raise pickle.loads(payload)
+    finally:
+        for worker in workers:
+            if worker.is_alive() and running:
+                worker.terminate()
+        for worker in workers:
+            if worker.pid is not None:
+                worker.join()
+
+    return accumulator
@@ -40,6 +40,8 @@ DARWIN = 'Darwin' in PLATFORM or 'macOS' in PLATFORM
 CWD = os.path.abspath(os.path.dirname(__file__))
 STATIC_SSL = os.getenv('STATIC_SSL')
 SSL_LIB_PATH = os.getenv('SSL_LIB_PATH')
+# Event library used by the C client's event loops, required by aerospike.aio
+EVENT_LIB = os.getenv('EVENT_LIB')
 
 ################################################################################
 # HELPER FUNCTION FOR RESOLVING THE C CLIENT DEPENDENCY
@@ -148,6 +150,27 @@ if STATIC_SSL:
     libraries.remove('crypto')
     library_dirs.remove('/usr/local/opt/openssl/lib')
 
+################################################################################
+# EVENT LIBRARY BUILD SETTINGS
+################################################################################
+
+if EVENT_LIB:
+    if EVENT_LIB == 'libev':
+        extra_compile_args.append('-DAS_USE_LIBEV')
+        libraries.append('ev')
+    elif EVENT_LIB == 'libuv':
+        extra_compile_args.append('-DAS_USE_LIBUV')
+        libraries.append('uv')
+    elif EVENT_LIB == 'libevent':
+        extra_compile_args.append('-DAS_USE_LIBEVENT')
+        libraries.extend(['event_core', 'event_pthreads'])
+    else:
+        print("error: EVENT_LIB must be one of libev, libuv or libevent:", EVENT_LIB, file=sys.stderr)
+        sys.exit(9)
+    # Download the C client package built against the same event library
+    os.putenv('AEROSPIKE_C_FLAVOR', EVENT_LIB)
+    os.environ['AEROSPIKE_C_FLAVOR'] = EVENT_LIB
+
 ################################################################################
 # PLATFORM SPECIFIC BUILD SETTINGS
 ################################################################################
@@ -256,6 +279,7 @@ setup(
                 'src/main/client/cdt_map_operate.c',
                 'src/main/client/hll_operate.c',
                 'src/main/client/expression_operations.c',
+                'src/main/client/compile_expression.c',
                 'src/main/client/cdt_operation_utils.c',
                 'src/main/client/close.c',
                 'src/main/client/connect.c',
@@ -263,11 +287,13 @@ setup(
                 'src/main/client/exists_many.c',
                 'src/main/client/get.c',
                 'src/main/client/get_many.c',
+                'src/main/client/batch_write.c',
                 'src/main/client/select_many.c',
                 'src/main/client/info_single_node.c',
                 'src/main/client/info_random_node.c',
                 'src/main/client/info_node.c',
                 'src/main/client/info.c',
+                'src/main/client/info_parsed.c',
                 'src/main/client/put.c',
                 'src/main/client/operate_list.c',
                 'src/main/client/operate_map.c',
@@ -282,6 +308,12 @@ setup(
                 'src/main/client/udf.c',
                 'src/main/client/sec_index.c',
                 'src/main/serializer.c',
+                'src/main/cdt_decoder.c',
+                'src/main/intern.c',
+                'src/main/pool.c',
+                'src/main/callback_batch.c',
+                'src/main/columnar.c',
+                'src/main/arrow.c',
                 'src/main/client/remove_bin.c',
                 'src/main/client/get_key_digest.c',
                 'src/main/query/type.c',
@@ -290,12 +322,17 @@ setup(
                 'src/main/query/foreach.c',
                 'src/main/query/predexp.c',
                 'src/main/query/results.c',
+                'src/main/query/iter_results.c',
+                'src/main/query/to_arrow.c',
                 'src/main/query/select.c',
                 'src/main/query/where.c',
                 'src/main/query/execute_background.c',
                 'src/main/scan/type.c',
                 'src/main/scan/foreach.c',
                 'src/main/scan/results.c',
+                'src/main/scan/partition_cursor.c',
+                'src/main/scan/iter_results.c',
+                'src/main/scan/to_arrow.c',
                 'src/main/scan/select.c',
                 'src/main/scan/execute_background.c',
                 'src/main/scan/apply.c',
@@ -311,14 +348,31 @@ setup(
                 'src/main/convert_expressions.c',
                 'src/main/policy_config.c',
                 'src/main/calc_digest.c',
+                'src/main/partition.c',
                 'src/main/predicates.c',
                 'src/main/tls_config.c',
-                'src/main/global_hosts/type.c',
+                'src/main/global_hosts/registry.c',
                 'src/main/nullobject/type.c',
                 'src/main/cdt_types/type.c',
+                'src/main/expression/type.c',
+                'src/main/key_batch/type.c',
+                'src/main/operation_list/type.c',
+                'src/main/result_iterator/type.c',
+                'src/main/blob/type.c',
+                'src/main/cdt_lazy/type.c',
+                'src/main/policy_types/type.c',
+                'src/main/aio/module.c',
+                'src/main/aio/type.c',
+                'src/main/aio/command.c',
+                'src/main/aio/get.c',
+                'src/main/aio/put.c',
+                'src/main/aio/operate.c',
+                'src/main/aio/get_many.c',
+                'src/main/aio/query.c',
                 'src/main/key_ordered_dict/type.c',
                 'src/main/client/set_xdr_filter.c',
-                'src/main/client/get_nodes.c'
+                'src/main/client/get_nodes.c',
+                'src/main/client/partition_map.c'
             ],
 
             # Compile
@@ -0,0 +1,112 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * COMMAND STATE
+ ******************************************************************************/
+
+/**
+ * State kept for a command between submitting it to the event loop and the
+ * listener that completes it. The listener runs on a C client event loop
+ * thread, so everything here is only touched with the GIL held.
+ */
+typedef struct {
+	AerospikeAioClient * client;
+	PyObject * py_future;
+	PyObject * py_key;
+	PyObject * py_owner;
+	PyObject * py_results;
+	as_key key;
+	bool key_initialised;
+	bool send_key;
+	as_error err;
+} AerospikeAioCommand;
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+/**
+ * Create the aerospike.aio module.
+ */
+PyObject * AerospikeAio_New(void);
+
+PyTypeObject * AerospikeAioClient_Ready(void);
+
+PyTypeObject * AerospikeAioQuery_Ready(void);
+
+/**
+ * Create the event loops shared by every aio.Client in the process.
+ * Only the first call creates loops, later calls are no-ops.
+ */
+as_status AerospikeAio_Create_Event_Loops(as_error * err, uint32_t count);
+
+/**
+ * Return a new future on the running asyncio loop and make sure that loop
+ * watches the client's wakeup fd. Returns NULL with a Python error set.
+ */
+PyObject * AerospikeAio_Create_Future(AerospikeAioClient * self);
+
+/**
+ * Allocate the state for a command that completes py_future and count it as
+ * in flight until it is destroyed.
+ */
+AerospikeAioCommand * AerospikeAio_Command_New(AerospikeAioClient * self, PyObject * py_future, PyObject * py_key);
+
+/**
+ * Queue the result of a command for its future and release the command.
+ * Must be called with the GIL held. Exactly one of py_result and err is used:
+ * if err is set and not AEROSPIKE_OK the future gets the matching exception.
+ * Steals the reference to py_result.
+ */
+void AerospikeAio_Command_Complete(AerospikeAioCommand * cmd, PyObject * py_result, as_error * err);
+
+/**
+ * Release a command. Called by AerospikeAio_Command_Complete(), or directly
+ * when the submission failed and the listener will never run.
+ */
+void AerospikeAio_Command_Destroy(AerospikeAioCommand * cmd);
+
+/**
+ * Set a Python exception for an error found while submitting a command.
+ */
+PyObject * AerospikeAio_Raise(as_error * err, PyObject * py_key);
+
+/*******************************************************************************
+ * OPERATIONS
+ ******************************************************************************/
+
+PyObject * AerospikeAioClient_Get(AerospikeAioClient * self, PyObject * args, PyObject * kwds);
+
+PyObject * AerospikeAioClient_Put(AerospikeAioClient * self, PyObject * args, PyObject * kwds);
+
+PyObject * AerospikeAioClient_Operate(AerospikeAioClient * self, PyObject * args, PyObject * kwds);
+
+PyObject * AerospikeAioClient_Get_Many(AerospikeAioClient * self, PyObject * args, PyObject * kwds);
+
+PyObject * AerospikeAioClient_Query(AerospikeAioClient * self, PyObject * args, PyObject * kwds);
+
+PyObject * AerospikeAioQuery_Results(AerospikeQuery * self, PyObject * args, PyObject * kwds);
@@ -0,0 +1,95 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdint.h>
+
+#include <aerospike/as_error.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * ARROW C DATA INTERFACE
+ *
+ * https://arrow.apache.org/docs/format/CDataInterface.html
+ ******************************************************************************/
+
+#ifndef ARROW_C_DATA_INTERFACE
+#define ARROW_C_DATA_INTERFACE
+
+#define ARROW_FLAG_DICTIONARY_ORDERED 1
+#define ARROW_FLAG_NULLABLE 2
+#define ARROW_FLAG_MAP_KEYS_SORTED 4
+
+struct ArrowSchema {
+	// Array type description
+	const char * format;
+	const char * name;
+	const char * metadata;
+	int64_t flags;
+	int64_t n_children;
+	struct ArrowSchema ** children;
+	struct ArrowSchema * dictionary;
+
+	// Release callback
+	void (*release)(struct ArrowSchema *);
+	// Opaque producer-specific data
+	void * private_data;
+};
+
+struct ArrowArray {
+	// Array data description
+	int64_t length;
+	int64_t null_count;
+	int64_t offset;
+	int64_t n_buffers;
+	int64_t n_children;
+	const void ** buffers;
+	struct ArrowArray ** children;
+	struct ArrowArray * dictionary;
+
+	// Release callback
+	void (*release)(struct ArrowArray *);
+	// Opaque producer-specific data
+	void * private_data;
+};
+
+#endif  // ARROW_C_DATA_INTERFACE
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+// Rows per record batch when to_arrow() is not given a batch_size.
+#define ARROW_DEFAULT_BATCH_SIZE 65536
+
+/**
+ * Validate the schema and batch_size arguments of to_arrow(), then start
+ * execute(command, ...) on a producer thread and return an iterator of
+ * pyarrow.RecordBatch. Records are collected into columns without the GIL,
+ * and each full batch is handed over to pyarrow through the Arrow C Data
+ * Interface.
+ *
+ * Takes ownership of command, as AerospikeResultIterator_New() does. On
+ * failure NULL is returned, err is populated and command has already been
+ * released.
+ */
+PyObject * arrow_iterator_new(AerospikeClient * client, PyObject * py_owner,
+		PyObject * py_schema, PyObject * py_batch_size,
+		AerospikeResultIterator_Execute execute, void * command,
+		void (*destroy)(void * command), as_error * err);
@@ -0,0 +1,39 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_bytes.h>
+
+#include "types.h"
+
+PyTypeObject * AerospikeBlob_Ready(void);
+
+/**
+ * Return an aerospike.Blob holding the payload of bytes. The buffer is taken
+ * over from bytes when it owns it, otherwise it is copied once.
+ */
+PyObject * AerospikeBlob_New(as_bytes * bytes);
+
+/**
+ * Return a writable memoryview over the payload of bytes. The buffer is
+ * taken over from bytes when it owns it, otherwise it is copied once, and
+ * stays alive for as long as the memoryview (or a slice of it) does.
+ */
+PyObject * AerospikeBlob_MemoryView(as_bytes * bytes);
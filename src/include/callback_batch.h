@@ -0,0 +1,92 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+
+#include <aerospike/as_bin.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_val.h>
+#include <aerospike/as_vector.h>
+
+#include "types.h"
+
+// Records per block when batch_callback is set without callback_batch_size.
+#define CALLBACK_BATCH_DEFAULT_SIZE 512
+
+struct callback_batch_s;
+
+/*
+ * Receives a block of converted results, with the GIL held. Returning false
+ * stops the scan or query.
+ */
+typedef bool (*callback_batch_handler)(struct callback_batch_s * batch, PyObject * py_results);
+
+/*
+ * Buffers the results handed to a scan or query callback on each C client
+ * thread, and converts them to Python objects a block at a time under a
+ * single GIL acquisition.
+ */
+typedef struct callback_batch_s {
+	AerospikeClient * client;
+	uint32_t batch_size;
+	uint64_t id;
+	callback_batch_handler handler;
+	void * udata;
+	volatile bool stopped;
+	// Set by the first thread which failed to buffer a result.
+	as_error err;
+	pthread_mutex_t lock;
+	as_vector buffers;
+} callback_batch;
+
+/**
+ * Read the callback_batch_size and batch_callback scan or query options.
+ * batch_size is 0 when results are not batched.
+ */
+as_status callback_batch_options(as_error * err, PyObject * py_options,
+		uint32_t * batch_size, bool * batch_callback);
+
+/**
+ * Must be called with the GIL held.
+ */
+void callback_batch_init(callback_batch * batch, AerospikeClient * client,
+		uint32_t batch_size, callback_batch_handler handler, void * udata);
+
+/**
+ * Scan and query callback, udata is the callback_batch. Keeps a copy of
+ * val in the buffer of the calling thread and hands the buffer over to the
+ * handler once it is full.
+ */
+bool callback_batch_add(const as_val * val, void * udata);
+
+/**
+ * Hands the results left in every buffer over to the handler once the scan
+ * or query has returned, then releases the buffers. A result which could
+ * not be buffered stopped the scan or query, its error is copied to err.
+ * Must be called with the GIL held.
+ */
+void callback_batch_destroy(callback_batch * batch, as_error * err);
+
+/**
+ * Returns a copy of the value of bin, or a new reference when the value is
+ * stored outside of the bin, which outlives the record handed to a scan or
+ * query callback.
+ */
+as_val * callback_batch_copy_bin(const as_bin * bin);
@@ -0,0 +1,114 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_policy.h>
+
+#include "types.h"
+
+// How list and map bins are read, see cdt_mode_from_policy().
+#define CDT_MODE_DEFAULT 0
+#define CDT_MODE_DIRECT 1
+#define CDT_MODE_LAZY 2
+
+/*
+ * Reads Aerospike's msgpack wire format, the packed form of list and map
+ * bins, from buffer.
+ */
+typedef struct {
+	const uint8_t * buffer;
+	uint32_t offset;
+	uint32_t length;
+} cdt_unpacker;
+
+/**
+ * Returns true if the msgpack type byte starts a list or a map.
+ */
+static inline bool cdt_is_container(uint8_t type)
+{
+	return (type & 0xf0) == 0x90 || type == 0xdc || type == 0xdd ||
+			(type & 0xf0) == 0x80 || type == 0xde || type == 0xdf;
+}
+
+/**
+ * Converts the msgpack value at the offset of pk to a Python object, with
+ * the same types as val_to_pyobject(), and moves past it.
+ */
+as_status cdt_unpack_value(AerospikeClient * self, as_error * err, cdt_unpacker * pk, PyObject ** py_val);
+
+/**
+ * cdt_unpack_value() for a map key, string keys are taken from the intern
+ * table of self.
+ */
+as_status cdt_unpack_map_key(AerospikeClient * self, as_error * err, cdt_unpacker * pk, PyObject ** py_key);
+
+/**
+ * Moves past the msgpack value at the offset of pk.
+ */
+as_status cdt_skip_value(as_error * err, cdt_unpacker * pk);
+
+/**
+ * Reads the header of the list or map at the offset of pk. count is the
+ * number of elements, or of key/value pairs, and the order flags of an
+ * ordered list or map are skipped.
+ */
+as_status cdt_unpack_container(as_error * err, cdt_unpacker * pk, bool * is_map, uint32_t * count);
+
+/**
+ * Converts a list or map bin read without deserialization, an as_bytes of
+ * type AS_BYTES_LIST or AS_BYTES_MAP, straight to a Python list or dict.
+ */
+as_status cdt_bytes_to_pyobject(AerospikeClient * self, as_error * err, const as_bytes * bytes, PyObject ** py_val);
+
+/**
+ * Reads the cdt_mode of a read or batch policy, given as a dict or a policy
+ * object. Defaults to the cdt_mode of the client.
+ */
+as_status cdt_mode_from_policy(AerospikeClient * self, as_error * err, PyObject * py_policy, int * cdt_mode);
+
+/**
+ * Reads a cdt_mode name, 'default', 'direct' or 'lazy'. Returns false if it
+ * is not one.
+ */
+bool cdt_mode_from_pyobject(PyObject * py_value, int * cdt_mode);
+
+/**
+ * Sets how list and map bins read without deserialization are returned by
+ * the current thread, returns the previous value.
+ */
+int set_cdt_mode(int cdt_mode);
+
+/**
+ * The cdt_mode of the current thread.
+ */
+int get_cdt_mode(void);
+
+/**
+ * Turns off the deserialization of list and map bins by the C client when
+ * cdt_mode is not CDT_MODE_DEFAULT. *policy_p is copied into policy first
+ * when it is NULL or shared with the client.
+ */
+void cdt_mode_apply_read(AerospikeClient * self, int cdt_mode, as_policy_read * policy, as_policy_read ** policy_p);
+
+void cdt_mode_apply_batch(AerospikeClient * self, int cdt_mode, as_policy_batch * policy, as_policy_batch ** policy_p);
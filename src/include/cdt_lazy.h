@@ -0,0 +1,75 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_error.h>
+
+#include "types.h"
+
+/*
+ * A read only view over a list or map bin, or over a list or map nested in
+ * one, left packed in the buffer it was read into. Elements are decoded when
+ * they are accessed, nested lists and maps as views over the same buffer.
+ */
+typedef struct {
+	PyObject_HEAD
+	AerospikeClient * client;
+	// Keeps buffer alive, shared by the nested views.
+	PyObject * py_owner;
+	const uint8_t * buffer;
+	uint32_t length;
+	// Offset of the msgpack header of the list or map.
+	uint32_t offset;
+	// Number of elements, or of key/value pairs.
+	uint32_t count;
+	// LazyList: offset of each element, built by the first indexed access.
+	uint32_t * offsets;
+	// LazyMap: the decoded keys mapped to the offsets of their values, built
+	// by the first access by key.
+	PyObject * py_index;
+} AerospikeLazyCDT;
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeLazyList_Ready(void);
+
+PyTypeObject * AerospikeLazyMap_Ready(void);
+
+/**
+ * Registers LazyList and LazyMap as a collections.abc.Sequence and a
+ * collections.abc.Mapping.
+ */
+void AerospikeLazyCDT_Register(void);
+
+/**
+ * Returns true if py_obj is an aerospike.LazyList or an aerospike.LazyMap.
+ */
+bool AerospikeLazyCDT_Check(PyObject * py_obj);
+
+/**
+ * Wraps a list or map bin read without deserialization, an as_bytes of type
+ * AS_BYTES_LIST or AS_BYTES_MAP, in a LazyList or a LazyMap. The buffer is
+ * taken over from bytes when it owns it, otherwise it is copied once.
+ */
+as_status AerospikeLazyCDT_FromBytes(AerospikeClient * client, as_error * err, as_bytes * bytes, PyObject ** py_val);
@@ -41,6 +41,21 @@
 #define AS_EXPR_KEY "expr"
 #define AS_EXPR_FLAGS_KEY "expr_flags"
 
+/*
+Operations are either dicts or aerospike_helpers.operations.Operation objects.
+get_op_entry returns a borrowed reference to the entry named key, or NULL if it is not set.
+get_op_unknown_entry returns the name of an entry of an Operation object which is set but
+not one of the NULL terminated keys, or NULL if there is none. Dicts are not checked.
+*/
+bool
+is_operation(PyObject * py_op);
+
+PyObject *
+get_op_entry(PyObject * py_op, const char * key);
+
+const char *
+get_op_unknown_entry(PyObject * py_op, const char ** keys);
+
 as_status
 get_bin(as_error * err, PyObject * op_dict, as_vector * unicodeStrVector, char** binName);
 
@@ -40,6 +40,14 @@ PyTypeObject * AerospikeClient_Ready(void);
  */
 AerospikeClient * AerospikeClient_New(PyObject * self, PyObject * args, PyObject * kwds);
 
+/**
+ * Create a client with use_shared_connection set, and connect it.
+ *
+ *		aerospike.shared_client(config[, username, password])
+ *
+ */
+AerospikeClient * AerospikeClient_New_Shared(PyObject * self, PyObject * args, PyObject * kwds);
+
 /*******************************************************************************
  * CONNECTION OPERATIONS
  ******************************************************************************/
@@ -588,6 +596,30 @@ PyObject * AerospikeClient_Select_Many(AerospikeClient * self, PyObject *args, P
  */
 PyObject * AerospikeClient_Exists_Many(AerospikeClient * self, PyObject *args, PyObject * kwds);
 
+/**
+ * Write a batch of records
+ *
+ *		client.batch_write([(key, bins, meta)], policies)
+ *
+ */
+PyObject * AerospikeClient_Batch_Write(AerospikeClient * self, PyObject *args, PyObject * kwds);
+
+/**
+ * Apply the same operations to a batch of records
+ *
+ *		client.batch_operate([keys], [ops], meta, policies)
+ *
+ */
+PyObject * AerospikeClient_Batch_Operate(AerospikeClient * self, PyObject *args, PyObject * kwds);
+
+/**
+ * Remove a batch of records
+ *
+ *		client.batch_remove([keys], policies)
+ *
+ */
+PyObject * AerospikeClient_Batch_Remove(AerospikeClient * self, PyObject *args, PyObject * kwds);
+
 /**
 * Perform xdr-set-filter info operation on the database.
 *
@@ -602,6 +634,12 @@ PyObject * AerospikeClient_SetXDRFilter(AerospikeClient * self, PyObject *args,
 */
 PyObject * AerospikeClient_InfoAll(AerospikeClient * self, PyObject * args, PyObject * kwds);
 
+/**
+ * Send an info request to the entire cluster and parse the responses
+ * client.info_all_parsed("statistics", ttl=1.0)
+*/
+PyObject * AerospikeClient_InfoAll_Parsed(AerospikeClient * self, PyObject * args, PyObject * kwds);
+
 /**
 * Perform info operation on the database.
 *
@@ -625,6 +663,20 @@ PyObject * AerospikeClient_GetNodes(AerospikeClient * self, PyObject * args, PyO
 */
 PyObject * AerospikeClient_GetNodeNames(AerospikeClient * self, PyObject * args, PyObject * kwds);
 /**
+* Return the owners of the partitions of the namespaces.
+*
+* client.partition_map([ns])
+*
+*/
+PyObject * AerospikeClient_Partition_Map(AerospikeClient * self, PyObject * args, PyObject * kwds);
+/**
+* Group keys by the node owning them.
+*
+* client.route(keys)
+*
+*/
+PyObject * AerospikeClient_Route(AerospikeClient * self, PyObject * args, PyObject * kwds);
+/**
 * Perforrm get key digest operation on the database.
 *
 * client.get_key_digest((x,y,z))
@@ -636,15 +688,28 @@ PyObject * AerospikeClient_Get_Key_Digest(AerospikeClient * self, PyObject * arg
  */
 char* return_search_string(aerospike *as);
 /**
- * Close the aerospike object depending on the global_hosts entries
+ * Drop the client's reference to the shared cluster as, and close it when
+ * no other client uses it. Must be called without the GIL.
  */
-void close_aerospike_object(aerospike *as, as_error *err, char *alias_to_search, PyObject *py_persistent_item, bool do_destroy);
+void close_aerospike_object(aerospike *as, as_error *err);
 /**
  * Check type for 'operate' operation
  */
 int check_type(AerospikeClient * self, PyObject * py_value, int op, as_error *err);
 
 
+/*******************************************************************************
+ * EXPRESSION OPERATIONS
+ ******************************************************************************/
+
+/**
+ * Compile an expression into a reusable aerospike.Expression
+ *
+ *		client.compile_expression(expressions)
+ *
+ */
+PyObject * AerospikeClient_CompileExpression(AerospikeClient * self, PyObject * args, PyObject * kwds);
+
 /*******************************************************************************
  * TRUNCATE OPERATIONS
  ******************************************************************************/
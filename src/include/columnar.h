@@ -0,0 +1,121 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/as_bin.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_val.h>
+#include <aerospike/as_vector.h>
+
+#include "types.h"
+
+typedef enum {
+	COLUMN_EMPTY,
+	COLUMN_INT64,
+	COLUMN_FLOAT64,
+	COLUMN_OBJECT
+} column_type;
+
+/*
+ * One cell of a column. Integer and float cells are stored unboxed, so the
+ * values of an int64 or float64 column are a contiguous array that numpy can
+ * use as is. Any other value is kept as a copy of the as_val.
+ */
+typedef union {
+	int64_t i;
+	double d;
+	as_val * v;
+} column_value;
+
+typedef struct {
+	char name[AS_BIN_NAME_MAX_SIZE];
+	column_type type;
+	column_value * values;
+	uint8_t * valid;
+} column;
+
+/*
+ * Accumulates records into one column per bin, without creating any Python
+ * object, until columnar_to_pyobject() is called.
+ */
+typedef struct {
+	as_vector columns;
+	bool fixed;
+	// Set once a column could not be allocated or grown.
+	bool failed;
+	uint32_t size;
+	uint32_t capacity;
+	pthread_mutex_t lock;
+} columnar;
+
+/**
+ * Read the columnar argument of get_many or results. It can be True, to
+ * get one column per bin found in the records, or a list of bin names.
+ * enabled is false when py_columnar is NULL, None or False, otherwise
+ * columns is initialised and must be destroyed with columnar_destroy().
+ * Must be called with the GIL held.
+ */
+as_status columnar_init(as_error * err, columnar * columns, PyObject * py_columnar, bool * enabled);
+
+/**
+ * Initialise empty columns, without the GIL. When fixed is true only the
+ * bins added with columnar_add_bin() are kept, otherwise a column is added
+ * for every bin found in the records.
+ */
+void columnar_init_bins(columnar * columns, bool fixed);
+
+/**
+ * Returns false when the column cannot be allocated.
+ */
+bool columnar_add_bin(columnar * columns, const char * name);
+
+/**
+ * Returns the column of the named bin, or NULL.
+ */
+column * columnar_find(columnar * columns, const char * name);
+
+/**
+ * Append a row holding the bins of rec. Safe to call from any thread.
+ * Returns false once the columns failed to allocate, the row is then
+ * dropped and columnar_to_pyobject() fails with AEROSPIKE_ERR_CLIENT.
+ */
+bool columnar_add_record(columnar * columns, const as_record * rec);
+
+/**
+ * Append a row without any value, such as a record that was not found.
+ * Returns false once the columns failed to allocate.
+ */
+bool columnar_add_missing(columnar * columns);
+
+/**
+ * Scan and query callback, udata is the columnar.
+ */
+bool columnar_callback(const as_val * val, void * udata);
+
+/**
+ * Convert the columns to a dict of numpy masked arrays keyed by bin name.
+ * Must be called with the GIL held.
+ */
+as_status columnar_to_pyobject(AerospikeClient * client, as_error * err, columnar * columns, PyObject ** py_columns);
+
+void columnar_destroy(columnar * columns);
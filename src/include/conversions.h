@@ -32,6 +32,13 @@
 
 #define CTX_KEY "ctx"
 
+// The result formats of get_many() and select_many().
+enum batch_result_format {
+	BATCH_RESULT_LIST,
+	BATCH_RESULT_DICT,
+	BATCH_RESULT_DICT_META
+};
+
 as_status as_udf_file_to_pyobject(as_error *err, as_udf_file * entry, PyObject ** py_file);
 
 as_status as_udf_files_to_pyobject(as_error *err, as_udf_files *files, PyObject **py_files);
@@ -77,6 +84,14 @@ as_status record_to_pyobject_cnvt_list_to_map(AerospikeClient * self, as_error *
 
 as_status key_to_pyobject(as_error * err, const as_key * key, PyObject ** obj);
 
+/**
+ * key_to_pyobject() with the namespace and set name taken from the intern
+ * table of self, which may be NULL.
+ */
+as_status do_key_to_pyobject(AerospikeClient * self, as_error * err, const as_key * key, PyObject ** obj);
+
+as_status key_value_to_pyobject(as_error * err, const as_key * key, PyObject ** obj);
+
 as_status metadata_to_pyobject(as_error * err, const as_record * rec, PyObject ** obj);
 
 as_status bins_to_pyobject(AerospikeClient * self, as_error * err, const as_record * rec, PyObject ** obj, bool cnvt_list_to_map);
@@ -109,6 +124,10 @@ as_status as_batch_read_results_to_pyobject(as_error* err, AerospikeClient* clie
 
 as_status batch_read_records_to_pyobject(AerospikeClient *self, as_error *err, as_batch_read_records* records, PyObject **py_recs);
 
+as_status batch_read_records_to_pydict(AerospikeClient *self, as_error *err, as_batch_read_records* records, bool with_meta, PyObject **py_recs);
+
+as_status batch_result_format_from_pyobject(as_error *err, PyObject *py_format, int *format);
+
 as_status
 string_and_pyuni_from_pystring(PyObject* py_string, PyObject** pyuni_r, char** c_str_ptr, as_error* err);
 
@@ -20,3 +20,5 @@
 
 PyObject * AerospikeException_New(void);
 PyObject* raise_exception(as_error * err);
+PyObject * new_exception_with_attrs(PyObject * exception_type, PyObject * py_err, ...);
+void raise_exception_with_attrs(PyObject * exception_type, PyObject * py_err, ...);
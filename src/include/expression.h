@@ -0,0 +1,53 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_exp.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeExpression_Ready(void);
+
+/**
+ * Wrap an already compiled as_exp in a new aerospike.Expression.
+ * The Expression takes ownership of exp and destroys it when it is freed.
+ */
+PyObject * AerospikeExpression_New(as_exp * exp);
+
+/**
+ * Returns true if py_obj is an aerospike.Expression.
+ */
+bool AerospikeExpression_Check(PyObject * py_obj);
+
+/**
+ * Resolve py_exp, which is either an aerospike.Expression or a list of
+ * compiled expression tuples, into an as_exp.
+ * If py_exp is an aerospike.Expression its as_exp is borrowed and *exp_owned
+ * is set to false, otherwise a new as_exp is compiled, *exp_owned is set to
+ * true and the caller must call as_exp_destroy on it.
+ */
+as_status get_as_exp(AerospikeClient * self, as_error * err, PyObject * py_exp,
+		as_exp ** exp, bool * exp_owned);
@@ -16,8 +16,53 @@
 
 #pragma once
 
-#include <Python.h>
 #include <stdbool.h>
-#include "types.h"
-AerospikeGlobalHosts * AerospikeGobalHosts_New(aerospike* as);
-void AerospikeGlobalHosts_Del(PyObject *self);
+
+#include <aerospike/aerospike.h>
+
+/*
+ * Process wide registry of the clusters shared by the clients created with
+ * use_shared_connection. Clients with the same hosts, user and TLS settings
+ * share one aerospike object, so one tend thread and one connection pool,
+ * across threads and sub-interpreters. The registry is plain C memory guarded
+ * by a mutex, none of its functions need the GIL.
+ */
+
+/**
+ * Takes the registry lock, so a lookup, the connect of a missing cluster and
+ * its registration happen at once. The lock is recursive.
+ */
+void global_hosts_lock(void);
+
+void global_hosts_unlock(void);
+
+/**
+ * Returns the cluster registered under alias with one more reference, NULL if
+ * there is none.
+ */
+aerospike * global_hosts_acquire(const char * alias);
+
+/**
+ * Registers the connected cluster as under alias with one reference. If a
+ * cluster was registered under alias meanwhile, returns it with one more
+ * reference instead, and the caller closes as. Returns NULL if the cluster
+ * could not be registered.
+ */
+aerospike * global_hosts_add(const char * alias, aerospike * as);
+
+/**
+ * Drops a reference to the registered cluster as. Returns true if it was the
+ * last one, the cluster is then unregistered and the caller closes it.
+ */
+bool global_hosts_release(aerospike * as);
+
+/**
+ * Unregisters alias, the clients already sharing it keep their cluster.
+ */
+void global_hosts_remove(const char * alias);
+
+/**
+ * Returns the first shared memory key from shm_key on that no registered
+ * cluster uses.
+ */
+int global_hosts_free_shm_key(int shm_key);
@@ -0,0 +1,39 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+
+struct info_cache_s;
+
+/**
+ * Parses the response of an info command into Python objects:
+ *
+ *    k1=v1;k2=v2            -> {'k1': v1, 'k2': v2}
+ *    a=1:b=2;a=3:b=4        -> [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]
+ *    v1;v2                  -> [v1, v2]
+ *    v                      -> v
+ *
+ * The echoed command in front of the response is dropped. Values that are
+ * integers, floats, true or false are converted, others are left as str.
+ */
+PyObject * info_response_to_pyobject(const char * response);
+
+/**
+ * Frees the client's cache of info responses.
+ */
+void info_cache_free(struct info_cache_s * info_cache);
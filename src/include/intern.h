@@ -0,0 +1,51 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stddef.h>
+#include <stdint.h>
+
+#include "types.h"
+
+// Default number of strings kept by the intern table of a client.
+#define INTERN_TABLE_DEFAULT_SIZE 1024
+
+// Longer strings are not interned.
+#define INTERN_MAX_LENGTH 64
+
+struct intern_table_s;
+
+/**
+ * Creates an intern table of size slots, rounded up to a power of two.
+ * Returns NULL if it can't be allocated.
+ */
+struct intern_table_s * intern_table_new(uint32_t size);
+
+/**
+ * Releases the strings of the table and frees it.
+ */
+void intern_table_free(struct intern_table_s * table);
+
+/**
+ * Returns a new reference to a str decoded from the UTF-8 string str of size
+ * bytes. Bin names, map keys, namespaces and set names recur in every record,
+ * the str is shared with earlier calls for the same string while it is in the
+ * intern table of the client, and has its hash computed already. Returns
+ * NULL with a Python exception set if str is not valid UTF-8.
+ */
+PyObject * intern_string(AerospikeClient * self, const char * str, size_t size);
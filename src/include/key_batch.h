@@ -0,0 +1,88 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+
+/*
+ * A key value read from Python without building an as_key, so many keys can
+ * be turned into as_keys or digests without holding the GIL. data points into
+ * the Python key or into memory owned by the holder of the digest_input.
+ */
+typedef struct {
+	as_val_t type;
+	int64_t integer;
+	const uint8_t * data;
+	Py_ssize_t size;
+} digest_input;
+
+typedef struct {
+	PyObject_HEAD
+	char ns[AS_NAMESPACE_MAX_SIZE];
+	char set[AS_SET_MAX_SIZE];
+	Py_ssize_t size;
+	digest_input * keys;
+	uint8_t * data;
+} AerospikeKeyBatch;
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+/**
+ * Reads the keys of an integer buffer, such as an int64 numpy array. Returns
+ * false for any other kind of buffer.
+ */
+bool digest_inputs_from_buffer(Py_buffer * view, digest_input * inputs);
+
+/**
+ * Reads one key, the values accepted as the key of a key tuple.
+ */
+as_status digest_input_from_pyobject(as_error * err, PyObject * py_key, digest_input * input);
+
+/**
+ * Copies the string and bytes keys of inputs into a new buffer, returned in
+ * data, so they no longer depend on the keys they were read from. Strings are
+ * NUL terminated for as_key_init_strp().
+ */
+as_status digest_inputs_own_data(as_error * err, digest_input * inputs, Py_ssize_t size, uint8_t ** data);
+
+/**
+ * Initializes key from input without copying the key value, input must
+ * outlive key.
+ */
+void digest_input_to_key(const digest_input * input, const char * ns, const char * set, as_key * key);
+
+PyTypeObject * AerospikeKeyBatch_Ready(void);
+
+/**
+ * Returns true if py_obj is an aerospike.KeyBatch.
+ */
+bool AerospikeKeyBatch_Check(PyObject * py_obj);
+
+/**
+ * Initializes key from the i-th key of the batch. The key borrows the key
+ * value, the batch must outlive it.
+ */
+void key_batch_key_init(AerospikeKeyBatch * self, Py_ssize_t i, as_key * key);
@@ -25,3 +25,11 @@
  *
  */
 PyObject * Aerospike_Calc_Digest(PyObject * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Calculates the digests and partition ids of many keys
+ *
+ *		aerospike.calc_digests()
+ *
+ */
+PyObject * Aerospike_Calc_Digests(PyObject * self, PyObject * args, PyObject * kwds);
@@ -0,0 +1,98 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_cdt_ctx.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_operations.h>
+#include <aerospike/as_vector.h>
+
+#include "pool.h"
+#include "types.h"
+
+/*
+ * One operation of an OperationList, the parts that do not depend on the
+ * client it is used with.
+ */
+typedef struct {
+	// Copy of the operation dict.
+	PyObject * py_op;
+	// The operation code, -1 if op is missing or not an integer.
+	long operation;
+	// (key, index) pairs of the placeholders of the operation, NULL if none.
+	PyObject * py_slots;
+} operation_template;
+
+typedef struct {
+	PyObject_HEAD
+	Py_ssize_t size;
+	operation_template * templates;
+	// Number of values bind() takes.
+	Py_ssize_t placeholders;
+	// Capsule of the operations compiled for the client last used.
+	PyObject * py_compiled;
+} AerospikeOperationList;
+
+typedef struct {
+	PyObject_HEAD
+	AerospikeOperationList * list;
+	PyObject * py_args;
+} AerospikeBoundOperationList;
+
+typedef struct {
+	PyObject_HEAD
+	Py_ssize_t index;
+} AerospikePlaceholder;
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeOperationList_Ready(void);
+
+PyTypeObject * AerospikePlaceholder_Ready(void);
+
+/**
+ * Returns true if py_obj is an aerospike.OperationList, or one returned by
+ * OperationList.bind().
+ */
+bool AerospikeOperationList_Check(PyObject * py_obj);
+
+/**
+ * Returns the number of operations of an OperationList or a bound one.
+ */
+Py_ssize_t operation_list_size(PyObject * py_ops);
+
+/**
+ * Adds the operations of an OperationList, or of a bound one, to ops.
+ * The operations are compiled for self the first time they are used with it.
+ * Operations without placeholders are added without converting them again,
+ * their values are shared with the compiled operations, which are returned
+ * in py_compiled and must be kept until ops is destroyed.
+ */
+as_status operation_list_add_ops(AerospikeClient * self, as_error * err, PyObject * py_ops,
+	as_vector * unicodeStrVector, as_static_pool * static_pool, as_operations * ops,
+	PyObject ** py_compiled);
+
+/**
+ * Initializes cdt_ctx from a ctx compiled by an OperationList, and returns
+ * true. Returns false if py_ctx is not one.
+ */
+bool compiled_cdt_ctx_copy(PyObject * py_ctx, as_cdt_ctx * cdt_ctx);
@@ -0,0 +1,89 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#pragma once
+
+#include <Python.h>
+#include <stdint.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_node.h>
+
+#include "types.h"
+
+// The number of partitions of an Aerospike namespace.
+#define AS_PARTITION_COUNT 4096
+
+/*
+ * The owners of the partitions of a namespace, as last seen in the cluster's
+ * partition table. owners holds the node name of each replica of each
+ * partition, an empty name when there is none.
+ * py_owners indexes py_nodes, -1 when there is no owner.
+ */
+typedef struct {
+	char ns[AS_NAMESPACE_MAX_SIZE];
+	uint32_t replica_size;
+	char (*owners)[AS_NODE_NAME_SIZE];
+	PyObject * py_nodes;
+	PyObject * py_owners;
+	const int16_t * owner_indexes;
+} partition_map_namespace;
+
+struct partition_map_s {
+	uint32_t size;
+	partition_map_namespace * namespaces;
+};
+
+/**
+ * Returns the partition a digest belongs to.
+ */
+static inline uint16_t digest_partition_id(const uint8_t * digest)
+{
+	return (uint16_t) ((digest[0] | (digest[1] << 8)) & (AS_PARTITION_COUNT - 1));
+}
+
+/**
+ * Updates the client's partition map from the cluster's partition tables.
+ * Only the namespaces whose owners changed since the last call are rebuilt.
+ */
+as_status partition_map_refresh(AerospikeClient * self, as_error * err);
+
+/**
+ * Returns the partition map entry of ns, NULL if the cluster has no
+ * partition table for it.
+ */
+partition_map_namespace * partition_map_get(AerospikeClient * self, const char * ns);
+
+/**
+ * Returns a borrowed reference to the name of the master node of
+ * partition_id, NULL if there is none.
+ */
+PyObject * partition_map_master(partition_map_namespace * map_ns, uint16_t partition_id);
+
+/**
+ * Frees the client's partition map.
+ */
+void partition_map_free(struct partition_map_s * partition_map);
+
+/**
+ * Sets py_nodes to a list with the name of the node owning each partition in
+ * partition_ids for namespace ns, or None where the client knows no owner.
+ * Names of the same node share one string.
+ */
+as_status partition_owner_names(AerospikeClient * self, as_error * err, const char * ns,
+		const uint16_t * partition_ids, Py_ssize_t size, PyObject ** py_nodes);
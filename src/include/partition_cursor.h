@@ -0,0 +1,75 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_partition_filter.h>
+
+#include "partition.h"
+
+/*
+ * The position of a partition scan: the range of partitions left to scan,
+ * and for each partition the digest of the last record handed to the
+ * callback, after which the partition is resumed.
+ */
+typedef struct {
+	uint16_t begin;
+	uint16_t count;
+	bool * has_after;
+	as_digest_value * after;
+} partition_cursor;
+
+/**
+ * Read a partition_filter dict, {'begin': p, 'count': n[, 'after': {pid: digest}]},
+ * as accepted by scan.foreach() and scan.results(), or a cursor returned by
+ * scan.foreach().
+ */
+as_status partition_cursor_from_pyobject(as_error * err, PyObject * py_filter,
+		partition_cursor * cursor);
+
+/**
+ * Records that the records in py_results, a record or a list of records,
+ * were handed to the callback. Must be called with the GIL held.
+ */
+void partition_cursor_track(partition_cursor * cursor, PyObject * py_results);
+
+/**
+ * Sets pf to a single scan of the partitions left in the cursor. Partitions
+ * with a last digest are resumed after it, through the partitions status of
+ * pf. pf must be released with partition_cursor_filter_destroy().
+ */
+as_status partition_cursor_filter(as_error * err, partition_cursor * cursor, as_partition_filter * pf);
+
+void partition_cursor_filter_destroy(as_partition_filter * pf);
+
+/**
+ * Empties the cursor once its scan completed and its records were handed to
+ * the callback.
+ */
+void partition_cursor_complete(partition_cursor * cursor);
+
+/**
+ * Returns the cursor as a partition_filter dict, or None once every partition
+ * was scanned.
+ */
+PyObject * partition_cursor_to_pyobject(partition_cursor * cursor);
+
+void partition_cursor_destroy(partition_cursor * cursor);
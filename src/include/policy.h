@@ -40,6 +40,7 @@ enum Aerospike_serializer_values {
 	SERIALIZER_PYTHON, /* default handler for serializer type */
 	SERIALIZER_JSON,
 	SERIALIZER_USER,
+	SERIALIZER_MSGPACK,
 };
 
 enum Aerospike_send_bool_as_values {
@@ -0,0 +1,47 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_policy.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+/**
+ * The aerospike.Policy base type.
+ */
+PyTypeObject * AerospikePolicy_Ready(void);
+
+/**
+ * The concrete policy type for one of the Aerospike_policy_kind values,
+ * such as aerospike.ReadPolicy for POLICY_KIND_READ.
+ */
+PyTypeObject * AerospikePolicy_Kind_Ready(int kind);
+
+/**
+ * The name the policy type for kind is exported under, e.g. "ReadPolicy".
+ */
+const char * AerospikePolicy_Kind_Name(int kind);
+
+bool AerospikePolicy_Check(PyObject * py_obj);
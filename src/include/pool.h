@@ -1,35 +1,74 @@
 /*
  *******************************************************************************************************
- * Static pool maintained to avoid runtime mallocs.
- * It comprises of following pools:
- * 1. Pool for Arraylist
- * 2. Pool for Hashmap
- * 3. Pool for Strings
- * 4. Pool for Integers
- * 5. Pool for Bytes
+ * Pool of as_bytes used while converting Python values for a command, to
+ * avoid a malloc per blob.
+ *
+ * The pool is an arena of fixed size blocks which are only taken when the
+ * first as_bytes is requested, so declaring a pool is cheap. It grows as
+ * needed, and POOL_DESTROY returns the blocks to a per-thread cache so that
+ * the next command on the thread reuses them. POOL_DESTROY must be called
+ * once the values handed out are no longer referenced, the pool can be used
+ * again afterwards.
  *******************************************************************************************************
  */
-#define AS_MAX_STORE_SIZE 4096
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/as_bytes.h>
+
+// Number of as_bytes in each block of the arena.
+#define AS_POOL_BLOCK_SIZE 64
+
+typedef struct as_bytes_block_s {
+    struct as_bytes_block_s * next;
+    as_bytes        bytes[AS_POOL_BLOCK_SIZE];
+} as_bytes_block;
 
 typedef struct bytes_static_pool {
-    as_bytes         bytes_pool[AS_MAX_STORE_SIZE];
+    // Most recently taken block first, the first block_used entries of it
+    // are in use, the others are full.
+    as_bytes_block * blocks;
+    uint32_t        block_used;
     uint32_t        current_bytes_id;
+    // When set, blobs wrap the memory of buffer-protocol objects instead of
+    // copying it. The exports are pinned in py_buffers until POOL_DESTROY,
+    // so only callers that destroy the pool once the command is done opt in.
+    bool            lend_buffers;
+    PyObject *      py_buffers;
 } as_static_pool;
 
+/**
+ * Allocate a pool on the heap, for pools owned by a Python object.
+ * Returns NULL if out of memory.
+ */
+as_static_pool * static_pool_new(void);
+
+/**
+ * Destroy and free a pool allocated with static_pool_new. NULL is ignored.
+ */
+void static_pool_free(as_static_pool * static_pool);
+
+/**
+ * Hand out a zeroed as_bytes from the pool, NULL if out of memory.
+ */
+as_bytes * static_pool_get_bytes(as_static_pool * static_pool);
+
+/**
+ * Destroy the as_bytes handed out, release the pinned buffers and give the
+ * blocks back to the thread's cache. Requires the GIL.
+ */
+void static_pool_reset(as_static_pool * static_pool);
+
 #define BYTES_CNT(static_pool)                                                 \
     (((as_static_pool *)static_pool)->current_bytes_id)
 
-#define BYTES_POOL(static_pool)                                                \
-    ((as_static_pool *)static_pool)->bytes_pool
-
 #define GET_BYTES_POOL(map_bytes, static_pool, err)                            \
-    if (AS_MAX_STORE_SIZE > BYTES_CNT(static_pool)) {                          \
-        map_bytes = &(BYTES_POOL(static_pool)[BYTES_CNT(static_pool)++]);      \
-    } else {                                                                   \
+    if (!(map_bytes = static_pool_get_bytes((as_static_pool *)static_pool))) { \
         as_error_update(err, AEROSPIKE_ERR, "Cannot allocate as_bytes");       \
     }
 
 #define POOL_DESTROY(static_pool)                                              \
-	for (uint32_t iter = 0; iter < BYTES_CNT(static_pool); iter++) {           \
-		as_bytes_destroy(&BYTES_POOL(static_pool)[iter]);                      \
-	}
+    static_pool_reset((as_static_pool *)static_pool);
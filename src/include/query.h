@@ -19,6 +19,7 @@
 #include <Python.h>
 #include <stdbool.h>
 
+#include <aerospike/as_error.h>
 #include <aerospike/as_query.h>
 
 #include "types.h"
@@ -106,6 +107,25 @@ PyObject * AerospikeQuery_Foreach(AerospikeQuery * self, PyObject * args, PyObje
  */
 PyObject * AerospikeQuery_Results(AerospikeQuery * self, PyObject * args, PyObject * kwds);
 
+/**
+ * Execute the query and return an iterator that streams the results
+ * through a bounded queue.
+ *
+ *		for result in query.iter_results():
+ *			print result
+ *
+ */
+PyObject * AerospikeQuery_Iter_Results(AerospikeQuery * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Execute the query and return an iterator of pyarrow.RecordBatch.
+ *
+ *		for batch in query.to_arrow(batch_size=10000):
+ *				print batch.num_rows
+ *
+ */
+PyObject * AerospikeQuery_To_Arrow(AerospikeQuery * self, PyObject * args, PyObject * kwds);
+
 /**
  * Execute a UDF in the background. Returns the query id to allow status of the query to be monitored.
  * */
@@ -126,4 +146,22 @@ int64_t pyobject_to_int64(PyObject * py_obj);
 /* Initialize the predexp module */
 PyObject * AerospikePredExp_New(void);
 
-as_status RegisterPredExpConstants(PyObject* module);
\ No newline at end of file
+as_status RegisterPredExpConstants(PyObject* module);
+
+/*******************************************************************************
+ * COMMANDS
+ ******************************************************************************/
+
+/**
+ * Create the query command run on a producer thread by iter_results() and
+ * to_arrow(). Returns NULL and populates err on failure.
+ */
+void * AerospikeQuery_Command_New(AerospikeQuery * self, as_error * err, PyObject * py_policy, PyObject * py_options);
+
+/**
+ * An AerospikeResultIterator_Execute running the query command.
+ */
+void AerospikeQuery_Command_Execute(void * command, as_error * err,
+		AerospikeResultIterator_Callback callback, void * udata);
+
+void AerospikeQuery_Command_Destroy(void * command);
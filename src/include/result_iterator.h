@@ -0,0 +1,60 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+
+#include "types.h"
+
+// Default number of results buffered ahead of the consumer.
+#define AEROSPIKE_RESULT_ITERATOR_QUEUE_SIZE 1024
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeResultIterator_Ready(void);
+
+/**
+ * Start execute(command, ...) on a producer thread and return an iterator
+ * over its results. At most queue_size converted results are buffered, the
+ * producing C client threads block once the queue is full.
+ *
+ * The iterator keeps py_owner alive while the command runs and takes
+ * ownership of command, which is released with destroy once the producer
+ * thread has finished. On failure NULL is returned, err is populated and
+ * command has already been released.
+ */
+PyObject * AerospikeResultIterator_New(AerospikeClient * client, PyObject * py_owner,
+		uint32_t queue_size, AerospikeResultIterator_Execute execute, void * command,
+		void (*destroy)(void * command), as_error * err);
+
+/**
+ * Queue py_result, stealing the reference. Called without the GIL from the
+ * threads of the command, blocks while the queue is full. Returns false once
+ * the iterator has been closed, the command should then stop.
+ */
+bool AerospikeResultIterator_Put(AerospikeResultIterator * self, PyObject * py_result);
+
+/**
+ * Validate the queue_size argument of iter_results().
+ */
+as_status AerospikeResultIterator_Queue_Size(as_error * err, PyObject * py_queue_size,
+		uint32_t * queue_size);
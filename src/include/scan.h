@@ -19,6 +19,7 @@
 #include <Python.h>
 #include <stdbool.h>
 
+#include <aerospike/as_error.h>
 #include <aerospike/as_scan.h>
 
 #include "types.h"
@@ -78,6 +79,34 @@ PyObject * AerospikeScan_Foreach(AerospikeScan * self, PyObject * args, PyObject
  */
 PyObject * AerospikeScan_Results(AerospikeScan * self, PyObject * args, PyObject * kwds);
 
+/**
+ * Return the cursor left by the last partition scan run by foreach(), or
+ * None if it scanned every partition.
+ *
+ *    scan.foreach(callback, partition_filter=scan.cursor())
+ *
+ */
+PyObject * AerospikeScan_Cursor(AerospikeScan * self, PyObject * args);
+
+/**
+ * Execute the scan and return an iterator that streams the records
+ * through a bounded queue.
+ *
+ *    for result in scan.iter_results():
+ *      print result
+ *
+ */
+PyObject * AerospikeScan_Iter_Results(AerospikeScan * self, PyObject * args, PyObject * kwds);
+
+/**
+ * Execute the scan and return an iterator of pyarrow.RecordBatch.
+ *
+ *    for batch in scan.to_arrow(batch_size=10000):
+ *        print batch.num_rows
+ *
+ */
+PyObject * AerospikeScan_To_Arrow(AerospikeScan * self, PyObject * args, PyObject * kwds);
+
 /**
  * Execute the scan in the background.
  *
@@ -98,4 +127,22 @@ AerospikeScan * AerospikeScan_Apply(AerospikeScan * self, PyObject * args, PyObj
  * Add an ops list to the scan.
  *
  */
-AerospikeScan * AerospikeScan_Add_Ops(AerospikeScan * self, PyObject * args, PyObject * kwds);
\ No newline at end of file
+AerospikeScan * AerospikeScan_Add_Ops(AerospikeScan * self, PyObject * args, PyObject * kwds);
+
+/*******************************************************************************
+ * COMMANDS
+ ******************************************************************************/
+
+/**
+ * Create the scan command run on a producer thread by iter_results() and
+ * to_arrow(). Returns NULL and populates err on failure.
+ */
+void * AerospikeScan_Command_New(AerospikeScan * self, as_error * err, PyObject * py_policy, PyObject * py_nodename);
+
+/**
+ * An AerospikeResultIterator_Execute running the scan command.
+ */
+void AerospikeScan_Command_Execute(void * command, as_error * err,
+		AerospikeResultIterator_Callback callback, void * udata);
+
+void AerospikeScan_Command_Destroy(void * command);
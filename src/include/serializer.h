@@ -20,6 +20,9 @@
 #include <stdbool.h>
 #include "aerospike/as_error.h"
 #include "types.h"
+
+#define READ_BLOB_AS_BYTEARRAY 0
+#define READ_BLOB_AS_MEMORYVIEW 1
 /*typedef struct {
     as_error error;
     PyObject * callback;
@@ -66,4 +69,34 @@ extern as_status deserialize_based_on_as_bytes_type(AerospikeClient * self,
         as_bytes  *bytes,
 		PyObject  **retval,
 		as_error  *error_p);
+
+/**
+ * Loads a buffer-protocol object into an as_bytes blob, wrapping its memory
+ * when static_pool lends buffers.
+ */
+as_status set_as_bytes_from_buffer(as_bytes **bytes,
+		PyObject *value,
+		as_static_pool *static_pool,
+		as_error *error_p);
+
+/**
+ * Whether value is a bytes, bytearray, memoryview or mmap object, the buffers stored as blobs.
+ */
+bool is_blob_buffer(PyObject * value);
+
+/**
+ * Whether values are handled by the python serializer or a built-in codec
+ * for serializer_policy.
+ */
+bool serializer_is_builtin(AerospikeClient * self, int32_t serializer_policy);
+
+/**
+ * Reads read_blob_as ('bytearray' or 'memoryview') from a read or batch policy.
+ */
+as_status read_blob_as_from_policy(as_error * err, PyObject * py_policy, int * blob_as);
+
+/**
+ * Sets how blobs are returned by the current thread, returns the previous value.
+ */
+int set_read_blob_as(int blob_as);
 #endif
@@ -17,6 +17,7 @@
 #pragma once
 
 #include <Python.h>
+#include <pthread.h>
 #include <stdbool.h>
 
 #include <aerospike/aerospike.h>
@@ -25,14 +26,14 @@
 #include <aerospike/as_scan.h>
 #include <aerospike/as_bin.h>
 #include <aerospike/as_operations.h>
+#include <aerospike/as_exp.h>
+#include <aerospike/as_policy.h>
 #include "pool.h"
 
 // Bin names can be of type Unicode in Python
 // DB supports 32767 maximum number of bins
 #define MAX_UNICODE_OBJECTS 32767
 extern int counter;
-extern PyObject *py_global_hosts;
-extern bool user_shm_key;
 
 typedef struct {
 	PyObject_HEAD
@@ -40,18 +41,17 @@ typedef struct {
 
 typedef struct {
 	PyObject_HEAD
-} AerospikeCDTWildcardObject;
+	uint8_t * data;
+	Py_ssize_t size;
+} AerospikeBlob;
 
 typedef struct {
 	PyObject_HEAD
-} AerospikeCDTInfObject;
+} AerospikeCDTWildcardObject;
 
 typedef struct {
 	PyObject_HEAD
-	aerospike * as;
-	int shm_key;
-	int ref_cnt;
-} AerospikeGlobalHosts;
+} AerospikeCDTInfObject;
 
 typedef struct {
 	as_error error;
@@ -70,10 +70,18 @@ typedef struct {
 	user_serializer_callback user_serializer_call_info;
 	user_serializer_callback user_deserializer_call_info;
 	uint8_t is_client_put_serializer;
+	int serializer_codec;
+	int cdt_mode;
 	uint8_t strict_types;
 	bool has_connected;
 	bool use_shared_connection;
+	bool user_shm_key;
 	uint8_t send_bool_as;
+	PyObject * expression_cache;
+	uint32_t expression_cache_size;
+	struct partition_map_s * partition_map;
+	struct info_cache_s * info_cache;
+	struct intern_table_s * intern_table;
 } AerospikeClient;
 
 typedef struct {
@@ -91,6 +99,7 @@ typedef struct {
 	as_scan scan;
 	as_vector * unicodeStrVector;
 	as_static_pool * static_pool;
+	PyObject * py_cursor;
 } AerospikeScan;
 
 typedef struct {
@@ -100,4 +109,81 @@ typedef struct {
 
 typedef struct {
 	PyDictObject dict;
-} AerospikeKeyOrderedDict;
\ No newline at end of file
+} AerospikeKeyOrderedDict;
+
+typedef struct {
+	PyObject_HEAD
+	as_exp * exp;
+} AerospikeExpression;
+
+enum Aerospike_policy_kind {
+	POLICY_KIND_APPLY,
+	POLICY_KIND_BATCH,
+	POLICY_KIND_OPERATE,
+	POLICY_KIND_QUERY,
+	POLICY_KIND_READ,
+	POLICY_KIND_REMOVE,
+	POLICY_KIND_SCAN,
+	POLICY_KIND_WRITE,
+	POLICY_KIND_COUNT
+};
+
+typedef union {
+	as_policy_apply apply;
+	as_policy_batch batch;
+	as_policy_operate operate;
+	as_policy_query query;
+	as_policy_read read;
+	as_policy_remove remove;
+	as_policy_scan scan;
+	as_policy_write write;
+} as_policy_any;
+
+typedef struct {
+	PyObject_HEAD
+	int kind;
+	PyObject * py_fields;
+	PyObject * py_expressions;
+	bool resolved;
+	as_policy_any config;
+	as_policy_any policy;
+} AerospikePolicy;
+
+typedef struct {
+	AerospikeClient client;
+	int wakeup_fds[2];
+	PyObject * py_completions;
+	PyObject * py_loop;
+	uint32_t in_flight;
+} AerospikeAioClient;
+
+typedef bool (*AerospikeResultIterator_Callback)(const as_val * val, void * udata);
+
+/*
+ * Runs a scan or a query, calling callback for each result. Called on the
+ * producer thread of an AerospikeResultIterator, without the GIL.
+ */
+typedef void (*AerospikeResultIterator_Execute)(void * command, as_error * err,
+		AerospikeResultIterator_Callback callback, void * udata);
+
+typedef struct {
+	PyObject_HEAD
+	AerospikeClient * client;
+	PyObject * py_owner;
+	void * command;
+	AerospikeResultIterator_Execute execute;
+	void (*destroy)(void * command);
+	pthread_t thread;
+	bool started;
+	bool joining;
+	pthread_mutex_t lock;
+	pthread_cond_t not_empty;
+	pthread_cond_t not_full;
+	PyObject ** queue;
+	uint32_t capacity;
+	uint32_t head;
+	uint32_t count;
+	bool done;
+	bool cancelled;
+	as_error err;
+} AerospikeResultIterator;
@@ -33,10 +33,16 @@
 #include "module_functions.h"
 #include "nullobject.h"
 #include "cdt_types.h"
+#include "expression.h"
+#include "key_batch.h"
+#include "operation_list.h"
+#include "policy_types.h"
+#include "aio.h"
+#include "result_iterator.h"
+#include "blob.h"
+#include "cdt_lazy.h"
 
-PyObject *py_global_hosts;
 int counter = 0xA8000000;
-bool user_shm_key = false;
 
 PyDoc_STRVAR(client_doc,
 "client(config) -> client object\n\
@@ -50,6 +56,13 @@ config = {\n\
 }\n\
 client = aerospike.client(config)");
 
+PyDoc_STRVAR(shared_client_doc,
+"shared_client(config[, username, password]) -> connected client object\n\
+\n\
+Creates a new instance of the Client class with use_shared_connection set, and connects it.\n\
+Clients with the same hosts, user and TLS settings share one connection to the cluster\n\
+within the process, until the last of them is closed.");
+
 static PyMethodDef Aerospike_Methods[] = {
 
 	//Serialization
@@ -65,6 +78,8 @@ static PyMethodDef Aerospike_Methods[] = {
 
 	{"client",		(PyCFunction) AerospikeClient_New,              METH_VARARGS | METH_KEYWORDS,
 		client_doc},
+	{"shared_client",	(PyCFunction) AerospikeClient_New_Shared,   METH_VARARGS | METH_KEYWORDS,
+		shared_client_doc},
 	{"set_log_level",	(PyCFunction)Aerospike_Set_Log_Level,       METH_VARARGS | METH_KEYWORDS,
 		"Sets the log level"},
 	{"set_log_handler", (PyCFunction)Aerospike_Set_Log_Handler,     METH_VARARGS | METH_KEYWORDS,
@@ -78,6 +93,9 @@ static PyMethodDef Aerospike_Methods[] = {
 	{"calc_digest",
 		(PyCFunction)Aerospike_Calc_Digest,                         METH_VARARGS | METH_KEYWORDS,
 		"Calculate the digest of a key"},
+	{"calc_digests",
+		(PyCFunction)Aerospike_Calc_Digests,                        METH_VARARGS | METH_KEYWORDS,
+		"Calculate the digests and partition ids of many keys"},
 	{NULL}
 };
 
@@ -106,8 +124,6 @@ MOD_INIT(aerospike)
 
 	MOD_DEF(aerospike, "aerospike", "Aerospike Python Client", Aerospike_Methods)
 
-	py_global_hosts = PyDict_New();
-
 	PyModule_AddStringConstant(aerospike, "__version__", version);
 
 	PyObject * exception = AerospikeException_New();
@@ -150,6 +166,12 @@ MOD_INIT(aerospike)
 	Py_INCREF(predexps);
 	PyModule_AddObject(aerospike, "predexp", predexps);
 
+	PyObject * aio = AerospikeAio_New();
+	Py_INCREF(aio);
+	PyModule_AddObject(aerospike, "aio", aio);
+	// Allow "import aerospike.aio" as well as "from aerospike import aio"
+	PyDict_SetItemString(PyImport_GetModuleDict(), "aerospike.aio", aio);
+
 	PyTypeObject * geospatial = AerospikeGeospatial_Ready();
 	Py_INCREF(geospatial);
 	PyModule_AddObject(aerospike, "GeoJSON", (PyObject *) geospatial);
@@ -166,5 +188,48 @@ MOD_INIT(aerospike)
 	Py_INCREF(infinite_object);
 	PyModule_AddObject(aerospike, "CDTInfinite", (PyObject *) infinite_object);
 
+	PyTypeObject * expression = AerospikeExpression_Ready();
+	Py_INCREF(expression);
+	PyModule_AddObject(aerospike, "Expression", (PyObject *) expression);
+
+	PyTypeObject * lazy_list = AerospikeLazyList_Ready();
+	Py_INCREF(lazy_list);
+	PyModule_AddObject(aerospike, "LazyList", (PyObject *) lazy_list);
+
+	PyTypeObject * lazy_map = AerospikeLazyMap_Ready();
+	Py_INCREF(lazy_map);
+	PyModule_AddObject(aerospike, "LazyMap", (PyObject *) lazy_map);
+
+	AerospikeLazyCDT_Register();
+
+	PyTypeObject * key_batch = AerospikeKeyBatch_Ready();
+	Py_INCREF(key_batch);
+	PyModule_AddObject(aerospike, "KeyBatch", (PyObject *) key_batch);
+
+	PyTypeObject * operation_list = AerospikeOperationList_Ready();
+	Py_INCREF(operation_list);
+	PyModule_AddObject(aerospike, "OperationList", (PyObject *) operation_list);
+
+	PyTypeObject * placeholder = AerospikePlaceholder_Ready();
+	Py_INCREF(placeholder);
+	PyModule_AddObject(aerospike, "Placeholder", (PyObject *) placeholder);
+
+	PyTypeObject * policy = AerospikePolicy_Ready();
+	Py_INCREF(policy);
+	PyModule_AddObject(aerospike, "Policy", (PyObject *) policy);
+
+	for (i = 0; i < POLICY_KIND_COUNT; i++) {
+		PyTypeObject * policy_kind = AerospikePolicy_Kind_Ready(i);
+		Py_INCREF(policy_kind);
+		PyModule_AddObject(aerospike, AerospikePolicy_Kind_Name(i), (PyObject *) policy_kind);
+	}
+
+	PyTypeObject * result_iterator = AerospikeResultIterator_Ready();
+	Py_INCREF(result_iterator);
+	PyModule_AddObject(aerospike, "ResultIterator", (PyObject *) result_iterator);
+
+	// Only used as the owner of memoryviews, not exported.
+	AerospikeBlob_Ready();
+
 	return MOD_SUCCESS_VAL(aerospike);
 }
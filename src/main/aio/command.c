@@ -0,0 +1,245 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <unistd.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_event.h>
+#include <aerospike/as_key.h>
+
+#include "aio.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+
+static PyObject * py_get_running_loop = NULL;
+
+/*******************************************************************************
+ * HELPERS
+ ******************************************************************************/
+
+static PyObject * get_running_loop(void)
+{
+	if (!py_get_running_loop) {
+		PyObject * py_asyncio = PyImport_ImportModule("asyncio");
+		if (!py_asyncio) {
+			return NULL;
+		}
+		py_get_running_loop = PyObject_GetAttrString(py_asyncio, "get_running_loop");
+		if (!py_get_running_loop) {
+			// Python 3.6 only has get_event_loop()
+			PyErr_Clear();
+			py_get_running_loop = PyObject_GetAttrString(py_asyncio, "get_event_loop");
+		}
+		Py_DECREF(py_asyncio);
+		if (!py_get_running_loop) {
+			return NULL;
+		}
+	}
+
+	return PyObject_CallObject(py_get_running_loop, NULL);
+}
+
+/**
+ * Move the wakeup fd of the client to py_loop. The loop calls the client's
+ * _wakeup() method whenever a listener signals the fd.
+ */
+static int watch_wakeup_fd(AerospikeAioClient * self, PyObject * py_loop)
+{
+	PyObject * py_callback = NULL;
+	PyObject * py_ret = NULL;
+
+	if (self->py_loop) {
+		py_ret = PyObject_CallMethod(self->py_loop, "remove_reader", "(i)", self->wakeup_fds[0]);
+		if (!py_ret) {
+			// The previous loop may already be closed
+			PyErr_Clear();
+		}
+		Py_XDECREF(py_ret);
+		Py_CLEAR(self->py_loop);
+	}
+
+	py_callback = PyObject_GetAttrString((PyObject *) self, "_wakeup");
+	if (!py_callback) {
+		return -1;
+	}
+
+	py_ret = PyObject_CallMethod(py_loop, "add_reader", "(iO)", self->wakeup_fds[0], py_callback);
+	Py_DECREF(py_callback);
+	if (!py_ret) {
+		return -1;
+	}
+	Py_DECREF(py_ret);
+
+	Py_INCREF(py_loop);
+	self->py_loop = py_loop;
+	return 0;
+}
+
+static PyObject * error_to_exception(as_error * err, PyObject * py_key)
+{
+	PyObject * py_err = NULL;
+	PyObject * py_exception = NULL;
+
+	error_to_pyobject(err, &py_err);
+	PyObject * exception_type = raise_exception(err);
+	py_exception = new_exception_with_attrs(exception_type, py_err, "key", py_key, NULL);
+	Py_DECREF(py_err);
+
+	return py_exception;
+}
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+as_status AerospikeAio_Create_Event_Loops(as_error * err, uint32_t count)
+{
+	as_error_reset(err);
+
+	if (as_event_loop_size > 0) {
+		return err->code;
+	}
+
+	return as_create_event_loops(err, NULL, count, NULL);
+}
+
+PyObject * AerospikeAio_Create_Future(AerospikeAioClient * self)
+{
+	PyObject * py_future = NULL;
+	PyObject * py_loop = get_running_loop();
+
+	if (!py_loop) {
+		return NULL;
+	}
+
+	if (py_loop != self->py_loop) {
+		if (self->in_flight > 0) {
+			as_error err;
+			as_error_init(&err);
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "aio.Client has commands in flight on another event loop");
+			Py_DECREF(py_loop);
+			return AerospikeAio_Raise(&err, NULL);
+		}
+		if (watch_wakeup_fd(self, py_loop) != 0) {
+			Py_DECREF(py_loop);
+			return NULL;
+		}
+	}
+
+	py_future = PyObject_CallMethod(py_loop, "create_future", NULL);
+	Py_DECREF(py_loop);
+
+	return py_future;
+}
+
+AerospikeAioCommand * AerospikeAio_Command_New(AerospikeAioClient * self, PyObject * py_future, PyObject * py_key)
+{
+	AerospikeAioCommand * cmd = (AerospikeAioCommand *) calloc(1, sizeof(AerospikeAioCommand));
+
+	if (!cmd) {
+		return NULL;
+	}
+
+	Py_INCREF(self);
+	cmd->client = self;
+	Py_INCREF(py_future);
+	cmd->py_future = py_future;
+	Py_XINCREF(py_key);
+	cmd->py_key = py_key;
+	as_error_init(&cmd->err);
+
+	self->in_flight++;
+	return cmd;
+}
+
+void AerospikeAio_Command_Complete(AerospikeAioCommand * cmd, PyObject * py_result, as_error * err)
+{
+	AerospikeAioClient * self = cmd->client;
+	PyObject * py_exception = NULL;
+	PyObject * py_completion = NULL;
+
+	if (err && err->code != AEROSPIKE_OK) {
+		Py_CLEAR(py_result);
+		py_exception = error_to_exception(err, cmd->py_key);
+	}
+
+	if (PyErr_Occurred()) {
+		// A conversion raised, hand that exception to the future instead
+		PyObject * py_type = NULL;
+		PyObject * py_traceback = NULL;
+		Py_CLEAR(py_result);
+		Py_CLEAR(py_exception);
+		PyErr_Fetch(&py_type, &py_exception, &py_traceback);
+		PyErr_NormalizeException(&py_type, &py_exception, &py_traceback);
+		Py_XDECREF(py_type);
+		Py_XDECREF(py_traceback);
+	}
+
+	py_completion = Py_BuildValue("(OOO)", cmd->py_future,
+			py_result ? py_result : Py_None, py_exception ? py_exception : Py_None);
+	Py_XDECREF(py_result);
+	Py_XDECREF(py_exception);
+
+	if (py_completion) {
+		// Only the first pending completion needs to wake the asyncio loop up
+		bool wakeup = PyList_Size(self->py_completions) == 0;
+		PyList_Append(self->py_completions, py_completion);
+		Py_DECREF(py_completion);
+		if (wakeup) {
+			uint64_t one = 1;
+			if (write(self->wakeup_fds[1], &one, sizeof(one)) < 0) {
+				// The fd is non blocking, a full pipe already has a wakeup pending
+			}
+		}
+	}
+	PyErr_Clear();
+
+	AerospikeAio_Command_Destroy(cmd);
+}
+
+void AerospikeAio_Command_Destroy(AerospikeAioCommand * cmd)
+{
+	AerospikeAioClient * self = cmd->client;
+
+	if (cmd->key_initialised) {
+		as_key_destroy(&cmd->key);
+	}
+
+	Py_XDECREF(cmd->py_results);
+	Py_XDECREF(cmd->py_owner);
+	Py_XDECREF(cmd->py_key);
+	Py_XDECREF(cmd->py_future);
+	free(cmd);
+
+	self->in_flight--;
+	Py_DECREF(self);
+}
+
+PyObject * AerospikeAio_Raise(as_error * err, PyObject * py_key)
+{
+	PyObject * py_err = NULL;
+	error_to_pyobject(err, &py_err);
+	PyObject *exception_type = raise_exception(err);
+	raise_exception_with_attrs(exception_type, py_err, "key", py_key, NULL);
+	Py_DECREF(py_err);
+	return NULL;
+}
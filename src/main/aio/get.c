@@ -0,0 +1,174 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_event.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_record.h>
+
+#include "aio.h"
+#include "client.h"
+#include "conversions.h"
+#include "policy.h"
+
+/**
+ *******************************************************************************************************
+ * Called by an event loop thread once the record has been read.
+ *******************************************************************************************************
+ */
+static void get_listener(as_error * err, as_record * rec, void * udata, as_event_loop * event_loop)
+{
+	AerospikeAioCommand * cmd = (AerospikeAioCommand *) udata;
+	PyObject * py_rec = NULL;
+
+	PyGILState_STATE gstate;
+	gstate = PyGILState_Ensure();
+
+	if (!err) {
+		err = &cmd->err;
+		if (record_to_pyobject((AerospikeClient *) cmd->client, err, rec, &cmd->key, &py_rec) == AEROSPIKE_OK &&
+				!cmd->send_key) {
+			// Same as the synchronous get, the primary key is only
+			// returned when the policy sends it.
+			PyObject * py_key = PyTuple_GetItem(py_rec, 0);
+			Py_INCREF(Py_None);
+			PyTuple_SetItem(py_key, 2, Py_None);
+		}
+	}
+
+	AerospikeAio_Command_Complete(cmd, py_rec, err);
+
+	PyGILState_Release(gstate);
+}
+
+/**
+ *******************************************************************************************************
+ * Reads a record from the Aerospike DB without blocking.
+ *
+ * @param self                  AerospikeAioClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a future resolved with a tuple of key, meta and bins.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeAioClient_Get(AerospikeAioClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_key = NULL;
+	PyObject * py_policy = NULL;
+
+	// Python Return Value
+	PyObject * py_future = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_read read_policy;
+	as_policy_read * read_policy_p = NULL;
+	AerospikeAioCommand * cmd = NULL;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp* exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list* predexp_list_p = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"key", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|O:get", kwlist,
+			&py_key, &py_policy) == false) {
+		return NULL;
+	}
+
+	// Initialize error
+	as_error_init(&err);
+
+	if (!self->client.as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->client.is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	py_future = AerospikeAio_Create_Future(self);
+	if (!py_future) {
+		return NULL;
+	}
+
+	cmd = AerospikeAio_Command_New(self, py_future, py_key);
+	if (!cmd) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Failed to allocate the command");
+		goto CLEANUP;
+	}
+
+	// Convert python key object to as_key
+	pyobject_to_key(&err, py_key, &cmd->key);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+	cmd->key_initialised = true;
+
+	// Convert python policy object to as_policy_read
+	pyobject_to_policy_read((AerospikeClient *) self, &err, py_policy, &read_policy, &read_policy_p,
+			&self->client.as->config.policies.read, &predexp_list, &predexp_list_p, &exp_list, &exp_list_p);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+	// Without a policy the command runs with the client's default one
+	cmd->send_key = (read_policy_p ? read_policy_p : &self->client.as->config.policies.read)->key
+			!= AS_POLICY_KEY_DIGEST;
+
+	// The listener needs the GIL, so it cannot run before this returns
+	if (aerospike_key_get_async(self->client.as, &err, read_policy_p, &cmd->key,
+			get_listener, cmd, NULL, NULL) == AEROSPIKE_OK) {
+		cmd = NULL;
+	}
+
+CLEANUP:
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	if (cmd) {
+		AerospikeAio_Command_Destroy(cmd);
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_XDECREF(py_future);
+		return AerospikeAio_Raise(&err, py_key);
+	}
+
+	return py_future;
+}
@@ -0,0 +1,202 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_batch.h>
+#include <aerospike/as_batch.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_event.h>
+#include <aerospike/as_key.h>
+
+#include "aio.h"
+#include "client.h"
+#include "conversions.h"
+#include "policy.h"
+
+/**
+ *******************************************************************************************************
+ * Called by an event loop thread once every node answered the batch.
+ * The records are owned by the listener.
+ *******************************************************************************************************
+ */
+static void get_many_listener(as_error * err, as_batch_read_records * records, void * udata, as_event_loop * event_loop)
+{
+	AerospikeAioCommand * cmd = (AerospikeAioCommand *) udata;
+	PyObject * py_recs = NULL;
+
+	PyGILState_STATE gstate;
+	gstate = PyGILState_Ensure();
+
+	if (!err) {
+		err = &cmd->err;
+		batch_read_records_to_pyobject((AerospikeClient *) cmd->client, err, records, &py_recs);
+	}
+
+	// Keys may point into the Python key objects, free them before the
+	// command releases its reference.
+	as_batch_read_destroy(records);
+
+	AerospikeAio_Command_Complete(cmd, py_recs, err);
+
+	PyGILState_Release(gstate);
+}
+
+/**
+ *******************************************************************************************************
+ * Reads a batch of records from the Aerospike DB without blocking.
+ *
+ * @param self                  AerospikeAioClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a future resolved with a list of (key, meta, bins) tuples.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeAioClient_Get_Many(AerospikeAioClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_keys = NULL;
+	PyObject * py_policy = NULL;
+
+	// Python Return Value
+	PyObject * py_future = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_batch batch_policy;
+	as_policy_batch * batch_policy_p = NULL;
+	as_batch_read_records * records = NULL;
+	AerospikeAioCommand * cmd = NULL;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp* exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list* predexp_list_p = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"keys", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|O:get_many", kwlist,
+			&py_keys, &py_policy) == false) {
+		return NULL;
+	}
+
+	// Initialize error
+	as_error_init(&err);
+
+	if (!self->client.as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->client.is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (!PyList_Check(py_keys) && !PyTuple_Check(py_keys)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Keys should be specified as a list or tuple.");
+		goto CLEANUP;
+	}
+
+	py_future = AerospikeAio_Create_Future(self);
+	if (!py_future) {
+		return NULL;
+	}
+
+	Py_ssize_t size = PySequence_Size(py_keys);
+	if (size == 0) {
+		PyObject * py_ret = PyObject_CallMethod(py_future, "set_result", "(N)", PyList_New(0));
+		if (!py_ret) {
+			Py_DECREF(py_future);
+			return NULL;
+		}
+		Py_DECREF(py_ret);
+		return py_future;
+	}
+
+	// Convert python policy object to as_policy_batch
+	pyobject_to_policy_batch((AerospikeClient *) self, &err, py_policy, &batch_policy, &batch_policy_p,
+			&self->client.as->config.policies.batch, &predexp_list, &predexp_list_p, &exp_list, &exp_list_p);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	cmd = AerospikeAio_Command_New(self, py_future, py_keys);
+	if (!cmd) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Failed to allocate the command");
+		goto CLEANUP;
+	}
+
+	records = as_batch_read_create((uint32_t) size);
+
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject * py_key = PySequence_Fast_GET_ITEM(py_keys, i);
+
+		if (!PyTuple_Check(py_key)) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "Key should be a tuple.");
+			goto CLEANUP;
+		}
+
+		as_batch_read_record * record = as_batch_read_reserve(records);
+		record->read_all_bins = true;
+
+		if (pyobject_to_key(&err, py_key, &record->key) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	// From here on the listener owns the records
+	if (aerospike_batch_read_async(self->client.as, &err, batch_policy_p, records,
+			get_many_listener, cmd, NULL) == AEROSPIKE_OK) {
+		records = NULL;
+		cmd = NULL;
+	}
+
+CLEANUP:
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	if (records) {
+		as_batch_read_destroy(records);
+	}
+
+	if (cmd) {
+		AerospikeAio_Command_Destroy(cmd);
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_XDECREF(py_future);
+		return AerospikeAio_Raise(&err, py_keys);
+	}
+
+	return py_future;
+}
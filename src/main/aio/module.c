@@ -0,0 +1,41 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+
+#include "aio.h"
+#include "macros.h"
+
+static PyMethodDef AerospikeAio_Methods[] = {
+	{NULL}
+};
+
+PyObject * AerospikeAio_New(void)
+{
+	PyObject * module;
+	MOD_DEF(module, "aerospike.aio", "asyncio Aerospike client", AerospikeAio_Methods);
+
+	PyTypeObject * client = AerospikeAioClient_Ready();
+	Py_INCREF(client);
+	PyModule_AddObject(module, "Client", (PyObject *) client);
+
+	PyTypeObject * query = AerospikeAioQuery_Ready();
+	Py_INCREF(query);
+	PyModule_AddObject(module, "Query", (PyObject *) query);
+
+	return module;
+}
@@ -0,0 +1,235 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_event.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_operations.h>
+#include <aerospike/as_record.h>
+
+#include "aio.h"
+#include "cdt_operation_utils.h"
+#include "client.h"
+#include "conversions.h"
+#include "operate.h"
+#include "operation_list.h"
+#include "policy.h"
+
+/**
+ *******************************************************************************************************
+ * Called by an event loop thread once the operations have been applied.
+ *******************************************************************************************************
+ */
+static void operate_listener(as_error * err, as_record * rec, void * udata, as_event_loop * event_loop)
+{
+	AerospikeAioCommand * cmd = (AerospikeAioCommand *) udata;
+	PyObject * py_rec = NULL;
+
+	PyGILState_STATE gstate;
+	gstate = PyGILState_Ensure();
+
+	if (!err) {
+		err = &cmd->err;
+		if (rec) {
+			record_to_pyobject((AerospikeClient *) cmd->client, err, rec, &cmd->key, &py_rec);
+		}
+		else {
+			py_rec = PyLong_FromLong(0);
+		}
+	}
+
+	AerospikeAio_Command_Complete(cmd, py_rec, err);
+
+	PyGILState_Release(gstate);
+}
+
+/**
+ *******************************************************************************************************
+ * Applies multiple operations to a single record without blocking.
+ *
+ * @param self                  AerospikeAioClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a future resolved with a tuple of key, meta and bins.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeAioClient_Operate(AerospikeAioClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_key = NULL;
+	PyObject * py_list = NULL;
+	PyObject * py_meta = NULL;
+	PyObject * py_policy = NULL;
+
+	// Python Return Value
+	PyObject * py_future = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_operate operate_policy;
+	as_policy_operate * operate_policy_p = NULL;
+	as_operations ops;
+	bool ops_initialised = false;
+	long operation;
+	long return_type = -1;
+	AerospikeAioCommand * cmd = NULL;
+	as_vector * unicodeStrVector = NULL;
+
+	// Compiled operations of an OperationList, shared by ops.
+	PyObject * py_compiled = NULL;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp* exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list* predexp_list_p = NULL;
+
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"key", "list", "meta", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:operate", kwlist,
+			&py_key, &py_list, &py_meta, &py_policy) == false) {
+		return NULL;
+	}
+
+	// Initialize error
+	as_error_init(&err);
+
+	if (!self->client.as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->client.is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (!PyList_Check(py_list) && !AerospikeOperationList_Check(py_list)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Operations should be of type list");
+		goto CLEANUP;
+	}
+
+	py_future = AerospikeAio_Create_Future(self);
+	if (!py_future) {
+		return NULL;
+	}
+
+	cmd = AerospikeAio_Command_New(self, py_future, py_key);
+	if (!cmd) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Failed to allocate the command");
+		goto CLEANUP;
+	}
+
+	// Convert python key object to as_key
+	pyobject_to_key(&err, py_key, &cmd->key);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+	cmd->key_initialised = true;
+
+	// Convert python policy object to as_policy_operate
+	pyobject_to_policy_operate((AerospikeClient *) self, &err, py_policy, &operate_policy, &operate_policy_p,
+			&self->client.as->config.policies.operate, &predexp_list, &predexp_list_p, &exp_list, &exp_list_p);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	Py_ssize_t size = PyList_Check(py_list) ? PyList_Size(py_list) : operation_list_size(py_list);
+	as_operations_init(&ops, size);
+	ops_initialised = true;
+	unicodeStrVector = as_vector_create(sizeof(char *), 128);
+
+	if (py_meta) {
+		if (check_for_meta(py_meta, &ops, &err) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	if (AerospikeOperationList_Check(py_list)) {
+		if (operation_list_add_ops((AerospikeClient *) self, &err, py_list, unicodeStrVector, &static_pool, &ops,
+				&py_compiled) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+	else {
+		for (Py_ssize_t i = 0; i < size; i++) {
+			PyObject * py_val = PyList_GetItem(py_list, i);
+
+			if (is_operation(py_val)) {
+				if (add_op((AerospikeClient *) self, &err, py_val, unicodeStrVector, &static_pool, &ops,
+						&operation, &return_type) != AEROSPIKE_OK) {
+					goto CLEANUP;
+				}
+			}
+		}
+	}
+
+	// The operations are serialized by the call, so they can be released right after
+	if (aerospike_key_operate_async(self->client.as, &err, operate_policy_p, &cmd->key, &ops,
+			operate_listener, cmd, NULL, NULL) == AEROSPIKE_OK) {
+		cmd = NULL;
+	}
+
+CLEANUP:
+
+	if (unicodeStrVector) {
+		for (unsigned int i = 0; i < unicodeStrVector->size; i++) {
+			free(as_vector_get_ptr(unicodeStrVector, i));
+		}
+		as_vector_destroy(unicodeStrVector);
+	}
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	if (ops_initialised) {
+		as_operations_destroy(&ops);
+	}
+	POOL_DESTROY(&static_pool);
+	Py_XDECREF(py_compiled);
+
+	if (cmd) {
+		AerospikeAio_Command_Destroy(cmd);
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_XDECREF(py_future);
+		return AerospikeAio_Raise(&err, py_key);
+	}
+
+	return py_future;
+}
@@ -0,0 +1,187 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_event.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_record.h>
+
+#include "aio.h"
+#include "client.h"
+#include "conversions.h"
+#include "policy.h"
+#include "serializer.h"
+
+/**
+ *******************************************************************************************************
+ * Called by an event loop thread once the record has been written.
+ *******************************************************************************************************
+ */
+static void put_listener(as_error * err, void * udata, as_event_loop * event_loop)
+{
+	AerospikeAioCommand * cmd = (AerospikeAioCommand *) udata;
+
+	PyGILState_STATE gstate;
+	gstate = PyGILState_Ensure();
+
+	AerospikeAio_Command_Complete(cmd, err ? NULL : PyLong_FromLong(0), err);
+
+	PyGILState_Release(gstate);
+}
+
+/**
+ *******************************************************************************************************
+ * Writes a record to the Aerospike DB without blocking.
+ *
+ * @param self                  AerospikeAioClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a future resolved with 0 once the record is written.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeAioClient_Put(AerospikeAioClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_key = NULL;
+	PyObject * py_bins = NULL;
+	PyObject * py_meta = NULL;
+	PyObject * py_policy = NULL;
+	PyObject * py_serializer_option = NULL;
+	long serializer_option = SERIALIZER_PYTHON;
+
+	// Python Return Value
+	PyObject * py_future = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_write write_policy;
+	as_policy_write * write_policy_p = NULL;
+	as_record rec;
+	AerospikeAioCommand * cmd = NULL;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp* exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list* predexp_list_p = NULL;
+
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+	static_pool.lend_buffers = true;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"key", "bins", "meta", "policy", "serializer", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|OOO:put", kwlist,
+			&py_key, &py_bins, &py_meta, &py_policy, &py_serializer_option) == false) {
+		return NULL;
+	}
+
+	if (py_serializer_option) {
+		if (PyInt_Check(py_serializer_option) || PyLong_Check(py_serializer_option)) {
+			self->client.is_client_put_serializer = true;
+			serializer_option = PyLong_AsLong(py_serializer_option);
+		}
+	} else {
+		self->client.is_client_put_serializer = false;
+	}
+
+	// Initialize error and record
+	as_error_init(&err);
+	as_record_init(&rec, 0);
+
+	if (!self->client.as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->client.is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	py_future = AerospikeAio_Create_Future(self);
+	if (!py_future) {
+		as_record_destroy(&rec);
+		return NULL;
+	}
+
+	cmd = AerospikeAio_Command_New(self, py_future, py_key);
+	if (!cmd) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Failed to allocate the command");
+		goto CLEANUP;
+	}
+
+	// Convert python key object to as_key
+	pyobject_to_key(&err, py_key, &cmd->key);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+	cmd->key_initialised = true;
+
+	// Convert python bins and metadata objects to as_record
+	pyobject_to_record((AerospikeClient *) self, &err, py_bins, py_meta, &rec, serializer_option, &static_pool);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	// Convert python policy object to as_policy_write
+	pyobject_to_policy_write((AerospikeClient *) self, &err, py_policy, &write_policy, &write_policy_p,
+			&self->client.as->config.policies.write, &predexp_list, &predexp_list_p, &exp_list, &exp_list_p);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	// The record is serialized by the call, so it can be released right after
+	if (aerospike_key_put_async(self->client.as, &err, write_policy_p, &cmd->key, &rec,
+			put_listener, cmd, NULL, NULL) == AEROSPIKE_OK) {
+		cmd = NULL;
+	}
+
+CLEANUP:
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	as_record_destroy(&rec);
+	POOL_DESTROY(&static_pool);
+
+	if (cmd) {
+		AerospikeAio_Command_Destroy(cmd);
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_XDECREF(py_future);
+		return AerospikeAio_Raise(&err, py_key);
+	}
+
+	return py_future;
+}
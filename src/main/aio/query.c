@@ -0,0 +1,297 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_query.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_event.h>
+#include <aerospike/as_query.h>
+#include <aerospike/as_record.h>
+
+#include "aio.h"
+#include "client.h"
+#include "conversions.h"
+#include "policy.h"
+#include "query.h"
+
+/*******************************************************************************
+ * PYTHON DOC METHODS
+ ******************************************************************************/
+
+PyDoc_STRVAR(results_doc,
+"results([policy[, options]]) -> awaitable of [(key, meta, bins)]\n\
+\n\
+Run the query on the event loops, and return an awaitable of the list of records.");
+
+/*******************************************************************************
+ * LISTENER
+ ******************************************************************************/
+
+/**
+ *******************************************************************************************************
+ * Called by an event loop thread for each record of the query, and once more
+ * with a NULL record when every node is done.
+ *******************************************************************************************************
+ */
+static bool query_listener(as_error * err, as_record * rec, void * udata, as_event_loop * event_loop)
+{
+	AerospikeAioCommand * cmd = (AerospikeAioCommand *) udata;
+	PyObject * py_results = NULL;
+	PyObject * py_rec = NULL;
+
+	PyGILState_STATE gstate;
+	gstate = PyGILState_Ensure();
+
+	if (err || !rec) {
+		py_results = cmd->py_results;
+		cmd->py_results = NULL;
+		AerospikeAio_Command_Complete(cmd, py_results, err ? err : &cmd->err);
+		PyGILState_Release(gstate);
+		return false;
+	}
+
+	// Once a record failed to convert the remaining ones are skipped,
+	// the future gets the error when the query ends.
+	if (cmd->err.code == AEROSPIKE_OK &&
+			record_to_pyobject((AerospikeClient *) cmd->client, &cmd->err, rec, &rec->key, &py_rec) == AEROSPIKE_OK) {
+		PyList_Append(cmd->py_results, py_rec);
+		Py_DECREF(py_rec);
+	}
+
+	PyGILState_Release(gstate);
+	return true;
+}
+
+/*******************************************************************************
+ * OPERATIONS
+ ******************************************************************************/
+
+/**
+ *******************************************************************************************************
+ * Runs the query without blocking.
+ *
+ * @param self                  AerospikeQuery object created by an aio.Client
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a future resolved with a list of (key, meta, bins) tuples.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeAioQuery_Results(AerospikeQuery * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_policy = NULL;
+	PyObject * py_options = NULL;
+
+	// Python Return Value
+	PyObject * py_future = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_query query_policy;
+	as_policy_query * query_policy_p = NULL;
+	AerospikeAioClient * client = (AerospikeAioClient *) self->client;
+	AerospikeAioCommand * cmd = NULL;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp* exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list* predexp_list_p = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"policy", "options", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|OO:results", kwlist,
+			&py_policy, &py_options) == false) {
+		return NULL;
+	}
+
+	// Initialize error
+	as_error_init(&err);
+
+	if (!client || !client->client.as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!client->client.is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (self->query.apply.function[0]) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Aggregation queries are not supported by aerospike.aio");
+		goto CLEANUP;
+	}
+
+	// Convert python policy object to as_policy_query
+	pyobject_to_policy_query((AerospikeClient *) client, &err, py_policy, &query_policy, &query_policy_p,
+			&client->client.as->config.policies.query, &predexp_list, &predexp_list_p, &exp_list, &exp_list_p);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (set_query_options(&err, py_options, &self->query) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	py_future = AerospikeAio_Create_Future(client);
+	if (!py_future) {
+		goto CLEANUP;
+	}
+
+	cmd = AerospikeAio_Command_New(client, py_future, NULL);
+	if (!cmd) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Failed to allocate the command");
+		goto CLEANUP;
+	}
+
+	// The query keeps the predicate values the command refers to alive
+	Py_INCREF(self);
+	cmd->py_owner = (PyObject *) self;
+	cmd->py_results = PyList_New(0);
+
+	if (aerospike_query_async(client->client.as, &err, query_policy_p, &self->query,
+			query_listener, cmd, NULL) == AEROSPIKE_OK) {
+		cmd = NULL;
+	}
+
+CLEANUP:
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	if (cmd) {
+		AerospikeAio_Command_Destroy(cmd);
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_XDECREF(py_future);
+		return AerospikeAio_Raise(&err, NULL);
+	}
+
+	return py_future;
+}
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+static PyMethodDef AerospikeAioQuery_Type_Methods[] = {
+
+	{"results",	(PyCFunction) AerospikeAioQuery_Results,	METH_VARARGS | METH_KEYWORDS,
+				results_doc},
+
+	{NULL}
+};
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeAioQuery_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	"aerospike.aio.Query",              // tp_name
+	sizeof(AerospikeQuery),             // tp_basicsize
+	0,                                  // tp_itemsize
+	0,                                  // tp_dealloc
+	0,                                  // tp_print
+	0,                                  // tp_getattr
+	0,                                  // tp_setattr
+	0,                                  // tp_compare
+	0,                                  // tp_repr
+	0,                                  // tp_as_number
+	0,                                  // tp_as_sequence
+	0,                                  // tp_as_mapping
+	0,                                  // tp_hash
+	0,                                  // tp_call
+	0,                                  // tp_str
+	0,                                  // tp_getattro
+	0,                                  // tp_setattro
+	0,                                  // tp_as_buffer
+	Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
+	                                    // tp_flags
+	"A query created by aerospike.aio.Client.query(), whose results() is awaitable.\n",
+	                                    // tp_doc
+	0,                                  // tp_traverse
+	0,                                  // tp_clear
+	0,                                  // tp_richcompare
+	0,                                  // tp_weaklistoffset
+	0,                                  // tp_iter
+	0,                                  // tp_iternext
+	AerospikeAioQuery_Type_Methods,     // tp_methods
+	0,                                  // tp_members
+	0,                                  // tp_getset
+	0,                                  // tp_base
+	0,                                  // tp_dict
+	0,                                  // tp_descr_get
+	0,                                  // tp_descr_set
+	0,                                  // tp_dictoffset
+	0,                                  // tp_init
+	0,                                  // tp_alloc
+	0,                                  // tp_new
+	0,                                  // tp_free
+	0,                                  // tp_is_gc
+	0                                   // tp_bases
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeAioQuery_Ready()
+{
+	AerospikeAioQuery_Type.tp_base = AerospikeQuery_Ready();
+	return PyType_Ready(&AerospikeAioQuery_Type) == 0 ? &AerospikeAioQuery_Type : NULL;
+}
+
+/**
+ *******************************************************************************************************
+ * Creates an aio.Query bound to the client.
+ *
+ * @param self                  AerospikeAioClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an aerospike.aio.Query.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeAioClient_Query(AerospikeAioClient * self, PyObject * args, PyObject * kwds)
+{
+	AerospikeQuery * query = (AerospikeQuery *) PyObject_Call((PyObject *) &AerospikeAioQuery_Type, args, kwds);
+
+	if (query) {
+		Py_INCREF(self);
+		query->client = (AerospikeClient *) self;
+	}
+
+	return (PyObject *) query;
+}
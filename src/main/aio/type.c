@@ -0,0 +1,363 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <structmember.h>
+#include <stdbool.h>
+#include <fcntl.h>
+#include <unistd.h>
+#if defined(__linux__)
+#include <sys/eventfd.h>
+#endif
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_event.h>
+
+#include "aio.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+
+static PyTypeObject * AerospikeAioClient_Base = NULL;
+
+/*******************************************************************************
+ * PYTHON DOC METHODS
+ ******************************************************************************/
+
+PyDoc_STRVAR(get_doc,
+"get(key[, policy]) -> awaitable of (key, meta, bins)\n\
+\n\
+Read a record with a given key, and return the record as a tuple consisting of key, meta and bins.");
+
+PyDoc_STRVAR(put_doc,
+"put(key, bins[, meta[, policy[, serializer]]]) -> awaitable\n\
+\n\
+Write a record with a given key to the cluster.");
+
+PyDoc_STRVAR(operate_doc,
+"operate(key, list[, meta[, policy]]) -> awaitable of (key, meta, bins)\n\
+\n\
+Perform multiple bin operations on a record with a given key.");
+
+PyDoc_STRVAR(get_many_doc,
+"get_many(keys[, policy]) -> awaitable of [(key, meta, bins)]\n\
+\n\
+Batch-read multiple records, and return them as a list.");
+
+PyDoc_STRVAR(query_doc,
+"query(namespace[, set]) -> aerospike.aio.Query\n\
+\n\
+Return an aerospike.aio.Query object, whose results() is awaitable.");
+
+PyDoc_STRVAR(close_doc,
+"close()\n\
+\n\
+Stop watching the event loop and close the connections to the cluster.");
+
+PyDoc_STRVAR(wakeup_doc,
+"_wakeup()\n\
+\n\
+Resolve the futures of completed commands. Called by the asyncio event loop.");
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+/**
+ *******************************************************************************************************
+ * Resolve the futures of the commands completed by the event loop threads.
+ * Registered with loop.add_reader() on the wakeup fd, so it always runs in
+ * the thread of the asyncio loop that owns the futures.
+ *******************************************************************************************************
+ */
+static PyObject * AerospikeAioClient_Wakeup(AerospikeAioClient * self, PyObject * args)
+{
+	char buf[64];
+	PyObject * py_completions = NULL;
+
+	// Reset the fd before taking the completions, so a listener that runs
+	// after the swap always triggers another wakeup.
+	while (read(self->wakeup_fds[0], buf, sizeof(buf)) > 0) {
+	}
+
+	py_completions = self->py_completions;
+	self->py_completions = PyList_New(0);
+	if (!self->py_completions) {
+		self->py_completions = py_completions;
+		return NULL;
+	}
+
+	Py_ssize_t size = PyList_Size(py_completions);
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject * py_completion = PyList_GetItem(py_completions, i);
+		PyObject * py_future = PyTuple_GetItem(py_completion, 0);
+		PyObject * py_result = PyTuple_GetItem(py_completion, 1);
+		PyObject * py_exception = PyTuple_GetItem(py_completion, 2);
+		PyObject * py_ret = NULL;
+
+		py_ret = PyObject_CallMethod(py_future, "cancelled", NULL);
+		int cancelled = py_ret ? PyObject_IsTrue(py_ret) : -1;
+		Py_XDECREF(py_ret);
+
+		if (cancelled == 0) {
+			if (py_exception != Py_None) {
+				py_ret = PyObject_CallMethod(py_future, "set_exception", "(O)", py_exception);
+			}
+			else {
+				py_ret = PyObject_CallMethod(py_future, "set_result", "(O)", py_result);
+			}
+			Py_XDECREF(py_ret);
+		}
+
+		if (PyErr_Occurred()) {
+			PyErr_WriteUnraisable(py_future);
+		}
+	}
+
+	Py_DECREF(py_completions);
+	Py_RETURN_NONE;
+}
+
+static PyObject * AerospikeAioClient_Close(AerospikeAioClient * self, PyObject * args, PyObject * kwds)
+{
+	as_error err;
+	as_error_init(&err);
+
+	if (self->in_flight > 0) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Cannot close an aio.Client with %u commands in flight", self->in_flight);
+		return AerospikeAio_Raise(&err, NULL);
+	}
+
+	if (self->py_loop) {
+		PyObject * py_ret = PyObject_CallMethod(self->py_loop, "remove_reader", "(i)", self->wakeup_fds[0]);
+		if (!py_ret) {
+			// The loop may already be closed
+			PyErr_Clear();
+		}
+		Py_XDECREF(py_ret);
+		Py_CLEAR(self->py_loop);
+	}
+
+	return AerospikeClient_Close((AerospikeClient *) self, args, kwds);
+}
+
+static PyMethodDef AerospikeAioClient_Type_Methods[] = {
+
+	// KVS OPERATIONS
+
+	{"get",
+		(PyCFunction) AerospikeAioClient_Get, METH_VARARGS | METH_KEYWORDS,
+		get_doc},
+
+	{"put",
+		(PyCFunction) AerospikeAioClient_Put, METH_VARARGS | METH_KEYWORDS,
+		put_doc},
+
+	{"operate",
+		(PyCFunction) AerospikeAioClient_Operate, METH_VARARGS | METH_KEYWORDS,
+		operate_doc},
+
+	// BATCH OPERATIONS
+
+	{"get_many",
+		(PyCFunction) AerospikeAioClient_Get_Many, METH_VARARGS | METH_KEYWORDS,
+		get_many_doc},
+
+	// QUERY OPERATIONS
+
+	{"query",
+		(PyCFunction) AerospikeAioClient_Query, METH_VARARGS | METH_KEYWORDS,
+		query_doc},
+
+	// CONNECTION OPERATIONS
+
+	{"close",
+		(PyCFunction) AerospikeAioClient_Close, METH_VARARGS | METH_KEYWORDS,
+		close_doc},
+
+	{"_wakeup",
+		(PyCFunction) AerospikeAioClient_Wakeup, METH_NOARGS,
+		wakeup_doc},
+
+	{NULL}
+};
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static as_status create_wakeup_fds(AerospikeAioClient * self, as_error * err)
+{
+#if defined(__linux__)
+	int fd = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+	if (fd < 0) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to create the eventfd for aio.Client");
+	}
+	self->wakeup_fds[0] = fd;
+	self->wakeup_fds[1] = fd;
+#else
+	if (pipe(self->wakeup_fds) != 0) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to create the wakeup pipe for aio.Client");
+	}
+	for (int i = 0; i < 2; i++) {
+		fcntl(self->wakeup_fds[i], F_SETFL, fcntl(self->wakeup_fds[i], F_GETFL) | O_NONBLOCK);
+		fcntl(self->wakeup_fds[i], F_SETFD, FD_CLOEXEC);
+	}
+#endif
+	return err->code;
+}
+
+static int AerospikeAioClient_Type_Init(AerospikeAioClient * self, PyObject * args, PyObject * kwds)
+{
+	PyObject * py_config = NULL;
+	long event_loops = 1;
+
+	as_error err;
+	as_error_init(&err);
+
+	static char * kwlist[] = {"config", NULL};
+
+	if (AerospikeAioClient_Base->tp_init((PyObject *) self, args, kwds) != 0) {
+		return -1;
+	}
+
+	// The event loops only have connection pools for clusters created after
+	// them, so an aio.Client never reuses a shared cluster.
+	self->client.use_shared_connection = false;
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O:client", kwlist, &py_config) == false) {
+		return -1;
+	}
+
+	PyObject * py_event_loops = PyDict_GetItemString(py_config, "event_loops");
+	if (py_event_loops) {
+		if (!PyInt_Check(py_event_loops)) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "event_loops must be an integer");
+			goto CLEANUP;
+		}
+		event_loops = PyInt_AsLong(py_event_loops);
+		if (event_loops < 1 || event_loops > UINT32_MAX) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "event_loops must be a positive integer");
+			goto CLEANUP;
+		}
+	}
+
+	if (AerospikeAio_Create_Event_Loops(&err, (uint32_t) event_loops) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (!self->py_completions) {
+		if (create_wakeup_fds(self, &err) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+		self->py_completions = PyList_New(0);
+	}
+
+CLEANUP:
+
+	if (err.code != AEROSPIKE_OK) {
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return -1;
+	}
+
+	return 0;
+}
+
+static void AerospikeAioClient_Type_Dealloc(AerospikeAioClient * self)
+{
+	// The wakeup fds only exist once the completion list does
+	if (self->py_completions) {
+		close(self->wakeup_fds[0]);
+		if (self->wakeup_fds[1] != self->wakeup_fds[0]) {
+			close(self->wakeup_fds[1]);
+		}
+	}
+
+	Py_CLEAR(self->py_completions);
+	Py_CLEAR(self->py_loop);
+
+	AerospikeAioClient_Base->tp_dealloc((PyObject *) self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeAioClient_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	"aerospike.aio.Client",             // tp_name
+	sizeof(AerospikeAioClient),         // tp_basicsize
+	0,                                  // tp_itemsize
+	(destructor) AerospikeAioClient_Type_Dealloc,
+	                                    // tp_dealloc
+	0,                                  // tp_print
+	0,                                  // tp_getattr
+	0,                                  // tp_setattr
+	0,                                  // tp_compare
+	0,                                  // tp_repr
+	0,                                  // tp_as_number
+	0,                                  // tp_as_sequence
+	0,                                  // tp_as_mapping
+	0,                                  // tp_hash
+	0,                                  // tp_call
+	0,                                  // tp_str
+	0,                                  // tp_getattro
+	0,                                  // tp_setattro
+	0,                                  // tp_as_buffer
+	Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
+	                                    // tp_flags
+	"An asyncio Aerospike client.\n"
+			"get(), put(), operate(), get_many() and Query.results() return\n"
+			"awaitables completed by the C client's event loops.\n",
+	                                    // tp_doc
+	0,                                  // tp_traverse
+	0,                                  // tp_clear
+	0,                                  // tp_richcompare
+	0,                                  // tp_weaklistoffset
+	0,                                  // tp_iter
+	0,                                  // tp_iternext
+	AerospikeAioClient_Type_Methods,    // tp_methods
+	0,                                  // tp_members
+	0,                                  // tp_getset
+	0,                                  // tp_base
+	0,                                  // tp_dict
+	0,                                  // tp_descr_get
+	0,                                  // tp_descr_set
+	0,                                  // tp_dictoffset
+	(initproc) AerospikeAioClient_Type_Init,
+	                                    // tp_init
+	0,                                  // tp_alloc
+	0,                                  // tp_new
+	0,                                  // tp_free
+	0,                                  // tp_is_gc
+	0                                   // tp_bases
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeAioClient_Ready()
+{
+	AerospikeAioClient_Base = AerospikeClient_Ready();
+	AerospikeAioClient_Type.tp_base = AerospikeAioClient_Base;
+	return PyType_Ready(&AerospikeAioClient_Type) == 0 ? &AerospikeAioClient_Type : NULL;
+}
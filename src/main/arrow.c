@@ -0,0 +1,890 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/as_bin.h>
+#include <aerospike/as_buffer.h>
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_double.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_geojson.h>
+#include <aerospike/as_integer.h>
+#include <aerospike/as_msgpack.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_serializer.h>
+#include <aerospike/as_string.h>
+#include <aerospike/as_val.h>
+
+#include "arrow.h"
+#include "columnar.h"
+#include "macros.h"
+#include "result_iterator.h"
+
+// Record batches buffered ahead of the consumer.
+#define ARROW_QUEUE_SIZE 4
+
+#define ARROW_MAX_BATCH_SIZE (1 << 24)
+
+typedef enum {
+	ARROW_INT64,
+	ARROW_FLOAT64,
+	ARROW_UTF8,
+	ARROW_BINARY
+} arrow_type;
+
+// Format strings of the C Data Interface, indexed by arrow_type.
+static const char * arrow_formats[] = {"l", "g", "u", "z"};
+
+// Names used in error messages, indexed by arrow_type.
+static const char * arrow_names[] = {"int64", "float64", "string", "binary"};
+
+typedef struct {
+	char name[AS_BIN_NAME_MAX_SIZE];
+	arrow_type type;
+} arrow_field;
+
+typedef struct {
+	void * command;
+	AerospikeResultIterator_Execute execute;
+	void (*destroy)(void * command);
+	AerospikeResultIterator * iterator;
+	uint32_t batch_size;
+	pthread_mutex_t lock;
+	columnar * columns;
+	// NULL until the schema is given or inferred from the first batch.
+	arrow_field * fields;
+	uint32_t n_fields;
+	// The fields were inferred, bins found later are checked against them.
+	bool inferred;
+	bool stopped;
+	as_error err;
+} ArrowCommand;
+
+/*******************************************************************************
+ * RELEASE CALLBACKS
+ ******************************************************************************/
+
+static void arrow_release_array(struct ArrowArray * array)
+{
+	for (int64_t i = 0; array->children && i < array->n_children; i++) {
+		struct ArrowArray * child = array->children[i];
+		if (child) {
+			if (child->release) {
+				child->release(child);
+			}
+			free(child);
+		}
+	}
+	free(array->children);
+
+	// The buffers are owned through private_data, buffers is the same array.
+	void ** buffers = (void **) array->private_data;
+	for (int64_t i = 0; buffers && i < array->n_buffers; i++) {
+		free(buffers[i]);
+	}
+	free(buffers);
+
+	array->release = NULL;
+}
+
+static void arrow_release_schema(struct ArrowSchema * schema)
+{
+	for (int64_t i = 0; schema->children && i < schema->n_children; i++) {
+		struct ArrowSchema * child = schema->children[i];
+		if (child) {
+			if (child->release) {
+				child->release(child);
+			}
+			free(child);
+		}
+	}
+	free(schema->children);
+	free((char *) schema->name);
+
+	schema->release = NULL;
+}
+
+/*
+ * Returns false when the buffer or children arrays cannot be allocated, the
+ * array can still be released.
+ */
+static bool arrow_array_init(struct ArrowArray * array, int64_t length, int64_t n_buffers, int64_t n_children)
+{
+	memset(array, 0, sizeof(struct ArrowArray));
+	array->length = length;
+	array->n_buffers = n_buffers;
+	array->n_children = n_children;
+	array->private_data = calloc(n_buffers, sizeof(void *));
+	array->buffers = (const void **) array->private_data;
+	array->children = (struct ArrowArray **) calloc(n_children ? n_children : 1, sizeof(struct ArrowArray *));
+	array->release = arrow_release_array;
+	return array->private_data && array->children;
+}
+
+static bool arrow_schema_init(struct ArrowSchema * schema, const char * format, char * name, int64_t n_children)
+{
+	memset(schema, 0, sizeof(struct ArrowSchema));
+	schema->format = format;
+	schema->name = name;
+	schema->n_children = n_children;
+	schema->children = (struct ArrowSchema **) calloc(n_children ? n_children : 1, sizeof(struct ArrowSchema *));
+	schema->release = arrow_release_schema;
+	return schema->children != NULL;
+}
+
+/*******************************************************************************
+ * EXPORT
+ ******************************************************************************/
+
+static inline void arrow_set_valid(uint8_t * bitmap, uint32_t i)
+{
+	bitmap[i >> 3] |= (uint8_t) (1 << (i & 7));
+}
+
+static const char * arrow_val_name(as_val_t type)
+{
+	switch (type) {
+		case AS_INTEGER:
+			return "integer";
+		case AS_DOUBLE:
+			return "float";
+		case AS_STRING:
+			return "string";
+		case AS_GEOJSON:
+			return "GeoJSON";
+		case AS_BYTES:
+			return "bytes";
+		case AS_LIST:
+			return "list";
+		case AS_MAP:
+			return "map";
+		default:
+			return "unsupported";
+	}
+}
+
+static bool arrow_alloc_error(as_error * err)
+{
+	as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the record batch");
+	return false;
+}
+
+/*
+ * A value that does not fit the type of its field fails the batch, it is
+ * never exported as a null.
+ */
+static bool arrow_type_error(as_error * err, arrow_field * field, as_val_t type)
+{
+	as_error_update(err, AEROSPIKE_ERR_CLIENT,
+			"Bin %s holds a %s value, which does not fit its %s column, pass a schema to to_arrow",
+			field->name, arrow_val_name(type), arrow_names[field->type]);
+	return false;
+}
+
+/*
+ * Sets the values buffer of an int64 or float64 array. When the column
+ * already holds the right type its buffer is handed over to Arrow as is.
+ * Integers are widened to float64, floats never narrowed to int64.
+ */
+static bool arrow_export_numbers(arrow_field * field, column * col, uint32_t size, uint8_t * bitmap,
+		int64_t * n_valid, void ** buffers, as_error * err)
+{
+	arrow_type type = field->type;
+	column_value * values = NULL;
+
+	if (col && (col->type == COLUMN_INT64 || col->type == COLUMN_FLOAT64)) {
+		bool same = (type == ARROW_INT64) == (col->type == COLUMN_INT64);
+
+		if (!same && type == ARROW_INT64) {
+			return arrow_type_error(err, field, AS_DOUBLE);
+		}
+
+		values = col->values;
+		col->values = NULL;
+		buffers[1] = values;
+		for (uint32_t i = 0; i < size; i++) {
+			if (col->valid[i]) {
+				if (!same) {
+					values[i].d = (double) values[i].i;
+				}
+				arrow_set_valid(bitmap, i);
+				(*n_valid)++;
+			}
+		}
+		return true;
+	}
+
+	values = (column_value *) calloc(size ? size : 1, sizeof(column_value));
+	if (!values) {
+		return arrow_alloc_error(err);
+	}
+	buffers[1] = values;
+
+	if (!col || col->type != COLUMN_OBJECT) {
+		return true;
+	}
+
+	for (uint32_t i = 0; i < size; i++) {
+		as_val * val = col->valid[i] ? col->values[i].v : NULL;
+
+		if (!val) {
+			continue;
+		}
+		if (as_val_type(val) == AS_INTEGER) {
+			int64_t value = as_integer_get((as_integer *) val);
+			if (type == ARROW_INT64) {
+				values[i].i = value;
+			}
+			else {
+				values[i].d = (double) value;
+			}
+		}
+		else if (as_val_type(val) == AS_DOUBLE && type == ARROW_FLOAT64) {
+			values[i].d = as_double_get((as_double *) val);
+		}
+		else {
+			return arrow_type_error(err, field, as_val_type(val));
+		}
+		arrow_set_valid(bitmap, i);
+		(*n_valid)++;
+	}
+
+	return true;
+}
+
+/*
+ * Fills the offsets and data buffers of a utf8 or binary array. Lists, maps
+ * and any other value that is not a number are exported as msgpack in
+ * binary arrays.
+ */
+static bool arrow_export_bytes(arrow_field * field, column * col, uint32_t size, uint8_t * bitmap,
+		int64_t * n_valid, void ** buffers, as_error * err)
+{
+	arrow_type type = field->type;
+	int32_t * offsets = (int32_t *) malloc((size + 1) * sizeof(int32_t));
+	uint8_t * data = NULL;
+	size_t len = 0;
+	size_t capacity = 0;
+	bool rval = true;
+
+	if (!offsets) {
+		return arrow_alloc_error(err);
+	}
+	offsets[0] = 0;
+	buffers[1] = offsets;
+
+	if (col && (col->type == COLUMN_INT64 || col->type == COLUMN_FLOAT64)) {
+		// Numbers are never turned into strings or bytes.
+		return arrow_type_error(err, field, col->type == COLUMN_INT64 ? AS_INTEGER : AS_DOUBLE);
+	}
+
+	as_serializer ser;
+	as_msgpack_init(&ser);
+
+	for (uint32_t i = 0; i < size; i++) {
+		as_val * val = (col && col->type == COLUMN_OBJECT && col->valid[i]) ? col->values[i].v : NULL;
+		as_val_t val_type = val ? as_val_type(val) : AS_UNDEF;
+		const uint8_t * bytes = NULL;
+		uint32_t n = 0;
+		as_buffer packed;
+		as_buffer_init(&packed);
+
+		switch (val_type) {
+			case AS_UNDEF:
+			case AS_NIL:
+				break;
+			case AS_STRING:
+				bytes = (const uint8_t *) as_string_get((as_string *) val);
+				n = (uint32_t) as_string_len((as_string *) val);
+				break;
+			case AS_GEOJSON:
+				bytes = (const uint8_t *) as_geojson_get((as_geojson *) val);
+				n = (uint32_t) as_geojson_len((as_geojson *) val);
+				break;
+			case AS_BYTES:
+				if (type == ARROW_BINARY) {
+					bytes = as_bytes_get((as_bytes *) val);
+					n = as_bytes_size((as_bytes *) val);
+				}
+				break;
+			case AS_INTEGER:
+			case AS_DOUBLE:
+				break;
+			default:
+				if (type == ARROW_BINARY) {
+					if (as_serializer_serialize(&ser, val, &packed) != 0) {
+						as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to encode bin %s with msgpack", field->name);
+						rval = false;
+					}
+					bytes = packed.data;
+					n = packed.size;
+				}
+				break;
+		}
+
+		if (!rval) {
+			as_buffer_destroy(&packed);
+			break;
+		}
+
+		if (val && val_type != AS_NIL && !bytes) {
+			as_buffer_destroy(&packed);
+			rval = arrow_type_error(err, field, val_type);
+			break;
+		}
+
+		if (bytes) {
+			if (len + n > INT32_MAX) {
+				as_buffer_destroy(&packed);
+				as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Record batch holds more than 2GB of data, use a smaller batch_size");
+				rval = false;
+				break;
+			}
+			if (len + n > capacity) {
+				uint8_t * grown = (uint8_t *) realloc(data, (len + n) * 2);
+				if (!grown) {
+					as_buffer_destroy(&packed);
+					rval = arrow_alloc_error(err);
+					break;
+				}
+				data = grown;
+				capacity = (len + n) * 2;
+			}
+			memcpy(data + len, bytes, n);
+			len += n;
+			arrow_set_valid(bitmap, i);
+			(*n_valid)++;
+		}
+		offsets[i + 1] = (int32_t) len;
+
+		as_buffer_destroy(&packed);
+	}
+
+	as_serializer_destroy(&ser);
+
+	buffers[2] = data ? data : malloc(1);
+	if (rval && !buffers[2]) {
+		rval = arrow_alloc_error(err);
+	}
+	return rval;
+}
+
+static bool arrow_export_column(arrow_field * field, column * col, uint32_t size,
+		struct ArrowArray * array, as_error * err)
+{
+	bool variable = field->type == ARROW_UTF8 || field->type == ARROW_BINARY;
+	int64_t n_valid = 0;
+
+	if (!arrow_array_init(array, size, variable ? 3 : 2, 0)) {
+		return arrow_alloc_error(err);
+	}
+
+	void ** buffers = (void **) array->private_data;
+	uint8_t * bitmap = (uint8_t *) calloc(size / 8 + 1, sizeof(uint8_t));
+	if (!bitmap) {
+		return arrow_alloc_error(err);
+	}
+	buffers[0] = bitmap;
+
+	if (variable) {
+		if (!arrow_export_bytes(field, col, size, bitmap, &n_valid, buffers, err)) {
+			return false;
+		}
+	}
+	else {
+		if (!arrow_export_numbers(field, col, size, bitmap, &n_valid, buffers, err)) {
+			return false;
+		}
+	}
+
+	array->null_count = size - n_valid;
+	return true;
+}
+
+/*
+ * A bin without any value in the first batch is not a field of an inferred
+ * schema, a later value of it fails the batch rather than being dropped.
+ */
+static bool arrow_check_columns(ArrowCommand * cmd, columnar * columns, as_error * err)
+{
+	for (uint32_t i = 0; i < columns->columns.size; i++) {
+		column * col = (column *) as_vector_get(&columns->columns, i);
+		bool found = false;
+
+		if (col->type == COLUMN_EMPTY) {
+			continue;
+		}
+		for (uint32_t j = 0; j < cmd->n_fields && !found; j++) {
+			found = strcmp(cmd->fields[j].name, col->name) == 0;
+		}
+		if (!found) {
+			as_error_update(err, AEROSPIKE_ERR_CLIENT,
+					"Bin %s has no value in the first batch, so no column, pass a schema to to_arrow", col->name);
+			return false;
+		}
+	}
+
+	return true;
+}
+
+/*
+ * Exports the columns as a struct array, the layout of a record batch.
+ */
+static bool arrow_export(ArrowCommand * cmd, columnar * columns, struct ArrowArray * array,
+		struct ArrowSchema * schema, as_error * err)
+{
+	if (cmd->inferred && !arrow_check_columns(cmd, columns, err)) {
+		return false;
+	}
+
+	// Both are initialised, so that both can be released.
+	bool rval = arrow_array_init(array, columns->size, 1, cmd->n_fields);
+	rval = arrow_schema_init(schema, "+s", NULL, cmd->n_fields) && rval;
+
+	if (!rval) {
+		arrow_alloc_error(err);
+	}
+
+	for (uint32_t i = 0; rval && i < cmd->n_fields; i++) {
+		arrow_field * field = &cmd->fields[i];
+		struct ArrowSchema * child_schema = (struct ArrowSchema *) malloc(sizeof(struct ArrowSchema));
+
+		if (!child_schema) {
+			rval = arrow_alloc_error(err);
+			break;
+		}
+		schema->children[i] = child_schema;
+
+		char * name = strdup(field->name);
+		if (!arrow_schema_init(child_schema, arrow_formats[field->type], name, 0) || !name) {
+			rval = arrow_alloc_error(err);
+			break;
+		}
+		child_schema->flags = ARROW_FLAG_NULLABLE;
+
+		array->children[i] = (struct ArrowArray *) malloc(sizeof(struct ArrowArray));
+		if (!array->children[i]) {
+			rval = arrow_alloc_error(err);
+			break;
+		}
+		rval = arrow_export_column(field, columnar_find(columns, field->name), columns->size,
+				array->children[i], err);
+	}
+
+	if (!rval) {
+		array->release(array);
+		schema->release(schema);
+	}
+
+	return rval;
+}
+
+/*
+ * Moves the exported structs into a pyarrow.RecordBatch, with the GIL held.
+ */
+static PyObject * arrow_import(struct ArrowArray * array, struct ArrowSchema * schema)
+{
+	PyObject * py_batch = NULL;
+	PyObject * py_pyarrow = PyImport_ImportModule("pyarrow");
+
+	if (py_pyarrow) {
+		PyObject * py_record_batch = PyObject_GetAttrString(py_pyarrow, "RecordBatch");
+		if (py_record_batch) {
+			py_batch = PyObject_CallMethod(py_record_batch, "_import_from_c", "NN",
+					PyLong_FromVoidPtr(array), PyLong_FromVoidPtr(schema));
+			Py_DECREF(py_record_batch);
+		}
+		Py_DECREF(py_pyarrow);
+	}
+
+	return py_batch;
+}
+
+/*******************************************************************************
+ * SCHEMA
+ ******************************************************************************/
+
+/*
+ * The schema of the record batches is the one of the first batch. A bin is
+ * int64 or float64 when its column is, string when all its values are
+ * strings, otherwise binary. Later batches fail on a bin or a value that
+ * does not fit.
+ */
+static bool arrow_infer_fields(ArrowCommand * cmd, columnar * columns, as_error * err)
+{
+	cmd->fields = (arrow_field *) calloc(columns->columns.size + 1, sizeof(arrow_field));
+	cmd->n_fields = 0;
+	if (!cmd->fields) {
+		return arrow_alloc_error(err);
+	}
+	cmd->inferred = true;
+
+	for (uint32_t i = 0; i < columns->columns.size; i++) {
+		column * col = (column *) as_vector_get(&columns->columns, i);
+		arrow_field * field = &cmd->fields[cmd->n_fields];
+
+		if (col->type == COLUMN_INT64) {
+			field->type = ARROW_INT64;
+		}
+		else if (col->type == COLUMN_FLOAT64) {
+			field->type = ARROW_FLOAT64;
+		}
+		else if (col->type == COLUMN_OBJECT) {
+			// string when every value is a string, binary otherwise.
+			field->type = ARROW_UTF8;
+			for (uint32_t j = 0; j < columns->size && field->type == ARROW_UTF8; j++) {
+				as_val * val = col->valid[j] ? col->values[j].v : NULL;
+				as_val_t type = val ? as_val_type(val) : AS_NIL;
+
+				if (type != AS_NIL && type != AS_STRING && type != AS_GEOJSON) {
+					field->type = ARROW_BINARY;
+				}
+			}
+		}
+		else {
+			// Without a single value the type is unknown, the bin has no field.
+			continue;
+		}
+
+		strcpy(field->name, col->name);
+		cmd->n_fields++;
+	}
+
+	return true;
+}
+
+/*
+ * Reads the fields of a pyarrow.Schema through its C Data Interface export.
+ */
+static as_status arrow_schema_fields(as_error * err, PyObject * py_schema, ArrowCommand * cmd)
+{
+	struct ArrowSchema schema;
+	schema.release = NULL;
+
+	PyObject * py_rval = PyObject_CallMethod(py_schema, "_export_to_c", "N", PyLong_FromVoidPtr(&schema));
+	if (!py_rval) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "schema must be a pyarrow.Schema");
+	}
+	Py_DECREF(py_rval);
+
+	if (strcmp(schema.format, "+s") != 0) {
+		as_error_update(err, AEROSPIKE_ERR_PARAM, "schema must be a pyarrow.Schema");
+		goto CLEANUP;
+	}
+
+	cmd->fields = (arrow_field *) calloc(schema.n_children + 1, sizeof(arrow_field));
+	cmd->n_fields = 0;
+	if (!cmd->fields) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the schema fields");
+		goto CLEANUP;
+	}
+
+	for (int64_t i = 0; i < schema.n_children; i++) {
+		struct ArrowSchema * child = schema.children[i];
+		arrow_field * field = &cmd->fields[cmd->n_fields];
+		bool found = false;
+
+		if (!child->name || strlen(child->name) >= AS_BIN_NAME_MAX_SIZE) {
+			as_error_update(err, AEROSPIKE_ERR_PARAM,
+					"schema field names must be bin names of at most %d characters", AS_BIN_NAME_MAX_LEN);
+			goto CLEANUP;
+		}
+
+		for (int t = ARROW_INT64; t <= ARROW_BINARY; t++) {
+			if (strcmp(child->format, arrow_formats[t]) == 0) {
+				field->type = (arrow_type) t;
+				found = true;
+			}
+		}
+		if (!found) {
+			as_error_update(err, AEROSPIKE_ERR_PARAM,
+					"Unsupported type for schema field %s, use int64, float64, string or binary", child->name);
+			goto CLEANUP;
+		}
+
+		strcpy(field->name, child->name);
+		cmd->n_fields++;
+	}
+
+CLEANUP:
+	schema.release(&schema);
+	return err->code;
+}
+
+/*******************************************************************************
+ * COMMAND
+ ******************************************************************************/
+
+/*
+ * Stops the command on its first error. Called with the lock of the command
+ * held.
+ */
+static bool arrow_command_stop(ArrowCommand * cmd, as_error * err)
+{
+	cmd->stopped = true;
+	if (cmd->err.code == AEROSPIKE_OK) {
+		as_error_copy(&cmd->err, err);
+	}
+	return false;
+}
+
+static bool arrow_command_alloc_failed(ArrowCommand * cmd)
+{
+	as_error err;
+	as_error_init(&err);
+	arrow_alloc_error(&err);
+	return arrow_command_stop(cmd, &err);
+}
+
+/*
+ * Columns of the next batch, NULL when they cannot be allocated. Only the
+ * fields of a given schema are kept, an inferred one keeps every bin to
+ * check them. Called with the lock of the command held.
+ */
+static columnar * arrow_command_columns(ArrowCommand * cmd)
+{
+	columnar * columns = (columnar *) malloc(sizeof(columnar));
+	if (!columns) {
+		return NULL;
+	}
+
+	columnar_init_bins(columns, cmd->fields != NULL && !cmd->inferred);
+	for (uint32_t i = 0; i < cmd->n_fields; i++) {
+		if (!columnar_add_bin(columns, cmd->fields[i].name)) {
+			columnar_destroy(columns);
+			free(columns);
+			return NULL;
+		}
+	}
+
+	return columns;
+}
+
+/*
+ * Exports a full batch and queues it, then releases the columns.
+ */
+static bool arrow_command_flush(ArrowCommand * cmd, columnar * columns)
+{
+	struct ArrowArray array;
+	struct ArrowSchema schema;
+	PyObject * py_batch = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	bool exported = false;
+
+	pthread_mutex_lock(&cmd->lock);
+	bool ready = !columns->failed || arrow_alloc_error(&err);
+	if (ready && !cmd->fields) {
+		ready = arrow_infer_fields(cmd, columns, &err);
+	}
+	pthread_mutex_unlock(&cmd->lock);
+
+	if (ready) {
+		exported = arrow_export(cmd, columns, &array, &schema, &err);
+	}
+
+	columnar_destroy(columns);
+	free(columns);
+
+	if (exported) {
+		PyGILState_STATE gstate;
+		gstate = PyGILState_Ensure();
+
+		py_batch = arrow_import(&array, &schema);
+		if (!py_batch) {
+			PyErr_Clear();
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to import the record batch into pyarrow");
+		}
+
+		PyGILState_Release(gstate);
+
+		// pyarrow has moved the structs when the import succeeded.
+		if (array.release) {
+			array.release(&array);
+		}
+		if (schema.release) {
+			schema.release(&schema);
+		}
+	}
+
+	if (!py_batch) {
+		pthread_mutex_lock(&cmd->lock);
+		arrow_command_stop(cmd, &err);
+		pthread_mutex_unlock(&cmd->lock);
+		return false;
+	}
+
+	if (!AerospikeResultIterator_Put(cmd->iterator, py_batch)) {
+		pthread_mutex_lock(&cmd->lock);
+		cmd->stopped = true;
+		pthread_mutex_unlock(&cmd->lock);
+		return false;
+	}
+
+	return true;
+}
+
+static bool arrow_command_each(const as_val * val, void * udata)
+{
+	ArrowCommand * cmd = (ArrowCommand *) udata;
+	columnar * full = NULL;
+
+	if (!val) {
+		return false;
+	}
+
+	as_record * rec = as_record_fromval(val);
+	if (!rec) {
+		// Only records have columns.
+		return true;
+	}
+
+	pthread_mutex_lock(&cmd->lock);
+	if (cmd->stopped) {
+		pthread_mutex_unlock(&cmd->lock);
+		return false;
+	}
+	if (!columnar_add_record(cmd->columns, rec)) {
+		arrow_command_alloc_failed(cmd);
+		pthread_mutex_unlock(&cmd->lock);
+		return false;
+	}
+	if (cmd->columns->size >= cmd->batch_size) {
+		columnar * next = arrow_command_columns(cmd);
+		if (!next) {
+			arrow_command_alloc_failed(cmd);
+			pthread_mutex_unlock(&cmd->lock);
+			return false;
+		}
+		full = cmd->columns;
+		cmd->columns = next;
+	}
+	pthread_mutex_unlock(&cmd->lock);
+
+	return full ? arrow_command_flush(cmd, full) : true;
+}
+
+/*
+ * Runs on the producer thread of the iterator, udata is the iterator.
+ */
+static void arrow_command_execute(void * command, as_error * err,
+		AerospikeResultIterator_Callback callback, void * udata)
+{
+	ArrowCommand * cmd = (ArrowCommand *) command;
+
+	cmd->iterator = (AerospikeResultIterator *) udata;
+	cmd->execute(cmd->command, err, arrow_command_each, cmd);
+
+	if (err->code == AEROSPIKE_OK && !cmd->stopped && cmd->columns->size > 0) {
+		columnar * last = cmd->columns;
+		cmd->columns = NULL;
+		arrow_command_flush(cmd, last);
+	}
+
+	if (cmd->err.code != AEROSPIKE_OK) {
+		as_error_copy(err, &cmd->err);
+	}
+}
+
+static void arrow_command_destroy(void * command)
+{
+	ArrowCommand * cmd = (ArrowCommand *) command;
+
+	if (cmd->columns) {
+		columnar_destroy(cmd->columns);
+		free(cmd->columns);
+	}
+	free(cmd->fields);
+	pthread_mutex_destroy(&cmd->lock);
+
+	cmd->destroy(cmd->command);
+	free(cmd);
+}
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyObject * arrow_iterator_new(AerospikeClient * client, PyObject * py_owner,
+		PyObject * py_schema, PyObject * py_batch_size,
+		AerospikeResultIterator_Execute execute, void * command,
+		void (*destroy)(void * command), as_error * err)
+{
+	long batch_size = ARROW_DEFAULT_BATCH_SIZE;
+
+	PyObject * py_pyarrow = PyImport_ImportModule("pyarrow");
+	if (!py_pyarrow) {
+		PyErr_Clear();
+		destroy(command);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "to_arrow requires pyarrow");
+		return NULL;
+	}
+	Py_DECREF(py_pyarrow);
+
+	if (py_batch_size && py_batch_size != Py_None) {
+		batch_size = -1;
+		if (PyInt_Check(py_batch_size) || PyLong_Check(py_batch_size)) {
+			batch_size = PyLong_AsLong(py_batch_size);
+		}
+		if (batch_size < 1 || batch_size > ARROW_MAX_BATCH_SIZE) {
+			PyErr_Clear();
+			destroy(command);
+			as_error_update(err, AEROSPIKE_ERR_PARAM,
+					"batch_size must be an integer between 1 and %d", ARROW_MAX_BATCH_SIZE);
+			return NULL;
+		}
+	}
+
+	ArrowCommand * cmd = (ArrowCommand *) calloc(1, sizeof(ArrowCommand));
+	if (!cmd) {
+		destroy(command);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the to_arrow command");
+		return NULL;
+	}
+	cmd->command = command;
+	cmd->execute = execute;
+	cmd->destroy = destroy;
+	cmd->batch_size = (uint32_t) batch_size;
+	as_error_init(&cmd->err);
+	pthread_mutex_init(&cmd->lock, NULL);
+
+	if (py_schema && py_schema != Py_None) {
+		if (arrow_schema_fields(err, py_schema, cmd) != AEROSPIKE_OK) {
+			arrow_command_destroy(cmd);
+			return NULL;
+		}
+	}
+
+	cmd->columns = arrow_command_columns(cmd);
+	if (!cmd->columns) {
+		arrow_command_destroy(cmd);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the to_arrow columns");
+		return NULL;
+	}
+
+	return AerospikeResultIterator_New(client, py_owner, ARROW_QUEUE_SIZE,
+			arrow_command_execute, cmd, arrow_command_destroy, err);
+}
@@ -0,0 +1,132 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_bytes.h>
+#include <citrusleaf/alloc.h>
+
+#include "blob.h"
+
+/*******************************************************************************
+ * BUFFER PROTOCOL
+ ******************************************************************************/
+
+static int AerospikeBlob_Type_GetBuffer(AerospikeBlob * self, Py_buffer * view, int flags)
+{
+	return PyBuffer_FillInfo(view, (PyObject *) self, self->data, self->size, 0, flags);
+}
+
+static PyBufferProcs AerospikeBlob_Buffer = {
+	.bf_getbuffer = (getbufferproc) AerospikeBlob_Type_GetBuffer,
+	.bf_releasebuffer = NULL,
+};
+
+static void AerospikeBlob_Type_Dealloc(AerospikeBlob * self)
+{
+	cf_free(self->data);
+	PyObject_Del(self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeBlob_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	"aerospike.Blob",                   // tp_name
+	sizeof(AerospikeBlob),              // tp_basicsize
+	0,                                  // tp_itemsize
+	(destructor) AerospikeBlob_Type_Dealloc,
+	                                    // tp_dealloc
+	0,                                  // tp_print
+	0,                                  // tp_getattr
+	0,                                  // tp_setattr
+	0,                                  // tp_compare
+	0,                                  // tp_repr
+	0,                                  // tp_as_number
+	0,                                  // tp_as_sequence
+	0,                                  // tp_as_mapping
+	0,                                  // tp_hash
+	0,                                  // tp_call
+	0,                                  // tp_str
+	0,                                  // tp_getattro
+	0,                                  // tp_setattro
+	&AerospikeBlob_Buffer,              // tp_as_buffer
+	Py_TPFLAGS_DEFAULT,                 // tp_flags
+	"Owner of a blob read with read_blob_as='memoryview', or of a list\n"
+			"or map bin read with cdt_mode='lazy'\n",
+	                                    // tp_doc
+};
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyObject * AerospikeBlob_New(as_bytes * bytes)
+{
+	uint32_t size = as_bytes_size(bytes);
+
+	AerospikeBlob * py_blob = PyObject_New(AerospikeBlob, &AerospikeBlob_Type);
+	if (!py_blob) {
+		return NULL;
+	}
+
+	if (bytes->free && bytes->value) {
+		// Take over the buffer the record was parsed into.
+		py_blob->data = bytes->value;
+		bytes->value = NULL;
+		bytes->size = 0;
+		bytes->capacity = 0;
+		bytes->free = false;
+	}
+	else {
+		// Never hand out a NULL buffer, even for an empty blob.
+		py_blob->data = (uint8_t *) cf_malloc(size ? size : 1);
+		if (!py_blob->data) {
+			py_blob->size = 0;
+			Py_DECREF(py_blob);
+			return PyErr_NoMemory();
+		}
+		if (size) {
+			memcpy(py_blob->data, as_bytes_get(bytes), size);
+		}
+	}
+	py_blob->size = size;
+
+	return (PyObject *) py_blob;
+}
+
+PyObject * AerospikeBlob_MemoryView(as_bytes * bytes)
+{
+	PyObject * py_blob = AerospikeBlob_New(bytes);
+	if (!py_blob) {
+		return NULL;
+	}
+
+	// The memoryview holds the only reference to the blob.
+	PyObject * py_view = PyMemoryView_FromObject(py_blob);
+	Py_DECREF(py_blob);
+
+	return py_view;
+}
+
+PyTypeObject * AerospikeBlob_Ready()
+{
+	return PyType_Ready(&AerospikeBlob_Type) == 0 ? &AerospikeBlob_Type : NULL;
+}
@@ -16,6 +16,7 @@
 
 #include <Python.h>
 #include <stdbool.h>
+#include <string.h>
 
 #include <aerospike/aerospike_key.h>
 #include <aerospike/as_key.h>
@@ -24,7 +25,9 @@
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
+#include "key_batch.h"
 #include "module_functions.h"
+#include "partition.h"
 
 static PyObject * Aerospike_Calc_Digest_Invoke(PyObject * py_ns, PyObject *py_set, PyObject * py_key)
 {
@@ -129,3 +132,368 @@ PyObject * Aerospike_Calc_Digest(PyObject * self, PyObject * args, PyObject * kw
 	// Invoke Operation
 	return Aerospike_Calc_Digest_Invoke(py_ns, py_set, py_key);
 }
+
+/**
+ * Reads the keys of an integer buffer, such as an int64 numpy array. Returns
+ * false for any other kind of buffer.
+ */
+bool digest_inputs_from_buffer(Py_buffer * view, digest_input * inputs)
+{
+	const char * format = view->format ? view->format : "B";
+	if (*format == '@' || *format == '=') {
+		format++;
+	}
+	if (view->ndim != 1 || strlen(format) != 1) {
+		return false;
+	}
+
+	for (Py_ssize_t i = 0; i < view->shape[0]; i++) {
+		const char * item = (const char *) view->buf + i * view->strides[0];
+		int64_t value;
+		switch (*format) {
+			case 'b': value = *(const signed char *) item; break;
+			case 'B': value = *(const unsigned char *) item; break;
+			case 'h': value = *(const short *) item; break;
+			case 'H': value = *(const unsigned short *) item; break;
+			case 'i': value = *(const int *) item; break;
+			case 'I': value = *(const unsigned int *) item; break;
+			case 'l': value = *(const long *) item; break;
+			case 'q': value = *(const long long *) item; break;
+			default:
+				return false;
+		}
+		inputs[i].type = AS_INTEGER;
+		inputs[i].integer = value;
+	}
+	return true;
+}
+
+/**
+ * Reads one key of calc_digests or aerospike.KeyBatch, the values accepted as
+ * the key of a key tuple.
+ */
+as_status digest_input_from_pyobject(as_error * err, PyObject * py_key, digest_input * input)
+{
+	if (PyUnicode_Check(py_key)) {
+		input->type = AS_STRING;
+		input->data = (const uint8_t *) PyUnicode_AsUTF8AndSize(py_key, &input->size);
+		if (!input->data) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "Key is invalid");
+		}
+	}
+	else if (PyBytes_Check(py_key)) {
+		// Bytes keys are sent as strings, as by the other commands.
+		input->type = AS_STRING;
+		input->data = (const uint8_t *) PyBytes_AsString(py_key);
+		input->size = PyBytes_Size(py_key);
+	}
+	else if (PyByteArray_Check(py_key)) {
+		input->type = AS_BYTES;
+		input->data = (const uint8_t *) PyByteArray_AsString(py_key);
+		input->size = PyByteArray_Size(py_key);
+	}
+	else if (PyIndex_Check(py_key)) {
+		PyObject * py_index = PyNumber_Index(py_key);
+		input->type = AS_INTEGER;
+		input->integer = py_index ? PyLong_AsLongLong(py_index) : -1;
+		Py_XDECREF(py_index);
+		if (input->integer == -1 && PyErr_Occurred()) {
+			PyErr_Clear();
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "integer key exceeds sys.maxsize");
+		}
+	}
+	else {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Key is invalid");
+	}
+	return AEROSPIKE_OK;
+}
+
+/**
+ * Copies the string and bytes keys of inputs into a new buffer, returned in
+ * data, so they no longer depend on the keys they were read from. Strings are
+ * NUL terminated for as_key_init_strp().
+ */
+as_status digest_inputs_own_data(as_error * err, digest_input * inputs, Py_ssize_t size, uint8_t ** data)
+{
+	size_t total = 0;
+	for (Py_ssize_t i = 0; i < size; i++) {
+		if (inputs[i].type != AS_INTEGER) {
+			total += inputs[i].size + 1;
+		}
+	}
+	if (total == 0) {
+		return AEROSPIKE_OK;
+	}
+
+	*data = (uint8_t *) PyMem_Malloc(total);
+	if (!*data) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate keys");
+	}
+
+	uint8_t * next = *data;
+	for (Py_ssize_t i = 0; i < size; i++) {
+		digest_input * input = &inputs[i];
+		if (input->type != AS_INTEGER) {
+			memcpy(next, input->data, input->size);
+			next[input->size] = '\0';
+			input->data = next;
+			next += input->size + 1;
+		}
+	}
+	return AEROSPIKE_OK;
+}
+
+void digest_input_to_key(const digest_input * input, const char * ns, const char * set, as_key * key)
+{
+	switch (input->type) {
+		case AS_INTEGER:
+			as_key_init_int64(key, ns, set, input->integer);
+			break;
+		case AS_STRING:
+			as_key_init_strp(key, ns, set, (char *) input->data, false);
+			break;
+		default:
+			as_key_init_rawp(key, ns, set, input->data, (uint32_t) input->size, false);
+			break;
+	}
+}
+
+static void compute_digests(const char * ns, const char * set, const digest_input * inputs,
+		Py_ssize_t size, uint8_t * digests, uint16_t * partition_ids)
+{
+	as_key key;
+
+	for (Py_ssize_t i = 0; i < size; i++) {
+		digest_input_to_key(&inputs[i], ns, set, &key);
+
+		as_digest * digest = as_key_digest(&key);
+		memcpy(digests + i * AS_DIGEST_VALUE_SIZE, digest->value, AS_DIGEST_VALUE_SIZE);
+		partition_ids[i] = digest_partition_id(digest->value);
+		as_key_destroy(&key);
+	}
+}
+
+/**
+ * Wraps the digests and partition ids buffers as numpy arrays, or as bytes
+ * and a memoryview of unsigned shorts.
+ */
+static as_status digests_to_pyobject(as_error * err, PyObject * py_digests, PyObject * py_partition_ids,
+		Py_ssize_t size, bool use_numpy, PyObject ** py_digests_out, PyObject ** py_partition_ids_out)
+{
+	if (use_numpy) {
+		PyObject * py_numpy = PyImport_ImportModule("numpy");
+		if (!py_numpy) {
+			PyErr_Clear();
+			return as_error_update(err, AEROSPIKE_ERR_CLIENT, "numpy results require numpy");
+		}
+		if (size == 0) {
+			// numpy.frombuffer() refuses an empty buffer on older numpy releases.
+			*py_digests_out = PyObject_CallMethod(py_numpy, "zeros", "(in)s", 0, (Py_ssize_t) AS_DIGEST_VALUE_SIZE, "uint8");
+			*py_partition_ids_out = PyObject_CallMethod(py_numpy, "zeros", "is", 0, "uint16");
+		}
+		else {
+			PyObject * py_flat = PyObject_CallMethod(py_numpy, "frombuffer", "Os", py_digests, "uint8");
+			if (py_flat) {
+				*py_digests_out = PyObject_CallMethod(py_flat, "reshape", "nn", size, (Py_ssize_t) AS_DIGEST_VALUE_SIZE);
+				Py_DECREF(py_flat);
+			}
+			*py_partition_ids_out = PyObject_CallMethod(py_numpy, "frombuffer", "Os", py_partition_ids, "uint16");
+		}
+		Py_DECREF(py_numpy);
+	}
+	else {
+		PyObject * py_view = PyMemoryView_FromObject(py_partition_ids);
+		if (py_view) {
+			*py_partition_ids_out = PyObject_CallMethod(py_view, "cast", "s", "H");
+			Py_DECREF(py_view);
+		}
+		if (*py_partition_ids_out) {
+			Py_INCREF(py_digests);
+			*py_digests_out = py_digests;
+		}
+	}
+
+	if (!*py_digests_out || !*py_partition_ids_out) {
+		Py_CLEAR(*py_digests_out);
+		Py_CLEAR(*py_partition_ids_out);
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to build digests");
+	}
+	return AEROSPIKE_OK;
+}
+
+PyObject * Aerospike_Calc_Digests(PyObject * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_ns = NULL;
+	PyObject * py_set = NULL;
+	PyObject * py_keys = NULL;
+	PyObject * py_client = NULL;
+	PyObject * py_numpy = NULL;
+
+	// Python Return Value
+	PyObject * py_result = NULL;
+	PyObject * py_digests = NULL;
+	PyObject * py_partition_ids = NULL;
+	PyObject * py_digests_out = NULL;
+	PyObject * py_partition_ids_out = NULL;
+	PyObject * py_nodes = NULL;
+
+	PyObject * py_fast = NULL;
+	digest_input * inputs = NULL;
+	uint8_t * data = NULL;
+	Py_buffer view;
+	bool view_acquired = false;
+	Py_ssize_t size = 0;
+	const char * ns = NULL;
+	const char * set = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"ns", "set", "keys", "client", "numpy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OOO|OO:calc_digests", kwlist,
+			&py_ns, &py_set, &py_keys, &py_client, &py_numpy) == false) {
+		return NULL;
+	}
+
+	if (!PyString_Check(py_ns)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Namespace should be a string");
+		goto CLEANUP;
+	}
+	ns = PyString_AsString(py_ns);
+	if (strlen(ns) >= AS_NAMESPACE_MAX_SIZE) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Namespace is too long");
+		goto CLEANUP;
+	}
+
+	if (PyUnicode_Check(py_set)) {
+		set = PyUnicode_AsUTF8(py_set);
+		if (strlen(set) >= AS_SET_MAX_SIZE) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "Set is too long");
+			goto CLEANUP;
+		}
+	}
+	else if (py_set != Py_None) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Set should be a string or None");
+		goto CLEANUP;
+	}
+
+	if (py_client && py_client != Py_None &&
+			!PyObject_TypeCheck(py_client, AerospikeClient_Ready())) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "client should be an aerospike.Client");
+		goto CLEANUP;
+	}
+
+	// A single key is a sequence too, but never what was meant.
+	if (PyUnicode_Check(py_keys) || PyBytes_Check(py_keys) || PyByteArray_Check(py_keys)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "keys should be a sequence or an array of keys");
+		goto CLEANUP;
+	}
+
+	// Integer buffers, such as numpy arrays, are read without boxing each key.
+	if (PyObject_CheckBuffer(py_keys) &&
+			PyObject_GetBuffer(py_keys, &view, PyBUF_FORMAT | PyBUF_STRIDES) == 0) {
+		view_acquired = true;
+		size = view.ndim == 1 ? view.shape[0] : 0;
+		inputs = (digest_input *) PyMem_Malloc(sizeof(digest_input) * (size ? size : 1));
+		if (!inputs) {
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate keys");
+			goto CLEANUP;
+		}
+		if (!digest_inputs_from_buffer(&view, inputs)) {
+			PyMem_Free(inputs);
+			inputs = NULL;
+			PyBuffer_Release(&view);
+			view_acquired = false;
+		}
+	}
+	else {
+		PyErr_Clear();
+	}
+
+	if (!inputs) {
+		py_fast = PySequence_Fast(py_keys, "keys should be a sequence");
+		if (!py_fast) {
+			PyErr_Clear();
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "keys should be a sequence");
+			goto CLEANUP;
+		}
+		size = PySequence_Fast_GET_SIZE(py_fast);
+		inputs = (digest_input *) PyMem_Malloc(sizeof(digest_input) * (size ? size : 1));
+		if (!inputs) {
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate keys");
+			goto CLEANUP;
+		}
+		for (Py_ssize_t i = 0; i < size; i++) {
+			if (digest_input_from_pyobject(&err, PySequence_Fast_GET_ITEM(py_fast, i), &inputs[i]) != AEROSPIKE_OK) {
+				goto CLEANUP;
+			}
+		}
+
+		// Other threads may change the keys or the sequence while the GIL is released.
+		if (digest_inputs_own_data(&err, inputs, size, &data) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	py_digests = PyBytes_FromStringAndSize(NULL, size * AS_DIGEST_VALUE_SIZE);
+	py_partition_ids = PyBytes_FromStringAndSize(NULL, size * sizeof(uint16_t));
+	if (!py_digests || !py_partition_ids) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate digests");
+		goto CLEANUP;
+	}
+
+	uint8_t * digests = (uint8_t *) PyBytes_AS_STRING(py_digests);
+	uint16_t * partition_ids = (uint16_t *) PyBytes_AS_STRING(py_partition_ids);
+
+	// The keys are copied or read from the buffer, which stays exported.
+	Py_BEGIN_ALLOW_THREADS
+	compute_digests(ns, set, inputs, size, digests, partition_ids);
+	Py_END_ALLOW_THREADS
+
+	if (py_client && py_client != Py_None) {
+		if (partition_owner_names((AerospikeClient *) py_client, &err, ns,
+				partition_ids, size, &py_nodes) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+	else {
+		Py_INCREF(Py_None);
+		py_nodes = Py_None;
+	}
+
+	if (digests_to_pyobject(&err, py_digests, py_partition_ids, size,
+			py_numpy && PyObject_IsTrue(py_numpy), &py_digests_out, &py_partition_ids_out) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	py_result = PyTuple_Pack(3, py_digests_out, py_partition_ids_out, py_nodes);
+
+CLEANUP:
+	if (view_acquired) {
+		PyBuffer_Release(&view);
+	}
+	PyMem_Free(inputs);
+	PyMem_Free(data);
+	Py_XDECREF(py_fast);
+	Py_XDECREF(py_digests);
+	Py_XDECREF(py_partition_ids);
+	Py_XDECREF(py_digests_out);
+	Py_XDECREF(py_partition_ids_out);
+	Py_XDECREF(py_nodes);
+
+	if (err.code != AEROSPIKE_OK) {
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_result;
+}
@@ -0,0 +1,370 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/as_buffer.h>
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_double.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_geojson.h>
+#include <aerospike/as_integer.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_msgpack.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_serializer.h>
+#include <aerospike/as_string.h>
+#include <aerospike/as_val.h>
+#include <aerospike/as_vector.h>
+
+#include "callback_batch.h"
+#include "conversions.h"
+#include "macros.h"
+
+#define CALLBACK_BATCH_MAX_SIZE (1 << 20)
+
+typedef struct {
+	uint32_t size;
+	as_val * vals[];
+} callback_batch_buffer;
+
+/*
+ * Buffer of the calling C client thread. thread_batch_id tells which batch
+ * it belongs to, a thread reused by another scan starts a new buffer.
+ */
+static __thread callback_batch_buffer * thread_buffer = NULL;
+static __thread uint64_t thread_batch_id = 0;
+
+// Protected by the GIL.
+static uint64_t last_batch_id = 0;
+
+/*******************************************************************************
+ * COPYING RESULTS
+ *
+ * Records handed to the callback live on the stack of the C client thread,
+ * they are copied before being buffered.
+ ******************************************************************************/
+
+static as_val * callback_batch_copy_value(as_val * val)
+{
+	as_val * copy = NULL;
+
+	switch (as_val_type(val)) {
+		case AS_INTEGER:
+			return (as_val *) as_integer_new(as_integer_get((as_integer *) val));
+		case AS_DOUBLE:
+			return (as_val *) as_double_new(as_double_get((as_double *) val));
+		case AS_STRING:
+			return (as_val *) as_string_new_strdup(as_string_get((as_string *) val));
+		case AS_GEOJSON:
+			return (as_val *) as_geojson_new(strdup(as_geojson_get((as_geojson *) val)), true);
+		case AS_BYTES: {
+			as_bytes * bytes = (as_bytes *) val;
+			as_bytes * bytes_copy = as_bytes_new(bytes->size);
+			as_bytes_set(bytes_copy, 0, bytes->value, bytes->size);
+			as_bytes_set_type(bytes_copy, as_bytes_get_type(bytes));
+			return (as_val *) bytes_copy;
+		}
+		default: {
+			// Anything else goes through a msgpack round trip.
+			as_serializer ser;
+			as_buffer buffer;
+			as_msgpack_init(&ser);
+			as_buffer_init(&buffer);
+			if (as_serializer_serialize(&ser, val, &buffer) == 0) {
+				as_serializer_deserialize(&ser, &buffer, &copy);
+			}
+			as_buffer_destroy(&buffer);
+			as_serializer_destroy(&ser);
+			return copy;
+		}
+	}
+}
+
+as_val * callback_batch_copy_bin(const as_bin * bin)
+{
+	as_val * val = (as_val *) bin->valuep;
+
+	if (val != (as_val *) &bin->value) {
+		// Stored outside of the bin, the value is reference counted.
+		return as_val_reserve(val);
+	}
+	return callback_batch_copy_value(val);
+}
+
+static bool callback_batch_copy_key(as_key * key, const as_key * src)
+{
+	as_val * val = (as_val *) src->valuep;
+
+	switch (val ? as_val_type(val) : AS_UNDEF) {
+		case AS_INTEGER:
+			as_key_init_int64(key, src->ns, src->set, as_integer_get((as_integer *) val));
+			break;
+		case AS_STRING: {
+			char * value = strdup(as_string_get((as_string *) val));
+			if (!value) {
+				return false;
+			}
+			as_key_init_strp(key, src->ns, src->set, value, true);
+			break;
+		}
+		case AS_BYTES: {
+			as_bytes * bytes = (as_bytes *) val;
+			uint8_t * value = (uint8_t *) malloc(bytes->size ? bytes->size : 1);
+			if (!value) {
+				return false;
+			}
+			memcpy(value, bytes->value, bytes->size);
+			as_key_init_rawp(key, src->ns, src->set, value, bytes->size, true);
+			break;
+		}
+		default:
+			as_key_init_digest(key, src->ns, src->set, src->digest.value);
+			break;
+	}
+	key->digest = src->digest;
+	return true;
+}
+
+static as_val * callback_batch_copy_record(const as_record * src)
+{
+	as_record * rec = as_record_new(src->bins.size);
+	if (!rec) {
+		return NULL;
+	}
+
+	rec->gen = src->gen;
+	rec->ttl = src->ttl;
+	if (!callback_batch_copy_key(&rec->key, &src->key)) {
+		as_record_destroy(rec);
+		return NULL;
+	}
+
+	for (uint16_t i = 0; i < src->bins.size; i++) {
+		as_bin * bin = &src->bins.entries[i];
+		as_val * val = (as_val *) bin->valuep;
+
+		if (!val || as_val_type(val) == AS_NIL) {
+			as_record_set_nil(rec, bin->name);
+		}
+		else {
+			as_val * copy = callback_batch_copy_bin(bin);
+			if (copy) {
+				as_record_set(rec, bin->name, (as_bin_value *) copy);
+			}
+		}
+	}
+
+	return (as_val *) rec;
+}
+
+static as_val * callback_batch_copy(const as_val * val)
+{
+	if (as_val_type(val) == AS_REC) {
+		return callback_batch_copy_record((const as_record *) val);
+	}
+	// Aggregation results are allocated by the stream, keep a reference.
+	return as_val_reserve((as_val *) val);
+}
+
+/*******************************************************************************
+ * DELIVERY
+ ******************************************************************************/
+
+/**
+ * Records the failure of a C client thread and stops the scan or query.
+ */
+static bool callback_batch_fail(callback_batch * batch, const char * message)
+{
+	pthread_mutex_lock(&batch->lock);
+	if (batch->err.code == AEROSPIKE_OK) {
+		as_error_update(&batch->err, AEROSPIKE_ERR_CLIENT, "%s", message);
+	}
+	batch->stopped = true;
+	pthread_mutex_unlock(&batch->lock);
+
+	return false;
+}
+
+/**
+ * Converts and releases the results of buffer, then passes them to the
+ * handler. Must be called with the GIL held.
+ */
+static bool callback_batch_deliver(callback_batch * batch, callback_batch_buffer * buffer)
+{
+	bool rval = false;
+	PyObject * py_results = NULL;
+
+	if (!batch->stopped) {
+		py_results = PyList_New(0);
+	}
+
+	for (uint32_t i = 0; i < buffer->size; i++) {
+		if (py_results) {
+			as_error err;
+			as_error_init(&err);
+			PyObject * py_result = NULL;
+
+			val_to_pyobject(batch->client, &err, buffer->vals[i], &py_result);
+			if (py_result) {
+				PyList_Append(py_results, py_result);
+				Py_DECREF(py_result);
+			}
+			else {
+				PyErr_Clear();
+			}
+		}
+		as_val_destroy(buffer->vals[i]);
+	}
+	buffer->size = 0;
+
+	if (py_results) {
+		rval = batch->handler(batch, py_results);
+		Py_DECREF(py_results);
+		if (!rval) {
+			batch->stopped = true;
+		}
+	}
+
+	return rval;
+}
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+as_status callback_batch_options(as_error * err, PyObject * py_options,
+		uint32_t * batch_size, bool * batch_callback)
+{
+	*batch_size = 0;
+	*batch_callback = false;
+
+	if (!py_options || !PyDict_Check(py_options)) {
+		return AEROSPIKE_OK;
+	}
+
+	PyObject * py_batch_size = PyDict_GetItemString(py_options, "callback_batch_size");
+	PyObject * py_batch_callback = PyDict_GetItemString(py_options, "batch_callback");
+
+	if (py_batch_callback) {
+		if (!PyBool_Check(py_batch_callback)) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "batch_callback must be a bool");
+		}
+		*batch_callback = (py_batch_callback == Py_True);
+	}
+
+	if (py_batch_size) {
+		long value = -1;
+		if (PyInt_Check(py_batch_size) || PyLong_Check(py_batch_size)) {
+			value = PyLong_AsLong(py_batch_size);
+		}
+		if (value < 0 || value > CALLBACK_BATCH_MAX_SIZE) {
+			PyErr_Clear();
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+					"callback_batch_size must be an integer between 0 and %d", CALLBACK_BATCH_MAX_SIZE);
+		}
+		*batch_size = (uint32_t) value;
+	}
+
+	if (*batch_callback && *batch_size == 0) {
+		*batch_size = CALLBACK_BATCH_DEFAULT_SIZE;
+	}
+
+	return AEROSPIKE_OK;
+}
+
+void callback_batch_init(callback_batch * batch, AerospikeClient * client,
+		uint32_t batch_size, callback_batch_handler handler, void * udata)
+{
+	batch->client = client;
+	batch->batch_size = batch_size;
+	batch->id = ++last_batch_id;
+	batch->handler = handler;
+	batch->udata = udata;
+	batch->stopped = false;
+	as_error_init(&batch->err);
+	pthread_mutex_init(&batch->lock, NULL);
+	as_vector_init(&batch->buffers, sizeof(callback_batch_buffer *), 8);
+}
+
+bool callback_batch_add(const as_val * val, void * udata)
+{
+	callback_batch * batch = (callback_batch *) udata;
+
+	if (!val) {
+		return false;
+	}
+
+	if (batch->stopped) {
+		return false;
+	}
+
+	if (thread_batch_id != batch->id) {
+		callback_batch_buffer * buffer = (callback_batch_buffer *) malloc(
+				sizeof(callback_batch_buffer) + batch->batch_size * sizeof(as_val *));
+		if (!buffer) {
+			return callback_batch_fail(batch, "Unable to allocate the callback batch buffer");
+		}
+		buffer->size = 0;
+
+		pthread_mutex_lock(&batch->lock);
+		as_vector_append(&batch->buffers, &buffer);
+		pthread_mutex_unlock(&batch->lock);
+
+		thread_buffer = buffer;
+		thread_batch_id = batch->id;
+	}
+
+	as_val * copy = callback_batch_copy(val);
+	if (!copy) {
+		return callback_batch_fail(batch, "Unable to copy a result into the callback batch");
+	}
+
+	thread_buffer->vals[thread_buffer->size++] = copy;
+
+	if (thread_buffer->size < batch->batch_size) {
+		return true;
+	}
+
+	PyGILState_STATE gstate;
+	gstate = PyGILState_Ensure();
+
+	bool rval = callback_batch_deliver(batch, thread_buffer);
+
+	PyGILState_Release(gstate);
+
+	return rval;
+}
+
+void callback_batch_destroy(callback_batch * batch, as_error * err)
+{
+	for (uint32_t i = 0; i < batch->buffers.size; i++) {
+		callback_batch_buffer * buffer = *(callback_batch_buffer **) as_vector_get(&batch->buffers, i);
+		callback_batch_deliver(batch, buffer);
+		free(buffer);
+	}
+
+	as_vector_destroy(&batch->buffers);
+	pthread_mutex_destroy(&batch->lock);
+
+	if (batch->err.code != AEROSPIKE_OK) {
+		as_error_copy(err, &batch->err);
+	}
+}
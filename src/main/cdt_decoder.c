@@ -0,0 +1,559 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <string.h>
+
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_policy.h>
+
+#include "cdt_decoder.h"
+#include "geo.h"
+#include "intern.h"
+#include "policy_types.h"
+#include "serializer.h"
+
+static __thread int cdt_mode = CDT_MODE_DEFAULT;
+
+/*******************************************************************************
+ * READING
+ ******************************************************************************/
+
+static inline as_status cdt_truncated(as_error * err)
+{
+	return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Truncated list or map value");
+}
+
+static inline bool cdt_has(cdt_unpacker * pk, uint32_t size)
+{
+	return pk->length - pk->offset >= size;
+}
+
+static inline uint64_t cdt_read_be(const uint8_t * p, uint32_t size)
+{
+	uint64_t value = 0;
+	for (uint32_t i = 0; i < size; i++) {
+		value = (value << 8) | p[i];
+	}
+	return value;
+}
+
+/**
+ * Reads a big endian unsigned integer of size bytes.
+ */
+static as_status cdt_read_uint(as_error * err, cdt_unpacker * pk, uint32_t size, uint64_t * value)
+{
+	if (!cdt_has(pk, size)) {
+		return cdt_truncated(err);
+	}
+	*value = cdt_read_be(pk->buffer + pk->offset, size);
+	pk->offset += size;
+	return AEROSPIKE_OK;
+}
+
+static inline bool cdt_is_ext(uint8_t type)
+{
+	return (type >= 0xc7 && type <= 0xc9) || (type >= 0xd4 && type <= 0xd8);
+}
+
+/**
+ * Reads the size of the payload of the string, blob, ext, array or map
+ * starting with type, already consumed. Returns false for any other type.
+ */
+static bool cdt_payload_size(as_error * err, cdt_unpacker * pk, uint8_t type, uint32_t * size)
+{
+	uint64_t value = 0;
+	uint32_t length_size = 0;
+
+	if ((type & 0xe0) == 0xa0) {
+		*size = type & 0x1f;
+		return true;
+	}
+	if ((type & 0xf0) == 0x90 || (type & 0xf0) == 0x80) {
+		*size = type & 0x0f;
+		return true;
+	}
+	switch (type) {
+		case 0xc4: case 0xc7: case 0xd9:
+			length_size = 1;
+			break;
+		case 0xc5: case 0xc8: case 0xda: case 0xdc: case 0xde:
+			length_size = 2;
+			break;
+		case 0xc6: case 0xc9: case 0xdb: case 0xdd: case 0xdf:
+			length_size = 4;
+			break;
+		case 0xd4: *size = 1; return true;
+		case 0xd5: *size = 2; return true;
+		case 0xd6: *size = 4; return true;
+		case 0xd7: *size = 8; return true;
+		case 0xd8: *size = 16; return true;
+		default:
+			return false;
+	}
+	if (cdt_read_uint(err, pk, length_size, &value) != AEROSPIKE_OK) {
+		return false;
+	}
+	*size = (uint32_t) value;
+	return true;
+}
+
+as_status cdt_skip_value(as_error * err, cdt_unpacker * pk)
+{
+	if (!cdt_has(pk, 1)) {
+		return cdt_truncated(err);
+	}
+
+	uint8_t type = pk->buffer[pk->offset++];
+	uint32_t size = 0;
+	uint64_t count = 0;
+
+	// Fixed size values.
+	if (type <= 0x7f || type >= 0xe0 || type == 0xc0 || type == 0xc2 || type == 0xc3) {
+		return AEROSPIKE_OK;
+	}
+	switch (type) {
+		case 0xcc: case 0xd0: size = 1; break;
+		case 0xcd: case 0xd1: size = 2; break;
+		case 0xca: case 0xce: case 0xd2: size = 4; break;
+		case 0xcb: case 0xcf: case 0xd3: size = 8; break;
+		default: {
+			if (!cdt_payload_size(err, pk, type, &size)) {
+				return err->code != AEROSPIKE_OK ? err->code :
+						as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unknown type for value");
+			}
+			// Arrays and maps hold size values, or size pairs of values.
+			if ((type & 0xf0) == 0x90 || type == 0xdc || type == 0xdd) {
+				count = size;
+				size = 0;
+			}
+			else if ((type & 0xf0) == 0x80 || type == 0xde || type == 0xdf) {
+				count = (uint64_t) size * 2;
+				size = 0;
+			}
+			else if (cdt_is_ext(type)) {
+				// The ext type byte.
+				size += 1;
+			}
+			break;
+		}
+	}
+
+	if (!cdt_has(pk, size)) {
+		return cdt_truncated(err);
+	}
+	pk->offset += size;
+
+	for (uint64_t i = 0; i < count; i++) {
+		if (cdt_skip_value(err, pk) != AEROSPIKE_OK) {
+			return err->code;
+		}
+	}
+	return AEROSPIKE_OK;
+}
+
+as_status cdt_unpack_container(as_error * err, cdt_unpacker * pk, bool * is_map, uint32_t * count)
+{
+	if (!cdt_has(pk, 1)) {
+		return cdt_truncated(err);
+	}
+
+	uint8_t type = pk->buffer[pk->offset++];
+	if ((type & 0xf0) == 0x90 || type == 0xdc || type == 0xdd) {
+		*is_map = false;
+	}
+	else if ((type & 0xf0) == 0x80 || type == 0xde || type == 0xdf) {
+		*is_map = true;
+	}
+	else {
+		pk->offset--;
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Value is not a list or a map");
+	}
+
+	if (!cdt_payload_size(err, pk, type, count)) {
+		return err->code;
+	}
+
+	// Ordered lists and maps start with an ext element holding their flags,
+	// with a nil value for maps.
+	if (*count > 0 && cdt_has(pk, 1) && cdt_is_ext(pk->buffer[pk->offset])) {
+		if (cdt_skip_value(err, pk) != AEROSPIKE_OK ||
+				(*is_map && cdt_skip_value(err, pk) != AEROSPIKE_OK)) {
+			return err->code;
+		}
+		(*count)--;
+	}
+	return AEROSPIKE_OK;
+}
+
+/*******************************************************************************
+ * CONVERSION
+ ******************************************************************************/
+
+/**
+ * Strings and blobs start with their as_bytes type, as in as_msgpack.
+ */
+static as_status cdt_unpack_bytes(AerospikeClient * self, as_error * err, cdt_unpacker * pk,
+		uint32_t size, PyObject ** py_val)
+{
+	if (!cdt_has(pk, size)) {
+		return cdt_truncated(err);
+	}
+
+	const uint8_t * data = pk->buffer + pk->offset;
+	pk->offset += size;
+
+	if (size == 0) {
+		*py_val = PyByteArray_FromStringAndSize(NULL, 0);
+		return AEROSPIKE_OK;
+	}
+
+	uint8_t type = data[0];
+	data++;
+	size--;
+
+	switch (type) {
+		case AS_BYTES_STRING: {
+			*py_val = PyUnicode_DecodeUTF8((const char *) data, size, NULL);
+			if (!*py_val) {
+				PyErr_Clear();
+				return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unknown type for value");
+			}
+			return AEROSPIKE_OK;
+		}
+		case AS_BYTES_GEOJSON: {
+			PyObject * py_locstr = PyUnicode_DecodeUTF8((const char *) data, size, NULL);
+			if (!py_locstr) {
+				PyErr_Clear();
+				return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unknown type for value");
+			}
+			PyObject * py_loads = AerospikeGeospatial_DoLoads(py_locstr, err);
+			Py_DECREF(py_locstr);
+			if (err->code != AEROSPIKE_OK) {
+				return err->code;
+			}
+			*py_val = AerospikeGeospatial_New(err, py_loads);
+			Py_XDECREF(py_loads);
+			return err->code;
+		}
+		default: {
+			// Blobs go through the serializers, as blobs of the as_val tree.
+			as_bytes bytes;
+			as_bytes_init_wrap(&bytes, (uint8_t *) data, size, false);
+			as_bytes_set_type(&bytes, (as_bytes_type) type);
+			return deserialize_based_on_as_bytes_type(self, &bytes, py_val, err);
+		}
+	}
+}
+
+as_status cdt_unpack_map_key(AerospikeClient * self, as_error * err, cdt_unpacker * pk, PyObject ** py_key)
+{
+	uint32_t offset = pk->offset;
+	uint32_t size = 0;
+
+	if (cdt_has(pk, 1)) {
+		uint8_t type = pk->buffer[pk->offset];
+		if ((type & 0xe0) == 0xa0 || type == 0xd9 || type == 0xda || type == 0xdb) {
+			pk->offset++;
+			if (!cdt_payload_size(err, pk, type, &size)) {
+				return err->code;
+			}
+			if (size > 0 && cdt_has(pk, size) && pk->buffer[pk->offset] == AS_BYTES_STRING) {
+				*py_key = intern_string(self, (const char *) pk->buffer + pk->offset + 1, size - 1);
+				if (*py_key) {
+					pk->offset += size;
+					return AEROSPIKE_OK;
+				}
+				PyErr_Clear();
+			}
+			// Blobs, and errors, are left to cdt_unpack_value().
+			pk->offset = offset;
+		}
+	}
+	return cdt_unpack_value(self, err, pk, py_key);
+}
+
+static as_status cdt_unpack_list(AerospikeClient * self, as_error * err, cdt_unpacker * pk,
+		uint32_t count, PyObject ** py_val)
+{
+	PyObject * py_list = PyList_New(count);
+	if (!py_list) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to allocate memory for list");
+	}
+
+	for (uint32_t i = 0; i < count; i++) {
+		PyObject * py_item = NULL;
+		if (cdt_unpack_value(self, err, pk, &py_item) != AEROSPIKE_OK) {
+			Py_DECREF(py_list);
+			return err->code;
+		}
+		PyList_SET_ITEM(py_list, i, py_item);
+	}
+
+	*py_val = py_list;
+	return AEROSPIKE_OK;
+}
+
+static as_status cdt_unpack_map(AerospikeClient * self, as_error * err, cdt_unpacker * pk,
+		uint32_t count, PyObject ** py_val)
+{
+	PyObject * py_dict = PyDict_New();
+	if (!py_dict) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to allocate memory for dictionary.");
+	}
+
+	for (uint32_t i = 0; i < count; i++) {
+		PyObject * py_key = NULL;
+		PyObject * py_value = NULL;
+
+		if (cdt_unpack_map_key(self, err, pk, &py_key) != AEROSPIKE_OK) {
+			Py_DECREF(py_dict);
+			return err->code;
+		}
+		if (cdt_unpack_value(self, err, pk, &py_value) != AEROSPIKE_OK) {
+			Py_DECREF(py_key);
+			Py_DECREF(py_dict);
+			return err->code;
+		}
+
+		int rc = PyDict_SetItem(py_dict, py_key, py_value);
+		Py_DECREF(py_key);
+		Py_DECREF(py_value);
+		if (rc == -1) {
+			if (PyErr_ExceptionMatches(PyExc_TypeError)) {
+				as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to use unhashable type as a dictionary key");
+			} else {
+				as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to add dictionary item");
+			}
+			PyErr_Clear();
+			Py_DECREF(py_dict);
+			return err->code;
+		}
+	}
+
+	*py_val = py_dict;
+	return AEROSPIKE_OK;
+}
+
+as_status cdt_unpack_value(AerospikeClient * self, as_error * err, cdt_unpacker * pk, PyObject ** py_val)
+{
+	uint64_t value = 0;
+	uint32_t size = 0;
+
+	*py_val = NULL;
+
+	if (!cdt_has(pk, 1)) {
+		return cdt_truncated(err);
+	}
+
+	uint8_t type = pk->buffer[pk->offset];
+
+	if (cdt_is_container(type)) {
+		bool is_map = false;
+		if (cdt_unpack_container(err, pk, &is_map, &size) != AEROSPIKE_OK) {
+			return err->code;
+		}
+		return is_map ? cdt_unpack_map(self, err, pk, size, py_val) :
+				cdt_unpack_list(self, err, pk, size, py_val);
+	}
+
+	pk->offset++;
+
+	if (type <= 0x7f) {
+		*py_val = PyLong_FromLong(type);
+	}
+	else if (type >= 0xe0) {
+		*py_val = PyLong_FromLong((int8_t) type);
+	}
+	else {
+		switch (type) {
+			case 0xc0:
+				Py_INCREF(Py_None);
+				*py_val = Py_None;
+				break;
+			case 0xc2:
+				*py_val = PyBool_FromLong(0);
+				break;
+			case 0xc3:
+				*py_val = PyBool_FromLong(1);
+				break;
+			case 0xcc: case 0xcd: case 0xce: case 0xcf: {
+				// Unsigned 64 bit integers wrap around, as in as_integer.
+				if (cdt_read_uint(err, pk, 1 << (type - 0xcc), &value) != AEROSPIKE_OK) {
+					return err->code;
+				}
+				*py_val = PyLong_FromLongLong((int64_t) value);
+				break;
+			}
+			case 0xd0:
+				if (cdt_read_uint(err, pk, 1, &value) != AEROSPIKE_OK) {
+					return err->code;
+				}
+				*py_val = PyLong_FromLong((int8_t) value);
+				break;
+			case 0xd1:
+				if (cdt_read_uint(err, pk, 2, &value) != AEROSPIKE_OK) {
+					return err->code;
+				}
+				*py_val = PyLong_FromLong((int16_t) value);
+				break;
+			case 0xd2:
+				if (cdt_read_uint(err, pk, 4, &value) != AEROSPIKE_OK) {
+					return err->code;
+				}
+				*py_val = PyLong_FromLong((int32_t) value);
+				break;
+			case 0xd3:
+				if (cdt_read_uint(err, pk, 8, &value) != AEROSPIKE_OK) {
+					return err->code;
+				}
+				*py_val = PyLong_FromLongLong((int64_t) value);
+				break;
+			case 0xca: {
+				if (cdt_read_uint(err, pk, 4, &value) != AEROSPIKE_OK) {
+					return err->code;
+				}
+				uint32_t bits = (uint32_t) value;
+				float f;
+				memcpy(&f, &bits, sizeof(f));
+				*py_val = PyFloat_FromDouble(f);
+				break;
+			}
+			case 0xcb: {
+				if (cdt_read_uint(err, pk, 8, &value) != AEROSPIKE_OK) {
+					return err->code;
+				}
+				double d;
+				memcpy(&d, &value, sizeof(d));
+				*py_val = PyFloat_FromDouble(d);
+				break;
+			}
+			case 0xc4: case 0xc5: case 0xc6: case 0xd9: case 0xda: case 0xdb:
+				if (!cdt_payload_size(err, pk, type, &size)) {
+					return err->code;
+				}
+				return cdt_unpack_bytes(self, err, pk, size, py_val);
+			default:
+				if ((type & 0xe0) == 0xa0) {
+					return cdt_unpack_bytes(self, err, pk, type & 0x1f, py_val);
+				}
+				return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unknown type for value");
+		}
+	}
+
+	if (!*py_val) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to convert value");
+	}
+	return AEROSPIKE_OK;
+}
+
+as_status cdt_bytes_to_pyobject(AerospikeClient * self, as_error * err, const as_bytes * bytes, PyObject ** py_val)
+{
+	cdt_unpacker pk = {
+		.buffer = bytes->value,
+		.offset = 0,
+		.length = bytes->size
+	};
+
+	return cdt_unpack_value(self, err, &pk, py_val);
+}
+
+/*******************************************************************************
+ * CDT MODE
+ ******************************************************************************/
+
+bool cdt_mode_from_pyobject(PyObject * py_value, int * mode)
+{
+	const char * name = PyUnicode_Check(py_value) ? PyUnicode_AsUTF8(py_value) : NULL;
+
+	if (name && !strcmp(name, "default")) {
+		*mode = CDT_MODE_DEFAULT;
+		return true;
+	}
+	if (name && !strcmp(name, "direct")) {
+		*mode = CDT_MODE_DIRECT;
+		return true;
+	}
+	if (name && !strcmp(name, "lazy")) {
+		*mode = CDT_MODE_LAZY;
+		return true;
+	}
+	PyErr_Clear();
+	return false;
+}
+
+as_status cdt_mode_from_policy(AerospikeClient * self, as_error * err, PyObject * py_policy, int * mode)
+{
+	PyObject * py_fields = py_policy;
+	PyObject * py_value = NULL;
+
+	*mode = self->cdt_mode;
+
+	if (AerospikePolicy_Check(py_policy)) {
+		py_fields = ((AerospikePolicy *) py_policy)->py_fields;
+	}
+
+	if (!py_fields || !PyDict_Check(py_fields)) {
+		return err->code;
+	}
+
+	py_value = PyDict_GetItemString(py_fields, "cdt_mode");
+	if (py_value && !cdt_mode_from_pyobject(py_value, mode)) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "cdt_mode must be 'default', 'direct' or 'lazy'");
+	}
+	return err->code;
+}
+
+int set_cdt_mode(int mode)
+{
+	int previous = cdt_mode;
+	cdt_mode = mode;
+	return previous;
+}
+
+int get_cdt_mode()
+{
+	return cdt_mode;
+}
+
+void cdt_mode_apply_read(AerospikeClient * self, int mode, as_policy_read * policy, as_policy_read ** policy_p)
+{
+	if (mode == CDT_MODE_DEFAULT) {
+		return;
+	}
+	if (*policy_p != policy) {
+		as_policy_read_copy(*policy_p ? *policy_p : &self->as->config.policies.read, policy);
+		*policy_p = policy;
+	}
+	policy->deserialize = false;
+}
+
+void cdt_mode_apply_batch(AerospikeClient * self, int mode, as_policy_batch * policy, as_policy_batch ** policy_p)
+{
+	if (mode == CDT_MODE_DEFAULT) {
+		return;
+	}
+	if (*policy_p != policy) {
+		as_policy_batch_copy(*policy_p ? *policy_p : &self->as->config.policies.batch, policy);
+		*policy_p = policy;
+	}
+	policy->deserialize = false;
+}
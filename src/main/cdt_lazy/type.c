@@ -0,0 +1,830 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_error.h>
+
+#include "blob.h"
+#include "cdt_decoder.h"
+#include "cdt_lazy.h"
+#include "conversions.h"
+#include "exceptions.h"
+
+static PyTypeObject AerospikeLazyList_Type;
+static PyTypeObject AerospikeLazyMap_Type;
+static PyTypeObject AerospikeLazyListIterator_Type;
+
+typedef struct {
+	PyObject_HEAD
+	AerospikeLazyCDT * list;
+	cdt_unpacker pk;
+	uint32_t remaining;
+} AerospikeLazyListIterator;
+
+/*******************************************************************************
+ * HELPERS
+ ******************************************************************************/
+
+static PyObject * lazy_raise(as_error * err)
+{
+	PyObject * py_err = NULL;
+	error_to_pyobject(err, &py_err);
+	PyObject * exception_type = raise_exception(err);
+	PyErr_SetObject(exception_type, py_err);
+	Py_DECREF(py_err);
+	return NULL;
+}
+
+static PyObject * lazy_new(PyTypeObject * type, AerospikeClient * client, PyObject * py_owner,
+		const uint8_t * buffer, uint32_t length, uint32_t offset, uint32_t count)
+{
+	AerospikeLazyCDT * self = PyObject_New(AerospikeLazyCDT, type);
+	if (!self) {
+		return NULL;
+	}
+
+	Py_XINCREF(client);
+	self->client = client;
+	Py_INCREF(py_owner);
+	self->py_owner = py_owner;
+	self->buffer = buffer;
+	self->length = length;
+	self->offset = offset;
+	self->count = count;
+	self->offsets = NULL;
+	self->py_index = NULL;
+
+	return (PyObject *) self;
+}
+
+/**
+ * Positions pk on the first element of self.
+ */
+static as_status lazy_start(AerospikeLazyCDT * self, as_error * err, cdt_unpacker * pk)
+{
+	bool is_map = false;
+	uint32_t count = 0;
+
+	pk->buffer = self->buffer;
+	pk->offset = self->offset;
+	pk->length = self->length;
+
+	return cdt_unpack_container(err, pk, &is_map, &count);
+}
+
+/**
+ * Reads the value at the offset of pk, a list or map as a view over the same
+ * buffer. pk is only moved past the value when advance is true, which costs
+ * a walk over the elements of a list or map.
+ */
+static as_status lazy_unpack_value(AerospikeLazyCDT * self, as_error * err, cdt_unpacker * pk,
+		bool advance, PyObject ** py_val)
+{
+	uint32_t offset = pk->offset;
+	bool is_map = false;
+	uint32_t count = 0;
+
+	*py_val = NULL;
+
+	if (pk->offset >= pk->length || !cdt_is_container(pk->buffer[pk->offset])) {
+		return cdt_unpack_value(self->client, err, pk, py_val);
+	}
+
+	if (cdt_unpack_container(err, pk, &is_map, &count) != AEROSPIKE_OK) {
+		return err->code;
+	}
+
+	if (advance) {
+		uint64_t values = is_map ? (uint64_t) count * 2 : count;
+		for (uint64_t i = 0; i < values; i++) {
+			if (cdt_skip_value(err, pk) != AEROSPIKE_OK) {
+				return err->code;
+			}
+		}
+	}
+
+	*py_val = lazy_new(is_map ? &AerospikeLazyMap_Type : &AerospikeLazyList_Type,
+			self->client, self->py_owner, self->buffer, self->length, offset, count);
+	if (!*py_val) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to allocate memory for list or map");
+	}
+	return AEROSPIKE_OK;
+}
+
+static PyObject * lazy_materialize(AerospikeLazyCDT * self)
+{
+	as_error err;
+	as_error_init(&err);
+
+	PyObject * py_val = NULL;
+	cdt_unpacker pk = {
+		.buffer = self->buffer,
+		.offset = self->offset,
+		.length = self->length
+	};
+
+	if (cdt_unpack_value(self->client, &err, &pk, &py_val) != AEROSPIKE_OK) {
+		return lazy_raise(&err);
+	}
+	return py_val;
+}
+
+/*******************************************************************************
+ * LAZY LIST
+ ******************************************************************************/
+
+/**
+ * Records the offset of every element, so they can be read by index.
+ */
+static as_status lazy_list_index(AerospikeLazyCDT * self, as_error * err)
+{
+	cdt_unpacker pk;
+
+	if (self->offsets) {
+		return AEROSPIKE_OK;
+	}
+
+	if (lazy_start(self, err, &pk) != AEROSPIKE_OK) {
+		return err->code;
+	}
+
+	uint32_t * offsets = (uint32_t *) PyMem_Malloc(sizeof(uint32_t) * (self->count ? self->count : 1));
+	if (!offsets) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to allocate memory for list");
+	}
+
+	for (uint32_t i = 0; i < self->count; i++) {
+		offsets[i] = pk.offset;
+		if (cdt_skip_value(err, &pk) != AEROSPIKE_OK) {
+			PyMem_Free(offsets);
+			return err->code;
+		}
+	}
+
+	self->offsets = offsets;
+	return AEROSPIKE_OK;
+}
+
+static PyObject * lazy_list_item(AerospikeLazyCDT * self, Py_ssize_t i)
+{
+	as_error err;
+	as_error_init(&err);
+
+	PyObject * py_item = NULL;
+
+	if (i < 0 || i >= (Py_ssize_t) self->count) {
+		PyErr_SetString(PyExc_IndexError, "LazyList index out of range");
+		return NULL;
+	}
+
+	if (lazy_list_index(self, &err) != AEROSPIKE_OK) {
+		return lazy_raise(&err);
+	}
+
+	cdt_unpacker pk = {
+		.buffer = self->buffer,
+		.offset = self->offsets[i],
+		.length = self->length
+	};
+
+	if (lazy_unpack_value(self, &err, &pk, false, &py_item) != AEROSPIKE_OK) {
+		return lazy_raise(&err);
+	}
+	return py_item;
+}
+
+static PyObject * AerospikeLazyList_Type_Subscript(AerospikeLazyCDT * self, PyObject * py_index)
+{
+	if (PyIndex_Check(py_index)) {
+		Py_ssize_t i = PyNumber_AsSsize_t(py_index, PyExc_IndexError);
+		if (i == -1 && PyErr_Occurred()) {
+			return NULL;
+		}
+		if (i < 0) {
+			i += self->count;
+		}
+		return lazy_list_item(self, i);
+	}
+
+	if (PySlice_Check(py_index)) {
+		Py_ssize_t start, stop, step;
+		if (PySlice_Unpack(py_index, &start, &stop, &step) < 0) {
+			return NULL;
+		}
+		Py_ssize_t size = PySlice_AdjustIndices(self->count, &start, &stop, step);
+
+		PyObject * py_list = PyList_New(size);
+		if (!py_list) {
+			return NULL;
+		}
+		for (Py_ssize_t i = 0; i < size; i++) {
+			PyObject * py_item = lazy_list_item(self, start + i * step);
+			if (!py_item) {
+				Py_DECREF(py_list);
+				return NULL;
+			}
+			PyList_SET_ITEM(py_list, i, py_item);
+		}
+		return py_list;
+	}
+
+	return PyErr_Format(PyExc_TypeError, "LazyList indices must be integers or slices, not %.200s",
+			Py_TYPE(py_index)->tp_name);
+}
+
+static PyObject * AerospikeLazyList_Type_Iter(AerospikeLazyCDT * self)
+{
+	as_error err;
+	as_error_init(&err);
+
+	AerospikeLazyListIterator * py_iter = PyObject_New(AerospikeLazyListIterator, &AerospikeLazyListIterator_Type);
+	if (!py_iter) {
+		return NULL;
+	}
+
+	Py_INCREF(self);
+	py_iter->list = self;
+	py_iter->remaining = self->count;
+
+	if (lazy_start(self, &err, &py_iter->pk) != AEROSPIKE_OK) {
+		Py_DECREF(py_iter);
+		return lazy_raise(&err);
+	}
+	return (PyObject *) py_iter;
+}
+
+PyDoc_STRVAR(lazy_list_index_doc,
+"index(value[, start[, stop]]) -> int\n\
+\n\
+Return the first index of value, decoding the elements until it is found.");
+
+static PyObject * AerospikeLazyList_Index(AerospikeLazyCDT * self, PyObject * args)
+{
+	PyObject * py_value = NULL;
+	Py_ssize_t start = 0;
+	Py_ssize_t stop = PY_SSIZE_T_MAX;
+
+	if (!PyArg_ParseTuple(args, "O|nn:index", &py_value, &start, &stop)) {
+		return NULL;
+	}
+
+	if (start < 0) {
+		start += self->count;
+		start = start < 0 ? 0 : start;
+	}
+	if (stop < 0) {
+		stop += self->count;
+	}
+	stop = stop > (Py_ssize_t) self->count ? (Py_ssize_t) self->count : stop;
+
+	for (Py_ssize_t i = start; i < stop; i++) {
+		PyObject * py_item = lazy_list_item(self, i);
+		if (!py_item) {
+			return NULL;
+		}
+		int rc = PyObject_RichCompareBool(py_item, py_value, Py_EQ);
+		Py_DECREF(py_item);
+		if (rc < 0) {
+			return NULL;
+		}
+		if (rc) {
+			return PyLong_FromSsize_t(i);
+		}
+	}
+
+	PyErr_SetString(PyExc_ValueError, "value is not in LazyList");
+	return NULL;
+}
+
+PyDoc_STRVAR(lazy_list_count_doc,
+"count(value) -> int\n\
+\n\
+Return the number of occurrences of value, decoding every element.");
+
+static PyObject * AerospikeLazyList_Count(AerospikeLazyCDT * self, PyObject * py_value)
+{
+	Py_ssize_t count = 0;
+
+	for (Py_ssize_t i = 0; i < (Py_ssize_t) self->count; i++) {
+		PyObject * py_item = lazy_list_item(self, i);
+		if (!py_item) {
+			return NULL;
+		}
+		int rc = PyObject_RichCompareBool(py_item, py_value, Py_EQ);
+		Py_DECREF(py_item);
+		if (rc < 0) {
+			return NULL;
+		}
+		count += rc;
+	}
+
+	return PyLong_FromSsize_t(count);
+}
+
+/*******************************************************************************
+ * LAZY LIST ITERATOR
+ ******************************************************************************/
+
+static PyObject * AerospikeLazyListIterator_Type_Next(AerospikeLazyListIterator * self)
+{
+	as_error err;
+	as_error_init(&err);
+
+	PyObject * py_item = NULL;
+
+	if (self->remaining == 0) {
+		return NULL;
+	}
+
+	if (lazy_unpack_value(self->list, &err, &self->pk, true, &py_item) != AEROSPIKE_OK) {
+		self->remaining = 0;
+		return lazy_raise(&err);
+	}
+	self->remaining--;
+	return py_item;
+}
+
+static void AerospikeLazyListIterator_Type_Dealloc(AerospikeLazyListIterator * self)
+{
+	Py_XDECREF(self->list);
+	PyObject_Del(self);
+}
+
+/*******************************************************************************
+ * LAZY MAP
+ ******************************************************************************/
+
+/**
+ * Decodes every key and records the offset of its value.
+ */
+static as_status lazy_map_index(AerospikeLazyCDT * self, as_error * err)
+{
+	cdt_unpacker pk;
+
+	if (self->py_index) {
+		return AEROSPIKE_OK;
+	}
+
+	if (lazy_start(self, err, &pk) != AEROSPIKE_OK) {
+		return err->code;
+	}
+
+	PyObject * py_index = PyDict_New();
+	if (!py_index) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to allocate memory for dictionary.");
+	}
+
+	for (uint32_t i = 0; i < self->count; i++) {
+		PyObject * py_key = NULL;
+		if (cdt_unpack_map_key(self->client, err, &pk, &py_key) != AEROSPIKE_OK) {
+			Py_DECREF(py_index);
+			return err->code;
+		}
+
+		PyObject * py_offset = PyLong_FromUnsignedLong(pk.offset);
+		int rc = py_offset ? PyDict_SetItem(py_index, py_key, py_offset) : -1;
+		Py_DECREF(py_key);
+		Py_XDECREF(py_offset);
+		if (rc == -1) {
+			if (PyErr_ExceptionMatches(PyExc_TypeError)) {
+				as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to use unhashable type as a dictionary key");
+			} else {
+				as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to add dictionary item");
+			}
+			PyErr_Clear();
+			Py_DECREF(py_index);
+			return err->code;
+		}
+
+		if (cdt_skip_value(err, &pk) != AEROSPIKE_OK) {
+			Py_DECREF(py_index);
+			return err->code;
+		}
+	}
+
+	// A deserializer run for a key may have let another thread in first.
+	if (self->py_index) {
+		Py_DECREF(py_index);
+	}
+	else {
+		self->py_index = py_index;
+	}
+	return AEROSPIKE_OK;
+}
+
+static PyObject * lazy_map_value(AerospikeLazyCDT * self, PyObject * py_offset)
+{
+	as_error err;
+	as_error_init(&err);
+
+	PyObject * py_value = NULL;
+	cdt_unpacker pk = {
+		.buffer = self->buffer,
+		.offset = (uint32_t) PyLong_AsUnsignedLong(py_offset),
+		.length = self->length
+	};
+
+	if (lazy_unpack_value(self, &err, &pk, false, &py_value) != AEROSPIKE_OK) {
+		return lazy_raise(&err);
+	}
+	return py_value;
+}
+
+/**
+ * Returns a borrowed reference to the offset of the value of py_key, NULL
+ * with no exception set if there is none.
+ */
+static PyObject * lazy_map_lookup(AerospikeLazyCDT * self, PyObject * py_key)
+{
+	as_error err;
+	as_error_init(&err);
+
+	if (lazy_map_index(self, &err) != AEROSPIKE_OK) {
+		return lazy_raise(&err);
+	}
+	return PyDict_GetItemWithError(self->py_index, py_key);
+}
+
+static PyObject * AerospikeLazyMap_Type_Subscript(AerospikeLazyCDT * self, PyObject * py_key)
+{
+	PyObject * py_offset = lazy_map_lookup(self, py_key);
+	if (!py_offset) {
+		if (!PyErr_Occurred()) {
+			PyObject * py_args = PyTuple_Pack(1, py_key);
+			if (py_args) {
+				PyErr_SetObject(PyExc_KeyError, py_args);
+				Py_DECREF(py_args);
+			}
+		}
+		return NULL;
+	}
+	return lazy_map_value(self, py_offset);
+}
+
+static int AerospikeLazyMap_Type_Contains(AerospikeLazyCDT * self, PyObject * py_key)
+{
+	PyObject * py_offset = lazy_map_lookup(self, py_key);
+	if (!py_offset) {
+		return PyErr_Occurred() ? -1 : 0;
+	}
+	return 1;
+}
+
+static PyObject * AerospikeLazyMap_Type_Iter(AerospikeLazyCDT * self)
+{
+	as_error err;
+	as_error_init(&err);
+
+	if (lazy_map_index(self, &err) != AEROSPIKE_OK) {
+		return lazy_raise(&err);
+	}
+	return PyObject_GetIter(self->py_index);
+}
+
+PyDoc_STRVAR(lazy_map_get_doc,
+"get(key[, default]) -> value\n\
+\n\
+Return the value of key, or default (None) if the map does not hold key.");
+
+static PyObject * AerospikeLazyMap_Get(AerospikeLazyCDT * self, PyObject * args)
+{
+	PyObject * py_key = NULL;
+	PyObject * py_default = Py_None;
+
+	if (!PyArg_ParseTuple(args, "O|O:get", &py_key, &py_default)) {
+		return NULL;
+	}
+
+	PyObject * py_offset = lazy_map_lookup(self, py_key);
+	if (!py_offset) {
+		if (PyErr_Occurred()) {
+			return NULL;
+		}
+		Py_INCREF(py_default);
+		return py_default;
+	}
+	return lazy_map_value(self, py_offset);
+}
+
+PyDoc_STRVAR(lazy_map_keys_doc,
+"keys() -> view\n\
+\n\
+Return a view of the keys of the map, decoding the keys but not the values.");
+
+static PyObject * AerospikeLazyMap_Keys(AerospikeLazyCDT * self, PyObject * Py_UNUSED(ignored))
+{
+	as_error err;
+	as_error_init(&err);
+
+	if (lazy_map_index(self, &err) != AEROSPIKE_OK) {
+		return lazy_raise(&err);
+	}
+	return PyObject_CallMethod(self->py_index, "keys", NULL);
+}
+
+/**
+ * Builds the list of the values, or of the (key, value) tuples.
+ */
+static PyObject * lazy_map_list(AerospikeLazyCDT * self, bool with_keys)
+{
+	as_error err;
+	as_error_init(&err);
+
+	PyObject * py_key = NULL;
+	PyObject * py_offset = NULL;
+	Py_ssize_t pos = 0;
+	Py_ssize_t i = 0;
+
+	if (lazy_map_index(self, &err) != AEROSPIKE_OK) {
+		return lazy_raise(&err);
+	}
+
+	PyObject * py_list = PyList_New(PyDict_Size(self->py_index));
+	if (!py_list) {
+		return NULL;
+	}
+
+	while (PyDict_Next(self->py_index, &pos, &py_key, &py_offset)) {
+		PyObject * py_item = lazy_map_value(self, py_offset);
+		if (py_item && with_keys) {
+			PyObject * py_pair = PyTuple_Pack(2, py_key, py_item);
+			Py_DECREF(py_item);
+			py_item = py_pair;
+		}
+		if (!py_item) {
+			Py_DECREF(py_list);
+			return NULL;
+		}
+		PyList_SET_ITEM(py_list, i++, py_item);
+	}
+
+	return py_list;
+}
+
+PyDoc_STRVAR(lazy_map_values_doc,
+"values() -> list\n\
+\n\
+Return the list of the values of the map, nested lists and maps as views.");
+
+static PyObject * AerospikeLazyMap_Values(AerospikeLazyCDT * self, PyObject * Py_UNUSED(ignored))
+{
+	return lazy_map_list(self, false);
+}
+
+PyDoc_STRVAR(lazy_map_items_doc,
+"items() -> list\n\
+\n\
+Return the list of the (key, value) pairs of the map, nested lists and maps as views.");
+
+static PyObject * AerospikeLazyMap_Items(AerospikeLazyCDT * self, PyObject * Py_UNUSED(ignored))
+{
+	return lazy_map_list(self, true);
+}
+
+/*******************************************************************************
+ * COMMON
+ ******************************************************************************/
+
+PyDoc_STRVAR(lazy_materialize_doc,
+"materialize() -> list or dict\n\
+\n\
+Decode every element, returning the list or dict a read without cdt_mode='lazy' would have returned.");
+
+static PyObject * AerospikeLazyCDT_Materialize(AerospikeLazyCDT * self, PyObject * Py_UNUSED(ignored))
+{
+	return lazy_materialize(self);
+}
+
+static Py_ssize_t AerospikeLazyCDT_Type_Length(AerospikeLazyCDT * self)
+{
+	return self->count;
+}
+
+/**
+ * Views compare equal to the list or dict they materialize to.
+ */
+static PyObject * AerospikeLazyCDT_Type_RichCompare(AerospikeLazyCDT * self, PyObject * py_other, int op)
+{
+	if (op != Py_EQ && op != Py_NE) {
+		Py_RETURN_NOTIMPLEMENTED;
+	}
+
+	PyObject * py_self = lazy_materialize(self);
+	if (!py_self) {
+		return NULL;
+	}
+
+	if (AerospikeLazyCDT_Check(py_other)) {
+		py_other = lazy_materialize((AerospikeLazyCDT *) py_other);
+		if (!py_other) {
+			Py_DECREF(py_self);
+			return NULL;
+		}
+	}
+	else {
+		Py_INCREF(py_other);
+	}
+
+	PyObject * py_result = PyObject_RichCompare(py_self, py_other, op);
+	Py_DECREF(py_self);
+	Py_DECREF(py_other);
+	return py_result;
+}
+
+static PyObject * AerospikeLazyCDT_Type_Repr(AerospikeLazyCDT * self)
+{
+	return PyUnicode_FromFormat("<%s size=%u>", Py_TYPE(self)->tp_name, self->count);
+}
+
+static void AerospikeLazyCDT_Type_Dealloc(AerospikeLazyCDT * self)
+{
+	Py_XDECREF(self->client);
+	Py_XDECREF(self->py_owner);
+	PyMem_Free(self->offsets);
+	Py_XDECREF(self->py_index);
+	PyObject_Del(self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTORS
+ ******************************************************************************/
+
+static PyMethodDef AerospikeLazyList_Type_Methods[] = {
+	{"materialize", (PyCFunction) AerospikeLazyCDT_Materialize, METH_NOARGS, lazy_materialize_doc},
+	{"index", (PyCFunction) AerospikeLazyList_Index, METH_VARARGS, lazy_list_index_doc},
+	{"count", (PyCFunction) AerospikeLazyList_Count, METH_O, lazy_list_count_doc},
+	{NULL}
+};
+
+static PySequenceMethods AerospikeLazyList_Type_Sequence = {
+	.sq_length = (lenfunc) AerospikeLazyCDT_Type_Length,
+	.sq_item = (ssizeargfunc) lazy_list_item,
+};
+
+static PyMappingMethods AerospikeLazyList_Type_Mapping = {
+	.mp_length = (lenfunc) AerospikeLazyCDT_Type_Length,
+	.mp_subscript = (binaryfunc) AerospikeLazyList_Type_Subscript,
+};
+
+static PyTypeObject AerospikeLazyList_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	.tp_name = "aerospike.LazyList",
+	.tp_basicsize = sizeof(AerospikeLazyCDT),
+	.tp_dealloc = (destructor) AerospikeLazyCDT_Type_Dealloc,
+	.tp_repr = (reprfunc) AerospikeLazyCDT_Type_Repr,
+	.tp_as_sequence = &AerospikeLazyList_Type_Sequence,
+	.tp_as_mapping = &AerospikeLazyList_Type_Mapping,
+	.tp_hash = PyObject_HashNotImplemented,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "A read only sequence over a list bin read with cdt_mode='lazy'.\n\n"
+			"Elements are decoded from the packed bin each time they are accessed,\n"
+			"nested lists and maps are returned as LazyList and LazyMap views.\n",
+	.tp_richcompare = (richcmpfunc) AerospikeLazyCDT_Type_RichCompare,
+	.tp_iter = (getiterfunc) AerospikeLazyList_Type_Iter,
+	.tp_methods = AerospikeLazyList_Type_Methods,
+};
+
+static PyTypeObject AerospikeLazyListIterator_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	.tp_name = "aerospike.LazyListIterator",
+	.tp_basicsize = sizeof(AerospikeLazyListIterator),
+	.tp_dealloc = (destructor) AerospikeLazyListIterator_Type_Dealloc,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_iter = PyObject_SelfIter,
+	.tp_iternext = (iternextfunc) AerospikeLazyListIterator_Type_Next,
+};
+
+static PyMethodDef AerospikeLazyMap_Type_Methods[] = {
+	{"materialize", (PyCFunction) AerospikeLazyCDT_Materialize, METH_NOARGS, lazy_materialize_doc},
+	{"get", (PyCFunction) AerospikeLazyMap_Get, METH_VARARGS, lazy_map_get_doc},
+	{"keys", (PyCFunction) AerospikeLazyMap_Keys, METH_NOARGS, lazy_map_keys_doc},
+	{"values", (PyCFunction) AerospikeLazyMap_Values, METH_NOARGS, lazy_map_values_doc},
+	{"items", (PyCFunction) AerospikeLazyMap_Items, METH_NOARGS, lazy_map_items_doc},
+	{NULL}
+};
+
+static PySequenceMethods AerospikeLazyMap_Type_Sequence = {
+	.sq_contains = (objobjproc) AerospikeLazyMap_Type_Contains,
+};
+
+static PyMappingMethods AerospikeLazyMap_Type_Mapping = {
+	.mp_length = (lenfunc) AerospikeLazyCDT_Type_Length,
+	.mp_subscript = (binaryfunc) AerospikeLazyMap_Type_Subscript,
+};
+
+static PyTypeObject AerospikeLazyMap_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	.tp_name = "aerospike.LazyMap",
+	.tp_basicsize = sizeof(AerospikeLazyCDT),
+	.tp_dealloc = (destructor) AerospikeLazyCDT_Type_Dealloc,
+	.tp_repr = (reprfunc) AerospikeLazyCDT_Type_Repr,
+	.tp_as_sequence = &AerospikeLazyMap_Type_Sequence,
+	.tp_as_mapping = &AerospikeLazyMap_Type_Mapping,
+	.tp_hash = PyObject_HashNotImplemented,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "A read only mapping over a map bin read with cdt_mode='lazy'.\n\n"
+			"The keys are decoded by the first access by key, values each time they\n"
+			"are accessed, nested lists and maps are returned as LazyList and LazyMap\n"
+			"views.\n",
+	.tp_richcompare = (richcmpfunc) AerospikeLazyCDT_Type_RichCompare,
+	.tp_iter = (getiterfunc) AerospikeLazyMap_Type_Iter,
+	.tp_methods = AerospikeLazyMap_Type_Methods,
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeLazyList_Ready()
+{
+	if (PyType_Ready(&AerospikeLazyListIterator_Type) != 0) {
+		return NULL;
+	}
+	return PyType_Ready(&AerospikeLazyList_Type) == 0 ? &AerospikeLazyList_Type : NULL;
+}
+
+PyTypeObject * AerospikeLazyMap_Ready()
+{
+	return PyType_Ready(&AerospikeLazyMap_Type) == 0 ? &AerospikeLazyMap_Type : NULL;
+}
+
+static void lazy_register(PyObject * py_abc, const char * name, PyTypeObject * type)
+{
+	PyObject * py_class = PyObject_GetAttrString(py_abc, name);
+	if (py_class) {
+		PyObject * py_result = PyObject_CallMethod(py_class, "register", "O", (PyObject *) type);
+		Py_XDECREF(py_result);
+		Py_DECREF(py_class);
+	}
+}
+
+void AerospikeLazyCDT_Register()
+{
+	PyObject * py_abc = PyImport_ImportModule("collections.abc");
+	if (py_abc) {
+		lazy_register(py_abc, "Sequence", &AerospikeLazyList_Type);
+		lazy_register(py_abc, "Mapping", &AerospikeLazyMap_Type);
+		Py_DECREF(py_abc);
+	}
+	// Only isinstance() checks depend on it, the views work regardless.
+	PyErr_Clear();
+}
+
+bool AerospikeLazyCDT_Check(PyObject * py_obj)
+{
+	return py_obj && (PyObject_TypeCheck(py_obj, &AerospikeLazyList_Type) ||
+			PyObject_TypeCheck(py_obj, &AerospikeLazyMap_Type));
+}
+
+as_status AerospikeLazyCDT_FromBytes(AerospikeClient * client, as_error * err, as_bytes * bytes, PyObject ** py_val)
+{
+	bool is_map = false;
+	uint32_t count = 0;
+
+	*py_val = NULL;
+
+	PyObject * py_owner = AerospikeBlob_New(bytes);
+	if (!py_owner) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to allocate memory for list or map");
+	}
+
+	AerospikeBlob * py_blob = (AerospikeBlob *) py_owner;
+	cdt_unpacker pk = {
+		.buffer = py_blob->data,
+		.offset = 0,
+		.length = (uint32_t) py_blob->size
+	};
+
+	if (cdt_unpack_container(err, &pk, &is_map, &count) == AEROSPIKE_OK) {
+		*py_val = lazy_new(is_map ? &AerospikeLazyMap_Type : &AerospikeLazyList_Type,
+				client, py_owner, pk.buffer, pk.length, 0, count);
+		if (!*py_val) {
+			PyErr_Clear();
+			as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to allocate memory for list or map");
+		}
+	}
+
+	Py_DECREF(py_owner);
+	return err->code;
+}
@@ -220,13 +220,11 @@ PyObject * AerospikeClient_Admin_Drop_User( AerospikeClient *self, PyObject *arg
 
 	char *alias_to_search = NULL;
 	alias_to_search = return_search_string(self->as);
-	PyObject *py_persistent_item = NULL;
 
-	py_persistent_item = PyDict_GetItemString(py_global_hosts, alias_to_search); 
-	if (py_persistent_item) {
-		PyDict_DelItemString(py_global_hosts, alias_to_search);
-		AerospikeGlobalHosts_Del(py_persistent_item);
-	}
+	Py_BEGIN_ALLOW_THREADS
+	global_hosts_remove(alias_to_search);
+	Py_END_ALLOW_THREADS
+
 	PyMem_Free(alias_to_search);
 	alias_to_search = NULL;
 
@@ -421,13 +419,11 @@ PyObject * AerospikeClient_Admin_Change_Password( AerospikeClient *self, PyObjec
 
 	char *alias_to_search = NULL;
 	alias_to_search = return_search_string(self->as);
-	PyObject *py_persistent_item = NULL;
 
-	py_persistent_item = PyDict_GetItemString(py_global_hosts, alias_to_search); 
-	if (py_persistent_item) {
-		PyDict_DelItemString(py_global_hosts, alias_to_search);
-		AerospikeGlobalHosts_Del(py_persistent_item);
-	}
+	Py_BEGIN_ALLOW_THREADS
+	global_hosts_remove(alias_to_search);
+	Py_END_ALLOW_THREADS
+
 	PyMem_Free(alias_to_search);
 	alias_to_search = NULL;
 
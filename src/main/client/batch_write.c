@@ -0,0 +1,828 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_cluster.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_operations.h>
+#include <aerospike/as_record.h>
+
+#include "cdt_operation_utils.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "operate.h"
+#include "policy.h"
+
+/*
+ * Number of records converted ahead of a round of commands. Conversion needs
+ * the GIL, the commands of a window run without it.
+ */
+#define BATCH_WRITE_WINDOW 1024
+#define BATCH_WRITE_MAX_CONCURRENCY 128
+
+typedef enum {
+	BATCH_WRITE_PUT,
+	BATCH_WRITE_OPERATE,
+	BATCH_WRITE_REMOVE
+} batch_write_op;
+
+typedef struct {
+	// Owned reference to the entry of the input sequence.
+	PyObject * py_item;
+	PyObject * py_key;
+	as_key key;
+	bool key_initialised;
+	as_record rec;
+	bool rec_initialised;
+	as_record * result;
+	as_error err;
+} batch_write_record;
+
+typedef struct {
+	aerospike * as;
+	batch_write_op op;
+	const void * policy;
+	const as_operations * ops;
+	batch_write_record * records;
+	uint32_t size;
+	uint32_t next;
+	pthread_mutex_t lock;
+	// The worker threads, started once and reused by every window.
+	pthread_t threads[BATCH_WRITE_MAX_CONCURRENCY];
+	uint32_t n_threads;
+	pthread_cond_t start;
+	pthread_cond_t done;
+	uint32_t generation;
+	uint32_t running;
+	bool shutdown;
+} batch_write_window;
+
+/**
+ *******************************************************************************************************
+ * Claims records of the window one at a time and applies the command to
+ * each of them, until none is left. Runs without the GIL.
+ *******************************************************************************************************
+ */
+static void batch_write_run(batch_write_window * window)
+{
+	while (true) {
+		pthread_mutex_lock(&window->lock);
+		uint32_t i = window->next++;
+		pthread_mutex_unlock(&window->lock);
+
+		if (i >= window->size) {
+			break;
+		}
+
+		batch_write_record * record = &window->records[i];
+
+		// The record could not be converted, its error is its result.
+		if (record->err.code != AEROSPIKE_OK) {
+			continue;
+		}
+
+		switch (window->op) {
+			case BATCH_WRITE_PUT:
+				aerospike_key_put(window->as, &record->err,
+						(const as_policy_write *) window->policy, &record->key, &record->rec);
+				break;
+			case BATCH_WRITE_OPERATE:
+				aerospike_key_operate(window->as, &record->err,
+						(const as_policy_operate *) window->policy, &record->key, window->ops, &record->result);
+				break;
+			case BATCH_WRITE_REMOVE:
+				aerospike_key_remove(window->as, &record->err,
+						(const as_policy_remove *) window->policy, &record->key);
+				break;
+		}
+	}
+}
+
+/**
+ *******************************************************************************************************
+ * Worker thread body. Waits for each window to be started, works on it,
+ * and reports back once it ran out of records.
+ *******************************************************************************************************
+ */
+static void * batch_write_worker(void * udata)
+{
+	batch_write_window * window = (batch_write_window *) udata;
+	uint32_t generation = 0;
+
+	pthread_mutex_lock(&window->lock);
+	while (true) {
+		while (!window->shutdown && window->generation == generation) {
+			pthread_cond_wait(&window->start, &window->lock);
+		}
+		if (window->shutdown) {
+			break;
+		}
+		generation = window->generation;
+		pthread_mutex_unlock(&window->lock);
+
+		batch_write_run(window);
+
+		pthread_mutex_lock(&window->lock);
+		if (--window->running == 0) {
+			pthread_cond_signal(&window->done);
+		}
+	}
+	pthread_mutex_unlock(&window->lock);
+
+	return NULL;
+}
+
+/**
+ *******************************************************************************************************
+ * Starts the worker threads, one less than concurrency as the calling
+ * thread works on the windows too. Falls back to fewer workers if a thread
+ * cannot be started.
+ *******************************************************************************************************
+ */
+static void batch_write_start(batch_write_window * window, uint32_t concurrency)
+{
+	pthread_mutex_init(&window->lock, NULL);
+	pthread_cond_init(&window->start, NULL);
+	pthread_cond_init(&window->done, NULL);
+	window->n_threads = 0;
+	window->generation = 0;
+	window->running = 0;
+	window->shutdown = false;
+
+	while (window->n_threads + 1 < concurrency) {
+		if (pthread_create(&window->threads[window->n_threads], NULL, batch_write_worker, window) != 0) {
+			break;
+		}
+		window->n_threads++;
+	}
+}
+
+/**
+ *******************************************************************************************************
+ * Stops and joins the worker threads.
+ *******************************************************************************************************
+ */
+static void batch_write_stop(batch_write_window * window)
+{
+	Py_BEGIN_ALLOW_THREADS
+	pthread_mutex_lock(&window->lock);
+	window->shutdown = true;
+	pthread_cond_broadcast(&window->start);
+	pthread_mutex_unlock(&window->lock);
+
+	for (uint32_t i = 0; i < window->n_threads; i++) {
+		pthread_join(window->threads[i], NULL);
+	}
+	Py_END_ALLOW_THREADS
+
+	pthread_cond_destroy(&window->start);
+	pthread_cond_destroy(&window->done);
+	pthread_mutex_destroy(&window->lock);
+}
+
+/**
+ *******************************************************************************************************
+ * Runs the commands of a window on the worker threads and the calling
+ * thread, and waits for all of them to finish.
+ *******************************************************************************************************
+ */
+static void batch_write_execute(batch_write_window * window)
+{
+	Py_BEGIN_ALLOW_THREADS
+	pthread_mutex_lock(&window->lock);
+	window->next = 0;
+	window->running = window->n_threads;
+	window->generation++;
+	pthread_cond_broadcast(&window->start);
+	pthread_mutex_unlock(&window->lock);
+
+	batch_write_run(window);
+
+	pthread_mutex_lock(&window->lock);
+	while (window->running > 0) {
+		pthread_cond_wait(&window->done, &window->lock);
+	}
+	pthread_mutex_unlock(&window->lock);
+	Py_END_ALLOW_THREADS
+}
+
+/**
+ *******************************************************************************************************
+ * Converts one entry of the input sequence. A conversion error is recorded
+ * as the result of that record, so that it does not abort the whole batch.
+ *******************************************************************************************************
+ */
+static void batch_write_prepare(AerospikeClient * self, batch_write_window * window,
+		batch_write_record * record, PyObject * py_item, as_static_pool * static_pool)
+{
+	PyObject * py_bins = NULL;
+	PyObject * py_meta = NULL;
+	as_error * err = &record->err;
+
+	Py_INCREF(py_item);
+	record->py_item = py_item;
+	record->py_key = py_item;
+
+	if (window->op == BATCH_WRITE_PUT) {
+		Py_ssize_t size = PyTuple_Check(py_item) ? PyTuple_Size(py_item) : 0;
+
+		if (size < 2 || size > 3) {
+			as_error_update(err, AEROSPIKE_ERR_PARAM, "Records should be tuples of (key, bins) or (key, bins, meta).");
+			record->py_key = Py_None;
+			return;
+		}
+
+		record->py_key = PyTuple_GetItem(py_item, 0);
+		py_bins = PyTuple_GetItem(py_item, 1);
+		if (size == 3 && PyTuple_GetItem(py_item, 2) != Py_None) {
+			py_meta = PyTuple_GetItem(py_item, 2);
+		}
+	}
+
+	if (!PyTuple_Check(record->py_key)) {
+		as_error_update(err, AEROSPIKE_ERR_PARAM, "Key should be a tuple.");
+		return;
+	}
+
+	if (pyobject_to_key(err, record->py_key, &record->key) != AEROSPIKE_OK) {
+		PyErr_Clear();
+		return;
+	}
+	record->key_initialised = true;
+
+	if (window->op == BATCH_WRITE_PUT) {
+		as_record_init(&record->rec, 0);
+		record->rec_initialised = true;
+
+		if (pyobject_to_record(self, err, py_bins, py_meta, &record->rec, SERIALIZER_PYTHON,
+				static_pool) != AEROSPIKE_OK) {
+			PyErr_Clear();
+		}
+	}
+}
+
+/**
+ *******************************************************************************************************
+ * Builds the result tuple of one record of the window.
+ *******************************************************************************************************
+ */
+static PyObject * batch_write_result(AerospikeClient * self, batch_write_window * window,
+		batch_write_record * record)
+{
+	PyObject * py_meta = Py_None;
+	PyObject * py_bins = Py_None;
+	PyObject * py_rec = NULL;
+	PyObject * py_result = NULL;
+
+	if (window->op != BATCH_WRITE_OPERATE) {
+		return Py_BuildValue("(Oi)", record->py_key, record->err.code);
+	}
+
+	if (record->err.code == AEROSPIKE_OK && record->result) {
+		record_to_pyobject(self, &record->err, record->result, &record->key, &py_rec);
+		if (py_rec) {
+			py_meta = PyTuple_GetItem(py_rec, 1);
+			py_bins = PyTuple_GetItem(py_rec, 2);
+		}
+		else {
+			PyErr_Clear();
+		}
+	}
+
+	py_result = Py_BuildValue("(OiOO)", record->py_key, record->err.code, py_meta, py_bins);
+	Py_XDECREF(py_rec);
+	return py_result;
+}
+
+/**
+ *******************************************************************************************************
+ * Releases everything the records of the window hold.
+ *******************************************************************************************************
+ */
+static void batch_write_release(batch_write_window * window)
+{
+	for (uint32_t i = 0; i < window->size; i++) {
+		batch_write_record * record = &window->records[i];
+
+		if (record->result) {
+			as_record_destroy(record->result);
+		}
+		if (record->rec_initialised) {
+			as_record_destroy(&record->rec);
+		}
+		if (record->key_initialised) {
+			as_key_destroy(&record->key);
+		}
+		Py_XDECREF(record->py_item);
+		memset(record, 0, sizeof(batch_write_record));
+	}
+	window->size = 0;
+}
+
+/**
+ *******************************************************************************************************
+ * Returns the number of commands to run at the same time, one per cluster
+ * node unless the caller asked for a specific number.
+ *******************************************************************************************************
+ */
+static as_status batch_write_concurrency(AerospikeClient * self, as_error * err,
+		PyObject * py_concurrency, uint32_t * concurrency)
+{
+	if (py_concurrency && py_concurrency != Py_None) {
+		long value = -1;
+
+		if (PyInt_Check(py_concurrency) || PyLong_Check(py_concurrency)) {
+			value = PyLong_AsLong(py_concurrency);
+		}
+		if (value < 1 || value > BATCH_WRITE_MAX_CONCURRENCY) {
+			PyErr_Clear();
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+					"concurrency must be an integer between 1 and %d", BATCH_WRITE_MAX_CONCURRENCY);
+		}
+		*concurrency = (uint32_t) value;
+		return AEROSPIKE_OK;
+	}
+
+	as_nodes * nodes = as_nodes_reserve(self->as->cluster);
+	*concurrency = nodes->size;
+	as_nodes_release(nodes);
+
+	if (*concurrency < 1) {
+		*concurrency = 1;
+	}
+	else if (*concurrency > BATCH_WRITE_MAX_CONCURRENCY) {
+		*concurrency = BATCH_WRITE_MAX_CONCURRENCY;
+	}
+	return AEROSPIKE_OK;
+}
+
+/**
+ *******************************************************************************************************
+ * Applies the command of the window to every entry of py_items, a window
+ * of records at a time, and returns the list of per record results.
+ *
+ * @param self                  AerospikeClient object
+ * @param err                   as_error object
+ * @param window                The window, with op, policy and ops set
+ * @param py_items              The list or tuple of keys or records
+ * @param concurrency           The number of commands run at the same time
+ * @param py_failed_key         Set to a new reference to the key of the
+ *                              record whose result could not be built
+ *
+ * Returns a list with one result per entry of py_items, in the same order.
+ *******************************************************************************************************
+ */
+static PyObject * batch_write_invoke(AerospikeClient * self, as_error * err,
+		batch_write_window * window, PyObject * py_items, uint32_t concurrency, PyObject ** py_failed_key)
+{
+	PyObject * py_results = NULL;
+	as_static_pool * static_pool = NULL;
+	Py_ssize_t size = PySequence_Fast_GET_SIZE(py_items);
+	Py_ssize_t offset = 0;
+	uint32_t window_size = size < BATCH_WRITE_WINDOW ? (uint32_t) size : BATCH_WRITE_WINDOW;
+
+	py_results = PyList_New(size);
+	if (!py_results) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the result list");
+		return NULL;
+	}
+
+	window->records = (batch_write_record *) calloc(window_size ? window_size : 1, sizeof(batch_write_record));
+	if (!window->records) {
+		Py_DECREF(py_results);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the records of a batch write");
+		return NULL;
+	}
+	if (window->op == BATCH_WRITE_PUT) {
+		static_pool = static_pool_new();
+		if (!static_pool) {
+			free(window->records);
+			window->records = NULL;
+			Py_DECREF(py_results);
+			as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the records of a batch write");
+			return NULL;
+		}
+		static_pool->lend_buffers = true;
+	}
+	batch_write_start(window, concurrency < window_size ? concurrency : window_size);
+
+	while (offset < size) {
+		window->size = 0;
+
+		while (offset + window->size < size && window->size < window_size) {
+			batch_write_record * record = &window->records[window->size];
+			as_error_init(&record->err);
+			batch_write_prepare(self, window, record,
+					PySequence_Fast_GET_ITEM(py_items, offset + window->size), static_pool);
+			window->size++;
+		}
+
+		batch_write_execute(window);
+
+		for (uint32_t i = 0; i < window->size; i++) {
+			PyObject * py_result = batch_write_result(self, window, &window->records[i]);
+			if (!py_result) {
+				PyErr_Clear();
+				as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to build the result of a record");
+				Py_INCREF(window->records[i].py_key);
+				*py_failed_key = window->records[i].py_key;
+				break;
+			}
+			PyList_SET_ITEM(py_results, offset + i, py_result);
+		}
+
+		offset += window->size;
+		batch_write_release(window);
+
+		if (static_pool) {
+			POOL_DESTROY(static_pool);
+		}
+
+		if (err->code != AEROSPIKE_OK) {
+			Py_CLEAR(py_results);
+			break;
+		}
+	}
+
+	batch_write_stop(window);
+	free(window->records);
+	static_pool_free(static_pool);
+
+	return py_results;
+}
+
+/**
+ *******************************************************************************************************
+ * Checks the client and the sequence argument shared by all batch writes.
+ *******************************************************************************************************
+ */
+static as_status batch_write_check(AerospikeClient * self, as_error * err, PyObject * py_items)
+{
+	if (!self || !self->as) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+	}
+
+	if (!self->is_conn_16) {
+		return as_error_update(err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+	}
+
+	if (!py_items || !(PyList_Check(py_items) || PyTuple_Check(py_items))) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Keys should be specified as a list or tuple.");
+	}
+
+	return AEROSPIKE_OK;
+}
+
+/**
+ *******************************************************************************************************
+ * Raises the python exception of a batch write failing as a whole. Its key is
+ * the key of the record that failed, None if the failure is not a record's.
+ *******************************************************************************************************
+ */
+static void batch_write_raise(as_error * err, PyObject * py_key)
+{
+	PyObject * py_err = NULL;
+	error_to_pyobject(err, &py_err);
+	PyObject *exception_type = raise_exception(err);
+	raise_exception_with_attrs(exception_type, py_err, "key", py_key ? py_key : Py_None, "bin", Py_None, NULL);
+	Py_DECREF(py_err);
+}
+
+/**
+ *******************************************************************************************************
+ * Writes a batch of records to the Aerospike DB.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a list of (key, status) tuples, one per record.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_Batch_Write(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_records = NULL;
+	PyObject * py_policy = NULL;
+	PyObject * py_concurrency = NULL;
+	PyObject * py_results = NULL;
+	PyObject * py_failed_key = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_write write_policy;
+	as_policy_write * write_policy_p = NULL;
+	batch_write_window window;
+	uint32_t concurrency = 1;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp* exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list* predexp_list_p = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"records", "policy", "concurrency", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OO:batch_write", kwlist,
+			&py_records, &py_policy, &py_concurrency) == false) {
+		return NULL;
+	}
+
+	as_error_init(&err);
+	memset(&window, 0, sizeof(window));
+
+	if (batch_write_check(self, &err, py_records) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (batch_write_concurrency(self, &err, py_concurrency, &concurrency) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	// Convert python policy object to as_policy_write
+	pyobject_to_policy_write(self, &err, py_policy, &write_policy, &write_policy_p,
+			&self->as->config.policies.write, &predexp_list, &predexp_list_p, &exp_list, &exp_list_p);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	self->is_client_put_serializer = false;
+
+	window.as = self->as;
+	window.op = BATCH_WRITE_PUT;
+	window.policy = write_policy_p;
+
+	py_results = batch_write_invoke(self, &err, &window, py_records, concurrency, &py_failed_key);
+
+CLEANUP:
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		batch_write_raise(&err, py_failed_key);
+		Py_XDECREF(py_failed_key);
+		return NULL;
+	}
+
+	return py_results;
+}
+
+/**
+ *******************************************************************************************************
+ * Applies the same list of operations to a batch of records.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a list of (key, status, meta, bins) tuples, one per key.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_Batch_Operate(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_keys = NULL;
+	PyObject * py_list = NULL;
+	PyObject * py_meta = NULL;
+	PyObject * py_policy = NULL;
+	PyObject * py_concurrency = NULL;
+	PyObject * py_results = NULL;
+	PyObject * py_failed_key = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_operate operate_policy;
+	as_policy_operate * operate_policy_p = NULL;
+	as_operations ops;
+	bool ops_initialised = false;
+	batch_write_window window;
+	uint32_t concurrency = 1;
+	long operation;
+	long return_type = -1;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp* exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list* predexp_list_p = NULL;
+
+	as_vector * unicodeStrVector = as_vector_create(sizeof(char *), 128);
+
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"keys", "list", "meta", "policy", "concurrency", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|OOO:batch_operate", kwlist,
+			&py_keys, &py_list, &py_meta, &py_policy, &py_concurrency) == false) {
+		as_vector_destroy(unicodeStrVector);
+		return NULL;
+	}
+
+	as_error_init(&err);
+	memset(&window, 0, sizeof(window));
+
+	if (batch_write_check(self, &err, py_keys) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (!PyList_Check(py_list)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Operations should be of type list");
+		goto CLEANUP;
+	}
+
+	if (batch_write_concurrency(self, &err, py_concurrency, &concurrency) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	// Convert python policy object to as_policy_operate
+	pyobject_to_policy_operate(self, &err, py_policy, &operate_policy, &operate_policy_p,
+			&self->as->config.policies.operate, &predexp_list, &predexp_list_p, &exp_list, &exp_list_p);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	// The operations are converted once and shared by every record.
+	Py_ssize_t size = PyList_Size(py_list);
+	as_operations_init(&ops, size);
+	ops_initialised = true;
+
+	if (py_meta && py_meta != Py_None) {
+		if (check_for_meta(py_meta, &ops, &err) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject * py_val = PyList_GetItem(py_list, i);
+
+		if (!is_operation(py_val)) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "Operation must be a dict or an Operation");
+			goto CLEANUP;
+		}
+		if (add_op(self, &err, py_val, unicodeStrVector, &static_pool, &ops, &operation, &return_type) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	window.as = self->as;
+	window.op = BATCH_WRITE_OPERATE;
+	window.policy = operate_policy_p;
+	window.ops = &ops;
+
+	py_results = batch_write_invoke(self, &err, &window, py_keys, concurrency, &py_failed_key);
+
+CLEANUP:
+	for (unsigned int i = 0; i < unicodeStrVector->size; i++) {
+		free(as_vector_get_ptr(unicodeStrVector, i));
+	}
+	as_vector_destroy(unicodeStrVector);
+
+	if (ops_initialised) {
+		as_operations_destroy(&ops);
+	}
+	POOL_DESTROY(&static_pool);
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		batch_write_raise(&err, py_failed_key);
+		Py_XDECREF(py_failed_key);
+		return NULL;
+	}
+
+	return py_results;
+}
+
+/**
+ *******************************************************************************************************
+ * Removes a batch of records from the Aerospike DB.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a list of (key, status) tuples, one per key.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_Batch_Remove(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_keys = NULL;
+	PyObject * py_policy = NULL;
+	PyObject * py_concurrency = NULL;
+	PyObject * py_results = NULL;
+	PyObject * py_failed_key = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_remove remove_policy;
+	as_policy_remove * remove_policy_p = NULL;
+	batch_write_window window;
+	uint32_t concurrency = 1;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp* exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list* predexp_list_p = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"keys", "policy", "concurrency", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OO:batch_remove", kwlist,
+			&py_keys, &py_policy, &py_concurrency) == false) {
+		return NULL;
+	}
+
+	as_error_init(&err);
+	memset(&window, 0, sizeof(window));
+
+	if (batch_write_check(self, &err, py_keys) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (batch_write_concurrency(self, &err, py_concurrency, &concurrency) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	// Convert python policy object to as_policy_remove
+	pyobject_to_policy_remove(self, &err, py_policy, &remove_policy, &remove_policy_p,
+			&self->as->config.policies.remove, &predexp_list, &predexp_list_p, &exp_list, &exp_list_p);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	window.as = self->as;
+	window.op = BATCH_WRITE_REMOVE;
+	window.policy = remove_policy_p;
+
+	py_results = batch_write_invoke(self, &err, &window, py_keys, concurrency, &py_failed_key);
+
+CLEANUP:
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		batch_write_raise(&err, py_failed_key);
+		Py_XDECREF(py_failed_key);
+		return NULL;
+	}
+
+	return py_results;
+}
@@ -749,7 +749,7 @@ get_bit_resize_flags(as_error * err, PyObject * op_dict, as_bit_resize_flags* re
 
 static as_status
 get_bit_policy(as_error * err, PyObject * op_dict, as_bit_policy* policy) {
-	PyObject* py_bit_policy = PyDict_GetItemString(op_dict, POLICY_KEY);
+	PyObject* py_bit_policy = get_op_entry(op_dict, POLICY_KEY);
 
     // This handles a null policy
     if (pyobject_to_bit_policy(err, py_bit_policy, policy) != AEROSPIKE_OK) {
@@ -761,7 +761,7 @@ get_bit_policy(as_error * err, PyObject * op_dict, as_bit_policy* policy) {
 
 static as_status
 get_bool_from_pyargs(as_error * err, char* key, PyObject * op_dict, bool * boolean) {
-    PyObject* py_val = PyDict_GetItemString(op_dict, key);
+    PyObject* py_val = get_op_entry(op_dict, key);
 
     if(! py_val) {
         return as_error_update(err, AEROSPIKE_ERR_PARAM, "Failed to convert %s", key);
@@ -778,7 +778,7 @@ get_bool_from_pyargs(as_error * err, char* key, PyObject * op_dict, bool * boole
 
 static as_status
 get_uint8t_from_pyargs(as_error * err, char* key, PyObject * op_dict, uint8_t ** value) {
-    PyObject * py_val = PyDict_GetItemString(op_dict, key);
+    PyObject * py_val = get_op_entry(op_dict, key);
     if (! py_val) {
         return as_error_update(err, AEROSPIKE_ERR_PARAM, "Failed to convert %s", key)
     }
@@ -338,7 +338,7 @@ get_map_return_type(as_error * err, PyObject * op_dict, int* return_type)
         return err->code;
     }
     *return_type = int64_return_type;
-    PyObject* py_inverted = PyDict_GetItemString(op_dict, AS_PY_RETURN_INVERTED_KEY); //NOT A MAGIC STRING
+    PyObject* py_inverted = get_op_entry(op_dict, AS_PY_RETURN_INVERTED_KEY); //NOT A MAGIC STRING
 
     if (py_inverted) {
         py_bool_val = PyObject_IsTrue(py_inverted);
@@ -1,4 +1,8 @@
 #include <Python.h>
+#include <structmember.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
 
 #include "cdt_operation_utils.h"
 #include "client.h"
@@ -7,6 +11,174 @@
 #include "policy.h"
 #include "conversions.h"
 
+#define OP_ENTRY_CACHE_SIZE 256
+#define OP_ENTRY_UNRESOLVED -2
+#define OP_ENTRY_NOT_A_SLOT -1
+
+/*
+Entry names are looked up once and cached by name, with the interned name used for dicts
+and the slot offset used for Operation objects. The cache holds its own copy of each name,
+so it never depends on the storage of the key passed in.
+*/
+typedef struct {
+	char * key;
+	PyObject * py_name;
+	Py_ssize_t offset;
+} op_entry_name;
+
+static op_entry_name op_entry_cache[OP_ENTRY_CACHE_SIZE];
+static PyTypeObject * operation_type = NULL;
+static bool operation_type_loaded = false;
+
+static PyTypeObject *
+get_operation_type(void)
+{
+	if (!operation_type_loaded) {
+		operation_type_loaded = true;
+		PyObject * py_module = PyImport_ImportModule("aerospike_helpers.operations");
+		if (py_module) {
+			PyObject * py_type = PyObject_GetAttrString(py_module, "Operation");
+			if (py_type && PyType_Check(py_type)) {
+				operation_type = (PyTypeObject *) py_type;
+			}
+			else {
+				Py_XDECREF(py_type);
+			}
+			Py_DECREF(py_module);
+		}
+		if (!operation_type) {
+			PyErr_Clear();
+		}
+	}
+	return operation_type;
+}
+
+static Py_ssize_t
+resolve_slot_offset(PyTypeObject * type, const char * key)
+{
+	Py_ssize_t offset = OP_ENTRY_NOT_A_SLOT;
+	PyObject * py_descr = PyObject_GetAttrString((PyObject *) type, key);
+
+	if (!py_descr) {
+		PyErr_Clear();
+		return offset;
+	}
+	if (Py_TYPE(py_descr) == &PyMemberDescr_Type) {
+		PyMemberDef * member = ((PyMemberDescrObject *) py_descr)->d_member;
+		if (member->type == T_OBJECT_EX) {
+			offset = member->offset;
+		}
+	}
+	Py_DECREF(py_descr);
+	return offset;
+}
+
+static size_t
+hash_op_entry_name(const char * key)
+{
+	size_t hash = 5381;
+
+	for (const char * c = key; *c; c++) {
+		hash = hash * 33 + (unsigned char) *c;
+	}
+	return hash;
+}
+
+static op_entry_name *
+get_op_entry_name(const char * key)
+{
+	size_t start = hash_op_entry_name(key) % OP_ENTRY_CACHE_SIZE;
+
+	for (size_t i = 0; i < OP_ENTRY_CACHE_SIZE; i++) {
+		op_entry_name * entry = &op_entry_cache[(start + i) % OP_ENTRY_CACHE_SIZE];
+
+		if (entry->key && strcmp(entry->key, key) == 0) {
+			return entry;
+		}
+		if (!entry->key) {
+			PyObject * py_name = PyUnicode_InternFromString(key);
+			char * name = strdup(key);
+			if (!py_name || !name) {
+				PyErr_Clear();
+				Py_XDECREF(py_name);
+				free(name);
+				return NULL;
+			}
+			entry->key = name;
+			entry->py_name = py_name;
+			entry->offset = OP_ENTRY_UNRESOLVED;
+			return entry;
+		}
+	}
+	return NULL;
+}
+
+bool
+is_operation(PyObject * py_op)
+{
+	if (PyDict_Check(py_op)) {
+		return true;
+	}
+	PyTypeObject * type = get_operation_type();
+	return type && PyObject_TypeCheck(py_op, type);
+}
+
+PyObject *
+get_op_entry(PyObject * py_op, const char * key)
+{
+	op_entry_name * entry = get_op_entry_name(key);
+
+	if (PyDict_Check(py_op)) {
+		return entry ? PyDict_GetItem(py_op, entry->py_name) : PyDict_GetItemString(py_op, key);
+	}
+
+	PyTypeObject * type = get_operation_type();
+	if (!type || !PyObject_TypeCheck(py_op, type)) {
+		return NULL;
+	}
+
+	Py_ssize_t offset;
+	if (entry) {
+		if (entry->offset == OP_ENTRY_UNRESOLVED) {
+			entry->offset = resolve_slot_offset(type, key);
+		}
+		offset = entry->offset;
+	}
+	else {
+		offset = resolve_slot_offset(type, key);
+	}
+
+	if (offset < 0) {
+		return NULL;
+	}
+	return *(PyObject **) ((char *) py_op + offset);
+}
+
+const char *
+get_op_unknown_entry(PyObject * py_op, const char ** keys)
+{
+	PyTypeObject * type = get_operation_type();
+	if (!type || !PyObject_TypeCheck(py_op, type)) {
+		return NULL;
+	}
+
+	// The slots of the Operation class are its members.
+	for (PyMemberDef * member = type->tp_members; member && member->name; member++) {
+		if (member->type != T_OBJECT_EX || !*(PyObject **) ((char *) py_op + member->offset)) {
+			continue;
+		}
+
+		bool known = false;
+		for (const char ** key = keys; *key && !known; key++) {
+			known = strcmp(*key, member->name) == 0;
+		}
+		if (!known) {
+			return member->name;
+		}
+	}
+	return NULL;
+}
+
 /*
 The caller of this does not own the pointer to binName, and should not free it. It is either
 held by Python, or is added to the list of chars to free later.
@@ -17,7 +189,7 @@ get_bin(as_error * err, PyObject * op_dict, as_vector * unicodeStrVector, char**
 {
         PyObject* intermediateUnicode = NULL;
 
-        PyObject* py_bin = PyDict_GetItemString(op_dict, AS_PY_BIN_KEY);
+        PyObject* py_bin = get_op_entry(op_dict, AS_PY_BIN_KEY);
 
         if (!py_bin) {
             return as_error_update(err, AEROSPIKE_ERR_PARAM, "Operation must contain a \"bin\" entry");
@@ -46,7 +218,7 @@ get_asval(AerospikeClient * self, as_error * err, char* key, PyObject * op_dict,
              as_static_pool * static_pool, int serializer_type, bool required)
 {
         *val = NULL;
-        PyObject* py_val = PyDict_GetItemString(op_dict, key);
+        PyObject* py_val = get_op_entry(op_dict, key);
         if (!py_val) {
             if (required) {  
                 return as_error_update(err, AEROSPIKE_ERR_PARAM, "Operation must contain a \"%s\" entry", key);
@@ -69,7 +241,7 @@ as_status
 get_val_list(AerospikeClient * self, as_error * err, const char* list_key, PyObject * op_dict, as_list** list_val, as_static_pool * static_pool, int serializer_type)
 {
         *list_val = NULL;
-        PyObject* py_val = PyDict_GetItemString(op_dict, list_key);
+        PyObject* py_val = get_op_entry(op_dict, list_key);
         if (!py_val) {
             return as_error_update(err, AEROSPIKE_ERR_PARAM, "Operation must contain a \"values\" entry");
         }
@@ -96,7 +268,7 @@ as_status
 get_optional_int64_t(as_error * err, const char* key,  PyObject * op_dict, int64_t* i64_valptr, bool* found)
 {
         *found = false;
-        PyObject* py_val = PyDict_GetItemString(op_dict, key);
+        PyObject* py_val = get_op_entry(op_dict, key);
         if (!py_val) {
             return AEROSPIKE_OK;
         }
@@ -156,7 +328,7 @@ get_list_return_type(as_error* err, PyObject* op_dict, int* return_type)
         return err->code;
     }
     *return_type = int64_return_type;
-    PyObject* py_inverted = PyDict_GetItemString(op_dict, "inverted"); //NOT A MAGIC STRING
+    PyObject* py_inverted = get_op_entry(op_dict, "inverted"); //NOT A MAGIC STRING
 
     if (py_inverted) {
         py_bool_val = PyObject_IsTrue(py_inverted);
@@ -176,7 +348,7 @@ as_status
 get_list_policy(as_error* err, PyObject* op_dict, as_list_policy* policy, bool* found) {
 	*found = false;
 
-	PyObject* list_policy = PyDict_GetItemString(op_dict, AS_PY_LIST_POLICY);
+	PyObject* list_policy = get_op_entry(op_dict, AS_PY_LIST_POLICY);
 
 	if (list_policy) {
 		if (pyobject_to_list_policy(err, list_policy, policy) != AEROSPIKE_OK) {
@@ -43,9 +43,6 @@
 PyObject * AerospikeClient_Close(AerospikeClient * self, PyObject * args, PyObject * kwds)
 {
 	as_error err;
-	char *alias_to_search = NULL;
-	PyObject *py_persistent_item = NULL;
-	AerospikeGlobalHosts* global_host = NULL;
 
 	// Initialize error
 	as_error_init(&err);
@@ -60,20 +57,9 @@ PyObject * AerospikeClient_Close(AerospikeClient * self, PyObject * args, PyObje
 	}
 
 	if (self->use_shared_connection) {
-		alias_to_search = return_search_string(self->as);
-		py_persistent_item = PyDict_GetItemString(py_global_hosts, alias_to_search);
-
-		if (py_persistent_item) {
-			global_host = (AerospikeGlobalHosts*)py_persistent_item;
-			// It is only safe to do a reference counted close if the
-			// local as is pointing to the global as
-			if (self->as == global_host->as) {
-				close_aerospike_object(self->as, &err, alias_to_search, py_persistent_item, false);
-			}
-		}
-
-		PyMem_Free(alias_to_search);
-		alias_to_search = NULL;
+		Py_BEGIN_ALLOW_THREADS
+		close_aerospike_object(self->as, &err);
+		Py_END_ALLOW_THREADS
 	} else {
 		aerospike_close(self->as, &err);
 	}
@@ -96,28 +82,28 @@ CLEANUP:
 char* return_search_string(aerospike *as)
 {
 	char port_str[MAX_PORT_SIZE];
-
-	int tot_address_size = 0;
-	int tot_port_size = 0;
-	int delimiter_size = 0;
-	int tot_user_size = 0;
-	int tot_shm_size = 0;
+	size_t size = 1;
 	uint32_t i = 0;
 
-	//Calculate total size for search string
-	for (i = 0; i < as->config.hosts->size; i++)
-	{
+	// Clients share a cluster when their hosts, user and TLS settings match.
+	for (i = 0; i < as->config.hosts->size; i++) {
 		as_host *host = (as_host *)as_vector_get(as->config.hosts, i);
-		tot_address_size = tot_address_size + strlen(host->name);
-		tot_port_size = tot_port_size + MAX_PORT_SIZE;
-		delimiter_size = delimiter_size + 3;
-		tot_user_size = tot_user_size + strlen(as->config.user);
+		size += strlen(host->name) + MAX_PORT_SIZE + strlen(as->config.user) + 3;
+		if (host->tls_name) {
+			size += strlen(host->tls_name) + 1;
+		}
+	}
+	if (as->config.tls.enable) {
+		size += 4;
+	}
+	if (as->config.cluster_name) {
+		size += strlen(as->config.cluster_name) + 1;
 	}
 	if (as->config.use_shm) {
-		tot_shm_size = MAX_SHM_SIZE;
+		size += MAX_SHM_SIZE;
 	}
 
-	char* alias_to_search = (char*) PyMem_Malloc(tot_address_size + tot_user_size + tot_port_size + delimiter_size + tot_shm_size);
+	char* alias_to_search = (char*) PyMem_Malloc(size);
 	alias_to_search[0] = '\0';
 
 	for (i=0; i<as->config.hosts->size; i++) {
@@ -125,6 +111,10 @@ char* return_search_string(aerospike *as)
 		int port = host->port;
 		sprintf(port_str, "%d", port);
 		strcat(alias_to_search, host->name);
+		if (host->tls_name) {
+			strcat(alias_to_search, ":");
+			strcat(alias_to_search, host->tls_name);
+		}
 		strcat(alias_to_search, ":");
 		strcat(alias_to_search, port_str);
 		strcat(alias_to_search, ":");
@@ -132,6 +122,15 @@ char* return_search_string(aerospike *as)
 		strcat(alias_to_search, ";");
 	}
 
+	if (as->config.tls.enable) {
+		strcat(alias_to_search, "tls;");
+	}
+
+	if (as->config.cluster_name) {
+		strcat(alias_to_search, as->config.cluster_name);
+		strcat(alias_to_search, ";");
+	}
+
 	if (as->config.use_shm) {
 		char shm_str[MAX_SHM_SIZE];
 		sprintf(shm_str, "%x", as->config.shm_key);
@@ -141,13 +140,9 @@ char* return_search_string(aerospike *as)
 	return alias_to_search;
 }
 
-void close_aerospike_object(aerospike *as, as_error *err, char *alias_to_search, PyObject *py_persistent_item, bool do_destroy)
+void close_aerospike_object(aerospike *as, as_error *err)
 {
-	if (((AerospikeGlobalHosts*)py_persistent_item)->ref_cnt == 1) {
-		PyDict_DelItemString(py_global_hosts, alias_to_search);
-		AerospikeGlobalHosts_Del(py_persistent_item);
+	if (global_hosts_release(as)) {
 		aerospike_close(as, err);
-	} else {
-		((AerospikeGlobalHosts*)py_persistent_item)->ref_cnt--;
 	}
 }
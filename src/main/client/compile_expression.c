@@ -0,0 +1,238 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_exp.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "expression.h"
+
+static PyObject * get_expression_cache_key(PyObject * py_obj);
+
+/**
+ *******************************************************************************************************
+ * Builds a hashable key for the expression cache from a compiled expression list.
+ * Lists, tuples and dicts are turned into tuples, and every leaf is paired with its
+ * type so that values such as 1, 1.0 and True do not share a cache entry.
+ *
+ * @param py_obj                The compiled expression, or a part of it.
+ *
+ * Returns a new reference to the key, or NULL with a python error set if a part of
+ * the expression can not be hashed.
+ *******************************************************************************************************
+ */
+static PyObject * get_expression_cache_key(PyObject * py_obj)
+{
+	PyObject * py_key = NULL;
+	Py_ssize_t size = 0;
+
+	if (PyList_Check(py_obj) || PyTuple_Check(py_obj)) {
+		size = PySequence_Fast_GET_SIZE(py_obj);
+		py_key = PyTuple_New(size + 1);
+		if (!py_key) {
+			return NULL;
+		}
+		Py_INCREF(Py_TYPE(py_obj));
+		PyTuple_SET_ITEM(py_key, 0, (PyObject *) Py_TYPE(py_obj));
+
+		for (Py_ssize_t i = 0; i < size; i++) {
+			PyObject * py_item = get_expression_cache_key(PySequence_Fast_GET_ITEM(py_obj, i));
+			if (!py_item) {
+				Py_DECREF(py_key);
+				return NULL;
+			}
+			PyTuple_SET_ITEM(py_key, i + 1, py_item);
+		}
+		return py_key;
+	}
+
+	if (PyDict_Check(py_obj)) {
+		PyObject * py_dict_key = NULL;
+		PyObject * py_dict_value = NULL;
+		Py_ssize_t pos = 0;
+		Py_ssize_t index = 1;
+
+		size = PyDict_Size(py_obj);
+		py_key = PyTuple_New(size * 2 + 1);
+		if (!py_key) {
+			return NULL;
+		}
+		Py_INCREF(Py_TYPE(py_obj));
+		PyTuple_SET_ITEM(py_key, 0, (PyObject *) Py_TYPE(py_obj));
+
+		while (PyDict_Next(py_obj, &pos, &py_dict_key, &py_dict_value)) {
+			PyObject * py_k = get_expression_cache_key(py_dict_key);
+			PyObject * py_v = py_k ? get_expression_cache_key(py_dict_value) : NULL;
+			if (!py_v) {
+				Py_XDECREF(py_k);
+				Py_DECREF(py_key);
+				return NULL;
+			}
+			PyTuple_SET_ITEM(py_key, index++, py_k);
+			PyTuple_SET_ITEM(py_key, index++, py_v);
+		}
+		return py_key;
+	}
+
+	if (PyByteArray_Check(py_obj)) {
+		PyObject * py_bytes = PyBytes_FromStringAndSize(PyByteArray_AsString(py_obj), PyByteArray_Size(py_obj));
+		if (!py_bytes) {
+			return NULL;
+		}
+		py_key = Py_BuildValue("(OO)", Py_TYPE(py_obj), py_bytes);
+		Py_DECREF(py_bytes);
+		return py_key;
+	}
+
+	if (PyObject_Hash(py_obj) == -1) {
+		return NULL;
+	}
+
+	return Py_BuildValue("(OO)", Py_TYPE(py_obj), py_obj);
+}
+
+/**
+ *******************************************************************************************************
+ * Compiles an expression into an aerospike.Expression object which holds the packed
+ * expression and can be passed as 'expressions' to any policy or expression operation.
+ * If the client was configured with an 'expression_cache_size', the most recently
+ * compiled expressions are kept in an LRU cache keyed on the compiled expression list.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an aerospike.Expression.
+ * In case of error, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_CompileExpression(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_expressions = NULL;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"expressions", NULL};
+
+	PyObject * py_exp_list = NULL;
+	PyObject * py_cache_key = NULL;
+	PyObject * py_compiled = NULL;
+	as_exp * exp_list_p = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O:compile_expression", kwlist,
+			&py_expressions) == false) {
+		return NULL;
+	}
+
+	if (!self) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	// Already compiled, nothing to do.
+	if (AerospikeExpression_Check(py_expressions)) {
+		Py_INCREF(py_expressions);
+		return py_expressions;
+	}
+
+	// Accept an uncompiled expression from aerospike_helpers.expressions as well.
+	if (!PyList_Check(py_expressions) && PyObject_HasAttrString(py_expressions, "compile")) {
+		py_exp_list = PyObject_CallMethod(py_expressions, "compile", NULL);
+		if (!py_exp_list) {
+			PyErr_Clear();
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "Failed to compile the expression");
+			goto CLEANUP;
+		}
+	} else {
+		Py_INCREF(py_expressions);
+		py_exp_list = py_expressions;
+	}
+
+	if (!PyList_Check(py_exp_list)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Expressions must be a non empty list of 4 element tuples, generated by a compiled aerospike expression");
+		goto CLEANUP;
+	}
+
+	if (self->expression_cache) {
+		py_cache_key = get_expression_cache_key(py_exp_list);
+		if (!py_cache_key) {
+			// Unhashable values in the expression, it just won't be cached.
+			PyErr_Clear();
+		} else {
+			py_compiled = PyDict_GetItem(self->expression_cache, py_cache_key);
+			if (py_compiled) {
+				// Move the hit to the most recently used end of the cache.
+				Py_INCREF(py_compiled);
+				PyDict_DelItem(self->expression_cache, py_cache_key);
+				PyDict_SetItem(self->expression_cache, py_cache_key, py_compiled);
+				goto CLEANUP;
+			}
+		}
+	}
+
+	if (convert_exp_list(self, py_exp_list, &exp_list_p, &err) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	py_compiled = AerospikeExpression_New(exp_list_p);
+	if (!py_compiled) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Failed to create aerospike.Expression");
+		goto CLEANUP;
+	}
+
+	if (py_cache_key) {
+		// Evict the least recently used entry once the cache is full.
+		if (PyDict_Size(self->expression_cache) >= (Py_ssize_t) self->expression_cache_size) {
+			PyObject * py_oldest_key = NULL;
+			PyObject * py_oldest_value = NULL;
+			Py_ssize_t pos = 0;
+			if (PyDict_Next(self->expression_cache, &pos, &py_oldest_key, &py_oldest_value)) {
+				Py_INCREF(py_oldest_key);
+				PyDict_DelItem(self->expression_cache, py_oldest_key);
+				Py_DECREF(py_oldest_key);
+			}
+		}
+		PyDict_SetItem(self->expression_cache, py_cache_key, py_compiled);
+	}
+
+CLEANUP:
+
+	Py_XDECREF(py_exp_list);
+	Py_XDECREF(py_cache_key);
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_XDECREF(py_compiled);
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_compiled;
+}
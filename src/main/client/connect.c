@@ -47,6 +47,7 @@ PyObject * AerospikeClient_Connect(AerospikeClient * self, PyObject * args, PyOb
 	bool free_alias_to_search = false;
 	PyObject * py_username = NULL;
 	PyObject * py_password = NULL;
+	aerospike * shared_as = NULL;
 
 	if (PyArg_ParseTuple(args, "|OO:connect", &py_username, &py_password) == false) {
 		return NULL;
@@ -66,77 +67,60 @@ PyObject * AerospikeClient_Connect(AerospikeClient * self, PyObject * args, PyOb
 	alias_to_search = return_search_string(self->as);
 	free_alias_to_search = true;
 
+	if (self->use_shared_connection && self->is_conn_16) {
+		// Already holds a reference to the shared cluster.
+		goto CLEANUP;
+	}
+
+	/*
+	 * The registry lock is held without the GIL, from the lookup to the
+	 * registration of a new cluster, so concurrent clients of the same
+	 * cluster wait for one connect and share it. It also guards the shm
+	 * keys in use. Other clients connect without it, so that a slow
+	 * connect does not hold up the rest of the process.
+	 */
+	bool use_registry = self->use_shared_connection || self->as->config.use_shm;
+
+	Py_BEGIN_ALLOW_THREADS
+	if (use_registry) {
+		global_hosts_lock();
+	}
+
 	if (self->use_shared_connection) {
-		PyObject * py_persistent_item = PyDict_GetItemString(py_global_hosts, alias_to_search);
-		if (py_persistent_item) {
-			aerospike *as = ((AerospikeGlobalHosts*)py_persistent_item)->as;
-			//Destroy the initial aerospike object as it has to point to the one in
-			//the persistent list now
-			if (as != self->as) {
-				// If the client has previously connected
-				// Other clients may share its aerospike* pointer
-				// So it is not safe to destroy it
-				if (!self->has_connected) {
-					aerospike_destroy(self->as);
-				}
-				self->as = as;
-				self->as->config.shm_key = ((AerospikeGlobalHosts*)py_persistent_item)->shm_key;
-
-				//Increase ref count of global host entry
-				((AerospikeGlobalHosts*)py_persistent_item)->ref_cnt++;
-			} else {
-				// If there is a matching global host entry,
-				// and this client was disconnected, increment the ref_cnt of the global.
-				// If the client is already connected, do nothing.
-				if(!self->is_conn_16) {
-					((AerospikeGlobalHosts*)py_persistent_item)->ref_cnt++;
-				}
-			}
-			goto CLEANUP;
-		}
+		shared_as = global_hosts_acquire(alias_to_search);
 	}
-	//Generate unique shm_key
-	PyObject *py_key, *py_value;
-	Py_ssize_t pos = 0;
-	int flag = 0;
-	int shm_key;
-	if (self->as->config.use_shm) {
-		if (user_shm_key) {
-			shm_key = self->as->config.shm_key;
-			user_shm_key = false;
-		} else {
-			shm_key = counter;
+
+	if (!shared_as) {
+		if (self->as->config.use_shm) {
+			// Generate unique shm_key
+			self->as->config.shm_key = global_hosts_free_shm_key(
+					self->user_shm_key ? self->as->config.shm_key : counter);
 		}
-		while (1) {
-			flag = 0;
-			while (PyDict_Next(py_global_hosts, &pos, &py_key, &py_value)) {
-				if (((AerospikeGlobalHosts*)py_value)->as->config.use_shm) {
-					if (((AerospikeGlobalHosts*)py_value)->shm_key == shm_key) {
-						flag = 1;
-						break;
-					}
-				}
-			}
-			if (!flag) {
-				self->as->config.shm_key = shm_key;
-				break;
-			}
-			shm_key = shm_key + 1;
+
+		aerospike_connect(self->as, &err);
+		if (err.code == AEROSPIKE_OK && self->use_shared_connection &&
+				!global_hosts_add(alias_to_search, self->as)) {
+			as_error close_err;
+			aerospike_close(self->as, &close_err);
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to register the shared connection");
 		}
-		self->as->config.shm_key = shm_key;
 	}
 
-	aerospike_connect(self->as, &err);
-	if (err.code != AEROSPIKE_OK) {
-		goto CLEANUP;
+	if (use_registry) {
+		global_hosts_unlock();
 	}
-	if (self->use_shared_connection) {
-		PyObject * py_newobject = (PyObject *)AerospikeGobalHosts_New(self->as);
-		PyDict_SetItemString(py_global_hosts, alias_to_search, py_newobject);
+	Py_END_ALLOW_THREADS
+
+	if (shared_as && shared_as != self->as) {
+		// If the client has previously connected
+		// Other clients may share its aerospike* pointer
+		// So it is not safe to destroy it
+		if (!self->has_connected) {
+			aerospike_destroy(self->as);
+		}
+		self->as = shared_as;
 	}
 
-
-
 CLEANUP:
 	if (free_alias_to_search && alias_to_search) {
 		PyMem_Free(alias_to_search);
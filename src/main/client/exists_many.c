@@ -27,6 +27,7 @@
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
+#include "key_batch.h"
 #include "policy.h"
 
 
@@ -140,8 +141,26 @@ static PyObject * batch_exists_aerospike_batch_exists(as_error *err, AerospikeCl
 	cb_data.cb_err = &local_err;
 
 	// Convert python keys list to as_key ** and add it to as_batch.keys
-	// keys can be specified in PyList or PyTuple
-	if (py_keys && PyList_Check(py_keys)) {
+	// keys can be specified in PyList, PyTuple or KeyBatch
+	if (AerospikeKeyBatch_Check(py_keys)) {
+		AerospikeKeyBatch * key_batch = (AerospikeKeyBatch *) py_keys;
+		Py_ssize_t size = key_batch->size;
+
+		cb_data.py_recs = PyList_New(size);
+		if (!cb_data.py_recs) {
+			as_error_update(err, AEROSPIKE_ERR_PARAM, "Failed to allocate return record");
+			goto CLEANUP;
+		}
+
+		as_batch_init(&batch, size);
+		// Batch object initialised
+		batch_initialised = true;
+
+		for (Py_ssize_t i = 0; i < size; i++) {
+			key_batch_key_init(key_batch, i, as_batch_keyat(&batch, i));
+		}
+	}
+	else if (py_keys && PyList_Check(py_keys)) {
 		Py_ssize_t size = PyList_Size(py_keys);
 
 		as_batch_init(&batch, size);
@@ -299,13 +318,7 @@ CLEANUP:
 		PyObject * py_err = NULL;
 		error_to_pyobject(&err, &py_err);
 		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_keys);
-		} 
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
+		raise_exception_with_attrs(exception_type, py_err, "key", py_keys, "bin", Py_None, NULL);
 		Py_DECREF(py_err);
 		return NULL;
 	}
@@ -26,6 +26,7 @@
 #include "exceptions.h"
 #include "policy.h"
 #include "serializer.h"
+#include "expression.h"
 #include "expression_operations.h"
 #include "cdt_operation_utils.h"
 
@@ -69,6 +70,7 @@ add_op_expr_write(AerospikeClient*self, as_error* err,
 		as_operations* ops, int serializer_type)
 {
 	as_exp* exp_list_p = NULL;
+	bool exp_owned = false;
 	PyObject* py_exp_list = NULL;
 	int64_t exp_write_flags = AS_EXP_WRITE_DEFAULT;
 	char* bin = NULL;
@@ -83,7 +85,7 @@ add_op_expr_write(AerospikeClient*self, as_error* err,
 
 	py_exp_list = PyDict_GetItemString(op_dict, AS_EXPR_KEY);
 
-	if (convert_exp_list(self, py_exp_list, &exp_list_p, err) != AEROSPIKE_OK) {
+	if (get_as_exp(self, err, py_exp_list, &exp_list_p, &exp_owned) != AEROSPIKE_OK) {
 		return err->code;
 	}
 
@@ -91,7 +93,7 @@ add_op_expr_write(AerospikeClient*self, as_error* err,
 		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to pack write expression op.");
 	}
 
-	if (exp_list_p) {
+	if (exp_list_p && exp_owned) {
 		as_exp_destroy(exp_list_p);
 	}
 
@@ -104,6 +106,7 @@ add_op_expr_read(AerospikeClient*self, as_error* err,
 		as_operations* ops, int serializer_type)
 {
 	as_exp* exp_list_p = NULL;
+	bool exp_owned = false;
 	PyObject* py_exp_list = NULL;
 	int64_t exp_read_flags = AS_EXP_READ_DEFAULT;
 	char* bin = NULL;
@@ -118,7 +121,7 @@ add_op_expr_read(AerospikeClient*self, as_error* err,
 
 	py_exp_list = PyDict_GetItemString(op_dict, AS_EXPR_KEY);
 
-	if (convert_exp_list(self, py_exp_list, &exp_list_p, err) != AEROSPIKE_OK) {
+	if (get_as_exp(self, err, py_exp_list, &exp_list_p, &exp_owned) != AEROSPIKE_OK) {
 		return err->code;
 	}
 
@@ -126,7 +129,7 @@ add_op_expr_read(AerospikeClient*self, as_error* err,
 		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to pack read expression op.");
 	}
 
-	if (exp_list_p) {
+	if (exp_list_p && exp_owned) {
 		as_exp_destroy(exp_list_p);
 	}
 
@@ -22,10 +22,12 @@
 #include <aerospike/as_error.h>
 #include <aerospike/as_record.h>
 
+#include "cdt_decoder.h"
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "serializer.h"
 
 /**
  *******************************************************************************************************
@@ -62,6 +64,12 @@ PyObject * AerospikeClient_Get_Invoke(
 	as_predexp_list predexp_list;
 	as_predexp_list* predexp_list_p = NULL;
 
+	// How blobs are returned
+	int read_blob_as = READ_BLOB_AS_BYTEARRAY;
+
+	// How list and map bins are returned
+	int cdt_mode = CDT_MODE_DEFAULT;
+
 	// Initialised flags
 	bool key_initialised = false;
 	bool record_initialised = false;
@@ -94,6 +102,15 @@ PyObject * AerospikeClient_Get_Invoke(
 		goto CLEANUP;
 	}
 
+	if (read_blob_as_from_policy(&err, py_policy, &read_blob_as) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (cdt_mode_from_policy(self, &err, py_policy, &cdt_mode) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+	cdt_mode_apply_read(self, cdt_mode, &read_policy, &read_policy_p);
+
 	// Invoke operation
 	Py_BEGIN_ALLOW_THREADS
 	aerospike_key_get(self->as, &err, read_policy_p, &key, &rec);
@@ -101,7 +118,12 @@ PyObject * AerospikeClient_Get_Invoke(
 	if (err.code == AEROSPIKE_OK) {
 		record_initialised = true;
 
-		if (record_to_pyobject(self, &err, rec, &key, &py_rec) != AEROSPIKE_OK) {
+		int previous_blob_as = set_read_blob_as(read_blob_as);
+		int previous_cdt_mode = set_cdt_mode(cdt_mode);
+		record_to_pyobject(self, &err, rec, &key, &py_rec);
+		set_cdt_mode(previous_cdt_mode);
+		set_read_blob_as(previous_blob_as);
+		if (err.code != AEROSPIKE_OK) {
 			goto CLEANUP;
 		}
 		if (!read_policy_p ||
@@ -144,13 +166,7 @@ CLEANUP:
 		PyObject * py_err = NULL;
 		error_to_pyobject(&err, &py_err);
 		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_key);
-		} 
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
+		raise_exception_with_attrs(exception_type, py_err, "key", py_key, "bin", Py_None, NULL);
 		Py_DECREF(py_err);
 		return NULL;
 	}
@@ -24,10 +24,14 @@
 #include <aerospike/as_record.h>
 #include <aerospike/as_batch.h>
 
+#include "cdt_decoder.h"
 #include "client.h"
+#include "columnar.h"
 #include "conversions.h"
 #include "exceptions.h"
+#include "key_batch.h"
 #include "policy.h"
+#include "serializer.h"
 
 #define MAX_STACK_ALLOCATION 4000
 
@@ -41,11 +45,15 @@
  * @param self                  AerospikeClient object
  * @param py_keys               The list of keys
  * @param batch_policy_p        as_policy_batch object
+ * @param columns               columnar results, or NULL for a list of records
+ * @param bin_names             bins of fixed columns, only these bins are read
+ * @param result_format         one of the batch_result_format, when columns is NULL
  *
  * Returns the record if key exists otherwise NULL.
  *******************************************************************************************************
  */
-static PyObject * batch_get_aerospike_batch_read(as_error *err, AerospikeClient * self, PyObject *py_keys, as_policy_batch * batch_policy_p)
+static PyObject * batch_get_aerospike_batch_read(as_error *err, AerospikeClient * self, PyObject *py_keys, as_policy_batch * batch_policy_p,
+		columnar * columns, char ** bin_names, int result_format)
 {
 	PyObject * py_recs = NULL;
 
@@ -56,8 +64,34 @@ static PyObject * batch_get_aerospike_batch_read(as_error *err, AerospikeClient
 	as_batch_read_record* record = NULL;
 
 	// Convert python keys list to as_key ** and add it to as_batch.keys
-	// keys can be specified in PyList or PyTuple
-	if (py_keys && PyList_Check(py_keys)) {
+	// keys can be specified in PyList, PyTuple or KeyBatch
+	if (AerospikeKeyBatch_Check(py_keys)) {
+		AerospikeKeyBatch * key_batch = (AerospikeKeyBatch *) py_keys;
+		Py_ssize_t size = key_batch->size;
+
+		if (size > MAX_STACK_ALLOCATION) {
+			as_batch_read_init(&records, size);
+		} else {
+			as_batch_read_inita(&records, size);
+		}
+
+		// Batch object initialised
+		batch_initialised = true;
+
+		// The keys borrow their values from the KeyBatch, no key tuple is read.
+		for (Py_ssize_t i = 0; i < size; i++) {
+			record = as_batch_read_reserve(&records);
+
+			key_batch_key_init(key_batch, i, &record->key);
+			if (bin_names) {
+				record->bin_names = bin_names;
+				record->n_bin_names = columns->columns.size;
+			} else {
+				record->read_all_bins = true;
+			}
+		}
+	}
+	else if (py_keys && PyList_Check(py_keys)) {
 		Py_ssize_t size = PyList_Size(py_keys);
 
 		if (size > MAX_STACK_ALLOCATION) {
@@ -81,7 +115,12 @@ static PyObject * batch_get_aerospike_batch_read(as_error *err, AerospikeClient
 			record = as_batch_read_reserve(&records);
 
 			pyobject_to_key(err, py_key, &record->key);
-			record->read_all_bins = true;
+			if (bin_names) {
+				record->bin_names = bin_names;
+				record->n_bin_names = columns->columns.size;
+			} else {
+				record->read_all_bins = true;
+			}
 
 			if (err->code != AEROSPIKE_OK) {
 				goto CLEANUP;
@@ -110,7 +149,12 @@ static PyObject * batch_get_aerospike_batch_read(as_error *err, AerospikeClient
 			record = as_batch_read_reserve(&records);
 
 			pyobject_to_key(err, py_key, &record->key);
-			record->read_all_bins = true;
+			if (bin_names) {
+				record->bin_names = bin_names;
+				record->n_bin_names = columns->columns.size;
+			} else {
+				record->read_all_bins = true;
+			}
 
 			if (err->code != AEROSPIKE_OK) {
 				goto CLEANUP;
@@ -130,7 +174,25 @@ static PyObject * batch_get_aerospike_batch_read(as_error *err, AerospikeClient
 	{
 		goto CLEANUP;
 	}
-	batch_read_records_to_pyobject(self, err, &records, &py_recs);
+
+	if (columns) {
+		for (uint32_t i = 0; i < records.list.size; i++) {
+			as_batch_read_record * batch = as_vector_get(&records.list, i);
+			bool added = batch->result == AEROSPIKE_OK ?
+					columnar_add_record(columns, &batch->record) : columnar_add_missing(columns);
+			if (!added) {
+				break;
+			}
+		}
+		// Fails with AEROSPIKE_ERR_CLIENT when the columns could not grow.
+		columnar_to_pyobject(self, err, columns, &py_recs);
+	}
+	else if (result_format != BATCH_RESULT_LIST) {
+		batch_read_records_to_pydict(self, err, &records, result_format == BATCH_RESULT_DICT_META, &py_recs);
+	}
+	else {
+		batch_read_records_to_pyobject(self, err, &records, &py_recs);
+	}
 
 CLEANUP:
 	if (batch_initialised == true) {
@@ -160,6 +222,8 @@ CLEANUP:
  * @param self                  AerospikeClient object
  * @param py_keys               The list of keys
  * @param py_policy             The dictionary of policies
+ * @param py_columnar           True or a list of bin names for columnar results
+ * @param py_result_format      'list', 'dict' or 'dict_meta'
  *
  * Returns the record if key exists otherwise NULL.
  *******************************************************************************************************
@@ -167,7 +231,7 @@ CLEANUP:
 static
 PyObject * AerospikeClient_Get_Many_Invoke(
 	AerospikeClient * self,
-	PyObject * py_keys, PyObject * py_policy)
+	PyObject * py_keys, PyObject * py_policy, PyObject * py_columnar, PyObject * py_result_format)
 {
 	// Python Return Value
 	PyObject * py_recs = NULL;
@@ -187,6 +251,19 @@ PyObject * AerospikeClient_Get_Many_Invoke(
 	as_predexp_list predexp_list;
 	as_predexp_list* predexp_list_p = NULL;
 
+	// For columnar results.
+	columnar columns;
+	bool columnar_enabled = false;
+	char ** bin_names = NULL;
+
+	int result_format = BATCH_RESULT_LIST;
+
+	// How blobs are returned
+	int read_blob_as = READ_BLOB_AS_BYTEARRAY;
+
+	// How list and map bins are returned
+	int cdt_mode = CDT_MODE_DEFAULT;
+
 	if (!self || !self->as) {
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
@@ -204,11 +281,57 @@ PyObject * AerospikeClient_Get_Many_Invoke(
 		goto CLEANUP;
 	}
 
-	py_recs = batch_get_aerospike_batch_read(&err, self, py_keys, batch_policy_p);
+	if (read_blob_as_from_policy(&err, py_policy, &read_blob_as) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (cdt_mode_from_policy(self, &err, py_policy, &cdt_mode) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+	cdt_mode_apply_batch(self, cdt_mode, &policy, &batch_policy_p);
+
+	if (batch_result_format_from_pyobject(&err, py_result_format, &result_format) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (columnar_init(&err, &columns, py_columnar, &columnar_enabled) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (columnar_enabled && result_format != BATCH_RESULT_LIST) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "columnar results can't be combined with a result_format");
+		goto CLEANUP;
+	}
+
+	if (columnar_enabled && columns.fixed) {
+		bin_names = (char **) malloc(sizeof(char *) * (columns.columns.size + 1));
+		if (!bin_names) {
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the bin names");
+			goto CLEANUP;
+		}
+		for (uint32_t i = 0; i < columns.columns.size; i++) {
+			bin_names[i] = ((column *) as_vector_get(&columns.columns, i))->name;
+		}
+	}
+
+	int previous_blob_as = set_read_blob_as(read_blob_as);
+	int previous_cdt_mode = set_cdt_mode(cdt_mode);
+	py_recs = batch_get_aerospike_batch_read(&err, self, py_keys, batch_policy_p,
+			columnar_enabled ? &columns : NULL, bin_names, result_format);
+	set_cdt_mode(previous_cdt_mode);
+	set_read_blob_as(previous_blob_as);
 
 
 CLEANUP:
 
+	if (columnar_enabled) {
+		columnar_destroy(&columns);
+	}
+
+	if (bin_names) {
+		free(bin_names);
+	}
+
 	if (exp_list_p) {
 		as_exp_destroy(exp_list_p);;
 	}
@@ -221,13 +344,7 @@ CLEANUP:
 		PyObject * py_err = NULL;
 		error_to_pyobject(&err, &py_err);
 		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_keys);
-		} 
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
+		raise_exception_with_attrs(exception_type, py_err, "key", py_keys, "bin", Py_None, NULL);
 		Py_DECREF(py_err);
 		return NULL;
 	}
@@ -254,16 +371,18 @@ PyObject * AerospikeClient_Get_Many(AerospikeClient * self, PyObject * args, PyO
 	// Python Function Arguments
 	PyObject * py_keys = NULL;
 	PyObject * py_policy = NULL;
+	PyObject * py_columnar = NULL;
+	PyObject * py_result_format = NULL;
 
 	// Python Function Keyword Arguments
-	static char * kwlist[] = {"keys", "policy", NULL};
+	static char * kwlist[] = {"keys", "policy", "columnar", "result_format", NULL};
 
 	// Python Function Argument Parsing
-	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|O:get_many", kwlist,
-			&py_keys, &py_policy) == false) {
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OOO:get_many", kwlist,
+			&py_keys, &py_policy, &py_columnar, &py_result_format) == false) {
 		return NULL;
 	}
 
 	// Invoke Operation
-	return AerospikeClient_Get_Many_Invoke(self, py_keys, py_policy);
+	return AerospikeClient_Get_Many_Invoke(self, py_keys, py_policy, py_columnar, py_result_format);
 }
@@ -427,7 +427,7 @@ cleanup:
 
 static as_status
 get_hll_policy(as_error* err, PyObject* op_dict, as_hll_policy* policy, as_hll_policy** policy_p) {
-    PyObject* hll_policy = PyDict_GetItemString(op_dict, AS_PY_HLL_POLICY);
+    PyObject* hll_policy = get_op_entry(op_dict, AS_PY_HLL_POLICY);
 
     if (hll_policy) {
         if (pyobject_to_hll_policy(err, hll_policy, policy) != AEROSPIKE_OK) {
@@ -0,0 +1,553 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include <aerospike/aerospike_info.h>
+#include <aerospike/as_cluster.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_node.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "info_parsed.h"
+#include "policy.h"
+
+// Responses kept by the cache, the oldest one is evicted first.
+#define INFO_CACHE_MAX_ENTRIES 1024
+
+/*
+ * Raw responses and the time they were fetched, by (node name, command),
+ * shared by the calls of info_all_parsed() with a ttl. The entries are only
+ * touched with the GIL held. While a response is fetched its entry is None,
+ * callers needing the same response wait for that round trip instead of
+ * making their own, callers needing another one are not held up.
+ */
+typedef struct info_cache_s {
+	pthread_mutex_t lock;
+	pthread_cond_t fetched;
+	uint64_t generation;
+	PyObject * py_entries;
+} info_cache;
+
+/*******************************************************************************
+ * PARSING
+ ******************************************************************************/
+
+typedef enum {
+	INFO_ITEM_VALUE,
+	INFO_ITEM_PAIR,
+	INFO_ITEM_RECORD
+} info_item_kind;
+
+static bool info_value_is_integer(const char * value)
+{
+	const char * p = value;
+
+	if (*p == '-') {
+		p++;
+	}
+	if (!*p) {
+		return false;
+	}
+	for (; *p; p++) {
+		if (*p < '0' || *p > '9') {
+			return false;
+		}
+	}
+	return true;
+}
+
+static bool info_value_is_float(const char * value)
+{
+	const char * p = value;
+	bool dot = false;
+
+	if (*p == '-') {
+		p++;
+	}
+	if (*p < '0' || *p > '9') {
+		return false;
+	}
+	for (; *p; p++) {
+		if (*p == '.' && !dot) {
+			dot = true;
+		}
+		else if (*p < '0' || *p > '9') {
+			return false;
+		}
+	}
+	return dot;
+}
+
+static PyObject * info_value_to_pyobject(const char * value)
+{
+	if (info_value_is_integer(value)) {
+		return PyLong_FromString(value, NULL, 10);
+	}
+	if (info_value_is_float(value)) {
+		return PyFloat_FromDouble(strtod(value, NULL));
+	}
+	if (strcmp(value, "true") == 0) {
+		Py_RETURN_TRUE;
+	}
+	if (strcmp(value, "false") == 0) {
+		Py_RETURN_FALSE;
+	}
+	return PyUnicode_DecodeUTF8(value, strlen(value), "replace");
+}
+
+/*
+ * Splits item at its first '=' and sets the value in py_dict.
+ */
+static int info_pair_set(PyObject * py_dict, char * item)
+{
+	char * value = strchr(item, '=');
+	*value++ = '\0';
+
+	PyObject * py_key = PyUnicode_DecodeUTF8(item, strlen(item), "replace");
+	PyObject * py_value = info_value_to_pyobject(value);
+	int rc = -1;
+
+	if (py_key && py_value) {
+		rc = PyDict_SetItem(py_dict, py_key, py_value);
+	}
+
+	Py_XDECREF(py_key);
+	Py_XDECREF(py_value);
+	return rc;
+}
+
+static info_item_kind info_item_classify(const char * item)
+{
+	const char * field = item;
+	int fields = 0;
+
+	if (!strchr(item, '=')) {
+		return INFO_ITEM_VALUE;
+	}
+
+	// A record has several fields, all of them k=v.
+	while (field) {
+		const char * next = strchr(field, ':');
+		const char * eq = strchr(field, '=');
+
+		if (!eq || (next && eq > next)) {
+			return INFO_ITEM_PAIR;
+		}
+		fields++;
+		field = next ? next + 1 : NULL;
+	}
+
+	return fields > 1 ? INFO_ITEM_RECORD : INFO_ITEM_PAIR;
+}
+
+static PyObject * info_record_to_pyobject(char * item)
+{
+	PyObject * py_record = PyDict_New();
+	char * field = item;
+
+	while (py_record && field) {
+		char * next = strchr(field, ':');
+		if (next) {
+			*next++ = '\0';
+		}
+		if (info_pair_set(py_record, field) == -1) {
+			Py_CLEAR(py_record);
+		}
+		field = next;
+	}
+
+	return py_record;
+}
+
+PyObject * info_response_to_pyobject(const char * response)
+{
+	PyObject * py_result = NULL;
+	const char * start = strchr(response, '\t');
+	start = start ? start + 1 : response;
+
+	size_t size = strcspn(start, "\n");
+	char * text = (char *) PyMem_Malloc(size + 1);
+	if (!text) {
+		return PyErr_NoMemory();
+	}
+	memcpy(text, start, size);
+	text[size] = '\0';
+
+	// Items are separated by ';', the response may end with one.
+	uint32_t capacity = 1;
+	for (char * p = text; *p; p++) {
+		if (*p == ';') {
+			capacity++;
+		}
+	}
+
+	char ** items = (char **) PyMem_Malloc(capacity * sizeof(char *));
+	if (!items) {
+		PyMem_Free(text);
+		return PyErr_NoMemory();
+	}
+
+	uint32_t count = 0;
+	uint32_t pairs = 0;
+	uint32_t records = 0;
+	char * item = text;
+
+	while (item) {
+		char * next = strchr(item, ';');
+		if (next) {
+			*next++ = '\0';
+		}
+		if (*item) {
+			info_item_kind kind = info_item_classify(item);
+			pairs += kind == INFO_ITEM_PAIR;
+			records += kind == INFO_ITEM_RECORD;
+			items[count++] = item;
+		}
+		item = next;
+	}
+
+	if (count > 0 && records == count) {
+		py_result = PyList_New(count);
+		for (uint32_t i = 0; py_result && i < count; i++) {
+			PyObject * py_record = info_record_to_pyobject(items[i]);
+			if (!py_record) {
+				Py_CLEAR(py_result);
+				break;
+			}
+			PyList_SET_ITEM(py_result, i, py_record);
+		}
+	}
+	else if (count > 0 && pairs + records == count) {
+		py_result = PyDict_New();
+		for (uint32_t i = 0; py_result && i < count; i++) {
+			if (info_pair_set(py_result, items[i]) == -1) {
+				Py_CLEAR(py_result);
+			}
+		}
+	}
+	else if (count == 1) {
+		py_result = info_value_to_pyobject(items[0]);
+	}
+	else {
+		py_result = PyList_New(count);
+		for (uint32_t i = 0; py_result && i < count; i++) {
+			PyObject * py_value = info_value_to_pyobject(items[i]);
+			if (!py_value) {
+				Py_CLEAR(py_result);
+				break;
+			}
+			PyList_SET_ITEM(py_result, i, py_value);
+		}
+	}
+
+	PyMem_Free(items);
+	PyMem_Free(text);
+	return py_result;
+}
+
+/*******************************************************************************
+ * CACHE
+ ******************************************************************************/
+
+static double info_cache_now(void)
+{
+	struct timespec ts;
+	clock_gettime(CLOCK_MONOTONIC, &ts);
+	return (double) ts.tv_sec + (double) ts.tv_nsec / 1e9;
+}
+
+static info_cache * info_cache_get(AerospikeClient * self)
+{
+	if (!self->info_cache) {
+		info_cache * cache = (info_cache *) malloc(sizeof(info_cache));
+		if (!cache) {
+			return NULL;
+		}
+		cache->py_entries = PyDict_New();
+		if (!cache->py_entries) {
+			PyErr_Clear();
+			free(cache);
+			return NULL;
+		}
+		cache->generation = 0;
+		pthread_mutex_init(&cache->lock, NULL);
+		pthread_cond_init(&cache->fetched, NULL);
+		self->info_cache = cache;
+	}
+	return self->info_cache;
+}
+
+void info_cache_free(info_cache * cache)
+{
+	if (!cache) {
+		return;
+	}
+	Py_XDECREF(cache->py_entries);
+	pthread_cond_destroy(&cache->fetched);
+	pthread_mutex_destroy(&cache->lock);
+	free(cache);
+}
+
+/*
+ * Returns a new reference to the cached response. When there is none, or it
+ * was fetched more than ttl seconds ago, returns NULL and marks the response
+ * as being fetched, info_cache_store() must then be called. A fetch of the
+ * same response in progress is waited for.
+ */
+static PyObject * info_cache_lookup(info_cache * cache, PyObject * py_cache_key, double ttl)
+{
+	while (true) {
+		PyObject * py_entry = PyDict_GetItem(cache->py_entries, py_cache_key);
+
+		if (py_entry == Py_None) {
+			// Only bumped with the GIL held, the wake up cannot be missed.
+			uint64_t generation = cache->generation;
+
+			Py_BEGIN_ALLOW_THREADS
+			pthread_mutex_lock(&cache->lock);
+			while (cache->generation == generation) {
+				pthread_cond_wait(&cache->fetched, &cache->lock);
+			}
+			pthread_mutex_unlock(&cache->lock);
+			Py_END_ALLOW_THREADS
+			continue;
+		}
+
+		if (py_entry && PyFloat_AsDouble(PyTuple_GET_ITEM(py_entry, 0)) + ttl > info_cache_now()) {
+			PyObject * py_response = PyTuple_GET_ITEM(py_entry, 1);
+			Py_INCREF(py_response);
+			return py_response;
+		}
+
+		// Removed first, the entries stay in the order they were fetched.
+		if ((py_entry && PyDict_DelItem(cache->py_entries, py_cache_key) == -1) ||
+				PyDict_SetItem(cache->py_entries, py_cache_key, Py_None) == -1) {
+			PyErr_Clear();
+		}
+		return NULL;
+	}
+}
+
+/*
+ * Evicts the oldest responses until there is room for one more. Responses
+ * being fetched are left alone.
+ */
+static void info_cache_evict(info_cache * cache)
+{
+	while (PyDict_Size(cache->py_entries) >= INFO_CACHE_MAX_ENTRIES) {
+		Py_ssize_t pos = 0;
+		PyObject * py_key = NULL;
+		PyObject * py_entry = NULL;
+		bool evicted = false;
+
+		while (PyDict_Next(cache->py_entries, &pos, &py_key, &py_entry)) {
+			if (py_entry != Py_None) {
+				Py_INCREF(py_key);
+				evicted = PyDict_DelItem(cache->py_entries, py_key) == 0;
+				Py_DECREF(py_key);
+				break;
+			}
+		}
+
+		if (!evicted) {
+			PyErr_Clear();
+			break;
+		}
+	}
+}
+
+/*
+ * Replaces the mark set by info_cache_lookup() with py_response and the time
+ * it was fetched, or drops it when the fetch failed and py_response is NULL,
+ * then wakes up the callers waiting for it.
+ */
+static void info_cache_store(info_cache * cache, PyObject * py_cache_key, PyObject * py_response)
+{
+	if (PyDict_DelItem(cache->py_entries, py_cache_key) == -1) {
+		PyErr_Clear();
+	}
+
+	if (py_response) {
+		info_cache_evict(cache);
+
+		PyObject * py_entry = Py_BuildValue("(dO)", info_cache_now(), py_response);
+		if (!py_entry || PyDict_SetItem(cache->py_entries, py_cache_key, py_entry) == -1) {
+			PyErr_Clear();
+		}
+		Py_XDECREF(py_entry);
+	}
+
+	pthread_mutex_lock(&cache->lock);
+	cache->generation++;
+	pthread_cond_broadcast(&cache->fetched);
+	pthread_mutex_unlock(&cache->lock);
+}
+
+/*******************************************************************************
+ * INFO ALL PARSED
+ ******************************************************************************/
+
+PyObject * AerospikeClient_InfoAll_Parsed(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	PyObject * py_req = NULL;
+	PyObject * py_policy = NULL;
+	PyObject * py_ustr = NULL;
+	PyObject * py_nodes = NULL;
+	double ttl = 0;
+
+	as_policy_info info_policy;
+	as_policy_info * info_policy_p = NULL;
+	info_cache * cache = NULL;
+	as_nodes * nodes = NULL;
+
+	static char * kwlist[] = {"command", "policy", "ttl", NULL};
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|Od:info_all_parsed", kwlist, &py_req, &py_policy, &ttl) == false) {
+		return NULL;
+	}
+
+	as_error err;
+	as_error_init(&err);
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+	if (!self->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+	if (ttl < 0) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "ttl must not be negative");
+		goto CLEANUP;
+	}
+
+	pyobject_to_policy_info(&err, py_policy, &info_policy, &info_policy_p,
+					&self->as->config.policies.info);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	char * request = NULL;
+	if (PyUnicode_Check(py_req)) {
+		py_ustr = PyUnicode_AsUTF8String(py_req);
+		request = PyBytes_AsString(py_ustr);
+	} else if (PyString_Check(py_req)) {
+		request = PyString_AsString(py_req);
+	} else {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Request must be a string");
+		goto CLEANUP;
+	}
+
+	if (ttl > 0) {
+		cache = info_cache_get(self);
+		if (!cache) {
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the info cache");
+			goto CLEANUP;
+		}
+	}
+
+	py_nodes = PyDict_New();
+	if (!py_nodes) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the info responses");
+		goto CLEANUP;
+	}
+
+	nodes = as_nodes_reserve(self->as->cluster);
+
+	for (uint32_t i = 0; i < nodes->size; i++) {
+		as_node * node = nodes->array[i];
+		PyObject * py_cache_key = NULL;
+		PyObject * py_response = NULL;
+
+		if (cache) {
+			py_cache_key = Py_BuildValue("(ss)", node->name, request);
+			if (!py_cache_key) {
+				as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the info cache key of node %s", node->name);
+				break;
+			}
+			py_response = info_cache_lookup(cache, py_cache_key, ttl);
+		}
+
+		if (!py_response) {
+			char * response = NULL;
+			as_status status = AEROSPIKE_OK;
+
+			Py_BEGIN_ALLOW_THREADS
+			status = aerospike_info_node(self->as, &err, info_policy_p, node, request, &response);
+			Py_END_ALLOW_THREADS
+
+			if (status == AEROSPIKE_OK) {
+				py_response = PyBytes_FromString(response ? response : "");
+				free(response);
+				if (!py_response) {
+					PyErr_Clear();
+					as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the info response of node %s", node->name);
+				}
+			}
+
+			if (cache) {
+				info_cache_store(cache, py_cache_key, py_response);
+			}
+
+			if (!py_response) {
+				Py_XDECREF(py_cache_key);
+				break;
+			}
+		}
+		Py_XDECREF(py_cache_key);
+
+		PyObject * py_parsed = info_response_to_pyobject(PyBytes_AS_STRING(py_response));
+		Py_DECREF(py_response);
+		if (!py_parsed) {
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Failed to parse the info response of node %s", node->name);
+			break;
+		}
+
+		int rval = PyDict_SetItemString(py_nodes, node->name, py_parsed);
+		Py_DECREF(py_parsed);
+		if (rval != 0) {
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to store the info response of node %s", node->name);
+			break;
+		}
+	}
+
+	as_nodes_release(nodes);
+
+CLEANUP:
+	Py_XDECREF(py_ustr);
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_XDECREF(py_nodes);
+		PyErr_Clear();
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_nodes;
+}
@@ -36,6 +36,8 @@
 #include "bit_operations.h"
 #include "hll_operations.h"
 #include "expression_operations.h"
+#include "operation_list.h"
+#include "cdt_operation_utils.h"
 
 #include <aerospike/as_double.h>
 #include <aerospike/as_integer.h>
@@ -80,13 +82,7 @@ static inline bool isExprOp(int op);
 		PyObject * py_err = NULL;\
 		error_to_pyobject(&err, &py_err);\
 		PyObject *exception_type = raise_exception(&err);\
-		if (PyObject_HasAttrString(exception_type, "key")) {\
-			PyObject_SetAttrString(exception_type, "key", py_key);\
-		}\
-		if (PyObject_HasAttrString(exception_type, "bin")) {\
-			PyObject_SetAttrString(exception_type, "bin", py_bin);\
-		}\
-		PyErr_SetObject(exception_type, py_err);\
+		raise_exception_with_attrs(exception_type, py_err, "key", py_key, "bin", py_bin, NULL);\
 		Py_DECREF(py_err);\
 		return NULL;\
 	}
@@ -372,38 +368,62 @@ as_status add_op(AerospikeClient * self, as_error * err, PyObject * py_val, as_v
 			ops, operation, SERIALIZER_PYTHON);
 	}
 
-	while (PyDict_Next(py_val, &pos, &key_op, &value)) {
-		if (!PyString_Check(key_op)) {
-			return as_error_update(err, AEROSPIKE_ERR_CLIENT, "An operation key must be a string.");
-		} else {
-			char * name = PyString_AsString(key_op);
-			if (!strcmp(name,"op")) {
-				continue;
-			} else if (!strcmp(name, "bin")) {
-				py_bin = value;
-			} else if (!strcmp(name, "index")) {
-				py_index = value;
-			} else if (!strcmp(name, "val")) {
-				py_value = value;
-			} else if (!strcmp(name, "key")) {
-				py_key = value;
-			} else if (!strcmp(name, "range")) {
-				py_range = value;
-			} else if (!strcmp(name, "map_policy")) {
-				py_map_policy = value;
-			} else if (!strcmp(name, "return_type")) {
-				py_return_type = value;
-			} else if (strcmp(name, "inverted") == 0) {
-				continue;
-			} else if (strcmp(name, "ctx") == 0) {
-				CONVERT_PY_CTX_TO_AS_CTX();
-				ctx_ref = (ctx_in_use ? &ctx : NULL);
+	if (PyDict_Check(py_val)) {
+		while (PyDict_Next(py_val, &pos, &key_op, &value)) {
+			if (!PyString_Check(key_op)) {
+				return as_error_update(err, AEROSPIKE_ERR_CLIENT, "An operation key must be a string.");
 			} else {
-				return as_error_update(err, AEROSPIKE_ERR_PARAM,
-						"Operation can contain only op, bin, index, key, val, return_type and map_policy keys");
+				char * name = PyString_AsString(key_op);
+				if (!strcmp(name,"op")) {
+					continue;
+				} else if (!strcmp(name, "bin")) {
+					py_bin = value;
+				} else if (!strcmp(name, "index")) {
+					py_index = value;
+				} else if (!strcmp(name, "val")) {
+					py_value = value;
+				} else if (!strcmp(name, "key")) {
+					py_key = value;
+				} else if (!strcmp(name, "range")) {
+					py_range = value;
+				} else if (!strcmp(name, "map_policy")) {
+					py_map_policy = value;
+				} else if (!strcmp(name, "return_type")) {
+					py_return_type = value;
+				} else if (strcmp(name, "inverted") == 0) {
+					continue;
+				} else if (strcmp(name, "ctx") == 0) {
+					CONVERT_PY_CTX_TO_AS_CTX();
+					ctx_ref = (ctx_in_use ? &ctx : NULL);
+				} else {
+					return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							"Operation can contain only op, bin, index, key, val, return_type and map_policy keys");
+				}
 			}
 		}
 	}
+	else {
+		static const char * known_keys[] = {"op", "bin", "index", "val", "key", "range",
+				"map_policy", "return_type", "inverted", "ctx", NULL};
+
+		if (get_op_unknown_entry(py_val, known_keys)) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+					"Operation can contain only op, bin, index, key, val, return_type and map_policy keys");
+		}
+
+		/* An Operation object has fixed entries, so read the ones this operation uses directly */
+		py_bin = get_op_entry(py_val, "bin");
+		py_index = get_op_entry(py_val, "index");
+		py_value = get_op_entry(py_val, "val");
+		py_key = get_op_entry(py_val, "key");
+		py_range = get_op_entry(py_val, "range");
+		py_map_policy = get_op_entry(py_val, "map_policy");
+		py_return_type = get_op_entry(py_val, "return_type");
+		if (get_op_entry(py_val, "ctx")) {
+			CONVERT_PY_CTX_TO_AS_CTX();
+			ctx_ref = (ctx_in_use ? &ctx : NULL);
+		}
+	}
 
 	*op = operation;
 
@@ -505,6 +525,8 @@ as_status add_op(AerospikeClient * self, as_error * err, PyObject * py_val, as_v
 						return err->code;
 					}
 					as_operations_add_append_rawp(ops, bin, bytes->value, bytes->size, true);
+					// The operation owns the value now.
+					bytes->free = false;
 				}
 			} else {
 				if (!self->strict_types || !strcmp(py_value->ob_type->tp_name, "aerospike.null")) {
@@ -531,6 +553,8 @@ as_status add_op(AerospikeClient * self, as_error * err, PyObject * py_val, as_v
 						return err->code;
 					}
 					as_operations_add_prepend_rawp(ops, bin, bytes->value, bytes->size, true);
+					// The operation owns the value now.
+					bytes->free = false;
 				}
 			} else {
 				if (!self->strict_types || !strcmp(py_value->ob_type->tp_name, "aerospike.null")) {
@@ -770,10 +794,16 @@ PyObject *  AerospikeClient_Operate_Invoke(
 
 	as_vector * unicodeStrVector = as_vector_create(sizeof(char *), 128);
 
+	// Compiled operations of an OperationList, shared by ops.
+	PyObject * py_compiled = NULL;
+
 	as_operations ops;
-	Py_ssize_t size = PyList_Size(py_list);
+	Py_ssize_t size = PyList_Check(py_list) ? PyList_Size(py_list) : operation_list_size(py_list);
 	as_operations_inita(&ops, size);
 
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
 	if (py_policy) {
 		if(pyobject_to_policy_operate(self, err, py_policy, &operate_policy, &operate_policy_p,
 				&self->as->config.policies.operate, &predexp_list, &predexp_list_p, &exp_list, &exp_list_p) != AEROSPIKE_OK) {
@@ -781,8 +811,6 @@ PyObject *  AerospikeClient_Operate_Invoke(
 		}
 	}
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
 	CHECK_CONNECTED(err);
 
 	if (py_meta) {
@@ -791,12 +819,19 @@ PyObject *  AerospikeClient_Operate_Invoke(
 		}
 	}
 
-	for (i = 0; i < size; i++) {
-		PyObject * py_val = PyList_GetItem(py_list, i);
+	if (AerospikeOperationList_Check(py_list)) {
+		if (operation_list_add_ops(self, err, py_list, unicodeStrVector, &static_pool, &ops, &py_compiled) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+	else {
+		for (i = 0; i < size; i++) {
+			PyObject * py_val = PyList_GetItem(py_list, i);
 
-		if (PyDict_Check(py_val)) {
-			if (add_op(self, err, py_val, unicodeStrVector, &static_pool, &ops, &operation, &return_type) != AEROSPIKE_OK) {
-				goto CLEANUP;
+			if (is_operation(py_val)) {
+				if (add_op(self, err, py_val, unicodeStrVector, &static_pool, &ops, &operation, &return_type) != AEROSPIKE_OK) {
+					goto CLEANUP;
+				}
 			}
 		}
 	}
@@ -843,6 +878,8 @@ CLEANUP:
 	}
 
 	as_operations_destroy(&ops);
+	POOL_DESTROY(&static_pool);
+	Py_XDECREF(py_compiled);
 
 	if (err->code != AEROSPIKE_OK) {
 		PyObject * py_err = NULL;
@@ -893,7 +930,7 @@ PyObject * AerospikeClient_Operate(AerospikeClient * self, PyObject * args, PyOb
 		goto CLEANUP;
 	}
 
-	if (py_list && PyList_Check(py_list)) {
+	if (py_list && (PyList_Check(py_list) || AerospikeOperationList_Check(py_list))) {
 		py_result = AerospikeClient_Operate_Invoke(self, &err, &key, py_list, py_meta,
 				py_policy);
 	} else {
@@ -939,8 +976,11 @@ static PyObject *  AerospikeClient_OperateOrdered_Invoke(
 	as_static_pool static_pool;
 	memset(&static_pool, 0, sizeof(static_pool));
 
+	// Compiled operations of an OperationList, shared by ops.
+	PyObject * py_compiled = NULL;
+
 	as_operations ops;
-	Py_ssize_t ops_list_size = PyList_Size(py_list);
+	Py_ssize_t ops_list_size = PyList_Check(py_list) ? PyList_Size(py_list) : operation_list_size(py_list);
 	as_operations_inita(&ops, ops_list_size);
 
 	// For expressions conversion.
@@ -971,19 +1011,26 @@ static PyObject *  AerospikeClient_OperateOrdered_Invoke(
 		}
 	}
 
-	for (Py_ssize_t i = 0; i < ops_list_size; i++) {
+	if (AerospikeOperationList_Check(py_list)) {
+		if (operation_list_add_ops(self, err, py_list, unicodeStrVector, &static_pool, &ops, &py_compiled) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+	else {
+		for (Py_ssize_t i = 0; i < ops_list_size; i++) {
 
-		PyObject* py_current_op = NULL;
-		py_current_op = PyList_GetItem(py_list, i);
+			PyObject* py_current_op = NULL;
+			py_current_op = PyList_GetItem(py_list, i);
 
-		if (PyDict_Check(py_current_op)) {
-			if (add_op(self, err, py_current_op, unicodeStrVector, &static_pool,
-					&ops, &operation, &return_type) != AEROSPIKE_OK) {
+			if (is_operation(py_current_op)) {
+				if (add_op(self, err, py_current_op, unicodeStrVector, &static_pool,
+						&ops, &operation, &return_type) != AEROSPIKE_OK) {
+					goto CLEANUP;
+				}
+			} else {
+				as_error_update(err, AEROSPIKE_ERR_PARAM, "Operation must be a dict or an Operation");
 				goto CLEANUP;
 			}
-		} else {
-			as_error_update(err, AEROSPIKE_ERR_PARAM, "Operation must be a dict");
-			goto CLEANUP;
 		}
 	}
 
@@ -1061,6 +1108,8 @@ CLEANUP:
 	}
 
 	as_operations_destroy(&ops);
+	POOL_DESTROY(&static_pool);
+	Py_XDECREF(py_compiled);
 
 	if (err->code != AEROSPIKE_OK) {
 		PyObject * py_err = NULL;
@@ -1122,7 +1171,7 @@ PyObject * AerospikeClient_OperateOrdered(AerospikeClient * self, PyObject * arg
 		goto CLEANUP;
 	}
 
-	if (py_list && PyList_Check(py_list)) {
+	if (py_list && (PyList_Check(py_list) || AerospikeOperationList_Check(py_list))) {
 		py_result = AerospikeClient_OperateOrdered_Invoke(self, &err, &key, py_list, py_meta,
 				py_policy);
 	} else {
@@ -1135,10 +1184,7 @@ CLEANUP:
 		PyObject * py_err = NULL;
 		error_to_pyobject(&err, &py_err);
 		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_key);
-		}
-		PyErr_SetObject(exception_type, py_err);
+		raise_exception_with_attrs(exception_type, py_err, "key", py_key, NULL);
 		Py_DECREF(py_err);
 		return NULL;
 	}
@@ -1329,7 +1375,7 @@ CLEANUP:
 static as_status
 get_operation(as_error* err, PyObject* op_dict, long* operation_ptr)
 {
-        PyObject* py_operation = PyDict_GetItemString(op_dict, PY_OPERATION_KEY);
+        PyObject* py_operation = get_op_entry(op_dict, PY_OPERATION_KEY);
         if (!py_operation) {
             return as_error_update(err, AEROSPIKE_ERR_PARAM, "Operation must contain an \"op\" entry");
         }
@@ -1351,7 +1397,7 @@ get_operation(as_error* err, PyObject* op_dict, long* operation_ptr)
 
 static as_status
 invertIfSpecified(as_error* err, PyObject* op_dict, uint64_t* return_value) {
-	PyObject* pyInverted = PyDict_GetItemString(op_dict, "inverted");
+	PyObject* pyInverted = get_op_entry(op_dict, "inverted");
 	int truthValue;
 	if (!pyInverted) {
 		return AEROSPIKE_OK;
@@ -48,6 +48,8 @@
 	as_key key;\
 	bool key_created = false;\
 	char* bin = NULL;\
+	as_static_pool static_pool;\
+	memset(&static_pool, 0, sizeof(static_pool));\
 
 #define CHECK_CONNECTED_AND_CDT_SUPPORT()\
 	if (!self || !self->as) {\
@@ -90,6 +92,7 @@
 	Py_END_ALLOW_THREADS
 
 #define EXCEPTION_ON_ERROR()\
+	POOL_DESTROY(&static_pool);\
 	if (key_created) {\
 		as_key_destroy(&key);\
 	}\
@@ -97,13 +100,7 @@
 		PyObject * py_err = NULL;\
 		error_to_pyobject(&err, &py_err);\
 		PyObject *exception_type = raise_exception(&err);\
-		if (PyObject_HasAttrString(exception_type, "key")) {\
-			PyObject_SetAttrString(exception_type, "key", py_key);\
-		}\
-		if (PyObject_HasAttrString(exception_type, "bin")) {\
-			PyObject_SetAttrString(exception_type, "bin", py_bin);\
-		}\
-		PyErr_SetObject(exception_type, py_err);\
+		raise_exception_with_attrs(exception_type, py_err, "key", py_key, "bin", py_bin, NULL);\
 		Py_DECREF(py_err);\
 		return NULL;\
 	}
@@ -161,9 +158,6 @@ PyObject * AerospikeClient_ListAppend(AerospikeClient * self, PyObject * args, P
 
 	CHECK_CONNECTED_AND_CDT_SUPPORT();
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	POLICY_KEY_META_BIN();
 
 	as_val* put_val = NULL;
@@ -212,9 +206,6 @@ PyObject * AerospikeClient_ListExtend(AerospikeClient * self, PyObject * args, P
 
 	CHECK_CONNECTED_AND_CDT_SUPPORT();
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	if (!PyList_Check(py_append_val)) {
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Items should be of type list");
 		goto CLEANUP;
@@ -269,9 +260,6 @@ PyObject * AerospikeClient_ListInsert(AerospikeClient * self, PyObject * args, P
 
 	CHECK_CONNECTED_AND_CDT_SUPPORT();
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	POLICY_KEY_META_BIN();
 
 	as_val* put_val = NULL;
@@ -322,9 +310,6 @@ PyObject * AerospikeClient_ListInsertItems(AerospikeClient * self, PyObject * ar
 
 	CHECK_CONNECTED_AND_CDT_SUPPORT();
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	if (!PyList_Check(py_insert_val)) {
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Items should be of type list");
 		goto CLEANUP;
@@ -685,9 +670,6 @@ PyObject * AerospikeClient_ListSet(AerospikeClient * self, PyObject * args, PyOb
 
 	CHECK_CONNECTED_AND_CDT_SUPPORT();
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	POLICY_KEY_META_BIN();
 
 	as_val* put_val = NULL;
@@ -41,6 +41,8 @@
 	char* bin = NULL;\
 	bool key_created = false;\
 	as_key key;\
+	as_static_pool static_pool;\
+	memset(&static_pool, 0, sizeof(static_pool));\
 
 #define CHECK_CONNECTED()\
 	if (!self || !self->as) {\
@@ -110,6 +112,7 @@
 #define CLEANUP_AND_EXCEPTION_ON_ERROR(__err)\
 	as_operations_destroy(&ops);\
 	as_record_destroy(rec);\
+	POOL_DESTROY(&static_pool);\
 	if (key_created) {\
 		as_key_destroy(&key);\
 	}\
@@ -165,9 +168,6 @@ PyObject * AerospikeClient_MapPut(AerospikeClient * self, PyObject * args, PyObj
 {
 	BASE_VARIABLES
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	PyObject * py_mapKey = NULL;
 	PyObject * py_mapValue = NULL;
 	PyObject * py_meta = NULL;
@@ -219,9 +219,6 @@ PyObject * AerospikeClient_MapPutItems(AerospikeClient * self, PyObject * args,
 {
 	BASE_VARIABLES
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	PyObject * py_items = NULL;
 	PyObject * py_policy = NULL;
 	PyObject * py_meta = NULL;
@@ -265,9 +262,6 @@ CLEANUP:
 PyObject * AerospikeClient_MapIncrement(AerospikeClient * self, PyObject * args, PyObject * kwds) {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject * py_mapKey = NULL;
 	PyObject * py_incr = NULL;
 	PyObject * py_meta = NULL;
@@ -294,11 +288,11 @@ PyObject * AerospikeClient_MapIncrement(AerospikeClient * self, PyObject * args,
 	POLICY_KEY_META_BIN();
 	SETUP_MAP_POLICY();
 
-	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_incr, &incr_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_incr, &incr_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
@@ -317,8 +311,6 @@ CLEANUP:
 PyObject * AerospikeClient_MapDecrement(AerospikeClient * self, PyObject * args, PyObject * kwds) {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
 	PyObject * py_mapKey = NULL;
 	PyObject * py_decr = NULL;
 	PyObject * py_meta = NULL;
@@ -345,11 +337,11 @@ PyObject * AerospikeClient_MapDecrement(AerospikeClient * self, PyObject * args,
 	POLICY_KEY_META_BIN();
 	SETUP_MAP_POLICY();
 
-	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_decr, &decr_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_decr, &decr_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
@@ -439,9 +431,6 @@ PyObject * AerospikeClient_MapRemoveByKey(AerospikeClient * self, PyObject * arg
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject * py_result = NULL;
 	PyObject * py_mapKey = NULL;
 	PyObject * py_meta = NULL;
@@ -468,7 +457,7 @@ PyObject * AerospikeClient_MapRemoveByKey(AerospikeClient * self, PyObject * arg
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
@@ -488,9 +477,6 @@ PyObject * AerospikeClient_MapRemoveByKeyList(AerospikeClient * self, PyObject *
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject * py_result = NULL;
 	PyObject * py_list = NULL;
 	PyObject * py_meta = NULL;
@@ -521,7 +507,7 @@ PyObject * AerospikeClient_MapRemoveByKeyList(AerospikeClient * self, PyObject *
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_list, &list_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_list, &list_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
@@ -541,9 +527,6 @@ PyObject * AerospikeClient_MapRemoveByKeyRange(AerospikeClient * self, PyObject
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject * py_mapKey = NULL;
 	PyObject * py_result = NULL;
 	PyObject * py_range = NULL;
@@ -572,11 +555,11 @@ PyObject * AerospikeClient_MapRemoveByKeyRange(AerospikeClient * self, PyObject
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_range, &range_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_range, &range_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
@@ -596,9 +579,6 @@ PyObject * AerospikeClient_MapRemoveByValue(AerospikeClient * self, PyObject * a
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject * py_mapValue = NULL;
 	PyObject * py_result = NULL;
 	PyObject * py_meta = NULL;
@@ -624,7 +604,7 @@ PyObject * AerospikeClient_MapRemoveByValue(AerospikeClient * self, PyObject * a
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
@@ -645,9 +625,6 @@ PyObject * AerospikeClient_MapRemoveByValueList(AerospikeClient * self, PyObject
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject * py_result = NULL;
 	PyObject * py_list = NULL;
 	PyObject * py_meta = NULL;
@@ -679,7 +656,7 @@ PyObject * AerospikeClient_MapRemoveByValueList(AerospikeClient * self, PyObject
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_list, &list_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_list, &list_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
@@ -700,9 +677,6 @@ PyObject * AerospikeClient_MapRemoveByValueRange(AerospikeClient * self, PyObjec
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject * py_mapValue = NULL;
 	PyObject * py_result = NULL;
 	PyObject * py_range = NULL;
@@ -731,11 +705,11 @@ PyObject * AerospikeClient_MapRemoveByValueRange(AerospikeClient * self, PyObjec
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_range, &range_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_range, &range_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
@@ -915,9 +889,6 @@ PyObject * AerospikeClient_MapGetByKey(AerospikeClient * self, PyObject * args,
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject * py_mapKey = NULL;
 	PyObject * py_result = NULL;
 	PyObject * py_meta = NULL;
@@ -943,7 +914,7 @@ PyObject * AerospikeClient_MapGetByKey(AerospikeClient * self, PyObject * args,
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
@@ -964,9 +935,6 @@ PyObject * AerospikeClient_MapGetByValue(AerospikeClient * self, PyObject * args
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject * py_mapValue = NULL;
 	PyObject * py_result = NULL;
 	PyObject * py_meta = NULL;
@@ -993,7 +961,7 @@ PyObject * AerospikeClient_MapGetByValue(AerospikeClient * self, PyObject * args
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
@@ -1013,9 +981,6 @@ PyObject * AerospikeClient_MapGetByKeyRange(AerospikeClient * self, PyObject * a
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject * py_mapKey = NULL;
 	PyObject * py_result = NULL;
 	PyObject * py_meta = NULL;
@@ -1043,11 +1008,11 @@ PyObject * AerospikeClient_MapGetByKeyRange(AerospikeClient * self, PyObject * a
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapKey, &map_key, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_mapKey, &map_key, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_range, &range_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_range, &range_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
@@ -1067,9 +1032,6 @@ PyObject * AerospikeClient_MapGetByValueRange(AerospikeClient * self, PyObject *
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject * py_mapValue = NULL;
 	PyObject * py_result = NULL;
 	PyObject * py_meta = NULL;
@@ -1097,11 +1059,11 @@ PyObject * AerospikeClient_MapGetByValueRange(AerospikeClient * self, PyObject *
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_range, &range_put, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_range, &range_put, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
@@ -1141,9 +1103,6 @@ PyObject* AerospikeClient_MapGetByValueList(AerospikeClient* self, PyObject* arg
 	PyObject* py_result = NULL;
 
 	//Util Vars
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	CHECK_CONNECTED();
 
 	static char* kwlist[] = {"key", "bin", "value_list", "return_type", "meta", "policy", "inverted", NULL};
@@ -1164,7 +1123,7 @@ PyObject* AerospikeClient_MapGetByValueList(AerospikeClient* self, PyObject* arg
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_value_list, &as_value_list, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_value_list, &as_value_list, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
@@ -1210,9 +1169,6 @@ PyObject* AerospikeClient_MapGetByKeyList(AerospikeClient* self, PyObject* args,
 	PyObject* py_result = NULL;
 
 	//Util Vars
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	CHECK_CONNECTED();
 
 	static char* kwlist[] = {"key", "bin", "key_list", "return_type", "meta", "policy", "inverted", NULL};
@@ -1233,7 +1189,7 @@ PyObject* AerospikeClient_MapGetByKeyList(AerospikeClient* self, PyObject* args,
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_key_list, &as_key_list, &pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+	if (pyobject_to_val(self, &err, py_key_list, &as_key_list, &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
@@ -0,0 +1,229 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "partition.h"
+
+static PyObject * partition_map_namespace_to_pyobject(partition_map_namespace * map_ns)
+{
+	return PyTuple_Pack(2, map_ns->py_nodes, map_ns->py_owners);
+}
+
+/**
+ ******************************************************************************************************
+ * Returns the owners of the partitions of the namespaces known to the client.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a (nodes, owners) tuple for ns, or a dict of them by namespace.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_Partition_Map(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_ns = NULL;
+
+	// Python Return Value
+	PyObject * py_result = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"ns", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|O:partition_map", kwlist, &py_ns) == false) {
+		return NULL;
+	}
+
+	if (py_ns && !PyString_Check(py_ns)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Namespace should be a string");
+		goto CLEANUP;
+	}
+
+	if (partition_map_refresh(self, &err) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (py_ns) {
+		const char * ns = PyString_AsString(py_ns);
+		partition_map_namespace * map_ns = partition_map_get(self, ns);
+		if (!map_ns) {
+			as_error_update(&err, AEROSPIKE_ERR_NAMESPACE_NOT_FOUND, "Namespace %s not found in partition map", ns);
+			goto CLEANUP;
+		}
+		py_result = partition_map_namespace_to_pyobject(map_ns);
+		goto CLEANUP;
+	}
+
+	py_result = PyDict_New();
+	for (uint32_t i = 0; py_result && i < self->partition_map->size; i++) {
+		partition_map_namespace * map_ns = &self->partition_map->namespaces[i];
+		if (!map_ns->py_owners) {
+			continue;
+		}
+		PyObject * py_entry = partition_map_namespace_to_pyobject(map_ns);
+		if (!py_entry || PyDict_SetItemString(py_result, map_ns->ns, py_entry) != 0) {
+			Py_XDECREF(py_entry);
+			Py_CLEAR(py_result);
+			break;
+		}
+		Py_DECREF(py_entry);
+	}
+
+	if (!py_result) {
+		PyErr_Clear();
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to build partition map");
+	}
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		Py_XDECREF(py_result);
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_result;
+}
+
+/**
+ ******************************************************************************************************
+ * Groups keys by the node owning the master replica of their partition.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a dict of the keys of each node name, keys without known owner
+ * are under None.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeClient_Route(AerospikeClient * self, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_keys = NULL;
+
+	// Python Return Value
+	PyObject * py_result = NULL;
+
+	PyObject * py_fast = NULL;
+	as_key key;
+	bool key_initialised = false;
+
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"keys", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O:route", kwlist, &py_keys) == false) {
+		return NULL;
+	}
+
+	py_fast = PySequence_Fast(py_keys, "keys should be a sequence");
+	if (!py_fast) {
+		PyErr_Clear();
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "keys should be a sequence");
+		goto CLEANUP;
+	}
+
+	if (partition_map_refresh(self, &err) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	py_result = PyDict_New();
+	if (!py_result) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate routes");
+		goto CLEANUP;
+	}
+
+	Py_ssize_t size = PySequence_Fast_GET_SIZE(py_fast);
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject * py_key = PySequence_Fast_GET_ITEM(py_fast, i);
+
+		if (pyobject_to_key(&err, py_key, &key) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+		key_initialised = true;
+
+		as_digest * digest = as_key_digest(&key);
+		if (!digest || !digest->init) {
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Digest could not be calculated");
+			goto CLEANUP;
+		}
+
+		partition_map_namespace * map_ns = partition_map_get(self, key.ns);
+		PyObject * py_node = partition_map_master(map_ns, digest_partition_id(digest->value));
+		if (!py_node) {
+			py_node = Py_None;
+		}
+
+		as_key_destroy(&key);
+		key_initialised = false;
+
+		PyObject * py_node_keys = PyDict_GetItem(py_result, py_node);
+		if (!py_node_keys) {
+			py_node_keys = PyList_New(0);
+			if (!py_node_keys || PyDict_SetItem(py_result, py_node, py_node_keys) != 0) {
+				Py_XDECREF(py_node_keys);
+				as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate routes");
+				goto CLEANUP;
+			}
+			Py_DECREF(py_node_keys);
+		}
+		if (PyList_Append(py_node_keys, py_key) != 0) {
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate routes");
+			goto CLEANUP;
+		}
+	}
+
+CLEANUP:
+	if (key_initialised) {
+		as_key_destroy(&key);
+	}
+	Py_XDECREF(py_fast);
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_XDECREF(py_result);
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_result;
+}
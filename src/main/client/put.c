@@ -72,6 +72,7 @@ PyObject * AerospikeClient_Put_Invoke(
 
 	as_static_pool static_pool;
 	memset(&static_pool, 0, sizeof(static_pool));
+	static_pool.lend_buffers = true;
 
 	// Initialize error
 	as_error_init(&err);
@@ -116,8 +117,6 @@ PyObject * AerospikeClient_Put_Invoke(
 	}
 
 CLEANUP:
-	POOL_DESTROY(&static_pool);
-
 	if (exp_list_p) {
 		as_exp_destroy(exp_list_p);;
 	}
@@ -134,19 +133,14 @@ CLEANUP:
 		// Destroy the record if it is initialised.
 		as_record_destroy(&rec);
 	}
+	POOL_DESTROY(&static_pool);
 
 	// If an error occurred, tell Python.
 	if (err.code != AEROSPIKE_OK) {
 		PyObject * py_err = NULL;
 		error_to_pyobject(&err, &py_err);
 		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_key);
-		} 
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", py_bins);
-		}
-		PyErr_SetObject(exception_type, py_err);
+		raise_exception_with_attrs(exception_type, py_err, "key", py_key, "bin", py_bins, NULL);
 		Py_DECREF(py_err);
 		return NULL;
 	}
@@ -428,6 +428,7 @@ CLEANUP:
 	if (is_query_init) {
 		as_query_destroy(&query);
 	}
+	POOL_DESTROY(&static_pool);
 
 	if (err.code != AEROSPIKE_OK) {
 		PyObject * py_err = NULL;
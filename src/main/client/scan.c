@@ -237,6 +237,7 @@ CLEANUP:
 	if (is_scan_init) {
 		as_scan_destroy(&scan);
 	}
+	POOL_DESTROY(&static_pool);
 
 	if (err.code != AEROSPIKE_OK) {
 		PyObject * py_err = NULL;
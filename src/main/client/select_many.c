@@ -24,10 +24,13 @@
 #include <aerospike/as_record.h>
 #include <aerospike/as_batch.h>
 
+#include "cdt_decoder.h"
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
+#include "key_batch.h"
 #include "policy.h"
+#include "serializer.h"
 
 /**
  *************************************************************************
@@ -54,11 +57,12 @@ PyObject * store_unicode_bins(UnicodePyObjects *u_obj, PyObject * py_uobj) {
  * @param self                  AerospikeClient object
  * @param py_keys               The list of keys
  * @param batch_policy_p        as_policy_batch object
+ * @param result_format         one of the batch_result_format
  *
  * Returns the record if key exists otherwise NULL.
  *******************************************************************************************************
  */
-static PyObject * batch_select_aerospike_batch_read(as_error *err, AerospikeClient * self, PyObject *py_keys, as_policy_batch * batch_policy_p, char** filter_bins, Py_ssize_t bins_size)
+static PyObject * batch_select_aerospike_batch_read(as_error *err, AerospikeClient * self, PyObject *py_keys, as_policy_batch * batch_policy_p, char** filter_bins, Py_ssize_t bins_size, int result_format)
 {
 	PyObject * py_recs = NULL;
 
@@ -68,8 +72,29 @@ static PyObject * batch_select_aerospike_batch_read(as_error *err, AerospikeClie
 	bool batch_initialised = false;
 
 	// Convert python keys list to as_key ** and add it to as_batch.keys
-	// keys can be specified in PyList or PyTuple
-	if (py_keys && PyList_Check(py_keys)) {
+	// keys can be specified in PyList, PyTuple or KeyBatch
+	if (AerospikeKeyBatch_Check(py_keys)) {
+		AerospikeKeyBatch * key_batch = (AerospikeKeyBatch *) py_keys;
+		Py_ssize_t size = key_batch->size;
+
+		as_batch_read_inita(&records, size);
+
+		// Batch object initialised
+		batch_initialised = true;
+
+		for (Py_ssize_t i = 0; i < size; i++) {
+			record = as_batch_read_reserve(&records);
+
+			key_batch_key_init(key_batch, i, &record->key);
+			if (bins_size) {
+				record->bin_names = filter_bins;
+				record->n_bin_names = bins_size;
+			} else {
+				record->read_all_bins = true;
+			}
+		}
+	}
+	else if (py_keys && PyList_Check(py_keys)) {
 		Py_ssize_t size = PyList_Size(py_keys);
 
 		as_batch_read_inita(&records, size);
@@ -143,7 +168,12 @@ static PyObject * batch_select_aerospike_batch_read(as_error *err, AerospikeClie
 	{
 		goto CLEANUP;
 	}
-	batch_read_records_to_pyobject(self, err, &records, &py_recs);
+	if (result_format != BATCH_RESULT_LIST) {
+		batch_read_records_to_pydict(self, err, &records, result_format == BATCH_RESULT_DICT_META, &py_recs);
+	}
+	else {
+		batch_read_records_to_pyobject(self, err, &records, &py_recs);
+	}
 
 CLEANUP:
 	if (batch_initialised == true) {
@@ -165,13 +195,14 @@ CLEANUP:
  * @param py_keys                 List of keys passed on by user
  * @param py_bins                 List of filter bins passed on by user
  * @param py_policy               User specified Policy dictionary
+ * @param py_result_format        'list', 'dict' or 'dict_meta'
  *
  *********************************************************************
  **/
 static
 PyObject * AerospikeClient_Select_Many_Invoke(
 		AerospikeClient * self,
-		PyObject * py_keys, PyObject * py_bins, PyObject * py_policy)
+		PyObject * py_keys, PyObject * py_bins, PyObject * py_policy, PyObject * py_result_format)
 {
 	// Python Return Value
 	PyObject * py_recs = NULL;
@@ -191,6 +222,14 @@ PyObject * AerospikeClient_Select_Many_Invoke(
 	as_predexp_list predexp_list;
 	as_predexp_list* predexp_list_p = NULL;
 
+	// How blobs are returned
+	int read_blob_as = READ_BLOB_AS_BYTEARRAY;
+
+	// How list and map bins are returned
+	int cdt_mode = CDT_MODE_DEFAULT;
+
+	int result_format = BATCH_RESULT_LIST;
+
 	// Unicode object's pool
 	UnicodePyObjects u_objs;
 	u_objs.size = 0;
@@ -255,7 +294,24 @@ PyObject * AerospikeClient_Select_Many_Invoke(
 		goto CLEANUP;
 	}
 
-	py_recs = batch_select_aerospike_batch_read(&err, self, py_keys, batch_policy_p, filter_bins, bins_size);
+	if (read_blob_as_from_policy(&err, py_policy, &read_blob_as) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (cdt_mode_from_policy(self, &err, py_policy, &cdt_mode) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+	cdt_mode_apply_batch(self, cdt_mode, &policy, &batch_policy_p);
+
+	if (batch_result_format_from_pyobject(&err, py_result_format, &result_format) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	int previous_blob_as = set_read_blob_as(read_blob_as);
+	int previous_cdt_mode = set_cdt_mode(cdt_mode);
+	py_recs = batch_select_aerospike_batch_read(&err, self, py_keys, batch_policy_p, filter_bins, bins_size, result_format);
+	set_cdt_mode(previous_cdt_mode);
+	set_read_blob_as(previous_blob_as);
 
 CLEANUP:
 
@@ -280,13 +336,7 @@ CLEANUP:
 		PyObject * py_err = NULL;
 		error_to_pyobject(&err, &py_err);
 		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_keys);
-		} 
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
+		raise_exception_with_attrs(exception_type, py_err, "key", py_keys, "bin", Py_None, NULL);
 		Py_DECREF(py_err);
 		return NULL;
 	}
@@ -299,16 +349,17 @@ PyObject * AerospikeClient_Select_Many(AerospikeClient * self, PyObject * args,
 	PyObject * py_keys = NULL;
 	PyObject * py_bins = NULL;
 	PyObject * py_policy = NULL;
+	PyObject * py_result_format = NULL;
 
 	// Python Function Keyword Arguments
-	static char * kwlist[] = {"keys", "bins", "policy", NULL};
+	static char * kwlist[] = {"keys", "bins", "policy", "result_format", NULL};
 
 	// Python Function Argument Parsing
-	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|O:select_many", kwlist,
-				&py_keys, &py_bins, &py_policy) == false) {
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:select_many", kwlist,
+				&py_keys, &py_bins, &py_policy, &py_result_format) == false) {
 		return NULL;
 	}
 
 	// Invoke Operation
-	return AerospikeClient_Select_Many_Invoke(self, py_keys, py_bins, py_policy);
+	return AerospikeClient_Select_Many_Invoke(self, py_keys, py_bins, py_policy, py_result_format);
 }
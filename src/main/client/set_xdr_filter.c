@@ -24,6 +24,7 @@
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
+#include "expression.h"
 #include "policy.h"
 
 /**
@@ -86,13 +87,16 @@ PyObject * AerospikeClient_SetXDRFilter(AerospikeClient * self, PyObject * args,
 	if (py_expression_filter == Py_None) {
         base64_filter = (char*)DELETE_CURRENT_XDR_FILTER;
 	} else {
-		if (convert_exp_list(self, py_expression_filter, &exp_list_p, &err) != AEROSPIKE_OK) {
+		bool exp_owned = false;
+		if (get_as_exp(self, &err, py_expression_filter, &exp_list_p, &exp_owned) != AEROSPIKE_OK) {
 			goto CLEANUP;
 		}
 
 		base64_filter = as_exp_compile_b64(exp_list_p);
         base64_filter_to_free = base64_filter;
-        as_exp_destroy(exp_list_p);
+		if (exp_owned) {
+			as_exp_destroy(exp_list_p);
+		}
 	}
 
 	as_policy_info info_policy;
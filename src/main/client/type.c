@@ -25,12 +25,16 @@
 #include <aerospike/as_policy.h>
 
 #include "admin.h"
+#include "cdt_decoder.h"
 #include "client.h"
 #include "policy.h"
 #include "conversions.h"
 #include "exceptions.h"
 #include "tls_config.h"
 #include "policy_config.h"
+#include "info_parsed.h"
+#include "intern.h"
+#include "partition.h"
 
 
 static int set_rack_aware_config(as_config* conf, PyObject* config_dict);
@@ -39,7 +43,8 @@ static int set_use_services_alternate(as_config* conf, PyObject* config_dict);
 enum {INIT_SUCCESS, INIT_NO_CONFIG_ERR, INIT_CONFIG_TYPE_ERR, INIT_LUA_USER_ERR,
 	  INIT_LUA_SYS_ERR,  INIT_HOST_TYPE_ERR, INIT_EMPTY_HOSTS_ERR,
 	  INIT_INVALID_ADRR_ERR, INIT_SERIALIZE_ERR, INIT_DESERIALIZE_ERR,
-	  INIT_COMPRESSION_ERR, INIT_POLICY_PARAM_ERR};
+	  INIT_COMPRESSION_ERR, INIT_POLICY_PARAM_ERR, INIT_SERIALIZER_CODEC_ERR,
+	  INIT_CDT_MODE_ERR};
 
 /*******************************************************************************
  * PYTHON DOC METHODS
@@ -120,6 +125,12 @@ Starting with 3.6.0 non-existent bins will not be present in the returned Record
 The returned record tuple will only contain one entry per bin, \
 even if multiple operations were performed on the bin.");
 
+PyDoc_STRVAR(compile_expression_doc,
+"compile_expression(expressions) -> aerospike.Expression\n\
+\n\
+Compile an expression into an immutable aerospike.Expression which can be passed \
+as 'expressions' to any policy or expression operation without being converted again on every call.");
+
 PyDoc_STRVAR(operate_ordered_doc,
 "operate_ordered(key, list[, meta[, policy]]) -> (key, meta, bins)\n\
 \n\
@@ -397,6 +408,12 @@ PyDoc_STRVAR(info_all_doc,
 Send an info *command* to all nodes in the cluster to which the client is connected.\n\
 If any of the individual requests fail, this will raise an exception.");
 
+PyDoc_STRVAR(info_all_parsed_doc,
+"info_all_parsed(command[, policy[, ttl]]) -> {}\n\
+\n\
+Send an info *command* to all nodes in the cluster, and return the parsed response of each node.\n\
+With a ttl in seconds, responses are cached per node and command and shared by later calls.");
+
 PyDoc_STRVAR(info_single_node_doc,
 "info_single_node(command, host[, policy]) -> str\n\
 \n\
@@ -423,6 +440,16 @@ PyDoc_STRVAR(get_node_names_doc,
 \n\
 Return the list of hosts, including node names, present in a connected cluster.");
 
+PyDoc_STRVAR(partition_map_doc,
+"partition_map([ns]) -> {}\n\
+\n\
+Return the owners of the partitions of every namespace, or of ns.");
+
+PyDoc_STRVAR(route_doc,
+"route(keys) -> {}\n\
+\n\
+Group keys by the node owning their partition.");
+
 PyDoc_STRVAR(udf_put_doc,
 "udf_put(filename[, udf_type[, policy]])\n\
 \n\
@@ -482,17 +509,20 @@ PyDoc_STRVAR(index_geo2dsphere_create_doc,
 Create a geospatial 2D spherical index with index_name on the bin in the specified ns, set.");
 
 PyDoc_STRVAR(get_many_doc,
-"get_many(keys[, policy]) -> [ (key, meta, bins)]\n\
+"get_many(keys[, policy[, columnar[, result_format]]]) -> [ (key, meta, bins)]\n\
 \n\
 Batch-read multiple records, and return them as a list. \
-Any record that does not exist will have a None value for metadata and bins in the record tuple.");
+Any record that does not exist will have a None value for metadata and bins in the record tuple. \
+When columnar is True, or a list of bin names, return a dict of numpy masked arrays with one row per key instead. \
+When result_format is 'dict', return a dict of bins by user key, 'dict_meta' a dict of (meta, bins).");
 
 PyDoc_STRVAR(select_many_doc,
-"select_many(keys, bins[, policy]) -> [(key, meta, bins)]\n\
+"select_many(keys, bins[, policy[, result_format]]) -> [(key, meta, bins)]\n\
 \n\
 Batch-read multiple records, and return them as a list. \
 Any record that does not exist will have a None value for metadata and bins in the record tuple. \
-The bins will be filtered as specified.");
+The bins will be filtered as specified. \
+When result_format is 'dict', return a dict of bins by user key, 'dict_meta' a dict of (meta, bins).");
 
 PyDoc_STRVAR(exists_many_doc,
 "exists_many(keys[, policy]) -> [ (key, meta)]\n\
@@ -500,6 +530,26 @@ PyDoc_STRVAR(exists_many_doc,
 Batch-read metadata for multiple keys, and return it as a list. \
 Any record that does not exist will have a None value for metadata in the result tuple.");
 
+PyDoc_STRVAR(batch_write_doc,
+"batch_write(records[, policy[, concurrency]]) -> [(key, status)]\n\
+\n\
+Write multiple records given as (key, bins) or (key, bins, meta) tuples. \
+Returns one (key, status) tuple per record, in the order of records. \
+A status of 0 means the record was written, otherwise it is the error code of that record.");
+
+PyDoc_STRVAR(batch_operate_doc,
+"batch_operate(keys, list[, meta[, policy[, concurrency]]]) -> [(key, status, meta, bins)]\n\
+\n\
+Apply the same list of operations to multiple records. \
+Returns one (key, status, meta, bins) tuple per key, in the order of keys. \
+The meta and bins are None when the status is not 0.");
+
+PyDoc_STRVAR(batch_remove_doc,
+"batch_remove(keys[, policy[, concurrency]]) -> [(key, status)]\n\
+\n\
+Remove multiple records. \
+Returns one (key, status) tuple per key, in the order of keys.");
+
 PyDoc_STRVAR(get_key_digest_doc,
 "get_key_digest(ns, set, key) -> bytearray\n\
 \n\
@@ -799,6 +849,9 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 	{"info_all",
 		(PyCFunction) AerospikeClient_InfoAll, METH_VARARGS | METH_KEYWORDS,
 		info_all_doc},
+	{"info_all_parsed",
+		(PyCFunction) AerospikeClient_InfoAll_Parsed, METH_VARARGS | METH_KEYWORDS,
+		info_all_parsed_doc},
 	{"info_single_node",
 		(PyCFunction) AerospikeClient_InfoSingleNode, METH_VARARGS | METH_KEYWORDS,
 		info_single_node_doc},
@@ -814,6 +867,12 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 	{"get_node_names",
 		(PyCFunction) AerospikeClient_GetNodeNames, METH_VARARGS | METH_KEYWORDS,
 		get_node_names_doc},
+	{"partition_map",
+		(PyCFunction) AerospikeClient_Partition_Map, METH_VARARGS | METH_KEYWORDS,
+		partition_map_doc},
+	{"route",
+		(PyCFunction) AerospikeClient_Route, METH_VARARGS | METH_KEYWORDS,
+		route_doc},
 	// UDF OPERATIONS
 
 	{"udf_put",
@@ -864,10 +923,24 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 	{"exists_many",
 		(PyCFunction)AerospikeClient_Exists_Many, METH_VARARGS | METH_KEYWORDS,
 		exists_many_doc},
+	{"batch_write",
+		(PyCFunction)AerospikeClient_Batch_Write, METH_VARARGS | METH_KEYWORDS,
+		batch_write_doc},
+	{"batch_operate",
+		(PyCFunction)AerospikeClient_Batch_Operate, METH_VARARGS | METH_KEYWORDS,
+		batch_operate_doc},
+	{"batch_remove",
+		(PyCFunction)AerospikeClient_Batch_Remove, METH_VARARGS | METH_KEYWORDS,
+		batch_remove_doc},
 	{"get_key_digest",
 		(PyCFunction)AerospikeClient_Get_Key_Digest, METH_VARARGS | METH_KEYWORDS,
 		get_key_digest_doc},
 
+	// EXPRESSION OPERATIONS
+	{"compile_expression",
+		(PyCFunction)AerospikeClient_CompileExpression, METH_VARARGS | METH_KEYWORDS,
+		compile_expression_doc},
+
 	// TRUNCATE OPERATIONS
 	{"truncate",
 		(PyCFunction)AerospikeClient_Truncate, METH_VARARGS | METH_KEYWORDS,
@@ -899,8 +972,14 @@ static int AerospikeClient_Type_Init(AerospikeClient * self, PyObject * args, Py
 
 	self->has_connected = false;
 	self->use_shared_connection = false;
+	self->user_shm_key = false;
 	self->as=NULL;
 	self->send_bool_as = SEND_BOOL_AS_PY_BYTES;
+	self->expression_cache = NULL;
+	self->expression_cache_size = 0;
+	self->partition_map = NULL;
+	self->info_cache = NULL;
+	self->intern_table = NULL;
 
 	if (PyArg_ParseTupleAndKeywords(args, kwds, "O:client", kwlist, &py_config) == false) {
 		error_code = INIT_NO_CONFIG_ERR;
@@ -1056,7 +1135,7 @@ static int AerospikeClient_Type_Init(AerospikeClient * self, PyObject * args, Py
 
 		PyObject* py_shm_cluster_key = PyDict_GetItemString(py_shm, "shm_key");
 		if (py_shm_cluster_key && PyInt_Check(py_shm_cluster_key)) {
-			user_shm_key = true;
+			self->user_shm_key = true;
 			config.shm_key = PyInt_AsLong(py_shm_cluster_key);
 		}
 	}
@@ -1064,8 +1143,16 @@ static int AerospikeClient_Type_Init(AerospikeClient * self, PyObject * args, Py
 	self->is_client_put_serializer = false;
 	self->user_serializer_call_info.callback = NULL;
 	self->user_deserializer_call_info.callback = NULL;
+	self->serializer_codec = SERIALIZER_NONE;
 	PyObject *py_serializer_option = PyDict_GetItemString(py_config, "serialization");
-	if (py_serializer_option && PyTuple_Check(py_serializer_option)) {
+	if (py_serializer_option && PyInt_Check(py_serializer_option)) {
+		long serializer_codec = PyInt_AsLong(py_serializer_option);
+		if (serializer_codec != SERIALIZER_JSON && serializer_codec != SERIALIZER_MSGPACK) {
+			error_code = INIT_SERIALIZER_CODEC_ERR;
+			goto CONSTRUCTOR_ERROR;
+		}
+		self->serializer_codec = (int) serializer_codec;
+	} else if (py_serializer_option && PyTuple_Check(py_serializer_option)) {
 		PyObject *py_serializer = PyTuple_GetItem(py_serializer_option, 0);
 		if (py_serializer && py_serializer != Py_None) {
 			if (!PyCallable_Check(py_serializer)) {
@@ -1086,6 +1173,13 @@ static int AerospikeClient_Type_Init(AerospikeClient * self, PyObject * args, Py
 		}
 	}
 
+	self->cdt_mode = CDT_MODE_DEFAULT;
+	PyObject *py_cdt_mode = PyDict_GetItemString(py_config, "cdt_mode");
+	if (py_cdt_mode && !cdt_mode_from_pyobject(py_cdt_mode, &self->cdt_mode)) {
+		error_code = INIT_CDT_MODE_ERR;
+		goto CONSTRUCTOR_ERROR;
+	}
+
 	as_policies_init(&config.policies);
 	//Set default value of use_batch_direct
 
@@ -1263,6 +1357,12 @@ static int AerospikeClient_Type_Init(AerospikeClient * self, PyObject * args, Py
 		config.max_conns_per_node = PyInt_AsLong(py_max_conns);
 	}
 
+	// async_max_conns_per_node
+	PyObject * py_async_max_conns = PyDict_GetItemString(py_config, "async_max_conns_per_node");
+	if (py_async_max_conns && PyInt_Check(py_async_max_conns)) {
+		config.async_max_conns_per_node = PyInt_AsLong(py_async_max_conns);
+	}
+
 
 	//conn_timeout_ms
 	PyObject * py_connect_timeout = PyDict_GetItemString(py_config, "connect_timeout");
@@ -1285,6 +1385,42 @@ static int AerospikeClient_Type_Init(AerospikeClient * self, PyObject * args, Py
 		}
 	}
 
+	// expression_cache_size
+	PyObject * py_expression_cache_size = PyDict_GetItemString(py_config, "expression_cache_size");
+	if (py_expression_cache_size) {
+		if (!PyInt_Check(py_expression_cache_size)) {
+			error_code = INIT_POLICY_PARAM_ERR;
+			goto CONSTRUCTOR_ERROR;
+		}
+		long expression_cache_size = PyInt_AsLong(py_expression_cache_size);
+		if (expression_cache_size < 0 || expression_cache_size > UINT32_MAX) {
+			error_code = INIT_POLICY_PARAM_ERR;
+			goto CONSTRUCTOR_ERROR;
+		}
+		if (expression_cache_size > 0) {
+			self->expression_cache_size = (uint32_t) expression_cache_size;
+			self->expression_cache = PyDict_New();
+		}
+	}
+
+	// intern_table_size
+	long intern_table_size = INTERN_TABLE_DEFAULT_SIZE;
+	PyObject * py_intern_table_size = PyDict_GetItemString(py_config, "intern_table_size");
+	if (py_intern_table_size) {
+		if (!PyInt_Check(py_intern_table_size)) {
+			error_code = INIT_POLICY_PARAM_ERR;
+			goto CONSTRUCTOR_ERROR;
+		}
+		intern_table_size = PyInt_AsLong(py_intern_table_size);
+		if (intern_table_size < 0 || intern_table_size > UINT32_MAX) {
+			error_code = INIT_POLICY_PARAM_ERR;
+			goto CONSTRUCTOR_ERROR;
+		}
+	}
+	if (intern_table_size > 0) {
+		self->intern_table = intern_table_new((uint32_t) intern_table_size);
+	}
+
 	//compression_threshold
 	PyObject * py_compression_threshold = PyDict_GetItemString(py_config, "compression_threshold");
 	if (py_compression_threshold && PyInt_Check(py_compression_threshold)) {
@@ -1381,6 +1517,14 @@ CONSTRUCTOR_ERROR:
 			as_error_update(&constructor_err, AEROSPIKE_ERR_PARAM, "Deserializer must be callable");
 			break;
 		}
+		case INIT_SERIALIZER_CODEC_ERR: {
+			as_error_update(&constructor_err, AEROSPIKE_ERR_PARAM, "Serialization codec must be SERIALIZER_JSON or SERIALIZER_MSGPACK");
+			break;
+		}
+		case INIT_CDT_MODE_ERR: {
+			as_error_update(&constructor_err, AEROSPIKE_ERR_PARAM, "cdt_mode must be 'default', 'direct' or 'lazy'");
+			break;
+		}
 		case INIT_COMPRESSION_ERR: {
 			as_error_update(&constructor_err, AEROSPIKE_ERR_PARAM, "Compression value must not be negative");
 			break;
@@ -1454,9 +1598,6 @@ static void AerospikeClient_Type_Dealloc(PyObject * self)
 {
 
 	as_error err;
-	char *alias_to_search = NULL;
-	PyObject *py_persistent_item = NULL;
-	AerospikeGlobalHosts* global_host = NULL;
 	AerospikeClient* client = (AerospikeClient*)self;
 
 	// If the client has never connected
@@ -1468,17 +1609,11 @@ static void AerospikeClient_Type_Dealloc(PyObject * self)
 
 			// If the connection is possibly shared, use reference counted deletes
 			if (client->use_shared_connection) {
-				// If this client was still connected, deal with the global host object
+				// If this client was still connected, drop its reference to the shared cluster
 				if (client->is_conn_16) {
-					alias_to_search = return_search_string(client->as);
-					py_persistent_item = PyDict_GetItemString(py_global_hosts, alias_to_search);
-					if (py_persistent_item) {
-						global_host = (AerospikeGlobalHosts*) py_persistent_item;
-						// Only modify the global as object if the client points to it
-						if (client->as == global_host->as) {
-							close_aerospike_object(client->as, &err, alias_to_search, py_persistent_item, false);
-						}
-					}
+					Py_BEGIN_ALLOW_THREADS
+					close_aerospike_object(client->as, &err);
+					Py_END_ALLOW_THREADS
 				}
 			// Connection is not shared, so it is safe to destroy the as object
 			} else {
@@ -1489,6 +1624,10 @@ static void AerospikeClient_Type_Dealloc(PyObject * self)
 			}
 		}
 	}
+	Py_XDECREF(client->expression_cache);
+	partition_map_free(client->partition_map);
+	info_cache_free(client->info_cache);
+	intern_table_free(client->intern_table);
 	self->ob_type->tp_free((PyObject *) self);
 }
 
@@ -1593,3 +1732,70 @@ AerospikeClient * AerospikeClient_New(PyObject * parent, PyObject * args, PyObje
 	return NULL;
 
 }
+
+AerospikeClient * AerospikeClient_New_Shared(PyObject * parent, PyObject * args, PyObject * kwds)
+{
+	PyObject * py_config = NULL;
+	PyObject * py_username = NULL;
+	PyObject * py_password = NULL;
+	PyObject * py_connected = NULL;
+	AerospikeClient * self = NULL;
+
+	static char * kwlist[] = {"config", "username", "password", NULL};
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OO:shared_client", kwlist, &py_config, &py_username, &py_password) == false) {
+		return NULL;
+	}
+
+	if (!PyDict_Check(py_config)) {
+		as_error err;
+		as_error_init(&err);
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "config must be a dict");
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	// The caller's config is left as it is.
+	PyObject * py_shared_config = PyDict_Copy(py_config);
+	if (!py_shared_config) {
+		return NULL;
+	}
+	PyDict_SetItemString(py_shared_config, "use_shared_connection", Py_True);
+
+	PyObject * py_args = PyTuple_Pack(1, py_shared_config);
+	Py_DECREF(py_shared_config);
+	if (!py_args) {
+		return NULL;
+	}
+
+	self = AerospikeClient_New(parent, py_args, NULL);
+	Py_DECREF(py_args);
+	if (!self) {
+		return NULL;
+	}
+
+	if (py_username && py_password) {
+		py_args = PyTuple_Pack(2, py_username, py_password);
+	}
+	else {
+		py_args = PyTuple_New(0);
+	}
+
+	if (py_args) {
+		py_connected = AerospikeClient_Connect(self, py_args, NULL);
+		Py_DECREF(py_args);
+	}
+
+	// connect() returns a new reference to the client.
+	Py_XDECREF(py_connected);
+	if (!py_connected) {
+		Py_DECREF(self);
+		return NULL;
+	}
+
+	return self;
+}
@@ -0,0 +1,520 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/as_double.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_integer.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_val.h>
+#include <aerospike/as_vector.h>
+
+#include "callback_batch.h"
+#include "columnar.h"
+#include "conversions.h"
+#include "macros.h"
+
+#define COLUMNAR_INITIAL_CAPACITY 1024
+
+/*******************************************************************************
+ * COLUMNS
+ ******************************************************************************/
+
+/*
+ * Returns NULL and marks the columns as failed when the column cannot be
+ * allocated.
+ */
+static column * columnar_add_column(columnar * columns, const char * name)
+{
+	column_value * values = (column_value *) calloc(columns->capacity, sizeof(column_value));
+	uint8_t * valid = (uint8_t *) calloc(columns->capacity, sizeof(uint8_t));
+
+	if (!values || !valid) {
+		free(values);
+		free(valid);
+		columns->failed = true;
+		return NULL;
+	}
+
+	column * col = (column *) as_vector_reserve(&columns->columns);
+
+	strncpy(col->name, name, AS_BIN_NAME_MAX_SIZE - 1);
+	col->name[AS_BIN_NAME_MAX_SIZE - 1] = '\0';
+	col->type = COLUMN_EMPTY;
+	col->values = values;
+	col->valid = valid;
+
+	return col;
+}
+
+static column * columnar_get_column(columnar * columns, const char * name)
+{
+	column * col = columnar_find(columns, name);
+
+	if (col || columns->fixed) {
+		return col;
+	}
+	return columnar_add_column(columns, name);
+}
+
+/*
+ * Makes room for one more row, with every cell of the row invalid. Returns
+ * false and marks the columns as failed when they cannot grow, the columns
+ * keep their buffers.
+ */
+static bool columnar_reserve_row(columnar * columns)
+{
+	if (columns->failed) {
+		return false;
+	}
+
+	if (columns->size == columns->capacity) {
+		uint32_t capacity = columns->capacity * 2;
+
+		// A column grown before a failure keeps its larger buffers.
+		for (uint32_t i = 0; i < columns->columns.size; i++) {
+			column * col = (column *) as_vector_get(&columns->columns, i);
+
+			column_value * values = (column_value *) realloc(col->values, capacity * sizeof(column_value));
+			if (!values) {
+				columns->failed = true;
+				return false;
+			}
+			col->values = values;
+
+			uint8_t * valid = (uint8_t *) realloc(col->valid, capacity * sizeof(uint8_t));
+			if (!valid) {
+				columns->failed = true;
+				return false;
+			}
+			col->valid = valid;
+		}
+		columns->capacity = capacity;
+	}
+
+	for (uint32_t i = 0; i < columns->columns.size; i++) {
+		column * col = (column *) as_vector_get(&columns->columns, i);
+		col->values[columns->size].i = 0;
+		col->valid[columns->size] = 0;
+	}
+	return true;
+}
+
+/*
+ * An integer column which receives a float becomes a float64 column.
+ */
+static void column_to_float64(column * col, uint32_t size)
+{
+	for (uint32_t i = 0; i < size; i++) {
+		if (col->valid[i]) {
+			col->values[i].d = (double) col->values[i].i;
+		}
+	}
+	col->type = COLUMN_FLOAT64;
+}
+
+/*
+ * A numeric column which receives any other type of value becomes an object
+ * column, its numbers are boxed.
+ */
+static void column_to_object(column * col, uint32_t size)
+{
+	for (uint32_t i = 0; i < size; i++) {
+		if (!col->valid[i]) {
+			continue;
+		}
+		if (col->type == COLUMN_INT64) {
+			col->values[i].v = (as_val *) as_integer_new(col->values[i].i);
+		}
+		else if (col->type == COLUMN_FLOAT64) {
+			col->values[i].v = (as_val *) as_double_new(col->values[i].d);
+		}
+	}
+	col->type = COLUMN_OBJECT;
+}
+
+static void column_set(column * col, uint32_t row, const as_bin * bin)
+{
+	as_val * val = (as_val *) bin->valuep;
+	column_value * cell = &col->values[row];
+
+	if (!val || as_val_type(val) == AS_NIL) {
+		return;
+	}
+
+	switch (as_val_type(val)) {
+		case AS_INTEGER:
+			if (col->type == COLUMN_EMPTY) {
+				col->type = COLUMN_INT64;
+			}
+			if (col->type == COLUMN_INT64) {
+				cell->i = as_integer_get((as_integer *) val);
+			}
+			else if (col->type == COLUMN_FLOAT64) {
+				cell->d = (double) as_integer_get((as_integer *) val);
+			}
+			else {
+				cell->v = callback_batch_copy_bin(bin);
+			}
+			break;
+		case AS_DOUBLE:
+			if (col->type == COLUMN_EMPTY) {
+				col->type = COLUMN_FLOAT64;
+			}
+			else if (col->type == COLUMN_INT64) {
+				column_to_float64(col, row);
+			}
+			if (col->type == COLUMN_FLOAT64) {
+				cell->d = as_double_get((as_double *) val);
+			}
+			else {
+				cell->v = callback_batch_copy_bin(bin);
+			}
+			break;
+		default:
+			if (col->type != COLUMN_OBJECT) {
+				column_to_object(col, row);
+			}
+			cell->v = callback_batch_copy_bin(bin);
+			if (!cell->v) {
+				return;
+			}
+			break;
+	}
+
+	col->valid[row] = 1;
+}
+
+/*******************************************************************************
+ * CONVERSION
+ ******************************************************************************/
+
+/*
+ * numpy.frombuffer() refuses an empty buffer on older numpy releases.
+ */
+static PyObject * columnar_array(PyObject * py_numpy, PyObject * py_buffer, const char * dtype)
+{
+	if (PyByteArray_GET_SIZE(py_buffer) == 0) {
+		return PyObject_CallMethod(py_numpy, "zeros", "is", 0, dtype);
+	}
+	return PyObject_CallMethod(py_numpy, "frombuffer", "Os", py_buffer, dtype);
+}
+
+static PyObject * column_data_to_pyobject(AerospikeClient * client, PyObject * py_numpy, column * col, uint32_t size)
+{
+	PyObject * py_buffer = NULL;
+	PyObject * py_data = NULL;
+
+	if (col->type == COLUMN_INT64 || col->type == COLUMN_FLOAT64) {
+		// The cells are 8 bytes wide, the values are copied in one go.
+		py_buffer = PyByteArray_FromStringAndSize((const char *) col->values, size * sizeof(column_value));
+		if (!py_buffer) {
+			return NULL;
+		}
+		py_data = columnar_array(py_numpy, py_buffer, col->type == COLUMN_INT64 ? "int64" : "float64");
+		Py_DECREF(py_buffer);
+		return py_data;
+	}
+
+	py_data = PyObject_CallMethod(py_numpy, "empty", "Is", size, "object");
+	if (!py_data) {
+		return NULL;
+	}
+
+	for (uint32_t i = 0; i < size; i++) {
+		PyObject * py_value = NULL;
+
+		if (col->valid[i]) {
+			as_error err;
+			as_error_init(&err);
+			val_to_pyobject(client, &err, col->values[i].v, &py_value);
+			if (err.code != AEROSPIKE_OK) {
+				Py_XDECREF(py_value);
+				Py_DECREF(py_data);
+				return NULL;
+			}
+		}
+		else {
+			Py_INCREF(Py_None);
+			py_value = Py_None;
+		}
+
+		// The array keeps its own reference to the value.
+		int rc = PySequence_SetItem(py_data, i, py_value);
+		Py_DECREF(py_value);
+		if (rc != 0) {
+			Py_DECREF(py_data);
+			return NULL;
+		}
+	}
+
+	return py_data;
+}
+
+static PyObject * column_mask_to_pyobject(PyObject * py_numpy, column * col, uint32_t size)
+{
+	PyObject * py_buffer = PyByteArray_FromStringAndSize(NULL, size);
+	if (!py_buffer) {
+		return NULL;
+	}
+
+	// numpy masks flag the missing values.
+	char * mask = PyByteArray_AS_STRING(py_buffer);
+	for (uint32_t i = 0; i < size; i++) {
+		mask[i] = !col->valid[i];
+	}
+
+	PyObject * py_mask = columnar_array(py_numpy, py_buffer, "bool");
+	Py_DECREF(py_buffer);
+	return py_mask;
+}
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+as_status columnar_init(as_error * err, columnar * columns, PyObject * py_columnar, bool * enabled)
+{
+	*enabled = false;
+
+	if (!py_columnar || py_columnar == Py_None || py_columnar == Py_False) {
+		return AEROSPIKE_OK;
+	}
+
+	if (py_columnar != Py_True && !PyList_Check(py_columnar) && !PyTuple_Check(py_columnar)) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "columnar must be a bool or a list of bin names");
+	}
+
+	PyObject * py_numpy = PyImport_ImportModule("numpy");
+	if (!py_numpy) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "columnar results require numpy");
+	}
+	Py_DECREF(py_numpy);
+
+	columnar_init_bins(columns, py_columnar != Py_True);
+
+	if (columns->fixed) {
+		Py_ssize_t size = PySequence_Size(py_columnar);
+
+		for (Py_ssize_t i = 0; i < size; i++) {
+			PyObject * py_bin = PySequence_GetItem(py_columnar, i);
+			PyObject * py_ustr = NULL;
+			char * name = NULL;
+
+			if (PyUnicode_Check(py_bin)) {
+				py_ustr = PyUnicode_AsUTF8String(py_bin);
+				name = py_ustr ? PyBytes_AsString(py_ustr) : NULL;
+			}
+			else if (PyString_Check(py_bin)) {
+				name = PyString_AsString(py_bin);
+			}
+
+			if (!name || strlen(name) >= AS_BIN_NAME_MAX_SIZE) {
+				PyErr_Clear();
+				as_error_update(err, AEROSPIKE_ERR_PARAM, "columnar bin names must be strings of at most %d characters",
+						AS_BIN_NAME_MAX_LEN);
+			}
+			else if (!columnar_add_bin(columns, name)) {
+				as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the columns");
+			}
+
+			Py_XDECREF(py_ustr);
+			Py_DECREF(py_bin);
+
+			if (err->code != AEROSPIKE_OK) {
+				columnar_destroy(columns);
+				return err->code;
+			}
+		}
+	}
+
+	*enabled = true;
+
+	return AEROSPIKE_OK;
+}
+
+void columnar_init_bins(columnar * columns, bool fixed)
+{
+	columns->fixed = fixed;
+	columns->failed = false;
+	columns->size = 0;
+	columns->capacity = COLUMNAR_INITIAL_CAPACITY;
+	as_vector_init(&columns->columns, sizeof(column), 8);
+	pthread_mutex_init(&columns->lock, NULL);
+}
+
+bool columnar_add_bin(columnar * columns, const char * name)
+{
+	bool rval = true;
+
+	pthread_mutex_lock(&columns->lock);
+
+	if (!columnar_find(columns, name)) {
+		rval = columnar_add_column(columns, name) != NULL;
+	}
+
+	pthread_mutex_unlock(&columns->lock);
+
+	return rval;
+}
+
+column * columnar_find(columnar * columns, const char * name)
+{
+	for (uint32_t i = 0; i < columns->columns.size; i++) {
+		column * col = (column *) as_vector_get(&columns->columns, i);
+		if (strcmp(col->name, name) == 0) {
+			return col;
+		}
+	}
+	return NULL;
+}
+
+bool columnar_add_record(columnar * columns, const as_record * rec)
+{
+	pthread_mutex_lock(&columns->lock);
+
+	if (columnar_reserve_row(columns)) {
+		for (uint16_t i = 0; i < rec->bins.size; i++) {
+			as_bin * bin = &rec->bins.entries[i];
+			column * col = columnar_get_column(columns, bin->name);
+			if (col) {
+				column_set(col, columns->size, bin);
+			}
+		}
+		columns->size++;
+	}
+	bool rval = !columns->failed;
+
+	pthread_mutex_unlock(&columns->lock);
+
+	return rval;
+}
+
+bool columnar_add_missing(columnar * columns)
+{
+	pthread_mutex_lock(&columns->lock);
+
+	if (columnar_reserve_row(columns)) {
+		columns->size++;
+	}
+	bool rval = !columns->failed;
+
+	pthread_mutex_unlock(&columns->lock);
+
+	return rval;
+}
+
+bool columnar_callback(const as_val * val, void * udata)
+{
+	if (!val) {
+		return false;
+	}
+
+	as_record * rec = as_record_fromval(val);
+	if (rec) {
+		// Stops the scan, columnar_to_pyobject() reports the failure.
+		return columnar_add_record((columnar *) udata, rec);
+	}
+
+	return true;
+}
+
+as_status columnar_to_pyobject(AerospikeClient * client, as_error * err, columnar * columns, PyObject ** py_columns)
+{
+	PyObject * py_numpy = NULL;
+	PyObject * py_masked_array = NULL;
+
+	*py_columns = NULL;
+
+	if (columns->failed) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the columns");
+	}
+
+	py_numpy = PyImport_ImportModule("numpy");
+	if (py_numpy) {
+		PyObject * py_ma = PyObject_GetAttrString(py_numpy, "ma");
+		if (py_ma) {
+			py_masked_array = PyObject_GetAttrString(py_ma, "MaskedArray");
+			Py_DECREF(py_ma);
+		}
+	}
+	if (!py_masked_array) {
+		goto CLEANUP;
+	}
+
+	*py_columns = PyDict_New();
+	if (!*py_columns) {
+		goto CLEANUP;
+	}
+
+	for (uint32_t i = 0; i < columns->columns.size; i++) {
+		column * col = (column *) as_vector_get(&columns->columns, i);
+		PyObject * py_data = column_data_to_pyobject(client, py_numpy, col, columns->size);
+		PyObject * py_mask = py_data ? column_mask_to_pyobject(py_numpy, col, columns->size) : NULL;
+		PyObject * py_array = NULL;
+
+		if (py_mask) {
+			py_array = PyObject_CallFunctionObjArgs(py_masked_array, py_data, py_mask, NULL);
+		}
+		Py_XDECREF(py_data);
+		Py_XDECREF(py_mask);
+
+		if (!py_array || PyDict_SetItemString(*py_columns, col->name, py_array) != 0) {
+			Py_XDECREF(py_array);
+			Py_CLEAR(*py_columns);
+			goto CLEANUP;
+		}
+		Py_DECREF(py_array);
+	}
+
+CLEANUP:
+	Py_XDECREF(py_masked_array);
+	Py_XDECREF(py_numpy);
+
+	if (!*py_columns) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to convert the columnar results");
+	}
+
+	return AEROSPIKE_OK;
+}
+
+void columnar_destroy(columnar * columns)
+{
+	for (uint32_t i = 0; i < columns->columns.size; i++) {
+		column * col = (column *) as_vector_get(&columns->columns, i);
+
+		if (col->type == COLUMN_OBJECT) {
+			for (uint32_t j = 0; j < columns->size; j++) {
+				if (col->valid[j]) {
+					as_val_destroy(col->values[j].v);
+				}
+			}
+		}
+		free(col->values);
+		free(col->valid);
+	}
+
+	as_vector_destroy(&columns->columns);
+	pthread_mutex_destroy(&columns->lock);
+}
@@ -41,12 +41,14 @@
 
 #include "conversions.h"
 #include "geo.h"
+#include "intern.h"
 #include "policy.h"
 #include "serializer.h"
 #include "exceptions.h"
 #include "cdt_types.h"
 #include "cdt_operation_utils.h"
 #include "key_ordered_dict.h"
+#include "operation_list.h"
 
 #define PY_KEYT_NAMESPACE 0
 #define PY_KEYT_SET 1
@@ -604,6 +606,15 @@ as_status pyobject_to_val(AerospikeClient * self, as_error * err, PyObject * py_
 		char *geo_value = PyString_AsString(AerospikeGeospatial_DoDumps(py_data, err));
 		Py_DECREF(py_data);
 		*val = (as_val *) as_geojson_new(geo_value, false);
+	} else if (is_blob_buffer(py_obj) && serializer_is_builtin(self, serializer_type)) {
+		as_bytes *bytes;
+		GET_BYTES_POOL(bytes, static_pool, err);
+		if (err->code == AEROSPIKE_OK) {
+			if (set_as_bytes_from_buffer(&bytes, py_obj, static_pool, err) != AEROSPIKE_OK) {
+				return err->code;
+			}
+			*val = (as_val *) bytes;
+		}
 	} else if (PyByteArray_Check(py_obj)) {
 		as_bytes *bytes;
 		GET_BYTES_POOL(bytes, static_pool, err);
@@ -785,6 +796,16 @@ as_status pyobject_to_record(AerospikeClient * self, as_error * err, PyObject *
 			} else if (PyString_Check(value)) {
 				char * val = PyString_AsString(value);
 				ret_val = as_record_set_strp(rec, name, val, false);
+			} else if (is_blob_buffer(value) && serializer_is_builtin(self, serializer_type)) {
+				// bytes, bytearray, memoryview and mmap
+				as_bytes *bytes;
+				GET_BYTES_POOL(bytes, static_pool, err);
+				if (err->code == AEROSPIKE_OK) {
+					if (set_as_bytes_from_buffer(&bytes, value, static_pool, err) != AEROSPIKE_OK) {
+						return err->code;
+					}
+					ret_val = as_record_set_bytes(rec, name, bytes);
+				}
 			} else if (PyByteArray_Check(value)) {
 				as_bytes *bytes;
 				GET_BYTES_POOL(bytes, static_pool, err);
@@ -1310,7 +1331,15 @@ static bool map_to_pyobject_each(const as_val * key, const as_val * val, void *
 	PyObject * py_dict = (PyObject *) convd->udata;
 
 	PyObject * py_key = NULL;
-	val_to_pyobject(convd->client, convd->err, key, &py_key);
+	as_string * key_string = as_string_fromval(key);
+	if (key_string && as_string_get(key_string)) {
+		// String keys recur across records, share them.
+		py_key = intern_string(convd->client, as_string_get(key_string), as_string_len(key_string));
+		PyErr_Clear();
+	}
+	if (!py_key) {
+		val_to_pyobject(convd->client, convd->err, key, &py_key);
+	}
 
 	if (err->code != AEROSPIKE_OK) {
 		return false;
@@ -1384,7 +1413,7 @@ as_status do_record_to_pyobject(AerospikeClient * self, as_error * err, const as
 	PyObject * py_rec_meta = NULL;
 	PyObject * py_rec_bins = NULL;
 
-	if (key_to_pyobject(err, key ? key : &rec->key, &py_rec_key) != AEROSPIKE_OK) {
+	if (do_key_to_pyobject(self, err, key ? key : &rec->key, &py_rec_key) != AEROSPIKE_OK) {
 		return err->code;
 	}
 
@@ -1433,28 +1462,14 @@ as_status record_to_pyobject_cnvt_list_to_map(AerospikeClient * self, as_error *
 	return do_record_to_pyobject(self, err, rec, key, obj, true);
 }
 
-as_status key_to_pyobject(as_error * err, const as_key * key, PyObject ** obj)
+/**
+ * Converts the user key of key, *obj is left NULL if the key has no value.
+ */
+as_status key_value_to_pyobject(as_error * err, const as_key * key, PyObject ** obj)
 {
-	as_error_reset(err);
-
-	*obj = NULL;
-
-	if (!key) {
-		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "key is null");
-	}
-
-	PyObject * py_namespace = NULL;
-	PyObject * py_set = NULL;
 	PyObject * py_key = NULL;
-	PyObject * py_digest = NULL;
-
-	if (key->ns && strlen(key->ns) > 0) {
-		py_namespace = PyString_FromString(key->ns);
-	}
 
-	if (key->set && strlen(key->set) > 0) {
-		py_set = PyString_FromString(key->set);
-	}
+	*obj = NULL;
 
 	if (key->valuep) {
 		as_val * val = (as_val *) key->valuep;
@@ -1495,6 +1510,44 @@ as_status key_to_pyobject(as_error * err, const as_key * key, PyObject ** obj)
 		}
 	}
 
+	*obj = py_key;
+	return err->code;
+}
+
+as_status key_to_pyobject(as_error * err, const as_key * key, PyObject ** obj)
+{
+	return do_key_to_pyobject(NULL, err, key, obj);
+}
+
+as_status do_key_to_pyobject(AerospikeClient * self, as_error * err, const as_key * key, PyObject ** obj)
+{
+	as_error_reset(err);
+
+	*obj = NULL;
+
+	if (!key) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "key is null");
+	}
+
+	PyObject * py_namespace = NULL;
+	PyObject * py_set = NULL;
+	PyObject * py_key = NULL;
+	PyObject * py_digest = NULL;
+
+	if (key->ns && strlen(key->ns) > 0) {
+		py_namespace = intern_string(self, key->ns, strlen(key->ns));
+	}
+
+	if (key->set && strlen(key->set) > 0) {
+		py_set = intern_string(self, key->set, strlen(key->set));
+	}
+
+	if (key_value_to_pyobject(err, key, &py_key) != AEROSPIKE_OK) {
+		Py_XDECREF(py_namespace);
+		Py_XDECREF(py_set);
+		return err->code;
+	}
+
 	if (key->digest.init) {
 		py_digest = PyByteArray_FromStringAndSize((char *) key->digest.value, AS_DIGEST_VALUE_SIZE);
 	}
@@ -1552,9 +1605,22 @@ static bool do_bins_to_pyobject_each(const char * name, const as_val * val, void
 		return false;
 	}
 
-	PyDict_SetItemString(py_bins, name, py_val);
+	PyObject * py_name = intern_string(convd->client, name, strlen(name));
+	if (!py_name) {
+		PyErr_Clear();
+		Py_DECREF(py_val);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to decode bin name");
+		return false;
+	}
 
+	int rc = PyDict_SetItem(py_bins, py_name, py_val);
+	Py_DECREF(py_name);
 	Py_DECREF(py_val);
+	if (rc == -1) {
+		PyErr_Clear();
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to add bin");
+		return false;
+	}
 
 	convd->count++;
 	return true;
@@ -1638,7 +1704,7 @@ as_status operate_bins_to_pyobject(AerospikeClient * self, as_error * err, const
 	    	as_error_update(err, AEROSPIKE_ERR_CLIENT, "Null entry in operate ordered conversion");
 	    	goto CLEANUP;
 	    }
-	    py_bin_pair = Py_BuildValue("sO", as_bin_get_name(bin), py_bin_value);
+	    py_bin_pair = Py_BuildValue("NO", intern_string(self, as_bin_get_name(bin), strlen(as_bin_get_name(bin))), py_bin_value);
 	    if (!py_bin_pair) {
 	    	as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to build bin entry");
 		    Py_DECREF(py_bin_value);
@@ -1766,6 +1832,8 @@ void initialize_bin_for_strictypes(AerospikeClient *self, as_error *err, PyObjec
 		serialize_based_on_serializer_policy(self, SERIALIZER_PYTHON,
 				&bytes, py_value, err);
 		as_bytes_init_wrap((as_bytes *) &binop_bin->value, bytes->value, bytes->size, true);
+		// The bin owns the value now.
+		bytes->free = false;
 		binop_bin->valuep = &binop_bin->value;
 	} else {
 		as_bytes *bytes;
@@ -1909,7 +1977,7 @@ as_batch_read_results_to_pyobject(as_error* err, AerospikeClient* client, const
 			}
 		/* The record wasn't found, build a (key, None, None) tuple */
 		} else {
-			key_to_pyobject(err, results[i].key, &py_key);
+			do_key_to_pyobject(client, err, results[i].key, &py_key);
 			if (!py_key || err->code != AEROSPIKE_OK) {
 				Py_XDECREF(temp_py_recs);
 				return err->code;
@@ -1962,7 +2030,7 @@ batch_read_records_to_pyobject(AerospikeClient *self, as_error *err, as_batch_re
 			}
 		/* No record, convert to (key, None, None) */
 		} else {
-			key_to_pyobject(err, &batch->key, &py_key);
+			do_key_to_pyobject(self, err, &batch->key, &py_key);
 			if (!py_key || err->code != AEROSPIKE_OK) {
 				Py_CLEAR(*py_recs);
 				return err->code;
@@ -1987,6 +2055,110 @@ batch_read_records_to_pyobject(AerospikeClient *self, as_error *err, as_batch_re
 	return AEROSPIKE_OK;
 }
 
+as_status
+batch_result_format_from_pyobject(as_error *err, PyObject *py_format, int *format)
+{
+	*format = BATCH_RESULT_LIST;
+
+	if (!py_format || py_format == Py_None) {
+		return AEROSPIKE_OK;
+	}
+
+	const char * name = PyUnicode_Check(py_format) ? PyUnicode_AsUTF8(py_format) : NULL;
+	if (name && strcmp(name, "list") == 0) {
+		*format = BATCH_RESULT_LIST;
+	}
+	else if (name && strcmp(name, "dict") == 0) {
+		*format = BATCH_RESULT_DICT;
+	}
+	else if (name && strcmp(name, "dict_meta") == 0) {
+		*format = BATCH_RESULT_DICT_META;
+	}
+	else {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "result_format must be 'list', 'dict' or 'dict_meta'");
+	}
+	return AEROSPIKE_OK;
+}
+
+/**
+ * Converts the records of a batch read to a dict of bins by user key, or of
+ * (meta, bins) with with_meta. A key without a user key is replaced by its
+ * digest as bytes, and bytes user keys by bytes, so they can be hashed.
+ */
+as_status
+batch_read_records_to_pydict(AerospikeClient *self, as_error *err, as_batch_read_records* records, bool with_meta, PyObject **py_recs)
+{
+	*py_recs = PyDict_New();
+
+	if (!(*py_recs)) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to allocate return dict of records");
+	}
+	as_vector* list = &records->list;
+	for (uint32_t i = 0; i < list->size; i++) {
+
+		as_batch_read_record* batch = as_vector_get(list, i);
+		PyObject* py_key = NULL;
+		PyObject* py_meta = NULL;
+		PyObject* py_bins = NULL;
+		PyObject* py_value = NULL;
+
+		if (key_value_to_pyobject(err, &batch->key, &py_key) != AEROSPIKE_OK) {
+			Py_CLEAR(*py_recs);
+			return err->code;
+		}
+		if (py_key && PyByteArray_Check(py_key)) {
+			PyObject * py_bytes = PyBytes_FromStringAndSize(PyByteArray_AS_STRING(py_key), PyByteArray_GET_SIZE(py_key));
+			Py_DECREF(py_key);
+			py_key = py_bytes;
+		}
+		else if (!py_key) {
+			as_digest * digest = as_key_digest(&batch->key);
+			py_key = PyBytes_FromStringAndSize((char *) digest->value, AS_DIGEST_VALUE_SIZE);
+		}
+		if (!py_key) {
+			as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to create a record key");
+			Py_CLEAR(*py_recs);
+			return err->code;
+		}
+
+		if (batch->result == AEROSPIKE_OK) {
+			if ((with_meta && metadata_to_pyobject(err, &batch->record, &py_meta) != AEROSPIKE_OK) ||
+					bins_to_pyobject(self, err, &batch->record, &py_bins, false) != AEROSPIKE_OK) {
+				Py_XDECREF(py_meta);
+				Py_DECREF(py_key);
+				Py_CLEAR(*py_recs);
+				return err->code;
+			}
+		}
+
+		if (with_meta) {
+			py_value = Py_BuildValue("OO", py_meta ? py_meta : Py_None, py_bins ? py_bins : Py_None);
+			Py_XDECREF(py_meta);
+			Py_XDECREF(py_bins);
+		}
+		else if (py_bins) {
+			py_value = py_bins;
+		}
+		else {
+			Py_INCREF(Py_None);
+			py_value = Py_None;
+		}
+
+		if (!py_value || PyDict_SetItem(*py_recs, py_key, py_value) != 0) {
+			as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to add record to return dict");
+			PyErr_Clear();
+			Py_XDECREF(py_value);
+			Py_DECREF(py_key);
+			Py_CLEAR(*py_recs);
+			return err->code;
+		}
+		Py_DECREF(py_value);
+		Py_DECREF(py_key);
+	}
+	return AEROSPIKE_OK;
+}
+
 /*
 This fetches a string from a Python String like. If it is a unicode in Python27, we need to convert it
 to a bytes like object first, and keep track of the intermediate object for later deletion.
@@ -2021,7 +2193,7 @@ string_and_pyuni_from_pystring(PyObject* py_string, PyObject** pyuni_r, char** c
 as_status get_cdt_ctx(AerospikeClient* self, as_error* err, as_cdt_ctx* cdt_ctx, 
 	PyObject* op_dict, bool* ctx_in_use, as_static_pool* static_pool, int serializer_type)
 {
-	PyObject* py_ctx = PyDict_GetItemString(op_dict, CTX_KEY);
+	PyObject* py_ctx = get_op_entry(op_dict, CTX_KEY);
 	long int_val = 0;
 	as_val* val = NULL;
 
@@ -2029,6 +2201,12 @@ as_status get_cdt_ctx(AerospikeClient* self, as_error* err, as_cdt_ctx* cdt_ctx,
 		return AEROSPIKE_OK;
 	}
 
+	// The ctx of an OperationList is only converted when it is compiled.
+	if (compiled_cdt_ctx_copy(py_ctx, cdt_ctx)) {
+		*ctx_in_use = true;
+		return AEROSPIKE_OK;
+	}
+
 	if (PyList_Check(py_ctx)) {
 		Py_ssize_t py_list_size = PyList_Size(py_ctx);
 		as_cdt_ctx_init(cdt_ctx, (int)py_list_size);
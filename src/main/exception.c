@@ -15,6 +15,7 @@
  ******************************************************************************/
 
 #include <Python.h>
+#include <stdarg.h>
 #include <aerospike/as_query.h>
 #include <aerospike/as_error.h>
 #include <aerospike/as_status.h>
@@ -28,6 +29,76 @@
 
 static PyObject *module;
 
+// Maps a status code to its exception class, built once with the module.
+static PyObject *py_exception_table = NULL;
+
+// Attributes an error tuple sets on the exception instance, in tuple order.
+#define EXCEPTION_ERROR_ATTRS 5
+static const char * exception_error_attrs[EXCEPTION_ERROR_ATTRS] = {"code", "msg", "file", "line", "in_doubt"};
+static PyObject * py_exception_error_attrs[EXCEPTION_ERROR_ATTRS];
+
+/**
+ * AerospikeError.__init__, copies the (code, msg, file, line, in_doubt) error
+ * tuple onto the instance, so raising never touches the class.
+ * Exceptions built with any other arguments keep the class defaults.
+ */
+static PyObject * AerospikeError_Init(PyObject * unused, PyObject * args, PyObject * kwds)
+{
+	Py_ssize_t size = PyTuple_Size(args);
+	if (size < 1) {
+		PyErr_SetString(PyExc_TypeError, "__init__ needs an exception instance");
+		return NULL;
+	}
+
+	PyObject * py_self = PyTuple_GetItem(args, 0);
+	if (size == EXCEPTION_ERROR_ATTRS + 1) {
+		for (int i = 0; i < EXCEPTION_ERROR_ATTRS; i++) {
+			if (PyObject_SetAttr(py_self, py_exception_error_attrs[i], PyTuple_GetItem(args, i + 1)) == -1) {
+				return NULL;
+			}
+		}
+	}
+
+	Py_RETURN_NONE;
+}
+
+static PyMethodDef AerospikeError_Init_Def = {
+	"__init__", (PyCFunction) AerospikeError_Init, METH_VARARGS | METH_KEYWORDS, NULL
+};
+
+/**
+ * Walks the module once and maps every status code to the first exception
+ * class carrying it, subclasses that only inherit a code keep their parent.
+ */
+static int build_exception_table(void)
+{
+	PyObject * py_key = NULL, *py_value = NULL;
+	Py_ssize_t pos = 0;
+	PyObject * py_module_dict = PyModule_GetDict(module);
+
+	py_exception_table = PyDict_New();
+	if (!py_exception_table) {
+		return -1;
+	}
+
+	while (PyDict_Next(py_module_dict, &pos, &py_key, &py_value)) {
+		if (!PyExceptionClass_Check(py_value)) {
+			continue;
+		}
+		PyObject * py_code = PyObject_GetAttrString(py_value, "code");
+		if (!py_code) {
+			PyErr_Clear();
+			continue;
+		}
+		if (py_code != Py_None && !PyDict_Contains(py_exception_table, py_code)) {
+			PyDict_SetItem(py_exception_table, py_code, py_value);
+		}
+		Py_DECREF(py_code);
+	}
+
+	return 0;
+}
+
 PyObject * AerospikeException_New(void)
 {
 	MOD_DEF(module, "aerospike.exception", "Exception objects", NULL);
@@ -99,6 +170,16 @@ PyObject * AerospikeException_New(void)
 	PyDict_SetItemString(py_dict, "file", Py_None);
 	PyDict_SetItemString(py_dict, "msg", Py_None);
 	PyDict_SetItemString(py_dict, "line", Py_None);
+	PyDict_SetItemString(py_dict, "in_doubt", Py_False);
+
+	for (int i = 0; i < EXCEPTION_ERROR_ATTRS; i++) {
+		py_exception_error_attrs[i] = PyUnicode_InternFromString(exception_error_attrs[i]);
+	}
+	PyObject * py_init = PyCFunction_New(&AerospikeError_Init_Def, NULL);
+	PyObject * py_init_method = PyInstanceMethod_New(py_init);
+	PyDict_SetItemString(py_dict, "__init__", py_init_method);
+	Py_DECREF(py_init_method);
+	Py_DECREF(py_init);
 
 	exceptions_array.AerospikeError = PyErr_NewException("exception.AerospikeError", NULL, py_dict);
 	Py_INCREF(exceptions_array.AerospikeError);
@@ -380,59 +461,79 @@ PyObject * AerospikeException_New(void)
 	PyObject_SetAttrString(exceptions_array.QueryQueueFull, "code", py_code);
 	Py_DECREF(py_code);
 
+	build_exception_table();
+
 	return module;
 }
 
 PyObject* raise_exception(as_error *err) {
-	PyObject * py_key = NULL, *py_value = NULL;
-	Py_ssize_t pos = 0;
-	PyObject * py_module_dict = PyModule_GetDict(module);
-	bool found = false;
+	PyObject * py_value = NULL;
 
-	while (PyDict_Next(py_module_dict, &pos, &py_key, &py_value)) {
-		if (PyObject_HasAttrString(py_value, "code")) {
-			PyObject * py_code = PyObject_GetAttrString(py_value, "code");
-			if (py_code == Py_None) {
-				continue;
-			}
-			if (err->code == PyInt_AsLong(py_code)) {
-				found = true;
-				PyObject *py_attr = NULL;
-				py_attr = PyString_FromString(err->message);
-				PyObject_SetAttrString(py_value, "msg", py_attr);
-				Py_DECREF(py_attr);
-
-				// as_error.file is a char* so this may be null
-				if(err->file) {
-					py_attr = PyString_FromString(err->file);
-					PyObject_SetAttrString(py_value, "file", py_attr);
-					Py_DECREF(py_attr);
-				} else {
-					PyObject_SetAttrString(py_value, "file", Py_None);
-
-				}
-				// If the line is 0, set it as None
-				if(err->line > 0) {
-					py_attr = PyInt_FromLong(err->line);
-					PyObject_SetAttrString(py_value, "line", py_attr);
-					Py_DECREF(py_attr);
-				} else {
-					PyObject_SetAttrString(py_value, "line", Py_None);
-				}
-
-				PyObject_SetAttrString(py_value, "in_doubt", PyBool_FromLong(err->in_doubt));
-
-				break;
-			}
+	if (py_exception_table) {
+		PyObject * py_code = PyInt_FromLong(err->code);
+		if (py_code) {
+			py_value = PyDict_GetItem(py_exception_table, py_code);
 			Py_DECREF(py_code);
 		}
 	}
-    // We haven't found the right exception, just use AerospikeError
-	if (!found) {
-		PyObject* base_exception = PyDict_GetItemString(py_module_dict, "AerospikeError");
-		if (base_exception) {
-			py_value = base_exception;
-		}
+
+	// We haven't found the right exception, just use AerospikeError
+	if (!py_value) {
+		py_value = PyDict_GetItemString(PyModule_GetDict(module), "AerospikeError");
 	}
 	return py_value;
 }
+
+static PyObject * exception_with_attrs(PyObject * exception_type, PyObject * py_err, va_list attrs)
+{
+	PyObject * py_exc = PyObject_CallObject(exception_type, py_err);
+	if (!py_exc) {
+		return NULL;
+	}
+
+	const char * name = NULL;
+	while ((name = va_arg(attrs, const char *)) != NULL) {
+		PyObject * py_value = va_arg(attrs, PyObject *);
+		if (PyObject_HasAttrString(exception_type, name) &&
+				PyObject_SetAttrString(py_exc, name, py_value ? py_value : Py_None) == -1) {
+			PyErr_Clear();
+		}
+	}
+
+	return py_exc;
+}
+
+/**
+ * Returns a new exception_type instance for the error tuple py_err. The NULL
+ * terminated name, value pairs which follow, such as "key" and "bin", are
+ * set on the instance for the names its class declares, so that concurrent
+ * errors never share them through the class.
+ */
+PyObject * new_exception_with_attrs(PyObject * exception_type, PyObject * py_err, ...)
+{
+	va_list attrs;
+	va_start(attrs, py_err);
+	PyObject * py_exc = exception_with_attrs(exception_type, py_err, attrs);
+	va_end(attrs);
+
+	return py_exc;
+}
+
+/**
+ * Raises exception_type with the error tuple py_err, setting the name, value
+ * pairs on the instance as new_exception_with_attrs() does.
+ */
+void raise_exception_with_attrs(PyObject * exception_type, PyObject * py_err, ...)
+{
+	va_list attrs;
+	va_start(attrs, py_err);
+	PyObject * py_exc = exception_with_attrs(exception_type, py_err, attrs);
+	va_end(attrs);
+
+	if (!py_exc) {
+		return;
+	}
+
+	PyErr_SetObject(exception_type, py_exc);
+	Py_DECREF(py_exc);
+}
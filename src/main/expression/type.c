@@ -14,53 +14,50 @@
  * limitations under the License.
  ******************************************************************************/
 
+
 #include <Python.h>
 #include <structmember.h>
 #include <stdbool.h>
-#include <unistd.h>
 
-#include <aerospike/aerospike.h>
-#include <aerospike/as_config.h>
 #include <aerospike/as_error.h>
-#include <aerospike/as_policy.h>
+#include <aerospike/as_exp.h>
 
-#include "admin.h"
 #include "client.h"
-#include "policy.h"
 #include "conversions.h"
-#include "exceptions.h"
-#include "global_hosts.h"
+#include "expression.h"
 
-static PyObject * AerospikeGlobalHosts_Type_New(PyTypeObject * type, PyObject * args, PyObject * kwds)
+static PyObject * AerospikeExpression_Type_Repr(AerospikeExpression * self)
 {
-	AerospikeGlobalHosts * self = NULL;
-
-	self = (AerospikeGlobalHosts *) PyObject_New(AerospikeGlobalHosts, type);
-
-	return (PyObject *) self;
+	return PyUnicode_FromFormat("<aerospike.Expression packed_size=%u>",
+			self->exp ? self->exp->packed_sz : 0);
 }
 
-static void AerospikeGlobalHosts_Type_Dealloc(PyObject * self)
+static void AerospikeExpression_Type_Dealloc(AerospikeExpression * self)
 {
-	PyObject_Del(self);
+	if (self->exp) {
+		as_exp_destroy(self->exp);
+		self->exp = NULL;
+	}
+	Py_TYPE(self)->tp_free((PyObject *) self);
 }
 
 /*******************************************************************************
  * PYTHON TYPE DESCRIPTOR
  ******************************************************************************/
 
-static PyTypeObject AerospikeGlobalHosts_Type = {
+static PyTypeObject AerospikeExpression_Type = {
 	PyVarObject_HEAD_INIT(NULL, 0)
-	0,                                  // tp_name
-	sizeof(AerospikeGlobalHosts),       // tp_basicsize
+	"aerospike.Expression",             // tp_name
+	sizeof(AerospikeExpression),        // tp_basicsize
 	0,                                  // tp_itemsize
-	(destructor) AerospikeGlobalHosts_Type_Dealloc,
+	(destructor) AerospikeExpression_Type_Dealloc,
 	                                    // tp_dealloc
 	0,                                  // tp_print
 	0,                                  // tp_getattr
 	0,                                  // tp_setattr
 	0,                                  // tp_compare
-	0,                                  // tp_repr
+	(reprfunc) AerospikeExpression_Type_Repr,
+	                                    // tp_repr
 	0,                                  // tp_as_number
 	0,                                  // tp_as_sequence
 	0,                                  // tp_as_mapping
@@ -70,9 +67,10 @@ static PyTypeObject AerospikeGlobalHosts_Type = {
 	0,                                  // tp_getattro
 	0,                                  // tp_setattro
 	0,                                  // tp_as_buffer
-	Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
-	                                    // tp_flags
-	"The Global Host stores the persistent objects\n",
+	Py_TPFLAGS_DEFAULT,                 // tp_flags
+	"An immutable, already packed Aerospike expression.\n"
+			"Instances are created with Client.compile_expression() and can be\n"
+			"used anywhere a policy or an operation takes 'expressions'.\n",
 	                                    // tp_doc
 	0,                                  // tp_traverse
 	0,                                  // tp_clear
@@ -90,24 +88,54 @@ static PyTypeObject AerospikeGlobalHosts_Type = {
 	0,                                  // tp_dictoffset
 	0,                                  // tp_init
 	0,                                  // tp_alloc
-	AerospikeGlobalHosts_Type_New,      // tp_new
+	0,                                  // tp_new
 	0,                                  // tp_free
 	0,                                  // tp_is_gc
 	0                                   // tp_bases
 };
 
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
 
-AerospikeGlobalHosts * AerospikeGobalHosts_New(aerospike* as)
+PyTypeObject * AerospikeExpression_Ready()
 {
-	AerospikeGlobalHosts * self = (AerospikeGlobalHosts *) AerospikeGlobalHosts_Type.tp_new(&AerospikeGlobalHosts_Type, Py_None, Py_None);
-	self->as = as;
-	self->shm_key = as->config.shm_key;
-	self->ref_cnt = 1;
-	Py_INCREF((PyObject*) self);
-	return self;
+	return PyType_Ready(&AerospikeExpression_Type) == 0 ? &AerospikeExpression_Type : NULL;
 }
 
-void AerospikeGlobalHosts_Del(PyObject *self)
+PyObject * AerospikeExpression_New(as_exp * exp)
 {
-	AerospikeGlobalHosts_Type_Dealloc(self);
+	AerospikeExpression * self = PyObject_New(AerospikeExpression, &AerospikeExpression_Type);
+	if (!self) {
+		as_exp_destroy(exp);
+		return NULL;
+	}
+	self->exp = exp;
+	return (PyObject *) self;
+}
+
+bool AerospikeExpression_Check(PyObject * py_obj)
+{
+	return py_obj && PyObject_TypeCheck(py_obj, &AerospikeExpression_Type);
+}
+
+as_status get_as_exp(AerospikeClient * self, as_error * err, PyObject * py_exp,
+		as_exp ** exp, bool * exp_owned)
+{
+	*exp_owned = false;
+
+	if (AerospikeExpression_Check(py_exp)) {
+		*exp = ((AerospikeExpression *) py_exp)->exp;
+		return err->code;
+	}
+
+	if (!py_exp || !PyList_Check(py_exp)) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Expressions must be an aerospike.Expression or a list generated by a compiled aerospike expression");
+	}
+
+	if (convert_exp_list(self, py_exp, exp, err) == AEROSPIKE_OK) {
+		*exp_owned = true;
+	}
+
+	return err->code;
 }
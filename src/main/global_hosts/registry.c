@@ -0,0 +1,179 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/aerospike.h>
+
+#include "global_hosts.h"
+
+typedef struct global_host_s {
+	char * alias;
+	aerospike * as;
+	int shm_key;
+	uint32_t ref_cnt;
+	struct global_host_s * next;
+} global_host;
+
+static global_host * global_hosts = NULL;
+
+static pthread_mutex_t global_hosts_mutex;
+static pthread_once_t global_hosts_once = PTHREAD_ONCE_INIT;
+
+static void global_hosts_init(void)
+{
+	pthread_mutexattr_t attr;
+	pthread_mutexattr_init(&attr);
+	pthread_mutexattr_settype(&attr, PTHREAD_MUTEX_RECURSIVE);
+	pthread_mutex_init(&global_hosts_mutex, &attr);
+	pthread_mutexattr_destroy(&attr);
+}
+
+void global_hosts_lock(void)
+{
+	pthread_once(&global_hosts_once, global_hosts_init);
+	pthread_mutex_lock(&global_hosts_mutex);
+}
+
+void global_hosts_unlock(void)
+{
+	pthread_mutex_unlock(&global_hosts_mutex);
+}
+
+/*
+ * Must be called with the registry lock held.
+ */
+static global_host ** global_hosts_find(const char * alias)
+{
+	global_host ** host = &global_hosts;
+
+	while (*host && strcmp((*host)->alias, alias) != 0) {
+		host = &(*host)->next;
+	}
+
+	return host;
+}
+
+static void global_host_free(global_host * host)
+{
+	free(host->alias);
+	free(host);
+}
+
+aerospike * global_hosts_acquire(const char * alias)
+{
+	aerospike * as = NULL;
+
+	global_hosts_lock();
+	global_host * host = *global_hosts_find(alias);
+	if (host) {
+		host->ref_cnt++;
+		as = host->as;
+	}
+	global_hosts_unlock();
+
+	return as;
+}
+
+aerospike * global_hosts_add(const char * alias, aerospike * as)
+{
+	global_hosts_lock();
+	global_host * host = *global_hosts_find(alias);
+
+	if (host) {
+		host->ref_cnt++;
+		as = host->as;
+	}
+	else {
+		host = (global_host *) malloc(sizeof(global_host));
+		char * host_alias = host ? strdup(alias) : NULL;
+		if (!host_alias) {
+			free(host);
+			global_hosts_unlock();
+			return NULL;
+		}
+		host->alias = host_alias;
+		host->as = as;
+		host->shm_key = as->config.shm_key;
+		host->ref_cnt = 1;
+		host->next = global_hosts;
+		global_hosts = host;
+	}
+	global_hosts_unlock();
+
+	return as;
+}
+
+bool global_hosts_release(aerospike * as)
+{
+	bool last = false;
+
+	global_hosts_lock();
+	global_host ** entry = &global_hosts;
+
+	/*
+	 * Looked up by cluster rather than alias, the alias of a client using
+	 * shared memory changes once connect() assigns its shm_key.
+	 */
+	while (*entry && (*entry)->as != as) {
+		entry = &(*entry)->next;
+	}
+
+	global_host * host = *entry;
+	if (host && --host->ref_cnt == 0) {
+		*entry = host->next;
+		global_host_free(host);
+		last = true;
+	}
+	global_hosts_unlock();
+
+	return last;
+}
+
+void global_hosts_remove(const char * alias)
+{
+	global_hosts_lock();
+	global_host ** entry = global_hosts_find(alias);
+	global_host * host = *entry;
+
+	if (host) {
+		*entry = host->next;
+		global_host_free(host);
+	}
+	global_hosts_unlock();
+}
+
+int global_hosts_free_shm_key(int shm_key)
+{
+	global_hosts_lock();
+	global_host * host = global_hosts;
+
+	while (host) {
+		if (host->as->config.use_shm && host->shm_key == shm_key) {
+			// Start over with the next key.
+			shm_key++;
+			host = global_hosts;
+			continue;
+		}
+		host = host->next;
+	}
+	global_hosts_unlock();
+
+	return shm_key;
+}
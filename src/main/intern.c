@@ -0,0 +1,113 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <string.h>
+
+#include "intern.h"
+
+/*
+ * A direct mapped cache: a string lives in the slot picked by its hash, and
+ * replaces whatever string was there. The table never holds more than its
+ * size strings, each of at most INTERN_MAX_LENGTH bytes.
+ */
+typedef struct {
+	uint32_t hash;
+	PyObject * py_str;
+} intern_slot;
+
+struct intern_table_s {
+	uint32_t mask;
+	intern_slot slots[];
+};
+
+static inline uint32_t intern_hash(const char * str, size_t size)
+{
+	// FNV-1a
+	uint32_t hash = 2166136261u;
+	for (size_t i = 0; i < size; i++) {
+		hash ^= (uint8_t) str[i];
+		hash *= 16777619u;
+	}
+	return hash;
+}
+
+struct intern_table_s * intern_table_new(uint32_t size)
+{
+	uint32_t slots = 1;
+	while (slots < size && slots < (1u << 20)) {
+		slots <<= 1;
+	}
+
+	struct intern_table_s * table = (struct intern_table_s *) calloc(1,
+			sizeof(struct intern_table_s) + sizeof(intern_slot) * slots);
+	if (table) {
+		table->mask = slots - 1;
+	}
+	return table;
+}
+
+void intern_table_free(struct intern_table_s * table)
+{
+	if (!table) {
+		return;
+	}
+	for (uint32_t i = 0; i <= table->mask; i++) {
+		Py_XDECREF(table->slots[i].py_str);
+	}
+	free(table);
+}
+
+PyObject * intern_string(AerospikeClient * self, const char * str, size_t size)
+{
+	struct intern_table_s * table = self ? self->intern_table : NULL;
+
+	if (!table || size > INTERN_MAX_LENGTH) {
+		return PyUnicode_DecodeUTF8(str, size, NULL);
+	}
+
+	// Only called with the GIL held, which guards the table.
+	uint32_t hash = intern_hash(str, size);
+	intern_slot * slot = &table->slots[hash & table->mask];
+
+	if (slot->py_str && slot->hash == hash) {
+		Py_ssize_t length = 0;
+		const char * utf8 = PyUnicode_AsUTF8AndSize(slot->py_str, &length);
+		if (utf8 && (size_t) length == size && !memcmp(utf8, str, size)) {
+			Py_INCREF(slot->py_str);
+			return slot->py_str;
+		}
+	}
+
+	PyObject * py_str = PyUnicode_DecodeUTF8(str, size, NULL);
+	if (!py_str) {
+		return NULL;
+	}
+
+	// The str caches its hash, dicts built with it won't hash it again.
+	(void) PyObject_Hash(py_str);
+
+	PyObject * py_previous = slot->py_str;
+	Py_INCREF(py_str);
+	slot->py_str = py_str;
+	slot->hash = hash;
+	Py_XDECREF(py_previous);
+
+	return py_str;
+}
@@ -0,0 +1,304 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+#include <ctype.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+
+#include "conversions.h"
+#include "exceptions.h"
+#include "key_batch.h"
+
+/**
+ * Reads the keys of a buffer of fixed size byte strings, such as a numpy
+ * bytes array. As numpy does, the trailing NUL bytes of each key are dropped.
+ * Returns false for any other kind of buffer.
+ */
+static bool key_batch_inputs_from_bytes_buffer(Py_buffer * view, digest_input * inputs)
+{
+	const char * format = view->format ? view->format : "B";
+	if (strchr("@=<>!|", *format)) {
+		format++;
+	}
+	while (isdigit((unsigned char) *format)) {
+		format++;
+	}
+	if (view->ndim != 1 || strcmp(format, "s") != 0) {
+		return false;
+	}
+
+	for (Py_ssize_t i = 0; i < view->shape[0]; i++) {
+		const uint8_t * item = (const uint8_t *) view->buf + i * view->strides[0];
+		Py_ssize_t size = view->itemsize;
+		while (size > 0 && item[size - 1] == '\0') {
+			size--;
+		}
+		inputs[i].type = AS_STRING;
+		inputs[i].data = item;
+		inputs[i].size = size;
+	}
+	return true;
+}
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static PyObject * AerospikeKeyBatch_Type_New(PyTypeObject * type, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_ns = NULL;
+	PyObject * py_set = NULL;
+	PyObject * py_keys = NULL;
+
+	AerospikeKeyBatch * self = NULL;
+	PyObject * py_fast = NULL;
+	Py_buffer view;
+	bool view_acquired = false;
+	const char * ns = NULL;
+	const char * set = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"ns", "set", "keys", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OOO:KeyBatch", kwlist,
+			&py_ns, &py_set, &py_keys) == false) {
+		return NULL;
+	}
+
+	self = (AerospikeKeyBatch *) type->tp_alloc(type, 0);
+	if (!self) {
+		return NULL;
+	}
+
+	if (!PyUnicode_Check(py_ns)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Namespace should be a string");
+		goto CLEANUP;
+	}
+	ns = PyUnicode_AsUTF8(py_ns);
+	if (strlen(ns) >= AS_NAMESPACE_MAX_SIZE) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Namespace is too long");
+		goto CLEANUP;
+	}
+	strcpy(self->ns, ns);
+
+	if (PyUnicode_Check(py_set)) {
+		set = PyUnicode_AsUTF8(py_set);
+		if (strlen(set) >= AS_SET_MAX_SIZE) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "Set is too long");
+			goto CLEANUP;
+		}
+		strcpy(self->set, set);
+	}
+	else if (py_set != Py_None) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Set should be a string or None");
+		goto CLEANUP;
+	}
+
+	// A single key is a sequence too, but never what was meant.
+	if (PyUnicode_Check(py_keys) || PyBytes_Check(py_keys) || PyByteArray_Check(py_keys)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "keys should be a sequence or an array of keys");
+		goto CLEANUP;
+	}
+
+	// Integer and bytes arrays, such as numpy arrays, are read without boxing each key.
+	if (PyObject_CheckBuffer(py_keys) &&
+			PyObject_GetBuffer(py_keys, &view, PyBUF_FORMAT | PyBUF_STRIDES) == 0) {
+		view_acquired = true;
+		self->size = view.ndim == 1 ? view.shape[0] : 0;
+		self->keys = (digest_input *) PyMem_Malloc(sizeof(digest_input) * (self->size ? self->size : 1));
+		if (!self->keys) {
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate keys");
+			goto CLEANUP;
+		}
+		if (!digest_inputs_from_buffer(&view, self->keys) &&
+				!key_batch_inputs_from_bytes_buffer(&view, self->keys)) {
+			PyMem_Free(self->keys);
+			self->keys = NULL;
+			self->size = 0;
+			PyBuffer_Release(&view);
+			view_acquired = false;
+		}
+	}
+	else {
+		PyErr_Clear();
+	}
+
+	if (!self->keys) {
+		py_fast = PySequence_Fast(py_keys, "keys should be a sequence or an array of keys");
+		if (!py_fast) {
+			PyErr_Clear();
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "keys should be a sequence or an array of keys");
+			goto CLEANUP;
+		}
+		self->size = PySequence_Fast_GET_SIZE(py_fast);
+		self->keys = (digest_input *) PyMem_Malloc(sizeof(digest_input) * (self->size ? self->size : 1));
+		if (!self->keys) {
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate keys");
+			goto CLEANUP;
+		}
+		for (Py_ssize_t i = 0; i < self->size; i++) {
+			if (digest_input_from_pyobject(&err, PySequence_Fast_GET_ITEM(py_fast, i), &self->keys[i]) != AEROSPIKE_OK) {
+				goto CLEANUP;
+			}
+		}
+	}
+
+	digest_inputs_own_data(&err, self->keys, self->size, &self->data);
+
+CLEANUP:
+	if (view_acquired) {
+		PyBuffer_Release(&view);
+	}
+
+	Py_XDECREF(py_fast);
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_DECREF(self);
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return (PyObject *) self;
+}
+
+static Py_ssize_t AerospikeKeyBatch_Type_Length(AerospikeKeyBatch * self)
+{
+	return self->size;
+}
+
+static PyObject * AerospikeKeyBatch_Type_Get_Ns(AerospikeKeyBatch * self, void * closure)
+{
+	return PyUnicode_FromString(self->ns);
+}
+
+static PyObject * AerospikeKeyBatch_Type_Get_Set(AerospikeKeyBatch * self, void * closure)
+{
+	if (!self->set[0]) {
+		Py_RETURN_NONE;
+	}
+	return PyUnicode_FromString(self->set);
+}
+
+static PyObject * AerospikeKeyBatch_Type_Repr(AerospikeKeyBatch * self)
+{
+	return PyUnicode_FromFormat("<aerospike.KeyBatch ns=%s set=%s size=%zd>",
+			self->ns, self->set[0] ? self->set : "None", self->size);
+}
+
+static void AerospikeKeyBatch_Type_Dealloc(AerospikeKeyBatch * self)
+{
+	PyMem_Free(self->keys);
+	PyMem_Free(self->data);
+	Py_TYPE(self)->tp_free((PyObject *) self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PySequenceMethods AerospikeKeyBatch_Type_Sequence = {
+	.sq_length = (lenfunc) AerospikeKeyBatch_Type_Length,
+};
+
+static PyGetSetDef AerospikeKeyBatch_Type_GetSet[] = {
+	{"ns", (getter) AerospikeKeyBatch_Type_Get_Ns, NULL, "The namespace of the keys.", NULL},
+	{"set", (getter) AerospikeKeyBatch_Type_Get_Set, NULL, "The set of the keys, None if there is none.", NULL},
+	{NULL}
+};
+
+static PyTypeObject AerospikeKeyBatch_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	"aerospike.KeyBatch",               // tp_name
+	sizeof(AerospikeKeyBatch),          // tp_basicsize
+	0,                                  // tp_itemsize
+	(destructor) AerospikeKeyBatch_Type_Dealloc,
+	                                    // tp_dealloc
+	0,                                  // tp_print
+	0,                                  // tp_getattr
+	0,                                  // tp_setattr
+	0,                                  // tp_compare
+	(reprfunc) AerospikeKeyBatch_Type_Repr,
+	                                    // tp_repr
+	0,                                  // tp_as_number
+	&AerospikeKeyBatch_Type_Sequence,   // tp_as_sequence
+	0,                                  // tp_as_mapping
+	0,                                  // tp_hash
+	0,                                  // tp_call
+	0,                                  // tp_str
+	0,                                  // tp_getattro
+	0,                                  // tp_setattro
+	0,                                  // tp_as_buffer
+	Py_TPFLAGS_DEFAULT,                 // tp_flags
+	"KeyBatch(ns, set, keys)\n\n"
+			"An immutable batch of keys sharing a namespace and a set.\n"
+			"keys is a sequence of key values, or an integer or bytes array\n"
+			"such as a numpy array. A KeyBatch can be passed to get_many(),\n"
+			"exists_many() and select_many() instead of a list of key tuples.\n",
+	                                    // tp_doc
+	0,                                  // tp_traverse
+	0,                                  // tp_clear
+	0,                                  // tp_richcompare
+	0,                                  // tp_weaklistoffset
+	0,                                  // tp_iter
+	0,                                  // tp_iternext
+	0,                                  // tp_methods
+	0,                                  // tp_members
+	AerospikeKeyBatch_Type_GetSet,      // tp_getset
+	0,                                  // tp_base
+	0,                                  // tp_dict
+	0,                                  // tp_descr_get
+	0,                                  // tp_descr_set
+	0,                                  // tp_dictoffset
+	0,                                  // tp_init
+	0,                                  // tp_alloc
+	AerospikeKeyBatch_Type_New,         // tp_new
+	0,                                  // tp_free
+	0,                                  // tp_is_gc
+	0                                   // tp_bases
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeKeyBatch_Ready()
+{
+	return PyType_Ready(&AerospikeKeyBatch_Type) == 0 ? &AerospikeKeyBatch_Type : NULL;
+}
+
+bool AerospikeKeyBatch_Check(PyObject * py_obj)
+{
+	return py_obj && PyObject_TypeCheck(py_obj, &AerospikeKeyBatch_Type);
+}
+
+void key_batch_key_init(AerospikeKeyBatch * self, Py_ssize_t i, as_key * key)
+{
+	digest_input_to_key(&self->keys[i], self->ns, self->set, key);
+}
@@ -0,0 +1,820 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/as_cdt_ctx.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_operations.h>
+#include <aerospike/as_vector.h>
+
+#include "cdt_operation_utils.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "operate.h"
+#include "operation_list.h"
+#include "serializer.h"
+
+#define COMPILED_OPERATIONS_NAME "aerospike.OperationList.compiled"
+#define COMPILED_CTX_NAME "aerospike.OperationList.ctx"
+
+// The ctx items holding an as_val, keys and values, have bit 1 of their type set.
+#define CTX_ITEM_HAS_VAL(__type) ((__type) & 0x02)
+
+enum {
+	// Added by copying the compiled binops.
+	COMPILED_CONST,
+	// Incr and write of a placeholder value, added without the op dict.
+	COMPILED_INCR,
+	COMPILED_WRITE,
+	// Added with add_op() from a copy of the op dict with the values bound.
+	COMPILED_TEMPLATE
+};
+
+typedef struct {
+	int kind;
+	// COMPILED_CONST: the binops of the operation in the compiled ops.
+	uint16_t first;
+	uint16_t count;
+	// COMPILED_CONST: the ttl set by a touch operation.
+	bool has_ttl;
+	uint32_t ttl;
+	// COMPILED_INCR and COMPILED_WRITE: the bin and the value placeholder.
+	char * bin;
+	Py_ssize_t arg;
+	// The op dict with its ctx compiled, for COMPILED_TEMPLATE and for the
+	// values COMPILED_INCR does not handle.
+	PyObject * py_op;
+} compiled_operation;
+
+/*
+ * The operations of an OperationList compiled for a client. It is kept in a
+ * capsule, which a command holds while its as_operations shares the values.
+ */
+typedef struct {
+	AerospikeClient * client;
+	as_operations * ops;
+	as_vector * unicodeStrVector;
+	as_static_pool * static_pool;
+	Py_ssize_t size;
+	compiled_operation * entries;
+} compiled_operations;
+
+static PyTypeObject AerospikeOperationList_Type;
+static PyTypeObject AerospikeBoundOperationList_Type;
+static PyTypeObject AerospikePlaceholder_Type;
+
+static PyObject * raise_as_error(as_error * err)
+{
+	PyObject * py_err = NULL;
+	error_to_pyobject(err, &py_err);
+	PyObject *exception_type = raise_exception(err);
+	PyErr_SetObject(exception_type, py_err);
+	Py_DECREF(py_err);
+	return NULL;
+}
+
+/*******************************************************************************
+ * COMPILATION
+ ******************************************************************************/
+
+static void compiled_ctx_destroy(PyObject * py_capsule)
+{
+	as_cdt_ctx * ctx = (as_cdt_ctx *) PyCapsule_GetPointer(py_capsule, COMPILED_CTX_NAME);
+	as_cdt_ctx_destroy(ctx);
+	free(ctx);
+}
+
+static void compiled_operations_destroy(PyObject * py_capsule)
+{
+	compiled_operations * compiled = (compiled_operations *) PyCapsule_GetPointer(py_capsule, COMPILED_OPERATIONS_NAME);
+
+	for (Py_ssize_t i = 0; i < compiled->size; i++) {
+		Py_XDECREF(compiled->entries[i].py_op);
+	}
+	free(compiled->entries);
+
+	if (compiled->ops) {
+		as_operations_destroy(compiled->ops);
+	}
+	static_pool_free(compiled->static_pool);
+
+	if (compiled->unicodeStrVector) {
+		for (unsigned int i = 0; i < compiled->unicodeStrVector->size; i++) {
+			free(as_vector_get_ptr(compiled->unicodeStrVector, i));
+		}
+		as_vector_destroy(compiled->unicodeStrVector);
+	}
+
+	Py_XDECREF(compiled->client);
+	free(compiled);
+}
+
+/**
+ * Returns true if the only placeholder of an operation is its value, and it
+ * has no keys other than op, bin and val.
+ */
+static bool operation_binds_only_value(operation_template * template)
+{
+	if (PyTuple_GET_SIZE(template->py_slots) != 1 || PyDict_Size(template->py_op) != 3) {
+		return false;
+	}
+	PyObject * py_key = PyTuple_GET_ITEM(PyTuple_GET_ITEM(template->py_slots, 0), 0);
+	PyObject * py_bin = PyDict_GetItemString(template->py_op, "bin");
+	return PyUnicode_Check(py_key) && PyUnicode_CompareWithASCIIString(py_key, "val") == 0 &&
+		py_bin && PyUnicode_Check(py_bin);
+}
+
+/**
+ * Returns true if the ctx of an operation is a placeholder.
+ */
+static bool operation_binds_ctx(operation_template * template)
+{
+	for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(template->py_slots); i++) {
+		PyObject * py_key = PyTuple_GET_ITEM(PyTuple_GET_ITEM(template->py_slots, i), 0);
+		if (PyUnicode_Check(py_key) && PyUnicode_CompareWithASCIIString(py_key, CTX_KEY) == 0) {
+			return true;
+		}
+	}
+	return false;
+}
+
+static as_status compile_value_operation(AerospikeClient * client, as_error * err, compiled_operations * compiled,
+	operation_template * template, compiled_operation * entry)
+{
+	PyObject * py_bin = PyDict_GetItemString(template->py_op, "bin");
+	const char * bin = PyUnicode_AsUTF8(py_bin);
+	if (!bin) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Bin name should be of type string");
+	}
+	if (client->strict_types && strlen(bin) > AS_BIN_NAME_MAX_LEN) {
+		return as_error_update(err, AEROSPIKE_ERR_BIN_NAME, "A bin name should not exceed 14 characters limit");
+	}
+
+	entry->kind = template->operation == AS_OPERATOR_INCR ? COMPILED_INCR : COMPILED_WRITE;
+	entry->bin = strdup(bin);
+	as_vector_append(compiled->unicodeStrVector, &entry->bin);
+	entry->arg = PyLong_AsSsize_t(PyTuple_GET_ITEM(PyTuple_GET_ITEM(template->py_slots, 0), 1));
+	Py_INCREF(template->py_op);
+	entry->py_op = template->py_op;
+	return AEROSPIKE_OK;
+}
+
+static as_status compile_template_operation(AerospikeClient * client, as_error * err, compiled_operations * compiled,
+	operation_template * template, compiled_operation * entry)
+{
+	entry->kind = COMPILED_TEMPLATE;
+	entry->py_op = PyDict_Copy(template->py_op);
+	if (!entry->py_op) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to copy operation");
+	}
+
+	if (!PyDict_GetItemString(entry->py_op, CTX_KEY) || operation_binds_ctx(template)) {
+		return AEROSPIKE_OK;
+	}
+
+	// The ctx is converted once, every call takes a copy of it.
+	bool ctx_in_use = false;
+	as_cdt_ctx * ctx = (as_cdt_ctx *) malloc(sizeof(as_cdt_ctx));
+	if (!ctx) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to compile ctx");
+	}
+	if (get_cdt_ctx(client, err, ctx, entry->py_op, &ctx_in_use, compiled->static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+		free(ctx);
+		return err->code;
+	}
+
+	PyObject * py_ctx = PyCapsule_New(ctx, COMPILED_CTX_NAME, compiled_ctx_destroy);
+	if (!py_ctx) {
+		PyErr_Clear();
+		as_cdt_ctx_destroy(ctx);
+		free(ctx);
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to compile ctx");
+	}
+	int rval = PyDict_SetItemString(entry->py_op, CTX_KEY, py_ctx);
+	Py_DECREF(py_ctx);
+	if (rval != 0) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to compile ctx");
+	}
+	return AEROSPIKE_OK;
+}
+
+/**
+ * Compiles the operations of list for client, returns a new capsule of
+ * compiled_operations or NULL with err set.
+ */
+static PyObject * operation_list_compile(AerospikeOperationList * list, AerospikeClient * client, as_error * err)
+{
+	long operation;
+	long return_type = -1;
+
+	if (list->size > UINT16_MAX) {
+		as_error_update(err, AEROSPIKE_ERR_PARAM, "OperationList can hold at most %d operations", UINT16_MAX);
+		return NULL;
+	}
+
+	compiled_operations * compiled = (compiled_operations *) calloc(1, sizeof(compiled_operations));
+	if (!compiled) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate operations");
+		return NULL;
+	}
+
+	PyObject * py_compiled = PyCapsule_New(compiled, COMPILED_OPERATIONS_NAME, compiled_operations_destroy);
+	if (!py_compiled) {
+		PyErr_Clear();
+		free(compiled);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate operations");
+		return NULL;
+	}
+
+	Py_INCREF(client);
+	compiled->client = client;
+	compiled->ops = as_operations_new((uint16_t) (list->size ? list->size : 1));
+	compiled->unicodeStrVector = as_vector_create(sizeof(char *), 8);
+	compiled->static_pool = static_pool_new();
+	compiled->entries = (compiled_operation *) calloc(list->size ? list->size : 1, sizeof(compiled_operation));
+	if (!compiled->ops || !compiled->static_pool || !compiled->entries) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate operations");
+		goto CLEANUP;
+	}
+
+	for (Py_ssize_t i = 0; i < list->size; i++) {
+		operation_template * template = &list->templates[i];
+		compiled_operation * entry = &compiled->entries[i];
+		compiled->size = i + 1;
+
+		if (!template->py_slots) {
+			entry->kind = COMPILED_CONST;
+			entry->first = compiled->ops->binops.size;
+			if (add_op(client, err, template->py_op, compiled->unicodeStrVector, compiled->static_pool,
+					compiled->ops, &operation, &return_type) != AEROSPIKE_OK) {
+				goto CLEANUP;
+			}
+			entry->count = compiled->ops->binops.size - entry->first;
+			if (operation == AS_OPERATOR_TOUCH && PyDict_GetItemString(template->py_op, "val")) {
+				entry->has_ttl = true;
+				entry->ttl = compiled->ops->ttl;
+			}
+		}
+		else if ((template->operation == AS_OPERATOR_INCR || template->operation == AS_OPERATOR_WRITE) &&
+				operation_binds_only_value(template)) {
+			if (compile_value_operation(client, err, compiled, template, entry) != AEROSPIKE_OK) {
+				goto CLEANUP;
+			}
+		}
+		else if (compile_template_operation(client, err, compiled, template, entry) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+CLEANUP:
+	if (err->code != AEROSPIKE_OK) {
+		Py_DECREF(py_compiled);
+		return NULL;
+	}
+	return py_compiled;
+}
+
+/*******************************************************************************
+ * BINDING
+ ******************************************************************************/
+
+/**
+ * Appends the compiled binops of an operation to ops. The values are shared:
+ * values held by the binop are copied without the memory they point to, the
+ * others are reserved.
+ */
+static as_status add_compiled_binops(as_error * err, compiled_operations * compiled, compiled_operation * entry,
+	as_operations * ops)
+{
+	if (ops->binops.size + entry->count > ops->binops.capacity) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Too many operations");
+	}
+
+	for (uint16_t i = 0; i < entry->count; i++) {
+		as_binop * src = &compiled->ops->binops.entries[entry->first + i];
+		as_binop * dst = &ops->binops.entries[ops->binops.size++];
+		*dst = *src;
+
+		if (src->bin.valuep == &src->bin.value) {
+			dst->bin.valuep = &dst->bin.value;
+			switch (as_bin_get_type(&dst->bin)) {
+				case AS_STRING:
+					dst->bin.value.string.free = false;
+					break;
+				case AS_BYTES:
+					dst->bin.value.bytes.free = false;
+					break;
+				case AS_GEOJSON:
+					dst->bin.value.geojson.free = false;
+					break;
+				default:
+					break;
+			}
+		}
+		else if (src->bin.valuep) {
+			as_val_reserve((as_val *) src->bin.valuep);
+		}
+	}
+
+	if (entry->has_ttl) {
+		ops->ttl = entry->ttl;
+	}
+	return AEROSPIKE_OK;
+}
+
+static as_status add_bound_op(AerospikeClient * self, as_error * err, operation_template * template,
+	compiled_operation * entry, PyObject * py_args, as_vector * unicodeStrVector,
+	as_static_pool * static_pool, as_operations * ops)
+{
+	long operation;
+	long return_type = -1;
+
+	PyObject * py_op = PyDict_Copy(entry->py_op);
+	if (!py_op) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to copy operation");
+	}
+
+	for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(template->py_slots); i++) {
+		PyObject * py_slot = PyTuple_GET_ITEM(template->py_slots, i);
+		Py_ssize_t arg = PyLong_AsSsize_t(PyTuple_GET_ITEM(py_slot, 1));
+		if (PyDict_SetItem(py_op, PyTuple_GET_ITEM(py_slot, 0), PyTuple_GET_ITEM(py_args, arg)) != 0) {
+			PyErr_Clear();
+			Py_DECREF(py_op);
+			return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to bind operation");
+		}
+	}
+
+	add_op(self, err, py_op, unicodeStrVector, static_pool, ops, &operation, &return_type);
+	Py_DECREF(py_op);
+	return err->code;
+}
+
+static as_status add_compiled_op(AerospikeClient * self, as_error * err, operation_template * template,
+	compiled_operations * compiled, compiled_operation * entry, PyObject * py_args,
+	as_vector * unicodeStrVector, as_static_pool * static_pool, as_operations * ops)
+{
+	PyObject * py_value = NULL;
+	as_val * val = NULL;
+
+	switch (entry->kind) {
+		case COMPILED_CONST:
+			return add_compiled_binops(err, compiled, entry, ops);
+		case COMPILED_INCR:
+			py_value = PyTuple_GET_ITEM(py_args, entry->arg);
+			if (PyLong_Check(py_value)) {
+				long offset = PyLong_AsLong(py_value);
+				if (offset != -1 || !PyErr_Occurred()) {
+					as_operations_add_incr(ops, entry->bin, offset);
+					return AEROSPIKE_OK;
+				}
+				PyErr_Clear();
+			}
+			else if (PyFloat_Check(py_value)) {
+				as_operations_add_incr_double(ops, entry->bin, PyFloat_AsDouble(py_value));
+				return AEROSPIKE_OK;
+			}
+			// Other values are checked and converted as operate() does.
+			break;
+		case COMPILED_WRITE:
+			py_value = PyTuple_GET_ITEM(py_args, entry->arg);
+			if (pyobject_to_val(self, err, py_value, &val, static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+				return err->code;
+			}
+			as_operations_add_write(ops, entry->bin, (as_bin_value *) val);
+			return AEROSPIKE_OK;
+		default:
+			break;
+	}
+
+	return add_bound_op(self, err, template, entry, py_args, unicodeStrVector, static_pool, ops);
+}
+
+/*******************************************************************************
+ * PLACEHOLDER TYPE
+ ******************************************************************************/
+
+static PyObject * AerospikePlaceholder_Type_New(PyTypeObject * type, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	Py_ssize_t index = 0;
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"index", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "n:Placeholder", kwlist, &index) == false) {
+		return NULL;
+	}
+
+	if (index < 0) {
+		as_error err;
+		as_error_init(&err);
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Placeholder index should not be negative");
+		return raise_as_error(&err);
+	}
+
+	AerospikePlaceholder * self = (AerospikePlaceholder *) type->tp_alloc(type, 0);
+	if (self) {
+		self->index = index;
+	}
+	return (PyObject *) self;
+}
+
+static PyObject * AerospikePlaceholder_Type_Get_Index(AerospikePlaceholder * self, void * closure)
+{
+	return PyLong_FromSsize_t(self->index);
+}
+
+static PyObject * AerospikePlaceholder_Type_Repr(AerospikePlaceholder * self)
+{
+	return PyUnicode_FromFormat("aerospike.Placeholder(%zd)", self->index);
+}
+
+/*******************************************************************************
+ * OPERATION LIST TYPE
+ ******************************************************************************/
+
+static PyObject * AerospikeOperationList_Type_New(PyTypeObject * type, PyObject * args, PyObject * kwds)
+{
+	// Python Function Arguments
+	PyObject * py_operations = NULL;
+
+	AerospikeOperationList * self = NULL;
+	PyObject * py_fast = NULL;
+	PyObject * py_slots = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char * kwlist[] = {"operations", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O:OperationList", kwlist, &py_operations) == false) {
+		return NULL;
+	}
+
+	self = (AerospikeOperationList *) type->tp_alloc(type, 0);
+	if (!self) {
+		return NULL;
+	}
+
+	py_fast = PySequence_Fast(py_operations, "Operations should be of type list");
+	if (!py_fast || PyUnicode_Check(py_operations)) {
+		PyErr_Clear();
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Operations should be of type list");
+		goto CLEANUP;
+	}
+
+	Py_ssize_t size = PySequence_Fast_GET_SIZE(py_fast);
+	if (size > UINT16_MAX) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "OperationList can hold at most %d operations", UINT16_MAX);
+		goto CLEANUP;
+	}
+
+	self->templates = (operation_template *) PyMem_Calloc(size ? size : 1, sizeof(operation_template));
+	if (!self->templates) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to allocate operations");
+		goto CLEANUP;
+	}
+
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject * py_op = PySequence_Fast_GET_ITEM(py_fast, i);
+		operation_template * template = &self->templates[i];
+		self->size = i + 1;
+
+		if (!is_operation(py_op)) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "Operation must be a dict or an Operation");
+			goto CLEANUP;
+		}
+
+		// The operation is copied so later changes to it do not apply.
+		// Operation objects are copied into a dict, which is what the templates hold.
+		if (PyDict_Check(py_op)) {
+			template->py_op = PyDict_Copy(py_op);
+		}
+		else {
+			template->py_op = PyDict_New();
+			if (template->py_op && PyDict_Merge(template->py_op, py_op, 1) != 0) {
+				Py_CLEAR(template->py_op);
+			}
+		}
+		if (!template->py_op) {
+			PyErr_Clear();
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to copy operation");
+			goto CLEANUP;
+		}
+
+		template->operation = -1;
+		PyObject * py_operation = PyDict_GetItemString(template->py_op, "op");
+		if (py_operation && PyLong_Check(py_operation)) {
+			template->operation = PyLong_AsLong(py_operation);
+			PyErr_Clear();
+		}
+
+		Py_ssize_t pos = 0;
+		PyObject * py_key = NULL;
+		PyObject * py_value = NULL;
+		while (PyDict_Next(template->py_op, &pos, &py_key, &py_value)) {
+			if (!PyObject_TypeCheck(py_value, &AerospikePlaceholder_Type)) {
+				continue;
+			}
+			if (PyUnicode_Check(py_key) && PyUnicode_CompareWithASCIIString(py_key, "op") == 0) {
+				as_error_update(&err, AEROSPIKE_ERR_PARAM, "The op of an operation can not be a placeholder");
+				goto CLEANUP;
+			}
+
+			Py_ssize_t index = ((AerospikePlaceholder *) py_value)->index;
+			if (index >= self->placeholders) {
+				self->placeholders = index + 1;
+			}
+
+			if (!py_slots) {
+				py_slots = PyList_New(0);
+			}
+			PyObject * py_slot = Py_BuildValue("(On)", py_key, index);
+			if (!py_slots || !py_slot || PyList_Append(py_slots, py_slot) != 0) {
+				Py_XDECREF(py_slot);
+				PyErr_Clear();
+				as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to compile operation");
+				goto CLEANUP;
+			}
+			Py_DECREF(py_slot);
+		}
+
+		if (py_slots) {
+			template->py_slots = PyList_AsTuple(py_slots);
+			Py_CLEAR(py_slots);
+		}
+	}
+
+CLEANUP:
+	Py_XDECREF(py_fast);
+	Py_XDECREF(py_slots);
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_DECREF(self);
+		return raise_as_error(&err);
+	}
+
+	return (PyObject *) self;
+}
+
+PyDoc_STRVAR(bind_doc,
+"bind(*values) -> OperationList\n\
+\n\
+Returns the operations with each Placeholder(i) replaced by values[i], to be passed to operate() or operate_ordered().");
+
+static PyObject * AerospikeOperationList_Bind(AerospikeOperationList * self, PyObject * args)
+{
+	if (PyTuple_GET_SIZE(args) != self->placeholders) {
+		as_error err;
+		as_error_init(&err);
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "bind() takes %zd values, %zd given",
+			self->placeholders, PyTuple_GET_SIZE(args));
+		return raise_as_error(&err);
+	}
+
+	AerospikeBoundOperationList * bound = PyObject_New(AerospikeBoundOperationList, &AerospikeBoundOperationList_Type);
+	if (!bound) {
+		return NULL;
+	}
+	Py_INCREF(self);
+	bound->list = self;
+	Py_INCREF(args);
+	bound->py_args = args;
+	return (PyObject *) bound;
+}
+
+static Py_ssize_t AerospikeOperationList_Type_Length(AerospikeOperationList * self)
+{
+	return self->size;
+}
+
+static PyObject * AerospikeOperationList_Type_Get_Placeholders(AerospikeOperationList * self, void * closure)
+{
+	return PyLong_FromSsize_t(self->placeholders);
+}
+
+static PyObject * AerospikeOperationList_Type_Repr(AerospikeOperationList * self)
+{
+	return PyUnicode_FromFormat("<aerospike.OperationList size=%zd placeholders=%zd>",
+			self->size, self->placeholders);
+}
+
+static void AerospikeOperationList_Type_Dealloc(AerospikeOperationList * self)
+{
+	for (Py_ssize_t i = 0; i < self->size; i++) {
+		Py_XDECREF(self->templates[i].py_op);
+		Py_XDECREF(self->templates[i].py_slots);
+	}
+	PyMem_Free(self->templates);
+	Py_XDECREF(self->py_compiled);
+	Py_TYPE(self)->tp_free((PyObject *) self);
+}
+
+static Py_ssize_t AerospikeBoundOperationList_Type_Length(AerospikeBoundOperationList * self)
+{
+	return self->list->size;
+}
+
+static PyObject * AerospikeBoundOperationList_Type_Repr(AerospikeBoundOperationList * self)
+{
+	return PyUnicode_FromFormat("<aerospike.BoundOperationList size=%zd>", self->list->size);
+}
+
+static void AerospikeBoundOperationList_Type_Dealloc(AerospikeBoundOperationList * self)
+{
+	Py_DECREF(self->list);
+	Py_DECREF(self->py_args);
+	PyObject_Del(self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTORS
+ ******************************************************************************/
+
+static PyGetSetDef AerospikePlaceholder_Type_GetSet[] = {
+	{"index", (getter) AerospikePlaceholder_Type_Get_Index, NULL, "The index of the value bound to the placeholder.", NULL},
+	{NULL}
+};
+
+static PyTypeObject AerospikePlaceholder_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	.tp_name = "aerospike.Placeholder",
+	.tp_basicsize = sizeof(AerospikePlaceholder),
+	.tp_repr = (reprfunc) AerospikePlaceholder_Type_Repr,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "Placeholder(index)\n\n"
+			"Stands for a value of an operation of an OperationList, the\n"
+			"index-th value given to OperationList.bind().\n",
+	.tp_getset = AerospikePlaceholder_Type_GetSet,
+	.tp_new = AerospikePlaceholder_Type_New,
+};
+
+static PyMethodDef AerospikeOperationList_Type_Methods[] = {
+	{"bind", (PyCFunction) AerospikeOperationList_Bind, METH_VARARGS, bind_doc},
+	{NULL}
+};
+
+static PySequenceMethods AerospikeOperationList_Type_Sequence = {
+	.sq_length = (lenfunc) AerospikeOperationList_Type_Length,
+};
+
+static PyGetSetDef AerospikeOperationList_Type_GetSet[] = {
+	{"placeholders", (getter) AerospikeOperationList_Type_Get_Placeholders, NULL, "The number of values bind() takes.", NULL},
+	{NULL}
+};
+
+static PyTypeObject AerospikeOperationList_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	.tp_name = "aerospike.OperationList",
+	.tp_basicsize = sizeof(AerospikeOperationList),
+	.tp_dealloc = (destructor) AerospikeOperationList_Type_Dealloc,
+	.tp_repr = (reprfunc) AerospikeOperationList_Type_Repr,
+	.tp_as_sequence = &AerospikeOperationList_Type_Sequence,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "OperationList(operations)\n\n"
+			"A list of operations compiled once, to be passed to operate() and\n"
+			"operate_ordered(). Values given as Placeholder(i) are bound per call\n"
+			"with bind().\n",
+	.tp_methods = AerospikeOperationList_Type_Methods,
+	.tp_getset = AerospikeOperationList_Type_GetSet,
+	.tp_new = AerospikeOperationList_Type_New,
+};
+
+static PySequenceMethods AerospikeBoundOperationList_Type_Sequence = {
+	.sq_length = (lenfunc) AerospikeBoundOperationList_Type_Length,
+};
+
+static PyTypeObject AerospikeBoundOperationList_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	.tp_name = "aerospike.BoundOperationList",
+	.tp_basicsize = sizeof(AerospikeBoundOperationList),
+	.tp_dealloc = (destructor) AerospikeBoundOperationList_Type_Dealloc,
+	.tp_repr = (reprfunc) AerospikeBoundOperationList_Type_Repr,
+	.tp_as_sequence = &AerospikeBoundOperationList_Type_Sequence,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "An OperationList with its placeholders bound, returned by OperationList.bind().\n",
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeOperationList_Ready()
+{
+	if (PyType_Ready(&AerospikeBoundOperationList_Type) != 0) {
+		return NULL;
+	}
+	return PyType_Ready(&AerospikeOperationList_Type) == 0 ? &AerospikeOperationList_Type : NULL;
+}
+
+PyTypeObject * AerospikePlaceholder_Ready()
+{
+	return PyType_Ready(&AerospikePlaceholder_Type) == 0 ? &AerospikePlaceholder_Type : NULL;
+}
+
+bool AerospikeOperationList_Check(PyObject * py_obj)
+{
+	return py_obj && (PyObject_TypeCheck(py_obj, &AerospikeOperationList_Type) ||
+		Py_TYPE(py_obj) == &AerospikeBoundOperationList_Type);
+}
+
+Py_ssize_t operation_list_size(PyObject * py_ops)
+{
+	if (Py_TYPE(py_ops) == &AerospikeBoundOperationList_Type) {
+		return ((AerospikeBoundOperationList *) py_ops)->list->size;
+	}
+	return ((AerospikeOperationList *) py_ops)->size;
+}
+
+as_status operation_list_add_ops(AerospikeClient * self, as_error * err, PyObject * py_ops,
+	as_vector * unicodeStrVector, as_static_pool * static_pool, as_operations * ops,
+	PyObject ** py_compiled)
+{
+	AerospikeOperationList * list = NULL;
+	PyObject * py_args = NULL;
+
+	if (Py_TYPE(py_ops) == &AerospikeBoundOperationList_Type) {
+		list = ((AerospikeBoundOperationList *) py_ops)->list;
+		py_args = ((AerospikeBoundOperationList *) py_ops)->py_args;
+	}
+	else {
+		list = (AerospikeOperationList *) py_ops;
+		if (list->placeholders) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+				"OperationList has placeholders, pass the operations returned by bind()");
+		}
+	}
+
+	compiled_operations * compiled = NULL;
+	if (list->py_compiled) {
+		compiled = (compiled_operations *) PyCapsule_GetPointer(list->py_compiled, COMPILED_OPERATIONS_NAME);
+	}
+
+	// Conversions depend on the client, the operations are compiled again
+	// when the list is used with another one.
+	if (!compiled || compiled->client != self) {
+		PyObject * py_new = operation_list_compile(list, self, err);
+		if (!py_new) {
+			return err->code;
+		}
+		Py_XDECREF(list->py_compiled);
+		list->py_compiled = py_new;
+		compiled = (compiled_operations *) PyCapsule_GetPointer(py_new, COMPILED_OPERATIONS_NAME);
+	}
+
+	// Commands in flight keep the values they share when the list is compiled again.
+	Py_INCREF(list->py_compiled);
+	*py_compiled = list->py_compiled;
+
+	for (Py_ssize_t i = 0; i < list->size; i++) {
+		if (add_compiled_op(self, err, &list->templates[i], compiled, &compiled->entries[i], py_args,
+				unicodeStrVector, static_pool, ops) != AEROSPIKE_OK) {
+			return err->code;
+		}
+	}
+	return AEROSPIKE_OK;
+}
+
+bool compiled_cdt_ctx_copy(PyObject * py_ctx, as_cdt_ctx * cdt_ctx)
+{
+	if (!PyCapsule_IsValid(py_ctx, COMPILED_CTX_NAME)) {
+		return false;
+	}
+
+	as_cdt_ctx * compiled = (as_cdt_ctx *) PyCapsule_GetPointer(py_ctx, COMPILED_CTX_NAME);
+	as_cdt_ctx_init(cdt_ctx, compiled->list.size);
+	for (uint32_t i = 0; i < compiled->list.size; i++) {
+		as_cdt_ctx_item * item = (as_cdt_ctx_item *) as_vector_get(&compiled->list, i);
+		if (CTX_ITEM_HAS_VAL(item->type)) {
+			as_val_reserve(item->val.pval);
+		}
+		as_vector_append(&cdt_ctx->list, item);
+	}
+	return true;
+}
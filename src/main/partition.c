@@ -0,0 +1,302 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/as_atomic.h>
+#include <aerospike/as_cluster.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_node.h>
+#include <aerospike/as_partition.h>
+
+#include "client.h"
+#include "partition.h"
+
+/*******************************************************************************
+ * PARTITION MAP
+ ******************************************************************************/
+
+static void partition_map_namespace_clear(partition_map_namespace * map_ns)
+{
+	free(map_ns->owners);
+	map_ns->owners = NULL;
+	map_ns->owner_indexes = NULL;
+	Py_CLEAR(map_ns->py_nodes);
+	Py_CLEAR(map_ns->py_owners);
+}
+
+/*
+ * Copies the owners of every partition of table into map_ns. Returns true
+ * if any of them changed, false with err set when the owners cannot be
+ * allocated.
+ */
+static bool partition_map_namespace_read(partition_map_namespace * map_ns, as_partition_table * table,
+		as_error * err)
+{
+	bool changed = false;
+	uint32_t replica_size = table->replica_size;
+
+	if (replica_size > AS_MAX_REPLICATION_FACTOR) {
+		replica_size = AS_MAX_REPLICATION_FACTOR;
+	}
+
+	if (!map_ns->owners || map_ns->replica_size != replica_size) {
+		partition_map_namespace_clear(map_ns);
+		map_ns->owners = calloc(replica_size * AS_PARTITION_COUNT, AS_NODE_NAME_SIZE);
+		if (!map_ns->owners) {
+			as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate partition map");
+			return false;
+		}
+		map_ns->replica_size = replica_size;
+		changed = true;
+	}
+
+	for (uint32_t r = 0; r < replica_size; r++) {
+		for (uint32_t i = 0; i < AS_PARTITION_COUNT; i++) {
+			as_node * node = i < table->size ? (as_node *) as_load_ptr(&table->partitions[i].nodes[r]) : NULL;
+			char * owner = map_ns->owners[r * AS_PARTITION_COUNT + i];
+			const char * name = node ? node->name : "";
+
+			if (strncmp(owner, name, AS_NODE_NAME_SIZE)) {
+				strncpy(owner, name, AS_NODE_NAME_SIZE - 1);
+				changed = true;
+			}
+		}
+	}
+
+	return changed;
+}
+
+/*
+ * Builds the nodes tuple and the owners memoryview of map_ns from its owner
+ * names.
+ */
+static as_status partition_map_namespace_build(partition_map_namespace * map_ns, as_error * err)
+{
+	uint32_t count = map_ns->replica_size * AS_PARTITION_COUNT;
+	PyObject * py_nodes = PyList_New(0);
+	PyObject * py_buffer = PyBytes_FromStringAndSize(NULL, count * sizeof(int16_t));
+	PyObject * py_view = NULL;
+
+	Py_CLEAR(map_ns->py_nodes);
+	Py_CLEAR(map_ns->py_owners);
+	map_ns->owner_indexes = NULL;
+
+	if (!py_nodes || !py_buffer) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate partition map");
+		goto CLEANUP;
+	}
+
+	int16_t * indexes = (int16_t *) PyBytes_AS_STRING(py_buffer);
+	const char * last_name = NULL;
+	int16_t last_index = -1;
+
+	for (uint32_t i = 0; i < count; i++) {
+		const char * name = map_ns->owners[i];
+		if (!*name) {
+			indexes[i] = -1;
+			continue;
+		}
+		// Consecutive partitions mostly share their owner.
+		if (last_name && !strcmp(name, last_name)) {
+			indexes[i] = last_index;
+			continue;
+		}
+
+		Py_ssize_t n = PyList_GET_SIZE(py_nodes);
+		Py_ssize_t j;
+		for (j = 0; j < n; j++) {
+			if (!strcmp(PyUnicode_AsUTF8(PyList_GET_ITEM(py_nodes, j)), name)) {
+				break;
+			}
+		}
+		if (j == n) {
+			PyObject * py_name = PyUnicode_FromString(name);
+			if (!py_name || PyList_Append(py_nodes, py_name) != 0) {
+				Py_XDECREF(py_name);
+				as_error_update(err, AEROSPIKE_ERR_CLIENT, "Failed to get node name");
+				goto CLEANUP;
+			}
+			Py_DECREF(py_name);
+		}
+		last_name = name;
+		last_index = indexes[i] = (int16_t) j;
+	}
+
+	py_view = PyMemoryView_FromObject(py_buffer);
+	if (py_view) {
+		map_ns->py_owners = PyObject_CallMethod(py_view, "cast", "s(II)", "h",
+				map_ns->replica_size, (unsigned int) AS_PARTITION_COUNT);
+	}
+	map_ns->py_nodes = PyList_AsTuple(py_nodes);
+	if (!map_ns->py_owners || !map_ns->py_nodes) {
+		PyErr_Clear();
+		Py_CLEAR(map_ns->py_owners);
+		Py_CLEAR(map_ns->py_nodes);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to build partition map");
+		goto CLEANUP;
+	}
+	// The memoryview keeps the buffer alive.
+	map_ns->owner_indexes = indexes;
+
+CLEANUP:
+	Py_XDECREF(py_view);
+	Py_XDECREF(py_buffer);
+	Py_XDECREF(py_nodes);
+	return err->code;
+}
+
+as_status partition_map_refresh(AerospikeClient * self, as_error * err)
+{
+	if (!self || !self->as) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+	}
+
+	if (!self->is_conn_16) {
+		return as_error_update(err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+	}
+
+	as_cluster * cluster = self->as->cluster;
+	if (!cluster) {
+		return as_error_update(err, AEROSPIKE_ERR_CLUSTER, "invalid aerospike cluster");
+	}
+
+	struct partition_map_s * partition_map = self->partition_map;
+	if (!partition_map) {
+		partition_map = self->partition_map = calloc(1, sizeof(struct partition_map_s));
+		if (!partition_map) {
+			return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate partition map");
+		}
+	}
+
+	// Holding the nodes keeps the ones referenced by the tables alive while
+	// their names are copied.
+	as_nodes * nodes = as_nodes_reserve(cluster);
+	as_partition_tables * tables = &cluster->partition_tables;
+	uint32_t size = as_load_uint32(&tables->size);
+
+	for (uint32_t t = 0; t < size && err->code == AEROSPIKE_OK; t++) {
+		as_partition_table * table = (as_partition_table *) as_load_ptr(&tables->tables[t]);
+		if (!table) {
+			continue;
+		}
+
+		partition_map_namespace * map_ns = partition_map_get(self, table->ns);
+		if (!map_ns) {
+			partition_map_namespace * namespaces = realloc(partition_map->namespaces,
+					(partition_map->size + 1) * sizeof(partition_map_namespace));
+			if (!namespaces) {
+				as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate partition map");
+				break;
+			}
+			partition_map->namespaces = namespaces;
+			map_ns = &namespaces[partition_map->size++];
+			memset(map_ns, 0, sizeof(partition_map_namespace));
+			strncpy(map_ns->ns, table->ns, AS_NAMESPACE_MAX_SIZE - 1);
+		}
+
+		bool changed = partition_map_namespace_read(map_ns, table, err);
+		if (err->code != AEROSPIKE_OK) {
+			break;
+		}
+		if (changed || !map_ns->py_owners) {
+			partition_map_namespace_build(map_ns, err);
+		}
+	}
+
+	as_nodes_release(nodes);
+	return err->code;
+}
+
+partition_map_namespace * partition_map_get(AerospikeClient * self, const char * ns)
+{
+	struct partition_map_s * partition_map = self->partition_map;
+	if (!partition_map) {
+		return NULL;
+	}
+
+	for (uint32_t i = 0; i < partition_map->size; i++) {
+		if (!strcmp(partition_map->namespaces[i].ns, ns)) {
+			return &partition_map->namespaces[i];
+		}
+	}
+	return NULL;
+}
+
+PyObject * partition_map_master(partition_map_namespace * map_ns, uint16_t partition_id)
+{
+	if (!map_ns || !map_ns->owner_indexes || map_ns->replica_size == 0) {
+		return NULL;
+	}
+
+	int16_t index = map_ns->owner_indexes[partition_id];
+	if (index < 0) {
+		return NULL;
+	}
+	return PyTuple_GET_ITEM(map_ns->py_nodes, index);
+}
+
+void partition_map_free(struct partition_map_s * partition_map)
+{
+	if (!partition_map) {
+		return;
+	}
+
+	for (uint32_t i = 0; i < partition_map->size; i++) {
+		partition_map_namespace_clear(&partition_map->namespaces[i]);
+	}
+	free(partition_map->namespaces);
+	free(partition_map);
+}
+
+/*******************************************************************************
+ * KEY OWNERS
+ ******************************************************************************/
+
+as_status partition_owner_names(AerospikeClient * self, as_error * err, const char * ns,
+		const uint16_t * partition_ids, Py_ssize_t size, PyObject ** py_nodes)
+{
+	if (partition_map_refresh(self, err) != AEROSPIKE_OK) {
+		return err->code;
+	}
+
+	partition_map_namespace * map_ns = partition_map_get(self, ns);
+	if (!map_ns) {
+		return as_error_update(err, AEROSPIKE_ERR_NAMESPACE_NOT_FOUND, "Namespace %s not found in partition map", ns);
+	}
+
+	PyObject * py_list = PyList_New(size);
+	if (!py_list) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate node names");
+	}
+
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject * py_name = partition_map_master(map_ns, partition_ids[i]);
+		if (!py_name) {
+			py_name = Py_None;
+		}
+		Py_INCREF(py_name);
+		PyList_SET_ITEM(py_list, i, py_name);
+	}
+
+	*py_nodes = py_list;
+	return AEROSPIKE_OK;
+}
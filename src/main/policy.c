@@ -31,7 +31,10 @@
 #include "aerospike/as_job.h"
 
 #include "conversions.h"
+#include "expression.h"
 #include "policy.h"
+#include "policy_types.h"
+#include "serializer.h"
 #include "macros.h"
 
 #define MAP_WRITE_FLAGS_KEY "map_write_flags"
@@ -47,6 +50,39 @@ if (!PyDict_Check(py_policy)) {\
 }\
 __policy##_init(policy);\
 
+/*
+ * Policy objects such as aerospike.ReadPolicy are validated when they are
+ * created. They are resolved against the client defaults the first time
+ * they are used, and later calls only copy the cached struct.
+ */
+#define POLICY_INIT_FROM_OBJECT(__kind, __field, __converter, __config) \
+if (py_policy && AerospikePolicy_Check(py_policy)) {\
+	AerospikePolicy * py_policy_obj = (AerospikePolicy *) py_policy;\
+	as_error_reset(err);\
+	if (py_policy_obj->kind != __kind) {\
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "policy must be a dict or an aerospike.%s, not %s",\
+				AerospikePolicy_Kind_Name(__kind), Py_TYPE(py_policy)->tp_name);\
+	}\
+	if (!py_policy_obj->resolved ||\
+			memcmp(&py_policy_obj->config.__field, __config, sizeof(*policy)) != 0) {\
+		if (__converter(self, err, py_policy_obj->py_fields, policy, policy_p, __config,\
+				NULL, NULL, NULL, NULL) != AEROSPIKE_OK) {\
+			return err->code;\
+		}\
+		memcpy(&py_policy_obj->config.__field, __config, sizeof(*policy));\
+		memcpy(&py_policy_obj->policy.__field, policy, sizeof(*policy));\
+		py_policy_obj->resolved = true;\
+	}\
+	else {\
+		memcpy(policy, &py_policy_obj->policy.__field, sizeof(*policy));\
+	}\
+	if (py_policy_obj->py_expressions) {\
+		policy->base.filter_exp = ((AerospikeExpression *) py_policy_obj->py_expressions)->exp;\
+	}\
+	*policy_p = policy;\
+	return err->code;\
+}
+
 #define POLICY_UPDATE() \
 	*policy_p = policy;
 
@@ -78,14 +114,28 @@ __policy##_init(policy);\
 	if (exp_list) {\
 		PyObject* py_exp_list = PyDict_GetItemString(py_policy, "expressions");\
 		if (py_exp_list) {\
-			if (convert_exp_list(self, py_exp_list, &exp_list, err) == AEROSPIKE_OK) {\
+			bool exp_owned = false;\
+			if (get_as_exp(self, err, py_exp_list, &exp_list, &exp_owned) == AEROSPIKE_OK) {\
 				policy->base.filter_exp = exp_list;\
-				*exp_list_p = exp_list;\
+				if (exp_owned) {\
+					*exp_list_p = exp_list;\
+				}\
 			}\
 		}\
 	}\
 }
 
+/*
+ * read_blob_as is applied while the records are converted, it is only
+ * validated here.
+ */
+#define POLICY_CHECK_READ_BLOB_AS() {\
+	int read_blob_as;\
+	if (read_blob_as_from_policy(err, py_policy, &read_blob_as) != AEROSPIKE_OK) {\
+		return err->code;\
+	}\
+}
+
 #define POLICY_SET_PREDEXP_BASE_FIELD() {\
 	if (predexp_list) {\
 		PyObject* py_predexp_list = PyDict_GetItemString(py_policy, "predexp");\
@@ -164,6 +214,7 @@ AerospikeConstants aerospike_constants[] = {
 	{ SERIALIZER_USER                       ,   "SERIALIZER_USER" },
 	{ SERIALIZER_JSON                       ,   "SERIALIZER_JSON" },
 	{ SERIALIZER_NONE                       ,   "SERIALIZER_NONE" },
+	{ SERIALIZER_MSGPACK                    ,   "SERIALIZER_MSGPACK" },
 	{ SEND_BOOL_AS_PY_BYTES                 ,   "PY_BYTES" },
 	{ SEND_BOOL_AS_INTEGER                  ,   "INTEGER" },
 	{ SEND_BOOL_AS_AS_BOOL                  ,   "AS_BOOL" },
@@ -485,6 +536,10 @@ void set_scan_options(as_error *err, as_scan* scan_p, PyObject * py_options)
 					as_error_update(err, AEROSPIKE_ERR_PARAM, "Unable to set scan nobins");
 					break;
 				}
+			} else if (strcmp("callback_batch_size", key_name) == 0 ||
+					strcmp("batch_callback", key_name) == 0) {
+				// Read by callback_batch_options().
+				continue;
 			} else {
 				as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid value for scan options");
 				break;
@@ -584,6 +639,9 @@ as_status pyobject_to_policy_apply(AerospikeClient * self, as_error * err, PyObj
 		as_exp * exp_list,
 		as_exp ** exp_list_p)
 {
+	// Use the cached struct of a policy object
+	POLICY_INIT_FROM_OBJECT(POLICY_KIND_APPLY, apply, pyobject_to_policy_apply, config_apply_policy);
+
 	// Initialize Policy
 	POLICY_INIT(as_policy_apply);
 	
@@ -661,6 +719,9 @@ as_status pyobject_to_policy_query(AerospikeClient * self, as_error * err, PyObj
 		as_exp * exp_list,
 		as_exp ** exp_list_p)
 {
+	// Use the cached struct of a policy object
+	POLICY_INIT_FROM_OBJECT(POLICY_KIND_QUERY, query, pyobject_to_policy_query, config_query_policy);
+
 	// Initialize Policy
 	POLICY_INIT(as_policy_query);
 
@@ -705,6 +766,9 @@ as_status pyobject_to_policy_read(AerospikeClient * self, as_error * err, PyObje
 		as_exp * exp_list,
 		as_exp ** exp_list_p)
 {
+	// Use the cached struct of a policy object
+	POLICY_INIT_FROM_OBJECT(POLICY_KIND_READ, read, pyobject_to_policy_read, config_read_policy);
+
 	// Initialize Policy
 	POLICY_INIT(as_policy_read);
 	
@@ -728,6 +792,9 @@ as_status pyobject_to_policy_read(AerospikeClient * self, as_error * err, PyObje
 	POLICY_SET_FIELD(read_mode_ap, as_policy_read_mode_ap);
 	POLICY_SET_FIELD(read_mode_sc, as_policy_read_mode_sc);
 
+	// 6.1.0 new policy
+	POLICY_CHECK_READ_BLOB_AS();
+
 	// C client 4.6.7 new policy
 	POLICY_SET_PREDEXP_BASE_FIELD();
 
@@ -755,6 +822,9 @@ as_status pyobject_to_policy_remove(AerospikeClient * self, as_error * err, PyOb
 		as_exp * exp_list,
 		as_exp ** exp_list_p)
 {
+	// Use the cached struct of a policy object
+	POLICY_INIT_FROM_OBJECT(POLICY_KIND_REMOVE, remove, pyobject_to_policy_remove, config_remove_policy);
+
 	// Initialize Policy
 	POLICY_INIT(as_policy_remove);
 	
@@ -805,6 +875,9 @@ as_status pyobject_to_policy_scan(AerospikeClient * self, as_error * err, PyObje
 		as_exp * exp_list,
 		as_exp ** exp_list_p)
 {
+	// Use the cached struct of a policy object
+	POLICY_INIT_FROM_OBJECT(POLICY_KIND_SCAN, scan, pyobject_to_policy_scan, config_scan_policy);
+
 	// Initialize Policy
 	POLICY_INIT(as_policy_scan);
 
@@ -852,6 +925,9 @@ as_status pyobject_to_policy_write(AerospikeClient * self, as_error * err, PyObj
 		as_exp * exp_list,
 		as_exp ** exp_list_p)
 {
+	// Use the cached struct of a policy object
+	POLICY_INIT_FROM_OBJECT(POLICY_KIND_WRITE, write, pyobject_to_policy_write, config_write_policy);
+
 	// Initialize Policy
 	POLICY_INIT(as_policy_write);
 
@@ -903,6 +979,9 @@ as_status pyobject_to_policy_operate(AerospikeClient * self, as_error * err, PyO
 		as_exp * exp_list,
 		as_exp ** exp_list_p)
 {
+	// Use the cached struct of a policy object
+	POLICY_INIT_FROM_OBJECT(POLICY_KIND_OPERATE, operate, pyobject_to_policy_operate, config_operate_policy);
+
 	// Initialize Policy
 	POLICY_INIT(as_policy_operate);
 	
@@ -957,6 +1036,9 @@ as_status pyobject_to_policy_batch(AerospikeClient * self, as_error * err, PyObj
 		as_exp * exp_list,
 		as_exp ** exp_list_p)
 {
+	// Use the cached struct of a policy object
+	POLICY_INIT_FROM_OBJECT(POLICY_KIND_BATCH, batch, pyobject_to_policy_batch, config_batch_policy);
+
 	// Initialize Policy
 	POLICY_INIT(as_policy_batch);
 
@@ -982,6 +1064,9 @@ as_status pyobject_to_policy_batch(AerospikeClient * self, as_error * err, PyObj
 	POLICY_SET_FIELD(read_mode_ap, as_policy_read_mode_ap);
 	POLICY_SET_FIELD(read_mode_sc, as_policy_read_mode_sc);
 
+	// 6.1.0 new policy
+	POLICY_CHECK_READ_BLOB_AS();
+
 	// C client 4.6.7 new policy
 	POLICY_SET_PREDEXP_BASE_FIELD();
 
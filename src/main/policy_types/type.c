@@ -0,0 +1,383 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <structmember.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_policy.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "expression.h"
+#include "policy.h"
+#include "policy_types.h"
+#include "macros.h"
+
+#define POLICY_BASE_FIELDS \
+	"timeout", "total_timeout", "socket_timeout", "max_retries",\
+	"sleep_between_retries", "compress", "expressions"
+
+static const char * apply_policy_fields[] = {POLICY_BASE_FIELDS,
+	"key", "replica", "commit_level", "durable_delete", NULL};
+
+static const char * batch_policy_fields[] = {POLICY_BASE_FIELDS,
+	"concurrent", "allow_inline", "send_set_name", "deserialize", "replica",
+	"read_mode_ap", "read_mode_sc", "read_blob_as", "cdt_mode", NULL};
+
+static const char * operate_policy_fields[] = {POLICY_BASE_FIELDS,
+	"key", "gen", "commit_level", "replica", "durable_delete", "deserialize",
+	"exists", "read_mode_ap", "read_mode_sc", NULL};
+
+static const char * query_policy_fields[] = {POLICY_BASE_FIELDS,
+	"deserialize", NULL};
+
+static const char * read_policy_fields[] = {POLICY_BASE_FIELDS,
+	"key", "replica", "deserialize", "read_mode_ap", "read_mode_sc",
+	"read_blob_as", "cdt_mode", NULL};
+
+static const char * remove_policy_fields[] = {POLICY_BASE_FIELDS,
+	"generation", "key", "gen", "commit_level", "replica", "durable_delete", NULL};
+
+static const char * scan_policy_fields[] = {POLICY_BASE_FIELDS,
+	"durable_delete", "records_per_second", "max_records", NULL};
+
+static const char * write_policy_fields[] = {POLICY_BASE_FIELDS,
+	"key", "gen", "exists", "commit_level", "durable_delete", "replica",
+	"compression_threshold", NULL};
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTORS
+ ******************************************************************************/
+
+static PyObject * AerospikePolicy_Type_New(PyTypeObject * type, PyObject * args, PyObject * kwds);
+static int AerospikePolicy_Type_Init(AerospikePolicy * self, PyObject * args, PyObject * kwds);
+static PyObject * AerospikePolicy_Type_Repr(AerospikePolicy * self);
+static void AerospikePolicy_Type_Dealloc(AerospikePolicy * self);
+
+static PyTypeObject AerospikePolicy_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	"aerospike.Policy",                 // tp_name
+	sizeof(AerospikePolicy),            // tp_basicsize
+	0,                                  // tp_itemsize
+	(destructor) AerospikePolicy_Type_Dealloc,
+	                                    // tp_dealloc
+	0,                                  // tp_print
+	0,                                  // tp_getattr
+	0,                                  // tp_setattr
+	0,                                  // tp_compare
+	(reprfunc) AerospikePolicy_Type_Repr,
+	                                    // tp_repr
+	0,                                  // tp_as_number
+	0,                                  // tp_as_sequence
+	0,                                  // tp_as_mapping
+	0,                                  // tp_hash
+	0,                                  // tp_call
+	0,                                  // tp_str
+	0,                                  // tp_getattro
+	0,                                  // tp_setattro
+	0,                                  // tp_as_buffer
+	Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
+	                                    // tp_flags
+	"Base class of the pre-validated, immutable policy objects.\n",
+	                                    // tp_doc
+	0,                                  // tp_traverse
+	0,                                  // tp_clear
+	0,                                  // tp_richcompare
+	0,                                  // tp_weaklistoffset
+	0,                                  // tp_iter
+	0,                                  // tp_iternext
+	0,                                  // tp_methods
+	0,                                  // tp_members
+	0,                                  // tp_getset
+	0,                                  // tp_base
+	0,                                  // tp_dict
+	0,                                  // tp_descr_get
+	0,                                  // tp_descr_set
+	0,                                  // tp_dictoffset
+	(initproc) AerospikePolicy_Type_Init,
+	                                    // tp_init
+	0,                                  // tp_alloc
+	AerospikePolicy_Type_New,           // tp_new
+	0,                                  // tp_free
+	0,                                  // tp_is_gc
+	0                                   // tp_bases
+};
+
+/*
+ * The concrete policy types only differ from aerospike.Policy by name,
+ * everything else is inherited when PyType_Ready() is called.
+ */
+#define POLICY_KIND_TYPE(__name, __doc) {\
+	PyVarObject_HEAD_INIT(NULL, 0)\
+	.tp_name = "aerospike." __name,\
+	.tp_basicsize = sizeof(AerospikePolicy),\
+	.tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,\
+	.tp_doc = __doc,\
+	.tp_base = &AerospikePolicy_Type,\
+}
+
+static PyTypeObject AerospikePolicy_Kind_Types[POLICY_KIND_COUNT] = {
+	[POLICY_KIND_APPLY] = POLICY_KIND_TYPE("ApplyPolicy",
+			"ApplyPolicy(policy=None, **fields)\n\nA pre-validated apply policy.\n"),
+	[POLICY_KIND_BATCH] = POLICY_KIND_TYPE("BatchPolicy",
+			"BatchPolicy(policy=None, **fields)\n\nA pre-validated batch policy.\n"),
+	[POLICY_KIND_OPERATE] = POLICY_KIND_TYPE("OperatePolicy",
+			"OperatePolicy(policy=None, **fields)\n\nA pre-validated operate policy.\n"),
+	[POLICY_KIND_QUERY] = POLICY_KIND_TYPE("QueryPolicy",
+			"QueryPolicy(policy=None, **fields)\n\nA pre-validated query policy.\n"),
+	[POLICY_KIND_READ] = POLICY_KIND_TYPE("ReadPolicy",
+			"ReadPolicy(policy=None, **fields)\n\nA pre-validated read policy.\n"),
+	[POLICY_KIND_REMOVE] = POLICY_KIND_TYPE("RemovePolicy",
+			"RemovePolicy(policy=None, **fields)\n\nA pre-validated remove policy.\n"),
+	[POLICY_KIND_SCAN] = POLICY_KIND_TYPE("ScanPolicy",
+			"ScanPolicy(policy=None, **fields)\n\nA pre-validated scan policy.\n"),
+	[POLICY_KIND_WRITE] = POLICY_KIND_TYPE("WritePolicy",
+			"WritePolicy(policy=None, **fields)\n\nA pre-validated write policy.\n"),
+};
+
+static const char ** AerospikePolicy_Kind_Fields[POLICY_KIND_COUNT] = {
+	[POLICY_KIND_APPLY] = apply_policy_fields,
+	[POLICY_KIND_BATCH] = batch_policy_fields,
+	[POLICY_KIND_OPERATE] = operate_policy_fields,
+	[POLICY_KIND_QUERY] = query_policy_fields,
+	[POLICY_KIND_READ] = read_policy_fields,
+	[POLICY_KIND_REMOVE] = remove_policy_fields,
+	[POLICY_KIND_SCAN] = scan_policy_fields,
+	[POLICY_KIND_WRITE] = write_policy_fields,
+};
+
+/*******************************************************************************
+ * HELPERS
+ ******************************************************************************/
+
+static int get_policy_kind(AerospikePolicy * self)
+{
+	int kind;
+
+	for (kind = 0; kind < POLICY_KIND_COUNT; kind++) {
+		if (PyObject_TypeCheck((PyObject *) self, &AerospikePolicy_Kind_Types[kind])) {
+			return kind;
+		}
+	}
+	return -1;
+}
+
+static bool is_policy_field(int kind, const char * name)
+{
+	const char ** field;
+
+	for (field = AerospikePolicy_Kind_Fields[kind]; *field; field++) {
+		if (strcmp(*field, name) == 0) {
+			return true;
+		}
+	}
+	return false;
+}
+
+#define VALIDATE_POLICY(__policy, __field, __converter) {\
+	__policy * policy_p = NULL;\
+	__policy##_init(&defaults.__field);\
+	return __converter(NULL, err, self->py_fields, &policy.__field, &policy_p,\
+			&defaults.__field, NULL, NULL, NULL, NULL);\
+}
+
+/**
+ * Run the fields through the same conversion a policy dict goes through,
+ * so that invalid values are reported when the object is created.
+ */
+static as_status validate_policy_fields(AerospikePolicy * self, as_error * err)
+{
+	as_policy_any defaults;
+	as_policy_any policy;
+
+	switch (self->kind) {
+		case POLICY_KIND_APPLY:
+			VALIDATE_POLICY(as_policy_apply, apply, pyobject_to_policy_apply);
+		case POLICY_KIND_BATCH:
+			VALIDATE_POLICY(as_policy_batch, batch, pyobject_to_policy_batch);
+		case POLICY_KIND_OPERATE:
+			VALIDATE_POLICY(as_policy_operate, operate, pyobject_to_policy_operate);
+		case POLICY_KIND_QUERY:
+			VALIDATE_POLICY(as_policy_query, query, pyobject_to_policy_query);
+		case POLICY_KIND_READ:
+			VALIDATE_POLICY(as_policy_read, read, pyobject_to_policy_read);
+		case POLICY_KIND_REMOVE:
+			VALIDATE_POLICY(as_policy_remove, remove, pyobject_to_policy_remove);
+		case POLICY_KIND_SCAN:
+			VALIDATE_POLICY(as_policy_scan, scan, pyobject_to_policy_scan);
+		case POLICY_KIND_WRITE:
+			VALIDATE_POLICY(as_policy_write, write, pyobject_to_policy_write);
+	}
+
+	return as_error_update(err, AEROSPIKE_ERR_PARAM, "Unknown policy type");
+}
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static PyObject * AerospikePolicy_Type_New(PyTypeObject * type, PyObject * args, PyObject * kwds)
+{
+	AerospikePolicy * self = (AerospikePolicy *) type->tp_alloc(type, 0);
+
+	if (self) {
+		self->kind = -1;
+		self->py_fields = NULL;
+		self->py_expressions = NULL;
+		self->resolved = false;
+	}
+
+	return (PyObject *) self;
+}
+
+static int AerospikePolicy_Type_Init(AerospikePolicy * self, PyObject * args, PyObject * kwds)
+{
+	PyObject * py_policy = NULL;
+	PyObject * py_key = NULL;
+	PyObject * py_value = NULL;
+	Py_ssize_t pos = 0;
+
+	as_error err;
+	as_error_init(&err);
+
+	self->kind = get_policy_kind(self);
+	if (self->kind < 0) {
+		PyErr_SetString(PyExc_TypeError, "aerospike.Policy cannot be instantiated directly");
+		return -1;
+	}
+
+	// Policies are immutable, clients may hold the policy resolved from the fields.
+	if (self->py_fields) {
+		PyErr_Format(PyExc_TypeError, "%s is immutable and cannot be initialized again",
+				AerospikePolicy_Kind_Name(self->kind));
+		return -1;
+	}
+
+	if (PyTuple_Size(args) > 1) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "%s() takes at most 1 positional argument", AerospikePolicy_Kind_Name(self->kind));
+		goto CLEANUP;
+	}
+
+	if (PyTuple_Size(args) == 1) {
+		py_policy = PyTuple_GetItem(args, 0);
+		if (py_policy != Py_None && !PyDict_Check(py_policy)) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "policy must be a dict");
+			goto CLEANUP;
+		}
+	}
+
+	self->py_fields = PyDict_New();
+	if (!self->py_fields) {
+		return -1;
+	}
+
+	if ((py_policy && py_policy != Py_None && PyDict_Update(self->py_fields, py_policy) < 0) ||
+			(kwds && PyDict_Update(self->py_fields, kwds) < 0)) {
+		return -1;
+	}
+
+	while (PyDict_Next(self->py_fields, &pos, &py_key, &py_value)) {
+		if (!PyString_Check(py_key) || !is_policy_field(self->kind, PyString_AsString(py_key))) {
+			PyObject * py_key_repr = PyObject_Repr(py_key);
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "%s is not a valid %s field",
+					py_key_repr ? PyString_AsString(py_key_repr) : "key",
+					AerospikePolicy_Kind_Name(self->kind));
+			Py_XDECREF(py_key_repr);
+			goto CLEANUP;
+		}
+	}
+
+	py_value = PyDict_GetItemString(self->py_fields, "expressions");
+	if (py_value) {
+		if (!AerospikeExpression_Check(py_value)) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "expressions must be an aerospike.Expression, see Client.compile_expression()");
+			goto CLEANUP;
+		}
+		Py_INCREF(py_value);
+		self->py_expressions = py_value;
+		PyDict_DelItemString(self->py_fields, "expressions");
+	}
+
+	validate_policy_fields(self, &err);
+
+CLEANUP:
+
+	if (err.code != AEROSPIKE_OK) {
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return -1;
+	}
+
+	return 0;
+}
+
+static PyObject * AerospikePolicy_Type_Repr(AerospikePolicy * self)
+{
+	if (!self->py_fields) {
+		return PyUnicode_FromFormat("%s()", Py_TYPE(self)->tp_name);
+	}
+
+	if (self->py_expressions) {
+		return PyUnicode_FromFormat("%s(%R, expressions=%R)", Py_TYPE(self)->tp_name,
+				self->py_fields, self->py_expressions);
+	}
+
+	return PyUnicode_FromFormat("%s(%R)", Py_TYPE(self)->tp_name, self->py_fields);
+}
+
+static void AerospikePolicy_Type_Dealloc(AerospikePolicy * self)
+{
+	Py_CLEAR(self->py_fields);
+	Py_CLEAR(self->py_expressions);
+	Py_TYPE(self)->tp_free((PyObject *) self);
+}
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikePolicy_Ready()
+{
+	return PyType_Ready(&AerospikePolicy_Type) == 0 ? &AerospikePolicy_Type : NULL;
+}
+
+PyTypeObject * AerospikePolicy_Kind_Ready(int kind)
+{
+	if (kind < 0 || kind >= POLICY_KIND_COUNT) {
+		return NULL;
+	}
+	return PyType_Ready(&AerospikePolicy_Kind_Types[kind]) == 0 ? &AerospikePolicy_Kind_Types[kind] : NULL;
+}
+
+const char * AerospikePolicy_Kind_Name(int kind)
+{
+	if (kind < 0 || kind >= POLICY_KIND_COUNT) {
+		return "Policy";
+	}
+	return AerospikePolicy_Kind_Types[kind].tp_name + strlen("aerospike.");
+}
+
+bool AerospikePolicy_Check(PyObject * py_obj)
+{
+	return py_obj && PyObject_TypeCheck(py_obj, &AerospikePolicy_Type);
+}
@@ -0,0 +1,165 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/as_bytes.h>
+
+#include "pool.h"
+
+// Blocks kept per thread once released, the same 4096 as_bytes the pool
+// used to reserve on the stack for every command.
+#define AS_POOL_CACHED_BLOCKS 64
+
+typedef struct {
+	as_bytes_block * blocks;
+	uint32_t size;
+} as_bytes_block_cache;
+
+static pthread_key_t block_cache_key;
+static pthread_once_t block_cache_once = PTHREAD_ONCE_INIT;
+
+/*******************************************************************************
+ * PER-THREAD BLOCK CACHE
+ ******************************************************************************/
+
+static void block_cache_destroy(void * udata)
+{
+	as_bytes_block_cache * cache = (as_bytes_block_cache *) udata;
+
+	while (cache->blocks) {
+		as_bytes_block * block = cache->blocks;
+		cache->blocks = block->next;
+		free(block);
+	}
+	free(cache);
+}
+
+static void block_cache_key_init(void)
+{
+	pthread_key_create(&block_cache_key, block_cache_destroy);
+}
+
+static as_bytes_block_cache * block_cache_get(void)
+{
+	pthread_once(&block_cache_once, block_cache_key_init);
+
+	as_bytes_block_cache * cache = (as_bytes_block_cache *) pthread_getspecific(block_cache_key);
+	if (!cache) {
+		cache = (as_bytes_block_cache *) calloc(1, sizeof(as_bytes_block_cache));
+		if (cache && pthread_setspecific(block_cache_key, cache) != 0) {
+			free(cache);
+			cache = NULL;
+		}
+	}
+
+	return cache;
+}
+
+static as_bytes_block * block_acquire(void)
+{
+	as_bytes_block_cache * cache = block_cache_get();
+
+	if (cache && cache->blocks) {
+		as_bytes_block * block = cache->blocks;
+		cache->blocks = block->next;
+		cache->size--;
+		return block;
+	}
+
+	return (as_bytes_block *) malloc(sizeof(as_bytes_block));
+}
+
+static void block_release(as_bytes_block * block)
+{
+	as_bytes_block_cache * cache = block_cache_get();
+
+	if (cache && cache->size < AS_POOL_CACHED_BLOCKS) {
+		block->next = cache->blocks;
+		cache->blocks = block;
+		cache->size++;
+		return;
+	}
+
+	free(block);
+}
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+as_static_pool * static_pool_new(void)
+{
+	return (as_static_pool *) calloc(1, sizeof(as_static_pool));
+}
+
+void static_pool_free(as_static_pool * static_pool)
+{
+	if (static_pool) {
+		static_pool_reset(static_pool);
+		free(static_pool);
+	}
+}
+
+as_bytes * static_pool_get_bytes(as_static_pool * static_pool)
+{
+	if (!static_pool) {
+		return NULL;
+	}
+
+	if (!static_pool->blocks || static_pool->block_used == AS_POOL_BLOCK_SIZE) {
+		as_bytes_block * block = block_acquire();
+		if (!block) {
+			return NULL;
+		}
+		block->next = static_pool->blocks;
+		static_pool->blocks = block;
+		static_pool->block_used = 0;
+	}
+
+	// Blocks are reused, an entry which is never initialised must still be
+	// safe to destroy.
+	as_bytes * bytes = &static_pool->blocks->bytes[static_pool->block_used++];
+	memset(bytes, 0, sizeof(as_bytes));
+	static_pool->current_bytes_id++;
+
+	return bytes;
+}
+
+void static_pool_reset(as_static_pool * static_pool)
+{
+	as_bytes_block * block = static_pool->blocks;
+	uint32_t used = static_pool->block_used;
+
+	while (block) {
+		as_bytes_block * next = block->next;
+		for (uint32_t i = 0; i < used; i++) {
+			as_bytes_destroy(&block->bytes[i]);
+		}
+		block_release(block);
+		block = next;
+		used = AS_POOL_BLOCK_SIZE;
+	}
+
+	static_pool->blocks = NULL;
+	static_pool->block_used = 0;
+	static_pool->current_bytes_id = 0;
+	Py_CLEAR(static_pool->py_buffers);
+}
@@ -27,6 +27,7 @@
 #include "query.h"
 #include "policy.h"
 #include "operate.h"
+#include "cdt_operation_utils.h"
 
 AerospikeQuery* AerospikeQuery_Add_Ops(AerospikeQuery * self, PyObject * args, PyObject * kwds)
 {
@@ -46,9 +47,10 @@ AerospikeQuery* AerospikeQuery_Add_Ops(AerospikeQuery * self, PyObject * args, P
 	long operation;
 	self->unicodeStrVector = as_vector_create(sizeof(char *), 128);
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-	self->static_pool = &static_pool;
+	// The operations are kept by the query, so are the bytes they use.
+	if (!self->static_pool) {
+		self->static_pool = static_pool_new();
+	}
 
 	as_error err;
 	as_error_init(&err);
@@ -73,7 +75,7 @@ AerospikeQuery* AerospikeQuery_Add_Ops(AerospikeQuery * self, PyObject * args, P
 
 		for (int i = 0; i < size; i++) {
 			PyObject * py_val = PyList_GetItem(py_ops, (Py_ssize_t)i);
-			if (PyDict_Check(py_val)) {
+			if (is_operation(py_val)) {
 				if (add_op(self->client, &err, py_val, self->unicodeStrVector, self->static_pool, self->query.ops, &operation, &return_type) != AEROSPIKE_OK) { //something wrong with ops bin name and value
 					as_error_update(&err, AEROSPIKE_ERR_PARAM, "Failed to convert ops.");
 					goto CLEANUP;
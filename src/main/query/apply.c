@@ -48,9 +48,6 @@ AerospikeQuery * AerospikeQuery_Apply(AerospikeQuery * self, PyObject * args, Py
 		return NULL;
 	}
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	// Aerospike error object
 	as_error err;
 	// Initialize error object
@@ -106,11 +103,16 @@ AerospikeQuery * AerospikeQuery_Apply(AerospikeQuery * self, PyObject * args, Py
 		 	goto CLEANUP;
 		}
 
+		// The arguments are kept by the query, so are the bytes they use.
+		if (!self->static_pool) {
+			self->static_pool = static_pool_new();
+		}
+
 		arglist = as_arraylist_new(size, 0);
 		for ( int i = 0; i < size; i++ ) {
 			PyObject * py_val = PyList_GetItem(py_args, (Py_ssize_t)i);
 			as_val * val = NULL;
-			pyobject_to_val(self->client, &err, py_val, &val, &static_pool, SERIALIZER_PYTHON);
+			pyobject_to_val(self->client, &err, py_val, &val, self->static_pool, SERIALIZER_PYTHON);
 			if ( err.code != AEROSPIKE_OK ) {
 				as_error_update(&err, err.code, NULL);
 				as_arraylist_destroy(arglist);
@@ -130,8 +132,6 @@ AerospikeQuery * AerospikeQuery_Apply(AerospikeQuery * self, PyObject * args, Py
 	as_query_apply(&self->query, module, function, (as_list *) arglist);
 	Py_END_ALLOW_THREADS
 CLEANUP:
-	POOL_DESTROY(&static_pool);
-
 	if (py_ufunction) {
 		Py_DECREF(py_ufunction);
 	}
@@ -144,13 +144,7 @@ CLEANUP:
 		PyObject * py_err = NULL;
 		error_to_pyobject(&err, &py_err);
 		PyObject *exception_type = raise_exception(&err);
-		if(PyObject_HasAttrString(exception_type, "module")) {
-			PyObject_SetAttrString(exception_type, "module", py_module);
-		} 
-		if(PyObject_HasAttrString(exception_type, "func")) {
-			PyObject_SetAttrString(exception_type, "func", py_function);
-		}
-		PyErr_SetObject(exception_type, py_err);
+		raise_exception_with_attrs(exception_type, py_err, "module", py_module, "func", py_function, NULL);
 		Py_DECREF(py_err);
 		return NULL;
 	}
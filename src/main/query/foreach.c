@@ -23,6 +23,7 @@
 #include <aerospike/as_query.h>
 #include <aerospike/as_arraylist.h>
 
+#include "callback_batch.h"
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
@@ -34,41 +35,23 @@ typedef struct {
 	as_error error;
 	PyObject * callback;
 	AerospikeClient * client;
+	bool batch_callback;
 } LocalData;
 
-
-static bool each_result(const as_val * val, void * udata)
+/*
+ * Calls the Python callback with py_result, which it steals.
+ * Must be called with the GIL held.
+ */
+static bool invoke_callback(LocalData * data, PyObject * py_result)
 {
 	bool rval = true;
-
-	if (!val) {
-		return false;
-	}
-
-	// Extract callback user-data
-	LocalData * data = (LocalData *) udata;
 	as_error * err = &data->error;
 	PyObject * py_callback = data->callback;
 
 	// Python Function Arguments and Result Value
 	PyObject * py_arglist = NULL;
-	PyObject * py_result  = NULL;
 	PyObject * py_return = NULL;
 
-	// Lock Python State
-	PyGILState_STATE gstate;
-	gstate = PyGILState_Ensure();
-
-	// Convert as_val to a Python Object
-	val_to_pyobject(data->client, err, val, &py_result);
-	
-	// The record could not be converted to a python object
-	if (!py_result) {
-		//TBD set error here
-		// Must release the interpreter lock before returning
-		PyGILState_Release(gstate);
-		return true;
-	}
 	// Build Python Function Arguments
 	py_arglist = PyTuple_New(1);
 	PyTuple_SetItem(py_arglist, 0, py_result);
@@ -99,12 +82,70 @@ static bool each_result(const as_val * val, void * udata)
 		Py_DECREF(py_return);
 	}
 
+	return rval;
+}
+
+static bool each_result(const as_val * val, void * udata)
+{
+	bool rval = true;
+
+	if (!val) {
+		return false;
+	}
+
+	// Extract callback user-data
+	LocalData * data = (LocalData *) udata;
+	as_error * err = &data->error;
+
+	PyObject * py_result  = NULL;
+
+	// Lock Python State
+	PyGILState_STATE gstate;
+	gstate = PyGILState_Ensure();
+
+	// Convert as_val to a Python Object
+	val_to_pyobject(data->client, err, val, &py_result);
+	
+	// The record could not be converted to a python object
+	if (!py_result) {
+		//TBD set error here
+		// Must release the interpreter lock before returning
+		PyGILState_Release(gstate);
+		return true;
+	}
+
+	rval = invoke_callback(data, py_result);
+
 	// Release Python State
 	PyGILState_Release(gstate);
 
 	return rval;
 }
 
+/*
+ * Receives the results of a callback batch, with the GIL held. They are
+ * passed to the callback one at a time, or all at once with batch_callback.
+ */
+static bool each_batch(callback_batch * batch, PyObject * py_results)
+{
+	LocalData * data = (LocalData *) batch->udata;
+
+	if (data->batch_callback) {
+		Py_INCREF(py_results);
+		return invoke_callback(data, py_results);
+	}
+
+	for (Py_ssize_t i = 0; i < PyList_GET_SIZE(py_results); i++) {
+		PyObject * py_result = PyList_GET_ITEM(py_results, i);
+		Py_INCREF(py_result);
+		if (!invoke_callback(data, py_result)) {
+			return false;
+		}
+	}
+
+	return true;
+}
+
 PyObject * AerospikeQuery_Foreach(AerospikeQuery * self, PyObject * args, PyObject * kwds)
 {
 	// Python Function Arguments
@@ -124,8 +165,12 @@ PyObject * AerospikeQuery_Foreach(AerospikeQuery * self, PyObject * args, PyObje
 	LocalData data;
 	data.callback = py_callback;
 	data.client = self->client;
+	data.batch_callback = false;
 	as_error_init(&data.error);
 
+	callback_batch batch;
+	uint32_t batch_size = 0;
+
 	// Aerospike Client Arguments
 	as_error err;
 	as_policy_query query_policy;
@@ -163,14 +208,31 @@ PyObject * AerospikeQuery_Foreach(AerospikeQuery * self, PyObject * args, PyObje
 		goto CLEANUP;
 	}
 
+	if (callback_batch_options(&err, py_options, &batch_size, &data.batch_callback) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (batch_size) {
+		callback_batch_init(&batch, self->client, batch_size, each_batch, &data);
+	}
+
 	// We are spawning multiple threads
 	PyThreadState * _save = PyEval_SaveThread();
 
 	// Invoke operation
-	aerospike_query_foreach(self->client->as, &err, query_policy_p, &self->query, each_result, &data);
+	if (batch_size) {
+		aerospike_query_foreach(self->client->as, &err, query_policy_p, &self->query, callback_batch_add, &batch);
+	} else {
+		aerospike_query_foreach(self->client->as, &err, query_policy_p, &self->query, each_result, &data);
+	}
 
 	// We are done using multiple threads
 	PyEval_RestoreThread(_save);
+
+	if (batch_size) {
+		// Hands over what is left in the per thread buffers.
+		callback_batch_destroy(&batch, &err);
+	}
 	if (data.error.code != AEROSPIKE_OK) {
 		as_error_update(&data.error, data.error.code, NULL);
 		goto CLEANUP;
@@ -201,10 +263,7 @@ CLEANUP:
 			error_to_pyobject(&data.error, &py_err);
 			exception_type = raise_exception(&data.error);
 		}
-		if (PyObject_HasAttrString(exception_type, "name")) {
-			PyObject_SetAttrString(exception_type, "name", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
+		raise_exception_with_attrs(exception_type, py_err, "name", Py_None, NULL);
 		Py_DECREF(py_err);
 		return NULL;
 	}
@@ -0,0 +1,163 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+#include <aerospike/aerospike_query.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_query.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "query.h"
+#include "result_iterator.h"
+
+typedef struct {
+	aerospike * as;
+	as_query * query;
+	PyObject * py_policy;
+	as_policy_query query_policy;
+	as_policy_query * query_policy_p;
+	as_exp exp_list;
+	as_exp * exp_list_p;
+	as_predexp_list predexp_list;
+	as_predexp_list * predexp_list_p;
+} QueryCommand;
+
+void AerospikeQuery_Command_Execute(void * command, as_error * err,
+		AerospikeResultIterator_Callback callback, void * udata)
+{
+	QueryCommand * cmd = (QueryCommand *) command;
+
+	aerospike_query_foreach(cmd->as, err, cmd->query_policy_p, cmd->query, callback, udata);
+}
+
+void AerospikeQuery_Command_Destroy(void * command)
+{
+	QueryCommand * cmd = (QueryCommand *) command;
+
+	if (cmd->exp_list_p) {
+		as_exp_destroy(cmd->exp_list_p);
+	}
+
+	if (cmd->predexp_list_p) {
+		as_predexp_list_destroy(&cmd->predexp_list);
+	}
+
+	// The policy may lend its compiled aerospike.Expression to the query policy.
+	Py_XDECREF(cmd->py_policy);
+	free(cmd);
+}
+
+void * AerospikeQuery_Command_New(AerospikeQuery * self, as_error * err, PyObject * py_policy, PyObject * py_options)
+{
+	QueryCommand * cmd = NULL;
+
+	if (set_query_options(err, py_options, &self->query) != AEROSPIKE_OK) {
+		return NULL;
+	}
+
+	// The command outlives this call, it is owned by the iterator.
+	cmd = (QueryCommand *) calloc(1, sizeof(QueryCommand));
+	cmd->as = self->client->as;
+	cmd->query = &self->query;
+
+	// Convert python policy object to as_policy_query
+	pyobject_to_policy_query(self->client, err, py_policy, &cmd->query_policy, &cmd->query_policy_p,
+			&self->client->as->config.policies.query, &cmd->predexp_list, &cmd->predexp_list_p,
+			&cmd->exp_list, &cmd->exp_list_p);
+	if (err->code != AEROSPIKE_OK) {
+		AerospikeQuery_Command_Destroy(cmd);
+		return NULL;
+	}
+
+	Py_XINCREF(py_policy);
+	cmd->py_policy = py_policy;
+
+	return cmd;
+}
+
+/**
+ *******************************************************************************************************
+ * Starts the query and returns an iterator over its results. Results are
+ * converted as they arrive, and at most queue_size of them are buffered.
+ *
+ * @param self                  AerospikeQuery object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an aerospike.ResultIterator.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeQuery_Iter_Results(AerospikeQuery * self, PyObject * args, PyObject * kwds)
+{
+	PyObject * py_policy = NULL;
+	PyObject * py_options = NULL;
+	PyObject * py_queue_size = NULL;
+	PyObject * py_iterator = NULL;
+	void * cmd = NULL;
+	uint32_t queue_size = 0;
+
+	static char * kwlist[] = {"policy", "options", "queue_size", NULL};
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|OOO:iter_results", kwlist,
+			&py_policy, &py_options, &py_queue_size) == false) {
+		return NULL;
+	}
+
+	as_error err;
+	as_error_init(&err);
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->client->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (AerospikeResultIterator_Queue_Size(&err, py_queue_size, &queue_size) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	cmd = AerospikeQuery_Command_New(self, &err, py_policy, py_options);
+	if (!cmd) {
+		goto CLEANUP;
+	}
+
+	py_iterator = AerospikeResultIterator_New(self->client, (PyObject *) self, queue_size,
+			AerospikeQuery_Command_Execute, cmd, AerospikeQuery_Command_Destroy, &err);
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_iterator;
+}
@@ -23,6 +23,7 @@
 #include <aerospike/as_query.h>
 #include <aerospike/as_arraylist.h>
 
+#include "callback_batch.h"
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
@@ -65,6 +66,19 @@ static bool each_result(const as_val * val, void * udata)
 	return true;
 }
 
+/*
+ * Receives the records of a callback batch, with the GIL held.
+ */
+static bool each_batch(callback_batch * batch, PyObject * py_results)
+{
+	LocalData * data = (LocalData *) batch->udata;
+	Py_ssize_t size = PyList_GET_SIZE(data->py_results);
+
+	PyList_SetSlice(data->py_results, size, size, py_results);
+
+	return true;
+}
+
 PyObject * AerospikeQuery_Results(AerospikeQuery * self, PyObject * args, PyObject * kwds)
 {
 	PyObject * py_policy = NULL;
@@ -76,6 +90,10 @@ PyObject * AerospikeQuery_Results(AerospikeQuery * self, PyObject * args, PyObje
 	LocalData data;
 	data.client = self->client;
 
+	callback_batch batch;
+	uint32_t batch_size = 0;
+	bool batch_callback = false;
+
 	if (PyArg_ParseTupleAndKeywords(args, kwds, "|OO:results", kwlist, &py_policy, &py_options) == false) {
 		return NULL;
 	}
@@ -115,15 +133,32 @@ PyObject * AerospikeQuery_Results(AerospikeQuery * self, PyObject * args, PyObje
 		goto CLEANUP;
 	}
 
+	if (callback_batch_options(&err, py_options, &batch_size, &batch_callback) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
 	py_results = PyList_New(0);
 	data.py_results = py_results;
 
+	if (batch_size) {
+		callback_batch_init(&batch, self->client, batch_size, each_batch, &data);
+	}
+
 	PyThreadState * _save = PyEval_SaveThread();
 
-	aerospike_query_foreach(self->client->as, &err, query_policy_p, &self->query, each_result, &data);
+	if (batch_size) {
+		aerospike_query_foreach(self->client->as, &err, query_policy_p, &self->query, callback_batch_add, &batch);
+	} else {
+		aerospike_query_foreach(self->client->as, &err, query_policy_p, &self->query, each_result, &data);
+	}
 
 	PyEval_RestoreThread(_save);
 
+	if (batch_size) {
+		// Hands over what is left in the per thread buffers.
+		callback_batch_destroy(&batch, &err);
+	}
+
 CLEANUP:/*??trace()*/
 	if (exp_list_p) {
 		as_exp_destroy(exp_list_p);;
@@ -0,0 +1,91 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+
+#include "arrow.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "query.h"
+
+/**
+ *******************************************************************************************************
+ * Starts the query and returns an iterator of pyarrow.RecordBatch. Records
+ * are added to columns as they arrive, and each batch of batch_size
+ * records is handed over to pyarrow through the Arrow C Data Interface.
+ *
+ * @param self                  AerospikeQuery object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an aerospike.ResultIterator.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeQuery_To_Arrow(AerospikeQuery * self, PyObject * args, PyObject * kwds)
+{
+	PyObject * py_schema = NULL;
+	PyObject * py_batch_size = NULL;
+	PyObject * py_policy = NULL;
+	PyObject * py_options = NULL;
+	PyObject * py_iterator = NULL;
+	void * cmd = NULL;
+
+	static char * kwlist[] = {"schema", "batch_size", "policy", "options", NULL};
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|OOOO:to_arrow", kwlist,
+			&py_schema, &py_batch_size, &py_policy, &py_options) == false) {
+		return NULL;
+	}
+
+	as_error err;
+	as_error_init(&err);
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->client->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	cmd = AerospikeQuery_Command_New(self, &err, py_policy, py_options);
+	if (!cmd) {
+		goto CLEANUP;
+	}
+
+	py_iterator = arrow_iterator_new(self->client, (PyObject *) self, py_schema, py_batch_size,
+			AerospikeQuery_Command_Execute, cmd, AerospikeQuery_Command_Destroy, &err);
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_iterator;
+}
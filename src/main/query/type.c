@@ -56,6 +56,18 @@ PyDoc_STRVAR(results_doc,
 \n\
 Buffer the records resulting from the query, and return them as a list of records.");
 
+PyDoc_STRVAR(iter_results_doc,
+"iter_results([policy [, options [, queue_size]]]) -> iterator of (key, meta, bins)\n\
+\n\
+Stream the records resulting from the query. At most queue_size records are buffered, \
+the query waits while the buffer is full.");
+
+PyDoc_STRVAR(to_arrow_doc,
+"to_arrow([schema [, batch_size [, policy [, options]]]]) -> iterator of pyarrow.RecordBatch\n\
+\n\
+Stream the records resulting from the query as pyarrow record batches of at most batch_size rows. \
+Without a schema, the schema of the first batch is used for every batch.");
+
 PyDoc_STRVAR(select_doc,
 "select(bin1[, bin2[, bin3..]])\n\
 \n\
@@ -93,6 +105,12 @@ static PyMethodDef AerospikeQuery_Type_Methods[] = {
 	{"results",	(PyCFunction) AerospikeQuery_Results,	METH_VARARGS | METH_KEYWORDS,
 				results_doc},
 
+	{"iter_results",	(PyCFunction) AerospikeQuery_Iter_Results,	METH_VARARGS | METH_KEYWORDS,
+				iter_results_doc},
+
+	{"to_arrow",	(PyCFunction) AerospikeQuery_To_Arrow,	METH_VARARGS | METH_KEYWORDS,
+				to_arrow_doc},
+
 	{"select",	(PyCFunction) AerospikeQuery_Select,	METH_VARARGS | METH_KEYWORDS,
 				select_doc},
 
@@ -206,6 +224,7 @@ static void AerospikeQuery_Type_Dealloc(AerospikeQuery * self)
 	}
 
 	as_query_destroy(&self->query);
+	static_pool_free(self->static_pool);
 
 	if (self->unicodeStrVector != NULL) {
 		for (unsigned int i = 0; i < self->unicodeStrVector->size ; ++i) {
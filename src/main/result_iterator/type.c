@@ -0,0 +1,400 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <structmember.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_val.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "result_iterator.h"
+
+#define RESULT_ITERATOR_MAX_QUEUE_SIZE (1 << 24)
+
+/**
+ *******************************************************************************************************
+ * Called by the C client for each result, on the threads of the command.
+ * The result is converted under the GIL, then queued without it. Blocks
+ * while the queue is full, which stops the command from reading more
+ * results until the consumer catches up.
+ *******************************************************************************************************
+ */
+static bool AerospikeResultIterator_Each(const as_val * val, void * udata)
+{
+	AerospikeResultIterator * self = (AerospikeResultIterator *) udata;
+	PyObject * py_result = NULL;
+	bool cancelled = false;
+
+	if (!val) {
+		return false;
+	}
+
+	pthread_mutex_lock(&self->lock);
+	cancelled = self->cancelled;
+	pthread_mutex_unlock(&self->lock);
+
+	if (cancelled) {
+		return false;
+	}
+
+	as_error err;
+	as_error_init(&err);
+
+	PyGILState_STATE gstate;
+	gstate = PyGILState_Ensure();
+
+	val_to_pyobject(self->client, &err, val, &py_result);
+	if (!py_result) {
+		PyErr_Clear();
+	}
+
+	PyGILState_Release(gstate);
+
+	if (!py_result) {
+		// Mirror results(), a record that cannot be converted is skipped.
+		return true;
+	}
+
+	return AerospikeResultIterator_Put(self, py_result);
+}
+
+/**
+ *******************************************************************************************************
+ * Body of the producer thread.
+ *******************************************************************************************************
+ */
+static void * AerospikeResultIterator_Run(void * udata)
+{
+	AerospikeResultIterator * self = (AerospikeResultIterator *) udata;
+
+	as_error err;
+	as_error_init(&err);
+
+	self->execute(self->command, &err, AerospikeResultIterator_Each, self);
+
+	pthread_mutex_lock(&self->lock);
+	as_error_copy(&self->err, &err);
+	self->done = true;
+	pthread_cond_broadcast(&self->not_empty);
+	pthread_mutex_unlock(&self->lock);
+
+	return NULL;
+}
+
+/**
+ *******************************************************************************************************
+ * Waits for the producer thread, cancelling the command first if asked to,
+ * then releases the command and every result still queued. The thread is
+ * joined by the first caller, the others wait for it under the lock.
+ *******************************************************************************************************
+ */
+static void AerospikeResultIterator_Stop(AerospikeResultIterator * self, bool cancel)
+{
+	Py_BEGIN_ALLOW_THREADS
+	pthread_mutex_lock(&self->lock);
+	if (self->started && cancel) {
+		self->cancelled = true;
+		pthread_cond_broadcast(&self->not_full);
+	}
+
+	bool join = self->started && !self->joining;
+	if (join) {
+		self->joining = true;
+	}
+	else {
+		while (self->joining) {
+			pthread_cond_wait(&self->not_empty, &self->lock);
+		}
+	}
+	pthread_mutex_unlock(&self->lock);
+
+	if (join) {
+		pthread_join(self->thread, NULL);
+
+		pthread_mutex_lock(&self->lock);
+		self->started = false;
+		self->joining = false;
+		pthread_cond_broadcast(&self->not_empty);
+		pthread_mutex_unlock(&self->lock);
+	}
+	Py_END_ALLOW_THREADS
+
+	void * command = self->command;
+	self->command = NULL;
+	if (command && self->destroy) {
+		self->destroy(command);
+	}
+
+	while (true) {
+		PyObject * py_result = NULL;
+
+		pthread_mutex_lock(&self->lock);
+		if (self->count > 0) {
+			py_result = self->queue[self->head];
+			self->head = (self->head + 1) % self->capacity;
+			self->count--;
+		}
+		pthread_mutex_unlock(&self->lock);
+
+		if (!py_result) {
+			break;
+		}
+		Py_DECREF(py_result);
+	}
+}
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+static PyObject * AerospikeResultIterator_Type_Next(AerospikeResultIterator * self)
+{
+	PyObject * py_result = NULL;
+
+	if (!self->started && self->count == 0) {
+		return NULL;
+	}
+
+	Py_BEGIN_ALLOW_THREADS
+	pthread_mutex_lock(&self->lock);
+	while (self->count == 0 && !self->done) {
+		pthread_cond_wait(&self->not_empty, &self->lock);
+	}
+	if (self->count > 0) {
+		py_result = self->queue[self->head];
+		self->head = (self->head + 1) % self->capacity;
+		self->count--;
+		pthread_cond_signal(&self->not_full);
+	}
+	pthread_mutex_unlock(&self->lock);
+	Py_END_ALLOW_THREADS
+
+	if (py_result) {
+		return py_result;
+	}
+
+	// The command has finished and every result has been consumed.
+	AerospikeResultIterator_Stop(self, false);
+
+	if (self->err.code != AEROSPIKE_OK && !self->cancelled) {
+		PyObject * py_err = NULL;
+		error_to_pyobject(&self->err, &py_err);
+		PyObject *exception_type = raise_exception(&self->err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		as_error_reset(&self->err);
+	}
+
+	return NULL;
+}
+
+PyDoc_STRVAR(close_doc,
+"close()\n\
+\n\
+Stop the scan or query and discard the results not consumed yet.");
+
+static PyObject * AerospikeResultIterator_Type_Close(AerospikeResultIterator * self, PyObject * args)
+{
+	AerospikeResultIterator_Stop(self, true);
+	Py_RETURN_NONE;
+}
+
+static PyMethodDef AerospikeResultIterator_Type_Methods[] = {
+	{"close",
+		(PyCFunction) AerospikeResultIterator_Type_Close, METH_NOARGS,
+		close_doc},
+	{NULL}
+};
+
+static void AerospikeResultIterator_Type_Dealloc(AerospikeResultIterator * self)
+{
+	AerospikeResultIterator_Stop(self, true);
+
+	pthread_cond_destroy(&self->not_full);
+	pthread_cond_destroy(&self->not_empty);
+	pthread_mutex_destroy(&self->lock);
+	free(self->queue);
+	Py_XDECREF(self->py_owner);
+
+	Py_TYPE(self)->tp_free((PyObject *) self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeResultIterator_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	"aerospike.ResultIterator",         // tp_name
+	sizeof(AerospikeResultIterator),    // tp_basicsize
+	0,                                  // tp_itemsize
+	(destructor) AerospikeResultIterator_Type_Dealloc,
+	                                    // tp_dealloc
+	0,                                  // tp_print
+	0,                                  // tp_getattr
+	0,                                  // tp_setattr
+	0,                                  // tp_compare
+	0,                                  // tp_repr
+	0,                                  // tp_as_number
+	0,                                  // tp_as_sequence
+	0,                                  // tp_as_mapping
+	0,                                  // tp_hash
+	0,                                  // tp_call
+	0,                                  // tp_str
+	0,                                  // tp_getattro
+	0,                                  // tp_setattro
+	0,                                  // tp_as_buffer
+	Py_TPFLAGS_DEFAULT,                 // tp_flags
+	"Iterator over the results of a scan or a query.\n"
+			"Instances are returned by Scan.iter_results(),\n"
+			"Query.iter_results() and to_arrow().\n",
+	                                    // tp_doc
+	0,                                  // tp_traverse
+	0,                                  // tp_clear
+	0,                                  // tp_richcompare
+	0,                                  // tp_weaklistoffset
+	PyObject_SelfIter,                  // tp_iter
+	(iternextfunc) AerospikeResultIterator_Type_Next,
+	                                    // tp_iternext
+	AerospikeResultIterator_Type_Methods,
+	                                    // tp_methods
+	0,                                  // tp_members
+	0,                                  // tp_getset
+	0,                                  // tp_base
+	0,                                  // tp_dict
+	0,                                  // tp_descr_get
+	0,                                  // tp_descr_set
+	0,                                  // tp_dictoffset
+	0,                                  // tp_init
+	0,                                  // tp_alloc
+	0,                                  // tp_new
+	0,                                  // tp_free
+	0,                                  // tp_is_gc
+	0                                   // tp_bases
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject * AerospikeResultIterator_Ready()
+{
+	return PyType_Ready(&AerospikeResultIterator_Type) == 0 ? &AerospikeResultIterator_Type : NULL;
+}
+
+PyObject * AerospikeResultIterator_New(AerospikeClient * client, PyObject * py_owner,
+		uint32_t queue_size, AerospikeResultIterator_Execute execute, void * command,
+		void (*destroy)(void * command), as_error * err)
+{
+	AerospikeResultIterator * self = PyObject_New(AerospikeResultIterator, &AerospikeResultIterator_Type);
+	if (!self) {
+		PyErr_Clear();
+		destroy(command);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to create the result iterator");
+		return NULL;
+	}
+
+	Py_INCREF(py_owner);
+	self->client = client;
+	self->py_owner = py_owner;
+	self->command = command;
+	self->execute = execute;
+	self->destroy = destroy;
+	self->started = false;
+	self->joining = false;
+	self->capacity = queue_size;
+	self->head = 0;
+	self->count = 0;
+	self->done = false;
+	self->cancelled = false;
+	as_error_init(&self->err);
+	pthread_mutex_init(&self->lock, NULL);
+	pthread_cond_init(&self->not_empty, NULL);
+	pthread_cond_init(&self->not_full, NULL);
+
+	self->queue = (PyObject **) calloc(queue_size, sizeof(PyObject *));
+	if (!self->queue) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the result queue");
+		Py_DECREF(self);
+		return NULL;
+	}
+
+	if (pthread_create(&self->thread, NULL, AerospikeResultIterator_Run, self) != 0) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to start the result iterator");
+		Py_DECREF(self);
+		return NULL;
+	}
+	self->started = true;
+
+	return (PyObject *) self;
+}
+
+as_status AerospikeResultIterator_Queue_Size(as_error * err, PyObject * py_queue_size,
+		uint32_t * queue_size)
+{
+	long value = -1;
+
+	if (!py_queue_size || py_queue_size == Py_None) {
+		*queue_size = AEROSPIKE_RESULT_ITERATOR_QUEUE_SIZE;
+		return AEROSPIKE_OK;
+	}
+
+	if (PyInt_Check(py_queue_size) || PyLong_Check(py_queue_size)) {
+		value = PyLong_AsLong(py_queue_size);
+	}
+
+	if (value < 1 || value > RESULT_ITERATOR_MAX_QUEUE_SIZE) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+				"queue_size must be an integer between 1 and %d", RESULT_ITERATOR_MAX_QUEUE_SIZE);
+	}
+
+	*queue_size = (uint32_t) value;
+	return AEROSPIKE_OK;
+}
+
+bool AerospikeResultIterator_Put(AerospikeResultIterator * self, PyObject * py_result)
+{
+	PyGILState_STATE gstate;
+	bool cancelled = false;
+
+	pthread_mutex_lock(&self->lock);
+	while (self->count == self->capacity && !self->cancelled) {
+		pthread_cond_wait(&self->not_full, &self->lock);
+	}
+	cancelled = self->cancelled;
+	if (!cancelled) {
+		self->queue[(self->head + self->count) % self->capacity] = py_result;
+		self->count++;
+		pthread_cond_signal(&self->not_empty);
+	}
+	pthread_mutex_unlock(&self->lock);
+
+	if (cancelled) {
+		gstate = PyGILState_Ensure();
+		Py_DECREF(py_result);
+		PyGILState_Release(gstate);
+		return false;
+	}
+
+	return true;
+}
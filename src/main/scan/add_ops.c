@@ -27,6 +27,7 @@
 #include "scan.h"
 #include "policy.h"
 #include "operate.h"
+#include "cdt_operation_utils.h"
 
 AerospikeScan* AerospikeScan_Add_Ops(AerospikeScan * self, PyObject * args, PyObject * kwds)
 {
@@ -44,9 +45,10 @@ AerospikeScan* AerospikeScan_Add_Ops(AerospikeScan * self, PyObject * args, PyOb
     long operation;
     self->unicodeStrVector = as_vector_create(sizeof(char *), 128);
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-	self->static_pool = &static_pool;
+	// The operations are kept by the scan, so are the bytes they use.
+	if (!self->static_pool) {
+		self->static_pool = static_pool_new();
+	}
 
 	as_error err;
 	as_error_init(&err);
@@ -68,7 +70,7 @@ AerospikeScan* AerospikeScan_Add_Ops(AerospikeScan * self, PyObject * args, PyOb
         for (int i = 0; i < size; i++) {
             PyObject * py_val = PyList_GetItem(py_ops, (Py_ssize_t)i);
             
-            if (PyDict_Check(py_val)) {
+            if (is_operation(py_val)) {
                 if (add_op(self->client, &err, py_val, self->unicodeStrVector, self->static_pool, self->scan.ops, &operation, &return_type) != AEROSPIKE_OK) {
                     as_error_update(&err, AEROSPIKE_ERR_PARAM, "Failed to convert ops.");
                     goto CLEANUP;
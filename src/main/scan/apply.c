@@ -48,9 +48,6 @@ AerospikeScan * AerospikeScan_Apply(AerospikeScan * self, PyObject * args, PyObj
 		return NULL;
 	}
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	as_error err;
 	as_error_init(&err);
 
@@ -103,11 +100,16 @@ AerospikeScan * AerospikeScan_Apply(AerospikeScan * self, PyObject * args, PyObj
 		 	goto CLEANUP;
 		}
 
+		// The arguments are kept by the scan, so are the bytes they use.
+		if (!self->static_pool) {
+			self->static_pool = static_pool_new();
+		}
+
 		arglist = as_arraylist_new(size, 0);
 		for (int i = 0; i < size; i++) {
 			PyObject * py_val = PyList_GetItem(py_args, (Py_ssize_t)i);
 			as_val * val = NULL;
-			pyobject_to_val(self->client, &err, py_val, &val, &static_pool, SERIALIZER_PYTHON);
+			pyobject_to_val(self->client, &err, py_val, &val, self->static_pool, SERIALIZER_PYTHON);
 			if (err.code != AEROSPIKE_OK) {
 				as_error_update(&err, err.code, NULL);
 				as_arraylist_destroy(arglist);
@@ -129,8 +131,6 @@ AerospikeScan * AerospikeScan_Apply(AerospikeScan * self, PyObject * args, PyObj
 	Py_END_ALLOW_THREADS
 
 CLEANUP:
-	POOL_DESTROY(&static_pool);
-
 	if (py_ufunction) {
 		Py_DECREF(py_ufunction);
 	}
@@ -143,13 +143,7 @@ CLEANUP:
 		PyObject * py_err = NULL;
 		error_to_pyobject(&err, &py_err);
 		PyObject *exception_type = raise_exception(&err);
-		if(PyObject_HasAttrString(exception_type, "module")) {
-			PyObject_SetAttrString(exception_type, "module", py_module);
-		} 
-		if(PyObject_HasAttrString(exception_type, "func")) {
-			PyObject_SetAttrString(exception_type, "func", py_function);
-		}
-		PyErr_SetObject(exception_type, py_err);
+		raise_exception_with_attrs(exception_type, py_err, "module", py_module, "func", py_function, NULL);
 		Py_DECREF(py_err);
 		return NULL;
 	}
@@ -21,9 +21,11 @@
 #include <aerospike/as_error.h>
 #include <aerospike/as_scan.h>
 
+#include "callback_batch.h"
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
+#include "partition_cursor.h"
 #include "scan.h"
 #include "policy.h"
 
@@ -32,38 +34,28 @@ typedef struct {
 	as_error error;
 	PyObject * callback;
 	AerospikeClient * client;
+	bool batch_callback;
+	partition_cursor * cursor;
+	bool stopped;
 } LocalData;
 
-
-static bool each_result(const as_val * val, void * udata)
+/*
+ * Calls the Python callback with py_result, which it steals.
+ * Must be called with the GIL held.
+ */
+static bool invoke_callback(LocalData * data, PyObject * py_result)
 {
 	bool rval = true;
-
-	if (!val) {
-		return false;
-	}
-
-	// Extract callback user-data
-	LocalData * data = (LocalData *) udata;
 	as_error * err = &data->error;
 	PyObject * py_callback = data->callback;
 
 	// Python Function Arguments and Result Value
 	PyObject * py_arglist = NULL;
-	PyObject * py_result = NULL;
 	PyObject * py_return = NULL;
 
-	// Lock Python State
-	PyGILState_STATE gstate;
-	gstate = PyGILState_Ensure();
+	// Kept alive for the partition cursor once the callback returns.
+	Py_INCREF(py_result);
 
-	// Convert as_val to a Python Object
-	val_to_pyobject(data->client, err, val, &py_result);
-
-	if (!py_result) {
-		PyGILState_Release(gstate);
-		return true;
-	}
 	// Build Python Function Arguments
 	py_arglist = PyTuple_New(1);
 	PyTuple_SetItem(py_arglist, 0, py_result);
@@ -95,12 +87,76 @@ static bool each_result(const as_val * val, void * udata)
 		Py_DECREF(py_return);
 	}
 
+	if (py_return && data->cursor) {
+		partition_cursor_track(data->cursor, py_result);
+	}
+	Py_DECREF(py_result);
+
+	if (!rval) {
+		data->stopped = true;
+	}
+
+	return rval;
+}
+
+static bool each_result(const as_val * val, void * udata)
+{
+	bool rval = true;
+
+	if (!val) {
+		return false;
+	}
+
+	// Extract callback user-data
+	LocalData * data = (LocalData *) udata;
+	as_error * err = &data->error;
+
+	PyObject * py_result = NULL;
+
+	// Lock Python State
+	PyGILState_STATE gstate;
+	gstate = PyGILState_Ensure();
+
+	// Convert as_val to a Python Object
+	val_to_pyobject(data->client, err, val, &py_result);
+
+	if (!py_result) {
+		PyGILState_Release(gstate);
+		return true;
+	}
+
+	rval = invoke_callback(data, py_result);
+
 	// Release Python State
 	PyGILState_Release(gstate);
 
 	return rval;
 }
 
+/*
+ * Receives the records of a callback batch, with the GIL held. They are
+ * passed to the callback one at a time, or all at once with batch_callback.
+ */
+static bool each_batch(callback_batch * batch, PyObject * py_results)
+{
+	LocalData * data = (LocalData *) batch->udata;
+
+	if (data->batch_callback) {
+		Py_INCREF(py_results);
+		return invoke_callback(data, py_results);
+	}
+
+	for (Py_ssize_t i = 0; i < PyList_GET_SIZE(py_results); i++) {
+		PyObject * py_result = PyList_GET_ITEM(py_results, i);
+		Py_INCREF(py_result);
+		if (!invoke_callback(data, py_result)) {
+			return false;
+		}
+	}
+
+	return true;
+}
+
 PyObject * AerospikeScan_Foreach(AerospikeScan * self, PyObject * args, PyObject * kwds)
 {
 	// Python Function Arguments
@@ -108,10 +164,18 @@ PyObject * AerospikeScan_Foreach(AerospikeScan * self, PyObject * args, PyObject
 	PyObject * py_policy = NULL;
 	PyObject * py_options = NULL;
 	PyObject * py_nodename = NULL;
+	PyObject * py_partition_filter = NULL;
+	PyObject * py_cursor = NULL;
 	PyObject* py_ustr = NULL;
 
 	char* nodename = NULL;
 
+	partition_cursor cursor;
+	as_partition_filter partition_filter;
+
+	callback_batch batch;
+	uint32_t batch_size = 0;
+
 	as_policy_scan scan_policy;
 	as_policy_scan * scan_policy_p = NULL;
 
@@ -124,10 +188,10 @@ PyObject * AerospikeScan_Foreach(AerospikeScan * self, PyObject * args, PyObject
 	as_predexp_list* predexp_list_p = NULL;
 
 	// Python Function Keyword Arguments
-	static char * kwlist[] = {"callback", "policy", "options", "nodename", NULL};
+	static char * kwlist[] = {"callback", "policy", "options", "nodename", "partition_filter", NULL};
 
 	// Python Function Argument Parsing
-	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OOO:foreach", kwlist, &py_callback, &py_policy, &py_options, &py_nodename) == false) {
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OOOO:foreach", kwlist, &py_callback, &py_policy, &py_options, &py_nodename, &py_partition_filter) == false) {
 		return NULL;
 	}
 
@@ -135,6 +199,9 @@ PyObject * AerospikeScan_Foreach(AerospikeScan * self, PyObject * args, PyObject
 	LocalData data;
 	data.callback = py_callback;
 	data.client = self->client;
+	data.batch_callback = false;
+	data.cursor = NULL;
+	data.stopped = false;
 	as_error_init(&data.error);
 
 	// Aerospike Client Arguments
@@ -166,6 +233,10 @@ PyObject * AerospikeScan_Foreach(AerospikeScan * self, PyObject * args, PyObject
 		}
 	}
 
+	if (callback_batch_options(&err, py_options, &batch_size, &data.batch_callback) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
 	if (py_nodename) {
 		if (PyString_Check(py_nodename)) {
 			nodename = PyString_AsString(py_nodename);
@@ -183,10 +254,72 @@ PyObject * AerospikeScan_Foreach(AerospikeScan * self, PyObject * args, PyObject
 		}
 	}
 
+	if (py_partition_filter && py_partition_filter != Py_None) {
+		if (nodename) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "nodename and partition_filter cannot be used together");
+			goto CLEANUP;
+		}
+
+		data.cursor = &cursor;
+		if (partition_cursor_from_pyobject(&err, py_partition_filter, &cursor) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+
+		/*
+		 * The cursor only tracks records once they were handed to the
+		 * callback, so it never skips a record that was left in a callback
+		 * batch buffer.
+		 */
+		if (partition_cursor_filter(&err, &cursor, &partition_filter) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+
+		if (batch_size) {
+			callback_batch_init(&batch, self->client, batch_size, each_batch, &data);
+		}
+
+		Py_BEGIN_ALLOW_THREADS
+		if (batch_size) {
+			aerospike_scan_partitions(self->client->as, &err, scan_policy_p, &self->scan, &partition_filter, callback_batch_add, &batch);
+		} else {
+			aerospike_scan_partitions(self->client->as, &err, scan_policy_p, &self->scan, &partition_filter, each_result, &data);
+		}
+		Py_END_ALLOW_THREADS
+
+		if (batch_size) {
+			callback_batch_destroy(&batch, &err);
+		}
+		partition_cursor_filter_destroy(&partition_filter);
+
+		if (err.code == AEROSPIKE_OK && data.error.code == AEROSPIKE_OK && !data.stopped) {
+			partition_cursor_complete(&cursor);
+		}
+
+		py_cursor = partition_cursor_to_pyobject(&cursor);
+		Py_XDECREF(self->py_cursor);
+		self->py_cursor = py_cursor;
+		Py_XINCREF(py_cursor);
+
+		if (data.error.code != AEROSPIKE_OK) {
+			as_error_update(&data.error, data.error.code, NULL);
+		}
+		goto CLEANUP;
+	}
+
+	if (batch_size) {
+		callback_batch_init(&batch, self->client, batch_size, each_batch, &data);
+	}
+
 	// We are spawning multiple threads
 	Py_BEGIN_ALLOW_THREADS
 	// Invoke operation
-	if (nodename) {
+	if (batch_size) {
+		if (nodename) {
+			aerospike_scan_node(self->client->as, &err, scan_policy_p, &self->scan, nodename, callback_batch_add, &batch);
+		} else {
+			aerospike_scan_foreach(self->client->as, &err, scan_policy_p, &self->scan, callback_batch_add, &batch);
+		}
+	} else if (nodename) {
 		aerospike_scan_node(self->client->as, &err, scan_policy_p, &self->scan, nodename, each_result, &data);
 	} else {
 		aerospike_scan_foreach(self->client->as, &err, scan_policy_p, &self->scan, each_result, &data);
@@ -194,12 +327,21 @@ PyObject * AerospikeScan_Foreach(AerospikeScan * self, PyObject * args, PyObject
 	// We are done using multiple threads
 	Py_END_ALLOW_THREADS
 
+	if (batch_size) {
+		// Hands over what is left in the per thread buffers.
+		callback_batch_destroy(&batch, &err);
+	}
+
 	if (data.error.code != AEROSPIKE_OK) {
 		as_error_update(&data.error, data.error.code, NULL);
 		goto CLEANUP;
 	}
 
 CLEANUP:
+	if (data.cursor) {
+		partition_cursor_destroy(&cursor);
+	}
+
 	if (exp_list_p) {
 		as_exp_destroy(exp_list_p);;
 	}
@@ -222,9 +364,25 @@ CLEANUP:
 		}
 		PyErr_SetObject(exception_type, py_err);
 		Py_DECREF(py_err);
+		Py_XDECREF(py_cursor);
 		return NULL;
 	}
 
+	if (py_cursor || PyErr_Occurred()) {
+		return py_cursor;
+	}
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
+
+PyObject * AerospikeScan_Cursor(AerospikeScan * self, PyObject * args)
+{
+	if (self->py_cursor) {
+		Py_INCREF(self->py_cursor);
+		return self->py_cursor;
+	}
+
 	Py_INCREF(Py_None);
 	return Py_None;
 }
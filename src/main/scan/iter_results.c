@@ -0,0 +1,189 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/aerospike_scan.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_scan.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "result_iterator.h"
+#include "scan.h"
+
+typedef struct {
+	aerospike * as;
+	as_scan * scan;
+	PyObject * py_policy;
+	as_policy_scan scan_policy;
+	as_policy_scan * scan_policy_p;
+	as_exp exp_list;
+	as_exp * exp_list_p;
+	as_predexp_list predexp_list;
+	as_predexp_list * predexp_list_p;
+	char * nodename;
+} ScanCommand;
+
+void AerospikeScan_Command_Execute(void * command, as_error * err,
+		AerospikeResultIterator_Callback callback, void * udata)
+{
+	ScanCommand * cmd = (ScanCommand *) command;
+
+	if (cmd->nodename) {
+		aerospike_scan_node(cmd->as, err, cmd->scan_policy_p, cmd->scan, cmd->nodename, callback, udata);
+	} else {
+		aerospike_scan_foreach(cmd->as, err, cmd->scan_policy_p, cmd->scan, callback, udata);
+	}
+}
+
+void AerospikeScan_Command_Destroy(void * command)
+{
+	ScanCommand * cmd = (ScanCommand *) command;
+
+	if (cmd->exp_list_p) {
+		as_exp_destroy(cmd->exp_list_p);
+	}
+
+	if (cmd->predexp_list_p) {
+		as_predexp_list_destroy(&cmd->predexp_list);
+	}
+
+	// The policy may lend its compiled aerospike.Expression to the scan policy.
+	Py_XDECREF(cmd->py_policy);
+	free(cmd->nodename);
+	free(cmd);
+}
+
+void * AerospikeScan_Command_New(AerospikeScan * self, as_error * err, PyObject * py_policy, PyObject * py_nodename)
+{
+	PyObject * py_ustr = NULL;
+	ScanCommand * cmd = NULL;
+	char * nodename = NULL;
+
+	if (py_nodename) {
+		if (PyString_Check(py_nodename)) {
+			nodename = PyString_AsString(py_nodename);
+		} else if (PyUnicode_Check(py_nodename)) {
+			/* The decoding could fail, so we need to check for null */
+			py_ustr = PyUnicode_AsUTF8String(py_nodename);
+			if (! py_ustr) {
+				as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid unicode nodename");
+				return NULL;
+			}
+			nodename = PyBytes_AsString(py_ustr);
+		}
+		else {
+			as_error_update(err, AEROSPIKE_ERR_PARAM, "nodename must be a string");
+			return NULL;
+		}
+	}
+
+	// The command outlives this call, it is owned by the iterator.
+	cmd = (ScanCommand *) calloc(1, sizeof(ScanCommand));
+	cmd->as = self->client->as;
+	cmd->scan = &self->scan;
+	if (nodename) {
+		cmd->nodename = strdup(nodename);
+	}
+	Py_XDECREF(py_ustr);
+
+	// Convert python policy object to as_policy_scan
+	pyobject_to_policy_scan(self->client, err, py_policy, &cmd->scan_policy, &cmd->scan_policy_p,
+			&self->client->as->config.policies.scan, &cmd->predexp_list, &cmd->predexp_list_p,
+			&cmd->exp_list, &cmd->exp_list_p);
+	if (err->code != AEROSPIKE_OK) {
+		AerospikeScan_Command_Destroy(cmd);
+		return NULL;
+	}
+
+	Py_XINCREF(py_policy);
+	cmd->py_policy = py_policy;
+
+	return cmd;
+}
+
+/**
+ *******************************************************************************************************
+ * Starts the scan and returns an iterator over its records. Records are
+ * converted as they arrive, and at most queue_size of them are buffered.
+ *
+ * @param self                  AerospikeScan object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an aerospike.ResultIterator.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject * AerospikeScan_Iter_Results(AerospikeScan * self, PyObject * args, PyObject * kwds)
+{
+	PyObject * py_policy = NULL;
+	PyObject * py_nodename = NULL;
+	PyObject * py_queue_size = NULL;
+	PyObject * py_iterator = NULL;
+	void * cmd = NULL;
+	uint32_t queue_size = 0;
+
+	static char * kwlist[] = {"policy", "nodename", "queue_size", NULL};
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|OOO:iter_results", kwlist,
+			&py_policy, &py_nodename, &py_queue_size) == false) {
+		return NULL;
+	}
+
+	as_error err;
+	as_error_init(&err);
+
+	if (! self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+	if (! self->client->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER, "No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (AerospikeResultIterator_Queue_Size(&err, py_queue_size, &queue_size) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	cmd = AerospikeScan_Command_New(self, &err, py_policy, py_nodename);
+	if (!cmd) {
+		goto CLEANUP;
+	}
+
+	py_iterator = AerospikeResultIterator_New(self->client, (PyObject *) self, queue_size,
+			AerospikeScan_Command_Execute, cmd, AerospikeScan_Command_Destroy, &err);
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		PyObject * py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_iterator;
+}
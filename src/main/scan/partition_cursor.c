@@ -0,0 +1,276 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_partition_filter.h>
+#include <citrusleaf/alloc.h>
+
+#include "macros.h"
+#include "partition_cursor.h"
+
+static as_status partition_id_from_pyobject(as_error * err, PyObject * py_value,
+		const char * name, long min, long max, long * value)
+{
+	if (!PyInt_Check(py_value) || PyBool_Check(py_value)) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "partition_filter %s must be an integer", name);
+	}
+
+	*value = PyLong_AsLong(py_value);
+	if (*value == -1 && PyErr_Occurred()) {
+		PyErr_Clear();
+		*value = -1;
+	}
+
+	if (*value < min || *value > max) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "partition_filter %s must be between %ld and %ld", name, min, max);
+	}
+
+	return AEROSPIKE_OK;
+}
+
+static as_status partition_cursor_after_from_pyobject(as_error * err, PyObject * py_after,
+		partition_cursor * cursor)
+{
+	PyObject * py_pid = NULL;
+	PyObject * py_digest = NULL;
+	Py_ssize_t pos = 0;
+	uint32_t end = cursor->begin + cursor->count;
+
+	if (!PyDict_Check(py_after)) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "partition_filter after must be a dict");
+	}
+
+	while (PyDict_Next(py_after, &pos, &py_pid, &py_digest)) {
+		long pid = 0;
+		char * digest = NULL;
+		Py_ssize_t size = 0;
+
+		if (partition_id_from_pyobject(err, py_pid, "after partition", cursor->begin, end - 1, &pid) != AEROSPIKE_OK) {
+			return err->code;
+		}
+
+		if (PyByteArray_Check(py_digest)) {
+			digest = PyByteArray_AsString(py_digest);
+			size = PyByteArray_Size(py_digest);
+		}
+		else if (PyBytes_Check(py_digest)) {
+			digest = PyBytes_AsString(py_digest);
+			size = PyBytes_Size(py_digest);
+		}
+
+		if (!digest || size != AS_DIGEST_VALUE_SIZE) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "partition_filter after digests must be 20 bytes");
+		}
+
+		if (digest_partition_id((uint8_t *) digest) != pid) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM, "partition_filter after digest does not belong to partition %ld", pid);
+		}
+
+		memcpy(cursor->after[pid], digest, AS_DIGEST_VALUE_SIZE);
+		cursor->has_after[pid] = true;
+	}
+
+	return AEROSPIKE_OK;
+}
+
+as_status partition_cursor_from_pyobject(as_error * err, PyObject * py_filter,
+		partition_cursor * cursor)
+{
+	PyObject * py_value = NULL;
+	long begin = 0;
+	long count = 0;
+
+	cursor->begin = 0;
+	cursor->count = 0;
+	cursor->has_after = NULL;
+	cursor->after = NULL;
+
+	if (!PyDict_Check(py_filter)) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "partition_filter must be a dict");
+	}
+
+	py_value = PyDict_GetItemString(py_filter, "begin");
+	if (py_value && partition_id_from_pyobject(err, py_value, "begin", 0, AS_PARTITION_COUNT - 1, &begin) != AEROSPIKE_OK) {
+		return err->code;
+	}
+
+	count = AS_PARTITION_COUNT - begin;
+	py_value = PyDict_GetItemString(py_filter, "count");
+	if (py_value && partition_id_from_pyobject(err, py_value, "count", 1, AS_PARTITION_COUNT - begin, &count) != AEROSPIKE_OK) {
+		return err->code;
+	}
+
+	cursor->has_after = (bool *) calloc(AS_PARTITION_COUNT, sizeof(bool));
+	cursor->after = (as_digest_value *) malloc(AS_PARTITION_COUNT * sizeof(as_digest_value));
+	if (!cursor->has_after || !cursor->after) {
+		partition_cursor_destroy(cursor);
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the partition cursor");
+	}
+	cursor->begin = (uint16_t) begin;
+	cursor->count = (uint16_t) count;
+
+	py_value = PyDict_GetItemString(py_filter, "after");
+	if (py_value && py_value != Py_None) {
+		return partition_cursor_after_from_pyobject(err, py_value, cursor);
+	}
+
+	return AEROSPIKE_OK;
+}
+
+static void partition_cursor_track_record(partition_cursor * cursor, PyObject * py_record)
+{
+	PyObject * py_key = NULL;
+	PyObject * py_digest = NULL;
+	uint8_t * digest = NULL;
+
+	if (!PyTuple_Check(py_record) || PyTuple_GET_SIZE(py_record) < 1) {
+		return;
+	}
+
+	py_key = PyTuple_GET_ITEM(py_record, 0);
+	if (!PyTuple_Check(py_key) || PyTuple_GET_SIZE(py_key) < 4) {
+		return;
+	}
+
+	py_digest = PyTuple_GET_ITEM(py_key, 3);
+	if (!PyByteArray_Check(py_digest) || PyByteArray_GET_SIZE(py_digest) != AS_DIGEST_VALUE_SIZE) {
+		return;
+	}
+
+	digest = (uint8_t *) PyByteArray_AS_STRING(py_digest);
+	uint16_t pid = digest_partition_id(digest);
+
+	memcpy(cursor->after[pid], digest, AS_DIGEST_VALUE_SIZE);
+	cursor->has_after[pid] = true;
+}
+
+void partition_cursor_track(partition_cursor * cursor, PyObject * py_results)
+{
+	if (PyList_Check(py_results)) {
+		for (Py_ssize_t i = 0; i < PyList_GET_SIZE(py_results); i++) {
+			partition_cursor_track_record(cursor, PyList_GET_ITEM(py_results, i));
+		}
+	}
+	else {
+		partition_cursor_track_record(cursor, py_results);
+	}
+}
+
+as_status partition_cursor_filter(as_error * err, partition_cursor * cursor, as_partition_filter * pf)
+{
+	uint32_t end = cursor->begin + cursor->count;
+	bool resumed = false;
+
+	for (uint32_t pid = cursor->begin; pid < end; pid++) {
+		if (cursor->has_after[pid]) {
+			resumed = true;
+			break;
+		}
+	}
+
+	as_partition_filter_set_range(pf, cursor->begin, cursor->count);
+	if (!resumed) {
+		return AEROSPIKE_OK;
+	}
+
+	// One scan of the whole range, each resumed partition from its last digest.
+	as_partitions_status * parts_all = (as_partitions_status *) cf_malloc(
+			sizeof(as_partitions_status) + sizeof(as_partition_status) * cursor->count);
+	if (!parts_all) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to allocate the partitions of a scan");
+	}
+
+	memset(parts_all, 0, sizeof(as_partitions_status) + sizeof(as_partition_status) * cursor->count);
+	parts_all->ref_count = 1;
+	parts_all->part_begin = cursor->begin;
+	parts_all->part_count = cursor->count;
+
+	for (uint32_t i = 0; i < cursor->count; i++) {
+		as_partition_status * ps = &parts_all->parts[i];
+		uint32_t pid = cursor->begin + i;
+
+		ps->part_id = (uint16_t) pid;
+		ps->digest.init = cursor->has_after[pid];
+		if (ps->digest.init) {
+			memcpy(ps->digest.value, cursor->after[pid], AS_DIGEST_VALUE_SIZE);
+		}
+	}
+
+	as_partition_filter_set_partitions(pf, parts_all);
+	// The filter holds its own reference.
+	as_partitions_status_release(parts_all);
+	return AEROSPIKE_OK;
+}
+
+void partition_cursor_filter_destroy(as_partition_filter * pf)
+{
+	if (pf->parts_all) {
+		as_partitions_status_release(pf->parts_all);
+		pf->parts_all = NULL;
+	}
+}
+
+void partition_cursor_complete(partition_cursor * cursor)
+{
+	cursor->begin += cursor->count;
+	cursor->count = 0;
+}
+
+PyObject * partition_cursor_to_pyobject(partition_cursor * cursor)
+{
+	if (cursor->count == 0) {
+		Py_RETURN_NONE;
+	}
+
+	PyObject * py_after = PyDict_New();
+	if (!py_after) {
+		return NULL;
+	}
+
+	for (uint32_t pid = cursor->begin; pid < (uint32_t) cursor->begin + cursor->count; pid++) {
+		if (!cursor->has_after[pid]) {
+			continue;
+		}
+
+		PyObject * py_pid = PyLong_FromUnsignedLong(pid);
+		PyObject * py_digest = PyByteArray_FromStringAndSize((char *) cursor->after[pid], AS_DIGEST_VALUE_SIZE);
+		if (!py_pid || !py_digest || PyDict_SetItem(py_after, py_pid, py_digest) == -1) {
+			Py_XDECREF(py_pid);
+			Py_XDECREF(py_digest);
+			Py_DECREF(py_after);
+			return NULL;
+		}
+		Py_DECREF(py_pid);
+		Py_DECREF(py_digest);
+	}
+
+	PyObject * py_cursor = Py_BuildValue("{s:H,s:H,s:N}", "begin", cursor->begin,
+			"count", cursor->count, "after", py_after);
+	return py_cursor;
+}
+
+void partition_cursor_destroy(partition_cursor * cursor)
+{
+	free(cursor->has_after);
+	free(cursor->after);
+	cursor->has_after = NULL;
+	cursor->after = NULL;
+}
@@ -22,9 +22,12 @@
 #include <aerospike/as_error.h>
 #include <aerospike/as_scan.h>
 
+#include "callback_batch.h"
 #include "client.h"
+#include "columnar.h"
 #include "conversions.h"
 #include "exceptions.h"
+#include "partition_cursor.h"
 #include "policy.h"
 #include "scan.h"
 
@@ -64,15 +67,55 @@ static bool each_result(const as_val * val, void * udata)
 	return true;
 }
 
+/*
+ * Receives the records of a callback batch, with the GIL held.
+ */
+static bool each_batch(callback_batch * batch, PyObject * py_results)
+{
+	LocalData * data = (LocalData *) batch->udata;
+	Py_ssize_t size = PyList_GET_SIZE(data->py_results);
+
+	PyList_SetSlice(data->py_results, size, size, py_results);
+
+	return true;
+}
+
+/*
+ * Runs the scan on nodename, on the partitions left in cursor, or on the
+ * whole namespace. Called without the GIL.
+ */
+static void scan_records(AerospikeScan * self, as_error * err, as_policy_scan * scan_policy_p,
+		const char * nodename, partition_cursor * cursor, aerospike_scan_foreach_callback callback, void * udata)
+{
+	as_partition_filter partition_filter;
+
+	if (nodename) {
+		aerospike_scan_node(self->client->as, err, scan_policy_p, &self->scan, nodename, callback, udata);
+	} else if (cursor) {
+		if (partition_cursor_filter(err, cursor, &partition_filter) != AEROSPIKE_OK) {
+			return;
+		}
+		if (aerospike_scan_partitions(self->client->as, err, scan_policy_p, &self->scan, &partition_filter, callback, udata) == AEROSPIKE_OK) {
+			partition_cursor_complete(cursor);
+		}
+		partition_cursor_filter_destroy(&partition_filter);
+	} else {
+		aerospike_scan_foreach(self->client->as, err, scan_policy_p, &self->scan, callback, udata);
+	}
+}
+
 PyObject * AerospikeScan_Results(AerospikeScan * self, PyObject * args, PyObject * kwds)
 {
 	PyObject * py_policy = NULL;
 	PyObject * py_results = NULL;
 	PyObject * py_nodename = NULL;
+	PyObject * py_options = NULL;
+	PyObject * py_columnar = NULL;
+	PyObject * py_partition_filter = NULL;
 	PyObject* py_ustr = NULL;
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	partition_cursor cursor;
+	partition_cursor * cursor_p = NULL;
 
 	as_policy_scan scan_policy;
 	as_policy_scan * scan_policy_p = NULL;
@@ -80,7 +123,14 @@ PyObject * AerospikeScan_Results(AerospikeScan * self, PyObject * args, PyObject
 	char* nodename = NULL;
 	LocalData data;
 	data.client = self->client;
-	static char * kwlist[] = {"policy", "nodename", NULL};
+	static char * kwlist[] = {"policy", "nodename", "options", "columnar", "partition_filter", NULL};
+
+	callback_batch batch;
+	uint32_t batch_size = 0;
+	bool batch_callback = false;
+
+	columnar columns;
+	bool columnar_enabled = false;
 
 	// For converting expressions.
 	as_exp exp_list;
@@ -90,7 +140,7 @@ PyObject * AerospikeScan_Results(AerospikeScan * self, PyObject * args, PyObject
 	as_predexp_list predexp_list;
 	as_predexp_list* predexp_list_p = NULL;
 
-	if (PyArg_ParseTupleAndKeywords(args, kwds, "|OO:results", kwlist, &py_policy, &py_nodename) == false) {
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|OOOOO:results", kwlist, &py_policy, &py_nodename, &py_options, &py_columnar, &py_partition_filter) == false) {
 		return NULL;
 	}
 
@@ -135,22 +185,78 @@ PyObject * AerospikeScan_Results(AerospikeScan * self, PyObject * args, PyObject
 		}
 	}
 
+	if (py_options && PyDict_Check(py_options)) {
+		set_scan_options(&err, &self->scan, py_options);
+		if (err.code != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	if (callback_batch_options(&err, py_options, &batch_size, &batch_callback) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (py_partition_filter && py_partition_filter != Py_None) {
+		if (nodename) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "nodename and partition_filter cannot be used together");
+			goto CLEANUP;
+		}
+
+		cursor_p = &cursor;
+		if (partition_cursor_from_pyobject(&err, py_partition_filter, &cursor) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	if (columnar_init(&err, &columns, py_columnar, &columnar_enabled) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (columnar_enabled) {
+		// Records are added to the columns without taking the GIL.
+		Py_BEGIN_ALLOW_THREADS
+		scan_records(self, &err, scan_policy_p, nodename, cursor_p, columnar_callback, &columns);
+		Py_END_ALLOW_THREADS
+
+		if (err.code == AEROSPIKE_OK) {
+			columnar_to_pyobject(self->client, &err, &columns, &py_results);
+		}
+		goto CLEANUP;
+	}
+
 	py_results = PyList_New(0);
 	data.py_results = py_results;
 
+	if (batch_size) {
+		callback_batch_init(&batch, self->client, batch_size, each_batch, &data);
+	}
+
 	Py_BEGIN_ALLOW_THREADS
 
-	if (nodename) {
-		aerospike_scan_node(self->client->as, &err, scan_policy_p, &self->scan, nodename, each_result, &data);
+	if (batch_size) {
+		scan_records(self, &err, scan_policy_p, nodename, cursor_p, callback_batch_add, &batch);
 	} else {
-		aerospike_scan_foreach(self->client->as, &err, scan_policy_p, &self->scan, each_result, &data);
+		scan_records(self, &err, scan_policy_p, nodename, cursor_p, each_result, &data);
 	}
 
 
 	Py_END_ALLOW_THREADS
 
+	if (batch_size) {
+		// Hands over what is left in the per thread buffers.
+		callback_batch_destroy(&batch, &err);
+	}
+
 
 CLEANUP:
+	if (cursor_p) {
+		partition_cursor_destroy(cursor_p);
+	}
+
+	if (columnar_enabled) {
+		columnar_destroy(&columns);
+	}
+
 	if (exp_list_p) {
 		as_exp_destroy(exp_list_p);
 	}
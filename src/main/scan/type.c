@@ -35,10 +35,24 @@
  ******************************************************************************/
 
 PyDoc_STRVAR(foreach_doc,
-"foreach(callback[, policy[, options [, nodename]])\n\
+"foreach(callback[, policy[, options [, nodename [, partition_filter]]]]) -> None or dict\n\
 \n\
 Invoke the callback function for each of the records streaming back from the scan. If provided \
-nodename should be the Node ID of a node to limit the scan to.");
+nodename should be the Node ID of a node to limit the scan to. With a partition_filter, only the \
+partitions it selects are scanned, and when the callback stops the scan a cursor is returned \
+which resumes it as the partition_filter of a later foreach().");
+
+PyDoc_STRVAR(cursor_doc,
+"cursor() -> None or dict\n\
+\n\
+Return the cursor left by the last foreach() with a partition_filter, or None if it scanned \
+every partition.");
+
+PyDoc_STRVAR(to_arrow_doc,
+"to_arrow([schema [, batch_size [, policy [, nodename]]]]) -> iterator of pyarrow.RecordBatch\n\
+\n\
+Stream the records resulting from the scan as pyarrow record batches of at most batch_size rows. \
+Without a schema, the schema of the first batch is used for every batch.");
 
 PyDoc_STRVAR(select_doc,
 "select(bin1[, bin2[, bin3..]])\n\
@@ -47,10 +61,19 @@ Set a filter on the record bins resulting from results() or foreach(). \
 If a selected bin does not exist in a record it will not appear in the bins portion of that record tuple.");
 
 PyDoc_STRVAR(results_doc,
-"results([policy [, nodename]) -> list of (key, meta, bins)\n\
+"results([policy [, nodename [, options [, columnar [, partition_filter]]]]]) -> list of (key, meta, bins)\n\
 \n\
 Buffer the records resulting from the scan, and return them as a list of records.If provided \
-nodename should be the Node ID of a node to limit the scan to.");
+nodename should be the Node ID of a node to limit the scan to. If provided partition_filter \
+selects the partitions to scan. When columnar is True, or a list \
+of bin names, return a dict of numpy masked arrays with one row per record instead.");
+
+PyDoc_STRVAR(iter_results_doc,
+"iter_results([policy [, nodename [, queue_size]]]) -> iterator of (key, meta, bins)\n\
+\n\
+Stream the records resulting from the scan. At most queue_size records are buffered, \
+the scan waits while the buffer is full. If provided nodename should be the Node ID \
+of a node to limit the scan to.");
 
 
 /*******************************************************************************
@@ -62,11 +85,20 @@ static PyMethodDef AerospikeScan_Type_Methods[] = {
 	{"foreach",	(PyCFunction) AerospikeScan_Foreach,	METH_VARARGS | METH_KEYWORDS,
 				foreach_doc},
 
+	{"cursor",	(PyCFunction) AerospikeScan_Cursor,	METH_NOARGS,
+				cursor_doc},
+
 	{"select",	(PyCFunction) AerospikeScan_Select,		METH_VARARGS | METH_KEYWORDS,
 				select_doc},
 
 	{"results",	(PyCFunction) AerospikeScan_Results,	METH_VARARGS | METH_KEYWORDS,
 				results_doc},
+
+	{"iter_results",	(PyCFunction) AerospikeScan_Iter_Results,	METH_VARARGS | METH_KEYWORDS,
+				iter_results_doc},
+
+	{"to_arrow",	(PyCFunction) AerospikeScan_To_Arrow,	METH_VARARGS | METH_KEYWORDS,
+				to_arrow_doc},
 	
 	{"execute_background",	(PyCFunction) AerospikeScan_ExecuteBackground,	METH_VARARGS | METH_KEYWORDS,
 				results_doc},
@@ -92,6 +124,7 @@ static PyObject * AerospikeScan_Type_New(PyTypeObject * type, PyObject * args, P
 
     if (self) {
         self->client = NULL;
+        self->py_cursor = NULL;
     }
 
     return (PyObject *) self;
@@ -143,6 +176,8 @@ static int AerospikeScan_Type_Init(AerospikeScan * self, PyObject * args, PyObje
 static void AerospikeScan_Type_Dealloc(AerospikeScan * self)
 {
 	as_scan_destroy(&self->scan);
+	static_pool_free(self->static_pool);
+	Py_CLEAR(self->py_cursor);
 
 	if (self->unicodeStrVector != NULL) {
 		for (unsigned int i = 0; i < self->unicodeStrVector->size ; ++i) {
@@ -15,16 +15,24 @@
  ******************************************************************************/
 #include <Python.h>
 #include <stdbool.h>
+#include <string.h>
 
 #include <aerospike/aerospike_key.h>
 #include <aerospike/as_key.h>
 #include <aerospike/as_error.h>
 #include <aerospike/as_record.h>
+#include <aerospike/as_buffer.h>
+#include <aerospike/as_msgpack.h>
+#include <aerospike/as_serializer.h>
 
+#include "blob.h"
+#include "cdt_decoder.h"
+#include "cdt_lazy.h"
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "policy_types.h"
 #include "serializer.h"
 
 uint32_t is_user_serializer_registered = 0;
@@ -32,6 +40,45 @@ uint32_t is_user_deserializer_registered = 0;
 
 user_serializer_callback user_serializer_call_info, user_deserializer_call_info;
 
+/*
+ * How blobs are returned when no deserializer is registered. Read commands
+ * set it from their policy for the duration of the record conversion, it is
+ * thread local as the GIL may be released in between by a deserializer.
+ */
+static __thread int read_blob_as = READ_BLOB_AS_BYTEARRAY;
+
+/*
+ * The dumps and loads functions of the pickle and json modules. They are
+ * looked up the first time they are needed and kept afterwards, instead of
+ * resolving the module and the method for every value.
+ */
+static PyObject * py_pickle_dumps = NULL;
+static PyObject * py_pickle_loads = NULL;
+static PyObject * py_json_dumps = NULL;
+static PyObject * py_json_loads = NULL;
+
+static PyObject * get_serializer_function(PyObject ** py_cache, const char * module_name, const char * function_name)
+{
+	if (*py_cache) {
+		return *py_cache;
+	}
+
+	PyObject * py_module = PyImport_ImportModule(module_name);
+	if (!py_module) {
+		return NULL;
+	}
+	PyObject * py_function = PyObject_GetAttrString(py_module, function_name);
+	Py_DECREF(py_module);
+
+	// The import may have let another thread in which already set the cache.
+	if (py_function && !*py_cache) {
+		*py_cache = py_function;
+	} else {
+		Py_XDECREF(py_function);
+	}
+	return *py_cache;
+}
+
 /**
  ******************************************************************************************************
  * Set a serializer in the aerospike database
@@ -197,6 +244,159 @@ CLEANUP:
 	return;
 }
 
+/*
+ *******************************************************************************************************
+ * Loads the contents of an object supporting the buffer protocol into an
+ * as_bytes of type AS_BYTES_BLOB.
+ * If static_pool lends buffers and the buffer is contiguous, the as_bytes
+ * wraps the memory of the object, which is kept exported (and so can't be
+ * resized) until the pool is destroyed. Otherwise the contents are copied.
+ *
+ * @param bytes                 The as_bytes object to be set.
+ * @param value                 The object supporting the buffer protocol.
+ * @param static_pool           The pool the as_bytes belongs to, or NULL.
+ * @param error_p               The error object
+ *******************************************************************************************************
+ */
+as_status set_as_bytes_from_buffer(as_bytes **bytes,
+		PyObject *value,
+		as_static_pool *static_pool,
+		as_error *error_p)
+{
+	Py_buffer view;
+
+	if (static_pool && static_pool->lend_buffers) {
+		PyObject * py_view = PyMemoryView_FromObject(value);
+		if (!py_view) {
+			PyErr_Clear();
+			return as_error_update(error_p, AEROSPIKE_ERR_PARAM, "Unable to get the buffer of a blob");
+		}
+
+		Py_buffer * buffer = PyMemoryView_GET_BUFFER(py_view);
+		if (PyBuffer_IsContiguous(buffer, 'C') && buffer->len <= UINT32_MAX) {
+			if (!static_pool->py_buffers) {
+				static_pool->py_buffers = PyList_New(0);
+			}
+			if (!static_pool->py_buffers || PyList_Append(static_pool->py_buffers, py_view) != 0) {
+				PyErr_Clear();
+				Py_DECREF(py_view);
+				return as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to keep the buffer of a blob");
+			}
+			as_bytes_init_wrap(*bytes, (uint8_t *) buffer->buf, (uint32_t) buffer->len, false);
+			as_bytes_set_type(*bytes, AS_BYTES_BLOB);
+			Py_DECREF(py_view);
+			return error_p->code;
+		}
+		Py_DECREF(py_view);
+	}
+
+	if (PyObject_GetBuffer(value, &view, PyBUF_FULL_RO) != 0) {
+		PyErr_Clear();
+		return as_error_update(error_p, AEROSPIKE_ERR_PARAM, "Unable to get the buffer of a blob");
+	}
+
+	if (view.len > UINT32_MAX) {
+		PyBuffer_Release(&view);
+		return as_error_update(error_p, AEROSPIKE_ERR_PARAM, "Blob is too large");
+	}
+
+	as_bytes_init(*bytes, (uint32_t) view.len);
+	if (view.len > 0 && PyBuffer_ToContiguous((*bytes)->value, &view, view.len, 'C') != 0) {
+		PyErr_Clear();
+		PyBuffer_Release(&view);
+		return as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to copy the buffer of a blob");
+	}
+	(*bytes)->size = (uint32_t) view.len;
+	as_bytes_set_type(*bytes, AS_BYTES_BLOB);
+
+	PyBuffer_Release(&view);
+	return error_p->code;
+}
+
+/*
+ *******************************************************************************************************
+ * Returns true for the buffer objects stored as blobs: bytes, bytearray,
+ * memoryview and mmap. Other buffer-protocol objects, such as array.array or
+ * numpy arrays, keep being serialized so that they are read back as the same
+ * type.
+ *******************************************************************************************************
+ */
+bool is_blob_buffer(PyObject * value)
+{
+	return PyBytes_Check(value) || PyByteArray_Check(value) || PyMemoryView_Check(value) ||
+		!strcmp(Py_TYPE(value)->tp_name, "mmap.mmap");
+}
+
+/*
+ *******************************************************************************************************
+ * Returns true if values are going to be handled by the python serializer or
+ * a built-in codec, in which case blob buffers are stored as blobs.
+ *******************************************************************************************************
+ */
+bool serializer_is_builtin(AerospikeClient * self, int32_t serializer_policy)
+{
+	if (!self->is_client_put_serializer && self->user_serializer_call_info.callback) {
+		return false;
+	}
+
+	return serializer_policy == SERIALIZER_PYTHON ||
+		serializer_policy == SERIALIZER_JSON ||
+		serializer_policy == SERIALIZER_MSGPACK;
+}
+
+/*
+ *******************************************************************************************************
+ * Reads the read_blob_as field of a read or batch policy, given as a dict
+ * or a policy object.
+ *******************************************************************************************************
+ */
+as_status read_blob_as_from_policy(as_error * err, PyObject * py_policy, int * blob_as)
+{
+	PyObject * py_fields = py_policy;
+	PyObject * py_value = NULL;
+
+	*blob_as = READ_BLOB_AS_BYTEARRAY;
+
+	if (AerospikePolicy_Check(py_policy)) {
+		py_fields = ((AerospikePolicy *) py_policy)->py_fields;
+	}
+
+	if (!py_fields || !PyDict_Check(py_fields)) {
+		return err->code;
+	}
+
+	py_value = PyDict_GetItemString(py_fields, "read_blob_as");
+	if (!py_value) {
+		return err->code;
+	}
+
+	if (PyString_Check(py_value)) {
+		const char * name = PyString_AsString(py_value);
+		if (name && !strcmp(name, "bytearray")) {
+			return err->code;
+		}
+		if (name && !strcmp(name, "memoryview")) {
+			*blob_as = READ_BLOB_AS_MEMORYVIEW;
+			return err->code;
+		}
+	}
+
+	return as_error_update(err, AEROSPIKE_ERR_PARAM, "read_blob_as must be 'bytearray' or 'memoryview'");
+}
+
+/*
+ *******************************************************************************************************
+ * Sets how blobs are returned by the current thread, returns the previous
+ * setting so that it can be restored.
+ *******************************************************************************************************
+ */
+int set_read_blob_as(int blob_as)
+{
+	int previous = read_blob_as;
+	read_blob_as = blob_as;
+	return previous;
+}
+
 /*
  *******************************************************************************************************
  * If serialize_flag == true, executes the passed user_serializer_callback,
@@ -284,6 +484,173 @@ CLEANUP:
 	}
 }
 
+/*
+ * Blobs written by the built-in codecs start with a tag, so that a client
+ * configured with a codec only decodes the blobs the codec wrote and returns
+ * any other blob as is. 0xc1 is never used by msgpack and can not start a
+ * json document.
+ */
+#define CODEC_TAG_SIZE 4
+static const uint8_t json_codec_tag[CODEC_TAG_SIZE] = {0xc1, 'A', 'S', 'J'};
+static const uint8_t msgpack_codec_tag[CODEC_TAG_SIZE] = {0xc1, 'A', 'S', 'M'};
+
+static const uint8_t * codec_tag(int codec)
+{
+	return codec == SERIALIZER_JSON ? json_codec_tag : msgpack_codec_tag;
+}
+
+/*
+ *******************************************************************************************************
+ * Sets as_bytes to a blob of the codec tag followed by the encoded value.
+ *
+ * @param bytes                     The as_bytes to be set.
+ * @param codec                     SERIALIZER_JSON or SERIALIZER_MSGPACK.
+ * @param data                      The encoded value.
+ * @param size                      The size of data.
+ * @param error_p                   The as_error to be populated by the function
+ *                                  with encountered error if any.
+ *******************************************************************************************************
+ */
+static as_status set_codec_bytes(as_bytes **bytes,
+		int codec,
+		const uint8_t *data,
+		uint32_t size,
+		as_error *error_p)
+{
+	as_bytes_init(*bytes, CODEC_TAG_SIZE + size);
+
+	if (!as_bytes_set(*bytes, 0, codec_tag(codec), CODEC_TAG_SIZE) ||
+			!as_bytes_set(*bytes, CODEC_TAG_SIZE, data, size)) {
+		return as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to set as_bytes");
+	}
+	as_bytes_set_type(*bytes, AS_BYTES_BLOB);
+	return AEROSPIKE_OK;
+}
+
+/*
+ *******************************************************************************************************
+ * Whether a blob was written by the codec.
+ *******************************************************************************************************
+ */
+static bool is_codec_bytes(as_bytes *bytes, int codec)
+{
+	return as_bytes_size(bytes) >= CODEC_TAG_SIZE &&
+		memcmp(as_bytes_get(bytes), codec_tag(codec), CODEC_TAG_SIZE) == 0;
+}
+
+/*
+ *******************************************************************************************************
+ * Serializes a tuple into as_bytes holding a msgpack array, without going
+ * through Python. Other values which reach the serializer have no msgpack
+ * representation.
+ *
+ * @param bytes                     The as_bytes to be set.
+ * @param value                     The value to be serialized.
+ * @param error_p                   The as_error to be populated by the function
+ *                                  with encountered error if any.
+ *******************************************************************************************************
+ */
+static as_status serialize_msgpack(AerospikeClient * self,
+		as_bytes **bytes,
+		PyObject *value,
+		as_error *error_p)
+{
+	if (!PyTuple_Check(value)) {
+		return as_error_update(error_p, AEROSPIKE_ERR_PARAM,
+				"Unable to serialize %s using msgpack serializer", Py_TYPE(value)->tp_name);
+	}
+
+	PyObject * py_list = PySequence_List(value);
+	if (!py_list) {
+		return as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to serialize tuple");
+	}
+
+	as_val * val = NULL;
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
+	if (pyobject_to_val(self, error_p, py_list, &val, &static_pool, SERIALIZER_MSGPACK) == AEROSPIKE_OK) {
+		as_serializer serializer;
+		as_buffer buffer;
+		as_msgpack_init(&serializer);
+		as_buffer_init(&buffer);
+
+		if (as_serializer_serialize(&serializer, val, &buffer) != 0) {
+			as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to serialize using msgpack serializer");
+		} else {
+			set_codec_bytes(bytes, SERIALIZER_MSGPACK, buffer.data, buffer.size, error_p);
+		}
+
+		as_buffer_destroy(&buffer);
+		as_serializer_destroy(&serializer);
+	}
+
+	as_val_destroy(val);
+	POOL_DESTROY(&static_pool);
+	Py_DECREF(py_list);
+	return error_p->code;
+}
+
+/*
+ *******************************************************************************************************
+ * Decodes a blob with the codec the client is configured with,
+ * SERIALIZER_JSON or SERIALIZER_MSGPACK. Blobs without the codec tag, and
+ * msgpack values followed by other bytes, are not decoded and fail.
+ *
+ * @param bytes                 The as_bytes to be deserialized.
+ * @param retval                The decoded value.
+ * @param error_p               The as_error to be populated by the function
+ *                              with encountered error if any.
+ *******************************************************************************************************
+ */
+static as_status deserialize_with_codec(AerospikeClient * self,
+		as_bytes *bytes,
+		PyObject **retval,
+		as_error *error_p)
+{
+	if (!is_codec_bytes(bytes, self->serializer_codec)) {
+		return as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Blob was not written by the codec");
+	}
+
+	uint8_t * data = as_bytes_get(bytes) + CODEC_TAG_SIZE;
+	uint32_t size = as_bytes_size(bytes) - CODEC_TAG_SIZE;
+
+	if (self->serializer_codec == SERIALIZER_JSON) {
+		PyObject * py_loads = get_serializer_function(&py_json_loads, "json", "loads");
+		if (!py_loads) {
+			return as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to load json module");
+		}
+		PyObject * py_value = PyBytes_FromStringAndSize((char *) data, size);
+		if (!py_value) {
+			return as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to deserialize bytes");
+		}
+		*retval = PyObject_CallFunctionObjArgs(py_loads, py_value, NULL);
+		Py_DECREF(py_value);
+		if (!*retval) {
+			return as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to deserialize bytes");
+		}
+		return AEROSPIKE_OK;
+	}
+
+	// as_serializer_deserialize ignores trailing bytes, the unpacker is used
+	// directly so that the value has to span the whole blob.
+	as_unpacker unpacker = {
+		.buffer = data,
+		.offset = 0,
+		.length = size
+	};
+	as_val * val = NULL;
+
+	if (as_unpack_val(&unpacker, &val) != 0 || !val || unpacker.offset != unpacker.length) {
+		as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to deserialize bytes");
+	} else {
+		val_to_pyobject(self, error_p, val, retval);
+	}
+
+	as_val_destroy(val);
+	return error_p->code;
+}
+
 /*
  *******************************************************************************************************
  * Checks serializer_policy.
@@ -315,6 +682,8 @@ extern as_status serialize_based_on_serializer_policy(AerospikeClient * self,
 		}
 	} else if (self->user_serializer_call_info.callback) {
 		serializer_policy = SERIALIZER_USER;
+	} else if (self->serializer_codec != SERIALIZER_NONE) {
+		serializer_policy = self->serializer_codec;
 	}
 
 	switch(serializer_policy) {
@@ -325,72 +694,78 @@ extern as_status serialize_based_on_serializer_policy(AerospikeClient * self,
 		case SERIALIZER_PYTHON:
 			{
 				/*
-				 * Serialize bytearray as is and store them into database with
+				 * Serialize bytes, bytearray, memoryview and mmap objects
+				 * as is and store them into database with
 				 * type AS_BYTES_BLOB, unlike other values in case of 
 				 * SERIALIZER_PYTHON.
 				 * This is a special case.
 				 * Refer: AER-3589 for more details.
 				 */
-				if (PyByteArray_Check(value)) {
-					uint8_t *bytes_array = (uint8_t *) PyByteArray_AsString(value);
-					uint32_t bytes_array_len  = (uint32_t)  PyByteArray_Size(value);
-					set_as_bytes(bytes, bytes_array, bytes_array_len, AS_BYTES_BLOB, error_p);
-				} else if (PyBytes_Check(value)) {
-					uint8_t *my_bytes = (uint8_t *) PyBytes_AsString(value);
-					uint32_t my_bytes_len  = (uint32_t)  PyBytes_Size(value);
-					set_as_bytes(bytes, my_bytes, my_bytes_len, AS_BYTES_BLOB, error_p);
+				if (is_blob_buffer(value)) {
+					if (set_as_bytes_from_buffer(bytes, value, NULL, error_p) != AEROSPIKE_OK) {
+						goto CLEANUP;
+					}
 				} else {
 
-					/* get the sys.modules dictionary */
-					PyObject* sysmodules = PyImport_GetModuleDict();
-					PyObject* cpickle_module = NULL;
-					if (PyMapping_HasKeyString(sysmodules, "pickle")) {
-						cpickle_module = PyMapping_GetItemString(sysmodules, "pickle");
-					} else {
-						cpickle_module = PyImport_ImportModule("pickle");
+					PyObject * py_dumps = get_serializer_function(&py_pickle_dumps, "pickle", "dumps");
+					if (!py_dumps) {
+						as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to load pickle module");
+						goto CLEANUP;
 					}
 
-					if (!cpickle_module) {
-						/* insert error handling here! and exit this function */
-						as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to load pickle module");
+					initresult = PyObject_CallFunctionObjArgs(py_dumps, value, NULL);
+					if (!initresult) {
+						as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to call dumps function");
 						goto CLEANUP;
-					} else {
-						PyObject * py_funcname = PyString_FromString("dumps");
-
-						Py_INCREF(cpickle_module);
-						initresult = PyObject_CallMethodObjArgs(cpickle_module,
-								py_funcname, value, NULL);
-						Py_DECREF(cpickle_module);
-						Py_DECREF(py_funcname);
-
-						if (!initresult) {
-							/* more error handling &c */
-							as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to call dumps function");
-							goto CLEANUP;
-						} else {
-							Py_INCREF(initresult);
-
-							char *return_value;
-							Py_ssize_t len;
-							PyBytes_AsStringAndSize(initresult, &return_value, &len);
-							set_as_bytes(bytes, (uint8_t *) return_value,
-									len, AS_BYTES_PYTHON, error_p);
-							Py_DECREF(initresult);
-						}
 					}
-					Py_XDECREF(cpickle_module);
+
+					char *return_value;
+					Py_ssize_t len;
+					PyBytes_AsStringAndSize(initresult, &return_value, &len);
+					set_as_bytes(bytes, (uint8_t *) return_value,
+							len, AS_BYTES_PYTHON, error_p);
 				}
 			}
 			break;
 		case SERIALIZER_JSON:
-			/*
-			 *   TODO:
-			 *     Handle JSON serialization after support for AS_BYTES_JSON
-			 *     is added in aerospike-client-c
-			 */
-			as_error_update(error_p, AEROSPIKE_ERR,
-					"Unable to serialize using standard json serializer");
-			goto CLEANUP;
+			{
+				/*
+				 * The server has no json particle type, the document is
+				 * stored as a blob. Clients configured with the json codec
+				 * decode blobs back on read.
+				 */
+				PyObject * py_dumps = get_serializer_function(&py_json_dumps, "json", "dumps");
+				if (!py_dumps) {
+					as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to load json module");
+					goto CLEANUP;
+				}
+
+				initresult = PyObject_CallFunctionObjArgs(py_dumps, value, NULL);
+				if (!initresult) {
+					as_error_update(error_p, AEROSPIKE_ERR,
+							"Unable to serialize using standard json serializer");
+					goto CLEANUP;
+				}
+
+				const char *return_value;
+				Py_ssize_t len;
+				return_value = PyUnicode_AsUTF8AndSize(initresult, &len);
+				if (!return_value) {
+					as_error_update(error_p, AEROSPIKE_ERR,
+							"Unable to serialize using standard json serializer");
+					goto CLEANUP;
+				}
+				if (set_codec_bytes(bytes, SERIALIZER_JSON, (uint8_t *) return_value,
+						len, error_p) != AEROSPIKE_OK) {
+					goto CLEANUP;
+				}
+			}
+			break;
+		case SERIALIZER_MSGPACK:
+			if (serialize_msgpack(self, bytes, value, error_p) != AEROSPIKE_OK) {
+				goto CLEANUP;
+			}
+			break;
 
 		case SERIALIZER_USER:
 			if (use_client_serializer) {
@@ -456,47 +831,29 @@ extern as_status deserialize_based_on_as_bytes_type(AerospikeClient * self,
 {
 	switch(as_bytes_get_type(bytes)) {
 		case AS_BYTES_PYTHON: {
-								PyObject* sysmodules = PyImport_GetModuleDict();
-								PyObject* cpickle_module = NULL;
-								if (PyMapping_HasKeyString(sysmodules, "pickle")) {
-									cpickle_module = PyMapping_GetItemString(sysmodules, "pickle");
-								} else {
-									cpickle_module = PyImport_ImportModule("pickle");
-								}
-
-								PyObject* initresult = NULL;
-								if (!cpickle_module) {
-									/* insert error handling here! and exit this function */
+								PyObject* py_loads = get_serializer_function(&py_pickle_loads, "pickle", "loads");
+								if (!py_loads) {
 									as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to load pickle module");
 									goto CLEANUP;
-								} else {
-									char*       bytes_val_p = (char*)bytes->value;
-									PyObject *py_value = PyBytes_FromStringAndSize(bytes_val_p, as_bytes_size(bytes));
-									PyObject *py_funcname = PyString_FromString("loads");
-
-									Py_INCREF(cpickle_module);
-									initresult = PyObject_CallMethodObjArgs(cpickle_module, py_funcname, py_value, NULL);
-									Py_DECREF(cpickle_module);
-									Py_DECREF(py_funcname);
-									Py_DECREF(py_value);
+								}
+
+								char*       bytes_val_p = (char*)bytes->value;
+								PyObject *py_value = PyBytes_FromStringAndSize(bytes_val_p, as_bytes_size(bytes));
+								PyObject *initresult = PyObject_CallFunctionObjArgs(py_loads, py_value, NULL);
+								Py_DECREF(py_value);
+								if (!initresult) {
+									// At this point we want to try to fallback to returning a byte array
+									uint32_t bval_size = as_bytes_size(bytes);
+									initresult = PyByteArray_FromStringAndSize((char *) as_bytes_get(bytes), bval_size);
+									// We couldn't convert the value into a byte array
 									if (!initresult) {
-										// At this point we want to try to fallback to returning a byte array
-										uint32_t bval_size = as_bytes_size(bytes);
-										initresult = PyByteArray_FromStringAndSize((char *) as_bytes_get(bytes), bval_size);
-										// We couldn't convert the value into a byte array
-										if (!initresult) {
-											as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to deserialize bytes");
-											Py_XDECREF(cpickle_module);
-											goto CLEANUP;
-										}
-										// The fallback deserialization succeeded
-										*retval = initresult;
-										as_error_update(error_p, AEROSPIKE_OK, NULL);
-									} else {
-										*retval = initresult;
+										as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to deserialize bytes");
+										goto CLEANUP;
 									}
+									// The fallback deserialization succeeded
+									as_error_update(error_p, AEROSPIKE_OK, NULL);
 								}
-								Py_XDECREF(cpickle_module);
+								*retval = initresult;
 							}
 							break;
 		case AS_BYTES_BLOB: {
@@ -512,6 +869,17 @@ extern as_status deserialize_based_on_as_bytes_type(AerospikeClient * self,
 										*retval = py_val;
 										as_error_update(error_p, AEROSPIKE_OK, NULL);
 									}
+								} else if (self->serializer_codec != SERIALIZER_NONE) {
+									if (deserialize_with_codec(self, bytes, retval, error_p) != AEROSPIKE_OK) {
+										uint32_t bval_size = as_bytes_size(bytes);
+										PyObject *py_val = PyByteArray_FromStringAndSize((char *) as_bytes_get(bytes), bval_size);
+										if (!py_val) {
+											as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to deserialize bytes");
+											goto CLEANUP;
+										}
+										*retval = py_val;
+										as_error_update(error_p, AEROSPIKE_OK, NULL);
+									}
 								} else {
 									if (is_user_deserializer_registered) {
 										execute_user_callback(&user_deserializer_call_info, &bytes, retval, false, error_p);
@@ -527,7 +895,12 @@ extern as_status deserialize_based_on_as_bytes_type(AerospikeClient * self,
 										}
 									} else {
 										uint32_t bval_size = as_bytes_size(bytes);
-										PyObject *py_val = PyByteArray_FromStringAndSize((char *) as_bytes_get(bytes), bval_size);
+										PyObject *py_val = NULL;
+										if (read_blob_as == READ_BLOB_AS_MEMORYVIEW) {
+											py_val = AerospikeBlob_MemoryView(bytes);
+										} else {
+											py_val = PyByteArray_FromStringAndSize((char *) as_bytes_get(bytes), bval_size);
+										}
 										if (!py_val) {
 											as_error_update(error_p, AEROSPIKE_ERR_CLIENT, "Unable to deserialize bytes");
 											goto CLEANUP;
@@ -537,6 +910,19 @@ extern as_status deserialize_based_on_as_bytes_type(AerospikeClient * self,
 								}
 							}
 							break;
+		case AS_BYTES_LIST:
+		case AS_BYTES_MAP:	{
+								// Read without deserialization, see cdt_mode.
+								if (get_cdt_mode() == CDT_MODE_LAZY) {
+									AerospikeLazyCDT_FromBytes(self, error_p, bytes, retval);
+									break;
+								}
+								if (get_cdt_mode() != CDT_MODE_DEFAULT) {
+									cdt_bytes_to_pyobject(self, error_p, bytes, retval);
+									break;
+								}
+							}
+							// Fall through
 		default:			{
 								// First try to return a raw byte array, if that fails raise an error
 								uint32_t bval_size = as_bytes_size(bytes);
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import pytest
+import sys
+from aerospike import exception as e
+from aerospike_helpers.operations import operations
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import aio
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+def run(command):
+    """
+    Run command() inside the event loop, aio.Client needs a running loop
+    to create its futures.
+    """
+    async def call():
+        return await command()
+
+    return asyncio.get_event_loop().run_until_complete(call())
+
+
+class TestAio(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        config = TestBaseClass.get_connection_config()
+        _, user, password = TestBaseClass().get_hosts()
+        try:
+            self.aio_client = aio.Client(config)
+        except e.ClientError:
+            pytest.skip("aerospike was built without an event library")
+        if user is None and password is None:
+            self.aio_client.connect()
+        else:
+            self.aio_client.connect(user, password)
+
+        self.keys = [('test', 'aio', i) for i in range(10)]
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {'i': i})
+
+        yield
+
+        self.aio_client.close()
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    def test_get(self):
+        key, meta, bins = run(lambda: self.aio_client.get(self.keys[1]))
+        assert bins == {'i': 1}
+        assert meta['gen'] == 1
+
+    def test_get_concurrent(self):
+        records = run(lambda: asyncio.gather(*(self.aio_client.get(key) for key in self.keys)))
+        assert [bins['i'] for _, _, bins in records] == list(range(10))
+
+    def test_get_record_not_found(self):
+        with pytest.raises(e.RecordNotFound):
+            run(lambda: self.aio_client.get(('test', 'aio', 'missing')))
+
+    def test_get_record_not_found_key(self):
+        missing = ('test', 'aio', 'missing')
+        with pytest.raises(e.RecordNotFound) as err_info:
+            run(lambda: self.aio_client.get(missing))
+        assert err_info.value.key == missing
+        assert e.RecordNotFound.key is None
+
+    def test_get_default_policy_send_key(self):
+        config = TestBaseClass.get_connection_config()
+        config['policies'] = {'read': {'key': aerospike.POLICY_KEY_SEND}}
+        _, user, password = TestBaseClass().get_hosts()
+        client = aio.Client(config)
+        if user is None and password is None:
+            client.connect()
+        else:
+            client.connect(user, password)
+
+        try:
+            key, _, _ = run(lambda: client.get(self.keys[1]))
+            assert key[2] == 1
+        finally:
+            client.close()
+
+    def test_put(self):
+        assert run(lambda: self.aio_client.put(self.keys[2], {'i': 20})) == 0
+        _, _, bins = self.as_connection.get(self.keys[2])
+        assert bins == {'i': 20}
+
+    def test_put_invalid_key(self):
+        with pytest.raises(e.ParamError):
+            run(lambda: self.aio_client.put(('test', 'aio'), {'i': 20}))
+
+    def test_operate(self):
+        ops = [operations.increment('i', 5), operations.read('i')]
+        _, _, bins = run(lambda: self.aio_client.operate(self.keys[3], ops))
+        assert bins == {'i': 8}
+
+    def test_get_many(self):
+        records = run(lambda: self.aio_client.get_many(self.keys))
+        assert len(records) == len(self.keys)
+        assert [bins['i'] for _, _, bins in records] == list(range(10))
+
+    def test_get_many_empty(self):
+        assert run(lambda: self.aio_client.get_many([])) == []
+
+    def test_query_results(self):
+        query = self.aio_client.query('test', 'aio')
+        assert isinstance(query, aio.Query)
+        query.select('i')
+        records = run(lambda: query.results())
+        assert sorted(bins['i'] for _, _, bins in records) == list(range(10))
+
+    def test_client_is_a_client(self):
+        assert isinstance(self.aio_client, aerospike.Client)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestBatchResultFormat(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.keys = [('test', 'result_format', i) for i in range(10)]
+        self.keys.append(('test', 'result_format', 'str_key'))
+        self.keys.append(('test', 'result_format', bytearray(b'bytes_key')))
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {'i': i, 'name': 'name%d' % i})
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    def test_get_many_dict(self):
+        keys = self.keys + [('test', 'result_format', 'missing')]
+        records = self.as_connection.get_many(keys, result_format='dict')
+
+        assert len(records) == 13
+        assert records[3] == {'i': 3, 'name': 'name3'}
+        assert records['str_key']['i'] == 10
+        assert records[b'bytes_key']['i'] == 11
+        assert records['missing'] is None
+
+    def test_get_many_dict_meta(self):
+        keys = self.keys[:2] + [('test', 'result_format', 'missing')]
+        records = self.as_connection.get_many(keys, result_format='dict_meta')
+
+        meta, bins = records[1]
+        assert meta['gen'] == 1
+        assert bins == {'i': 1, 'name': 'name1'}
+        assert records['missing'] == (None, None)
+
+    def test_get_many_dict_matches_list(self):
+        records = self.as_connection.get_many(self.keys[:10])
+        by_key = self.as_connection.get_many(self.keys[:10], result_format='dict')
+        assert by_key == dict((key[2], bins) for key, _, bins in records)
+
+    def test_get_many_dict_by_digest(self):
+        digest = aerospike.calc_digest('test', 'result_format', 1)
+        records = self.as_connection.get_many([('test', 'result_format', None, digest)],
+                                              result_format='dict')
+        assert records == {bytes(digest): {'i': 1, 'name': 'name1'}}
+
+    def test_get_many_list_format(self):
+        records = self.as_connection.get_many(self.keys, result_format='list')
+        assert records == self.as_connection.get_many(self.keys)
+
+    def test_get_many_key_batch_dict(self):
+        keys = aerospike.KeyBatch('test', 'result_format', range(10))
+        records = self.as_connection.get_many(keys, result_format='dict')
+        assert sorted(records) == list(range(10))
+
+    def test_select_many_dict(self):
+        records = self.as_connection.select_many(self.keys[:3], ['name'], result_format='dict')
+        assert records == {0: {'name': 'name0'}, 1: {'name': 'name1'}, 2: {'name': 'name2'}}
+
+    def test_select_many_dict_meta(self):
+        records = self.as_connection.select_many(self.keys[:1], ['i'], result_format='dict_meta')
+        meta, bins = records[0]
+        assert meta['gen'] == 1
+        assert bins == {'i': 0}
+
+    @pytest.mark.parametrize("result_format", ['tuple', 1, b'dict'])
+    def test_invalid_result_format(self, result_format):
+        with pytest.raises(e.ParamError):
+            self.as_connection.get_many(self.keys, result_format=result_format)
+        with pytest.raises(e.ParamError):
+            self.as_connection.select_many(self.keys, ['i'], result_format=result_format)
+
+    def test_columnar_and_dict(self):
+        pytest.importorskip("numpy")
+        with pytest.raises(e.ParamError):
+            self.as_connection.get_many(self.keys, columnar=True, result_format='dict')
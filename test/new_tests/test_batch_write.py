@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+from aerospike_helpers.operations import operations
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestBatchWrite(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.keys = [('test', 'demo', 'batch_write_%d' % i) for i in range(20)]
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    def test_batch_write(self):
+        records = [(key, {'i': i}) for i, key in enumerate(self.keys)]
+        results = self.as_connection.batch_write(records)
+
+        assert results == [(key, 0) for key in self.keys]
+        for i, key in enumerate(self.keys):
+            _, _, bins = self.as_connection.get(key)
+            assert bins == {'i': i}
+
+    def test_batch_write_with_meta(self):
+        records = [(key, {'i': 1}, {'ttl': 1000}) for key in self.keys[:3]]
+        self.as_connection.batch_write(records)
+
+        _, meta, _ = self.as_connection.get(self.keys[0])
+        assert 0 < meta['ttl'] <= 1000
+
+    def test_batch_write_policy(self):
+        self.as_connection.put(self.keys[0], {'i': 0})
+        records = [(key, {'i': 1}) for key in self.keys[:2]]
+        results = self.as_connection.batch_write(records, {'exists': aerospike.POLICY_EXISTS_CREATE})
+
+        assert results[0] == (self.keys[0], e.RecordExistsError.code)
+        assert results[1] == (self.keys[1], 0)
+
+    @pytest.mark.parametrize("concurrency", [1, 3, 128])
+    def test_batch_write_concurrency(self, concurrency):
+        records = [(key, {'i': i}) for i, key in enumerate(self.keys)]
+        results = self.as_connection.batch_write(records, concurrency=concurrency)
+        assert [status for _, status in results] == [0] * len(self.keys)
+
+    def test_batch_write_invalid_record_is_reported(self):
+        records = [(self.keys[0], {'i': 0}), (('test', 'demo'), {'i': 1}), ('not a record',)]
+        results = self.as_connection.batch_write(records)
+
+        assert results[0] == (self.keys[0], 0)
+        assert results[1][1] == e.ParamError.code
+        assert results[2][1] == e.ParamError.code
+
+    def test_batch_write_empty(self):
+        assert self.as_connection.batch_write([]) == []
+
+    def test_batch_operate(self):
+        for key in self.keys:
+            self.as_connection.put(key, {'i': 1})
+
+        ops = [operations.increment('i', 2), operations.read('i')]
+        results = self.as_connection.batch_operate(self.keys, ops)
+
+        assert len(results) == len(self.keys)
+        for key, (result_key, status, meta, bins) in zip(self.keys, results):
+            assert result_key == key
+            assert status == 0
+            assert meta['gen'] == 2
+            assert bins == {'i': 3}
+
+    def test_batch_operate_missing_record(self):
+        self.as_connection.put(self.keys[0], {'i': 1})
+        ops = [operations.read('i')]
+        results = self.as_connection.batch_operate(self.keys[:2], ops)
+
+        assert results[0][1] == 0
+        assert results[0][3] == {'i': 1}
+        assert results[1] == (self.keys[1], e.RecordNotFound.code, None, None)
+
+    def test_batch_operate_invalid_operations(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.batch_operate(self.keys, {'op': aerospike.OPERATOR_READ})
+
+    def test_batch_remove(self):
+        for key in self.keys[:10]:
+            self.as_connection.put(key, {'i': 1})
+
+        results = self.as_connection.batch_remove(self.keys)
+
+        assert [status for _, status in results[:10]] == [0] * 10
+        assert [status for _, status in results[10:]] == [e.RecordNotFound.code] * 10
+        _, meta = self.as_connection.exists(self.keys[0])
+        assert meta is None
+
+    @pytest.mark.parametrize("method", ["batch_write", "batch_remove"])
+    def test_keys_must_be_a_sequence(self, method):
+        with pytest.raises(e.ParamError):
+            getattr(self.as_connection, method)("keys")
+
+    @pytest.mark.parametrize("concurrency", [0, 129, "2"])
+    def test_invalid_concurrency(self, concurrency):
+        with pytest.raises(e.ParamError):
+            self.as_connection.batch_remove(self.keys, concurrency=concurrency)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+def partition_id(digest):
+    return (digest[0] | (digest[1] << 8)) & 4095
+
+
+class TestCalcDigests(object):
+
+    def test_matches_calc_digest(self):
+        keys = [1, -5, 'a', u'été', b'bytes', bytearray(b'\x00\x01')]
+        digests, partition_ids, nodes = aerospike.calc_digests('test', 'demo', keys)
+
+        assert isinstance(digests, bytes)
+        assert len(digests) == 20 * len(keys)
+        assert nodes is None
+        for i, key in enumerate(keys):
+            digest = aerospike.calc_digest('test', 'demo', key)
+            assert digests[20 * i:20 * (i + 1)] == digest
+            assert partition_ids[i] == partition_id(digest)
+
+    def test_bool_keys(self):
+        digests, _, _ = aerospike.calc_digests('test', 'demo', [True, False])
+        assert digests[:20] == aerospike.calc_digest('test', 'demo', 1)
+        assert digests[20:] == aerospike.calc_digest('test', 'demo', 0)
+
+    def test_partition_ids_format(self):
+        _, partition_ids, _ = aerospike.calc_digests('test', 'demo', range(100))
+        assert partition_ids.format == 'H'
+        assert len(partition_ids) == 100
+        assert all(0 <= pid < 4096 for pid in partition_ids)
+
+    def test_set_none(self):
+        digests, _, _ = aerospike.calc_digests('test', None, [1])
+        assert len(digests) == 20
+
+    def test_empty(self):
+        digests, partition_ids, nodes = aerospike.calc_digests('test', 'demo', [])
+        assert digests == b''
+        assert len(partition_ids) == 0
+
+    def test_numpy(self):
+        np = pytest.importorskip("numpy")
+        keys = np.arange(1000, dtype=np.int64)
+        digests, partition_ids, _ = aerospike.calc_digests('test', 'demo', keys, numpy=True)
+
+        assert digests.shape == (1000, 20)
+        assert digests.dtype == np.uint8
+        assert partition_ids.dtype == np.uint16
+        assert bytes(digests[7]) == aerospike.calc_digest('test', 'demo', 7)
+
+    def test_numpy_int_buffer_matches_list(self):
+        np = pytest.importorskip("numpy")
+        keys = np.arange(0, 2000, 2, dtype=np.int32)[::3]
+        from_array = aerospike.calc_digests('test', 'demo', keys)
+        from_list = aerospike.calc_digests('test', 'demo', [int(k) for k in keys])
+        assert from_array[0] == from_list[0]
+
+    def test_owner_nodes(self, as_connection):
+        keys = list(range(50))
+        _, _, nodes = aerospike.calc_digests('test', 'demo', keys, client=as_connection)
+
+        node_names = set(node['node_name'] for node in as_connection.get_node_names())
+        assert len(nodes) == len(keys)
+        assert set(nodes) <= node_names
+
+    @pytest.mark.parametrize("ns, set_name, keys", [
+        (1, 'demo', [1]),
+        ('test', 1, [1]),
+        ('test', 'demo', 1),
+        ('test', 'demo', [1.5]),
+        ('test', 'demo', [None]),
+        ('test', 'demo', [2 ** 64]),
+        ('test', 's' * 64, [1]),
+        ('test', 'demo', 'key'),
+        ('test', 'demo', b'key'),
+        ('test', 'demo', bytearray(b'key')),
+    ])
+    def test_invalid_arguments(self, ns, set_name, keys):
+        with pytest.raises(e.ParamError):
+            aerospike.calc_digests(ns, set_name, keys)
+
+    def test_invalid_client(self):
+        with pytest.raises(e.ParamError):
+            aerospike.calc_digests('test', 'demo', [1], client=object())
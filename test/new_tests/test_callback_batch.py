@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+from aerospike import predicates as p
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestCallbackBatch(object):
+
+    def setup_class(cls):
+        client = TestBaseClass.get_new_connection()
+        try:
+            client.index_integer_create('test', 'cb_batch', 'age', 'cb_batch_age_index')
+        except e.IndexFoundError:
+            pass
+        client.close()
+
+    def teardown_class(cls):
+        client = TestBaseClass.get_new_connection()
+        try:
+            client.index_remove('test', 'cb_batch_age_index', {})
+        except e.IndexNotFound:
+            pass
+        client.close()
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.keys = [('test', 'cb_batch', i) for i in range(100)]
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {'age': i, 'name': 'name%d' % i, 'blob': bytearray([i])},
+                                   policy={'key': aerospike.POLICY_KEY_SEND})
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    @pytest.mark.parametrize("batch_size", [1, 7, 512])
+    def test_scan_foreach_batched(self, batch_size):
+        records = []
+        scan = self.as_connection.scan('test', 'cb_batch')
+        scan.foreach(records.append, options={'callback_batch_size': batch_size})
+
+        assert sorted(bins['age'] for _, _, bins in records) == list(range(100))
+        key, meta, bins = [r for r in records if r[2]['age'] == 5][0]
+        assert key[2] == 5
+        assert meta['gen'] == 1
+        assert bins == {'age': 5, 'name': 'name5', 'blob': bytearray([5])}
+
+    def test_scan_foreach_batch_callback(self):
+        blocks = []
+        scan = self.as_connection.scan('test', 'cb_batch')
+        scan.foreach(blocks.append, options={'callback_batch_size': 10, 'batch_callback': True})
+
+        assert all(isinstance(block, list) and len(block) <= 10 for block in blocks)
+        assert sum(len(block) for block in blocks) == 100
+
+    def test_scan_foreach_batch_callback_default_size(self):
+        blocks = []
+        scan = self.as_connection.scan('test', 'cb_batch')
+        scan.foreach(blocks.append, options={'batch_callback': True})
+
+        assert sum(len(block) for block in blocks) == 100
+
+    def test_scan_foreach_batched_stop(self):
+        records = []
+
+        def callback(record):
+            records.append(record)
+            if len(records) == 3:
+                return False
+
+        scan = self.as_connection.scan('test', 'cb_batch')
+        scan.foreach(callback, options={'callback_batch_size': 10})
+        assert len(records) == 3
+
+    def test_scan_results_batched(self):
+        scan = self.as_connection.scan('test', 'cb_batch')
+        records = scan.results(options={'callback_batch_size': 16})
+        assert sorted(bins['age'] for _, _, bins in records) == list(range(100))
+
+    def test_query_results_batched(self):
+        query = self.as_connection.query('test', 'cb_batch')
+        query.where(p.between('age', 0, 49))
+        records = query.results(options={'callback_batch_size': 16})
+        assert sorted(bins['age'] for _, _, bins in records) == list(range(50))
+
+    def test_query_foreach_batch_callback(self):
+        blocks = []
+        query = self.as_connection.query('test', 'cb_batch')
+        query.where(p.between('age', 0, 49))
+        query.foreach(blocks.append, options={'callback_batch_size': 8, 'batch_callback': True})
+
+        assert sorted(bins['age'] for block in blocks for _, _, bins in block) == list(range(50))
+
+    @pytest.mark.parametrize("options", [
+        {'callback_batch_size': -1},
+        {'callback_batch_size': '10'},
+        {'callback_batch_size': 2 ** 21},
+        {'batch_callback': 1},
+    ])
+    def test_invalid_options(self, options):
+        scan = self.as_connection.scan('test', 'cb_batch')
+        with pytest.raises(e.ParamError):
+            scan.foreach(lambda record: None, options=options)
+
+        query = self.as_connection.query('test', 'cb_batch')
+        with pytest.raises(e.ParamError):
+            query.results(options=options)
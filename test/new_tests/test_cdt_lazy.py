@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from collections.abc import Mapping, Sequence
+from aerospike import exception as e
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestCdtLazy(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.key = ('test', 'cdt_lazy', 1)
+        self.bins = {
+            'list': [1, 'two', 3.0, bytearray(b'four'), None, [5, [6]], {'seven': 7}],
+            'big_list': list(range(50000)),
+            'map': {'a': 1, 'b': [2, 3], 'c': {'d': 'e'}, 4: 'four'},
+            'i': 1,
+        }
+        self.as_connection.put(self.key, self.bins)
+
+        yield
+
+        try:
+            self.as_connection.remove(self.key)
+        except e.AerospikeError:
+            pass
+
+    def get_lazy(self):
+        _, _, bins = self.as_connection.get(self.key, {'cdt_mode': 'lazy'})
+        return bins
+
+    def test_lazy_list(self):
+        bins = self.get_lazy()
+        lazy = bins['list']
+
+        assert isinstance(lazy, aerospike.LazyList)
+        assert isinstance(lazy, Sequence)
+        assert len(lazy) == 7
+        assert lazy[0] == 1
+        assert lazy[-1] == {'seven': 7}
+        assert lazy[1:3] == ['two', 3.0]
+        assert list(lazy) == self.bins['list']
+        assert list(reversed(lazy)) == self.bins['list'][::-1]
+        assert 'two' in lazy
+        assert lazy.index(3.0) == 2
+        assert lazy.count(1) == 1
+        assert bins['i'] == 1
+
+    def test_lazy_list_index_error(self):
+        lazy = self.get_lazy()['list']
+        with pytest.raises(IndexError):
+            lazy[7]
+        with pytest.raises(ValueError):
+            lazy.index('missing')
+
+    def test_lazy_big_list(self):
+        lazy = self.get_lazy()['big_list']
+        assert len(lazy) == 50000
+        assert lazy[49999] == 49999
+        assert lazy[12345] == 12345
+
+    def test_lazy_map(self):
+        lazy = self.get_lazy()['map']
+
+        assert isinstance(lazy, aerospike.LazyMap)
+        assert isinstance(lazy, Mapping)
+        assert len(lazy) == 4
+        assert lazy['a'] == 1
+        assert lazy[4] == 'four'
+        assert 'c' in lazy and 'z' not in lazy
+        assert lazy.get('z') is None
+        assert lazy.get('z', 0) == 0
+        assert sorted(lazy.keys(), key=str) == [4, 'a', 'b', 'c']
+        assert dict(lazy.items()) == self.bins['map']
+        with pytest.raises(KeyError):
+            lazy['z']
+
+    def test_nested_views(self):
+        bins = self.get_lazy()
+        nested = bins['list'][5]
+        assert isinstance(nested, aerospike.LazyList)
+        assert isinstance(nested[1], aerospike.LazyList)
+        assert nested[1][0] == 6
+        assert isinstance(bins['map']['c'], aerospike.LazyMap)
+        assert bins['map']['c']['d'] == 'e'
+
+    def test_materialize(self):
+        bins = self.get_lazy()
+        assert bins['list'].materialize() == self.bins['list']
+        assert type(bins['list'].materialize()) is list
+        assert bins['map'].materialize() == self.bins['map']
+        assert type(bins['map'].materialize()) is dict
+
+    def test_equality(self):
+        bins = self.get_lazy()
+        assert bins['list'] == self.bins['list']
+        assert bins['map'] == self.bins['map']
+        assert bins['list'] != self.bins['map']
+        assert self.get_lazy()['map'] == bins['map']
+        with pytest.raises(TypeError):
+            hash(bins['list'])
+
+    def test_view_outlives_bins(self):
+        bins = self.get_lazy()
+        lazy = bins['big_list']
+        del bins
+        assert lazy[100] == 100
+
+    def test_get_many_lazy(self):
+        records = self.as_connection.get_many([self.key], {'cdt_mode': 'lazy'})
+        _, _, bins = records[0]
+        assert isinstance(bins['map'], aerospike.LazyMap)
+        assert bins['map'] == self.bins['map']
+
+    def test_select_lazy(self):
+        _, _, bins = self.as_connection.select(self.key, ['list'], {'cdt_mode': 'lazy'})
+        assert bins['list'][1] == 'two'
+
+    def test_client_lazy(self):
+        client = TestBaseClass.get_new_connection({'cdt_mode': 'lazy'})
+        try:
+            _, _, bins = client.get(self.key)
+            assert isinstance(bins['list'], aerospike.LazyList)
+            _, _, bins = client.get(self.key, {'cdt_mode': 'default'})
+            assert type(bins['list']) is list
+        finally:
+            client.close()
+
+    def test_cannot_instantiate(self):
+        with pytest.raises(TypeError):
+            aerospike.LazyList()
+        with pytest.raises(TypeError):
+            aerospike.LazyMap()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestCdtMode(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.keys = [('test', 'cdt_mode', i) for i in range(5)]
+        self.bins = {
+            'list': [1, -1, 2 ** 40, -2 ** 63, 1.5, 'str', u'ünicode', bytearray(b'\x00\x01'), None, True],
+            'map': {'a': 1, 2: 'b', 'nested': {'list': [[1, 2], {'x': [3]}], 'empty': {}}},
+            'empty_list': [],
+            'big_list': list(range(1000)),
+            'geo_list': [aerospike.GeoJSON({'type': 'Point', 'coordinates': [-122.0, 37.5]})],
+            'i': 1,
+        }
+        for key in self.keys:
+            self.as_connection.put(key, self.bins)
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    def test_get_direct(self):
+        _, _, bins = self.as_connection.get(self.keys[0], {'cdt_mode': 'direct'})
+        _, _, expected = self.as_connection.get(self.keys[0])
+        assert bins == expected
+        assert bins['map']['nested']['list'] == [[1, 2], {'x': [3]}]
+        assert isinstance(bins['list'][7], bytearray)
+        assert isinstance(bins['geo_list'][0], aerospike.GeoJSON)
+
+    def test_select_direct(self):
+        _, _, bins = self.as_connection.select(self.keys[0], ['map', 'i'], {'cdt_mode': 'direct'})
+        assert bins == {'map': self.bins['map'], 'i': 1}
+
+    def test_get_many_direct(self):
+        records = self.as_connection.get_many(self.keys, {'cdt_mode': 'direct'})
+        assert records == self.as_connection.get_many(self.keys)
+
+    def test_select_many_direct(self):
+        records = self.as_connection.select_many(self.keys, ['list', 'big_list'], {'cdt_mode': 'direct'})
+        assert [bins['big_list'] for _, _, bins in records] == [self.bins['big_list']] * 5
+
+    def test_ordered_map_direct(self):
+        self.as_connection.map_set_policy(self.keys[0], 'map', {'map_order': aerospike.MAP_KEY_ORDERED})
+        _, _, bins = self.as_connection.get(self.keys[0], {'cdt_mode': 'direct'})
+        assert bins['map'] == self.bins['map']
+
+    def test_policy_object_direct(self):
+        policy = aerospike.ReadPolicy(cdt_mode='direct')
+        _, _, bins = self.as_connection.get(self.keys[0], policy)
+        assert bins['list'] == self.bins['list']
+
+    def test_client_direct(self):
+        client = TestBaseClass.get_new_connection({'cdt_mode': 'direct'})
+        try:
+            _, _, bins = client.get(self.keys[0])
+            assert bins['map'] == self.bins['map']
+            _, _, bins = client.get(self.keys[0], {'cdt_mode': 'default', 'deserialize': False})
+            assert isinstance(bins['map'], bytearray)
+        finally:
+            client.close()
+
+    def test_default_without_deserialize(self):
+        _, _, bins = self.as_connection.get(self.keys[0], {'deserialize': False})
+        assert isinstance(bins['list'], bytearray)
+
+    @pytest.mark.parametrize("cdt_mode", ['fast', 1, None, b'direct'])
+    def test_invalid_cdt_mode(self, cdt_mode):
+        with pytest.raises(e.ParamError):
+            self.as_connection.get(self.keys[0], {'cdt_mode': cdt_mode})
+        with pytest.raises(e.ParamError):
+            self.as_connection.get_many(self.keys, {'cdt_mode': cdt_mode})
+
+    def test_invalid_client_cdt_mode(self):
+        config = TestBaseClass.get_connection_config()
+        config['cdt_mode'] = 'fast'
+        with pytest.raises(e.ParamError):
+            aerospike.client(config)
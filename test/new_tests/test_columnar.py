@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+
+aerospike = pytest.importorskip("aerospike")
+numpy = pytest.importorskip("numpy")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestColumnar(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.keys = [('test', 'columnar', i) for i in range(20)]
+        for i, key in enumerate(self.keys):
+            bins = {'i': i, 'f': i / 2.0, 'name': 'name%d' % i}
+            if i % 5 == 0:
+                del bins['f']
+            self.as_connection.put(key, bins)
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    def test_get_many_columnar(self):
+        keys = self.keys + [('test', 'columnar', 'missing')]
+        columns = self.as_connection.get_many(keys, columnar=True)
+
+        assert sorted(columns.keys()) == ['f', 'i', 'name']
+        assert columns['i'].dtype == numpy.int64
+        assert columns['i'].tolist() == list(range(20)) + [None]
+        assert columns['f'].dtype == numpy.float64
+        assert columns['f'].mask.tolist() == [i % 5 == 0 for i in range(20)] + [True]
+        assert columns['f'][3] == 1.5
+        assert columns['name'].dtype == object
+        assert columns['name'][7] == 'name7'
+
+    def test_get_many_columnar_bins(self):
+        columns = self.as_connection.get_many(self.keys, columnar=['i', 'other'])
+
+        assert sorted(columns.keys()) == ['i', 'other']
+        assert columns['i'].sum() == sum(range(20))
+        assert columns['other'].mask.all()
+
+    def test_get_many_columnar_mixed_numbers(self):
+        self.as_connection.put(self.keys[0], {'i': 0.5})
+        columns = self.as_connection.get_many(self.keys[:3], columnar=['i'])
+
+        assert columns['i'].dtype == numpy.float64
+        assert columns['i'].tolist() == [0.5, 1.0, 2.0]
+
+    def test_get_many_columnar_mixed_types(self):
+        self.as_connection.put(self.keys[1], {'i': 'one'})
+        columns = self.as_connection.get_many(self.keys[:3], columnar=['i'])
+
+        assert columns['i'].dtype == object
+        assert columns['i'].tolist() == [0, 'one', 2]
+
+    def test_scan_results_columnar(self):
+        scan = self.as_connection.scan('test', 'columnar')
+        columns = scan.results(columnar=['i', 'name'])
+
+        assert sorted(columns['i'].tolist()) == list(range(20))
+        assert sorted(columns['name'].tolist()) == sorted('name%d' % i for i in range(20))
+
+    def test_scan_results_columnar_empty(self):
+        scan = self.as_connection.scan('test', 'columnar_empty')
+        columns = scan.results(columnar=['i'])
+
+        assert len(columns['i']) == 0
+
+    @pytest.mark.parametrize("columnar", [1, 'i', [1], ['a' * 16]])
+    def test_invalid_columnar(self, columnar):
+        with pytest.raises(e.ParamError):
+            self.as_connection.get_many(self.keys, columnar=columnar)
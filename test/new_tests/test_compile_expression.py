@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+from aerospike_helpers import expressions as exp
+from aerospike_helpers.operations import expression_operations as expressions
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestCompileExpression(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.keys = []
+        for i in range(5):
+            key = ('test', 'demo', 'compile_expr_%d' % i)
+            self.as_connection.put(key, {'age': i, 'name': 'name%d' % i})
+            self.keys.append(key)
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    def test_compile_expression_returns_expression(self):
+        """
+        Compiling an expression list returns an aerospike.Expression.
+        """
+        expr = self.as_connection.compile_expression(exp.Eq(exp.IntBin('age'), 1).compile())
+        assert isinstance(expr, aerospike.Expression)
+
+    def test_compile_expression_accepts_uncompiled_expression(self):
+        """
+        An expression object is compiled before conversion.
+        """
+        expr = self.as_connection.compile_expression(exp.Eq(exp.IntBin('age'), 1))
+        assert isinstance(expr, aerospike.Expression)
+
+    def test_compile_expression_is_idempotent(self):
+        expr = self.as_connection.compile_expression(exp.Eq(exp.IntBin('age'), 1).compile())
+        assert self.as_connection.compile_expression(expr) is expr
+
+    def test_compiled_expression_in_policy(self):
+        """
+        A compiled expression is reusable as a policy filter.
+        """
+        expr = self.as_connection.compile_expression(exp.Eq(exp.IntBin('age'), 1).compile())
+        policy = {'expressions': expr}
+
+        for _ in range(3):
+            _, _, bins = self.as_connection.get(self.keys[1], policy=policy)
+            assert bins['age'] == 1
+
+        with pytest.raises(e.FilteredOut):
+            self.as_connection.get(self.keys[2], policy=policy)
+
+    def test_compiled_expression_in_operation(self):
+        expr = self.as_connection.compile_expression(exp.Add(exp.IntBin('age'), 10).compile())
+        ops = [expressions.expression_read('result', expr)]
+        _, _, bins = self.as_connection.operate(self.keys[3], ops)
+        assert bins['result'] == 13
+
+    def test_expression_cache_returns_same_object(self):
+        config = TestBaseClass.get_connection_config()
+        config['expression_cache_size'] = 2
+        _, user, password = TestBaseClass().get_hosts()
+        client = aerospike.client(config).connect(user, password)
+
+        try:
+            first = client.compile_expression(exp.Eq(exp.IntBin('age'), 1).compile())
+            second = client.compile_expression(exp.Eq(exp.IntBin('age'), 1).compile())
+            other = client.compile_expression(exp.Eq(exp.IntBin('age'), 2).compile())
+            assert first is second
+            assert first is not other
+        finally:
+            client.close()
+
+    def test_expression_cache_evicts_least_recently_used(self):
+        config = TestBaseClass.get_connection_config()
+        config['expression_cache_size'] = 1
+        _, user, password = TestBaseClass().get_hosts()
+        client = aerospike.client(config).connect(user, password)
+
+        try:
+            first = client.compile_expression(exp.Eq(exp.IntBin('age'), 1).compile())
+            client.compile_expression(exp.Eq(exp.IntBin('age'), 2).compile())
+            again = client.compile_expression(exp.Eq(exp.IntBin('age'), 1).compile())
+            assert first is not again
+        finally:
+            client.close()
+
+    @pytest.mark.parametrize("cache_size", [-1, "10", 2 ** 40])
+    def test_invalid_expression_cache_size(self, cache_size):
+        config = TestBaseClass.get_connection_config()
+        config['expression_cache_size'] = cache_size
+        with pytest.raises(e.ParamError):
+            aerospike.client(config)
+
+    @pytest.mark.parametrize("expressions", [None, 1, "expr", {'a': 1}])
+    def test_compile_expression_invalid(self, expressions):
+        with pytest.raises(e.ParamError):
+            self.as_connection.compile_expression(expressions)
+
+    def test_expression_cannot_be_instantiated(self):
+        with pytest.raises(TypeError):
+            aerospike.Expression()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestExceptionAttributes(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.key = ('test', 'demo', 'exception_attributes')
+        try:
+            self.as_connection.remove(self.key)
+        except e.RecordNotFound:
+            pass
+
+    def test_error_details_on_instance(self):
+        with pytest.raises(e.RecordNotFound) as excinfo:
+            self.as_connection.get(self.key)
+
+        exc = excinfo.value
+        assert exc.code == e.RecordNotFound.code == 2
+        assert exc.msg == exc.args[1]
+        assert exc.file == exc.args[2]
+        assert exc.line == exc.args[3]
+        assert exc.in_doubt is False
+
+    def test_error_details_not_on_class(self):
+        with pytest.raises(e.RecordNotFound):
+            self.as_connection.get(self.key)
+
+        assert e.RecordNotFound.msg is None
+        assert e.RecordNotFound.file is None
+        assert e.RecordNotFound.line is None
+
+    def test_instances_keep_their_own_message(self):
+        errors = []
+        for key in [self.key, ('test', 'demo', 1, 2)]:
+            try:
+                self.as_connection.get(key)
+            except e.AerospikeError as exc:
+                errors.append(exc)
+
+        assert isinstance(errors[0], e.RecordNotFound)
+        assert isinstance(errors[1], e.ParamError)
+        assert errors[0].msg != errors[1].msg
+        assert errors[0].code == 2
+        assert errors[1].code == -2
+
+    def test_unmapped_code_raises_aerospike_error(self):
+        with pytest.raises(e.AerospikeError):
+            self.as_connection.get(('test', 'demo'))
+
+    def test_exception_without_error_tuple(self):
+        exc = e.ParamError("bad argument")
+        assert exc.args == ("bad argument",)
+        assert exc.code == -2
+        assert exc.msg is None
+
+    def test_exception_from_error_tuple(self):
+        exc = e.ServerError(1, "failed", "file.c", 10, True)
+        assert exc.code == 1
+        assert exc.msg == "failed"
+        assert exc.file == "file.c"
+        assert exc.line == 10
+        assert exc.in_doubt is True
+
+    def test_key_and_bin_on_instance(self):
+        with pytest.raises(e.RecordNotFound) as excinfo:
+            self.as_connection.get(self.key)
+
+        assert excinfo.value.key == self.key
+        assert excinfo.value.bin is None
+        assert e.RecordNotFound.key is None
+
+    def test_udf_details_on_instance(self):
+        with pytest.raises(e.AerospikeError) as excinfo:
+            self.as_connection.apply(self.key, 'missing_module', 'missing_function', [])
+
+        if hasattr(type(excinfo.value), 'module'):
+            assert excinfo.value.module == 'missing_module'
+            assert excinfo.value.func == 'missing_function'
+            assert type(excinfo.value).module is None
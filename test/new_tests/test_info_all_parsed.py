@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+import time
+import threading
+from aerospike import exception as e
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestInfoAllParsed(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.key = ('test', 'info_parsed', 1)
+        self.as_connection.put(self.key, {'i': 1})
+
+        yield
+
+        try:
+            self.as_connection.remove(self.key)
+        except e.AerospikeError:
+            pass
+
+    def test_statistics(self):
+        response = self.as_connection.info_all_parsed('statistics')
+        assert set(response) == set(self.as_connection.info_all('statistics'))
+        for stats in response.values():
+            assert isinstance(stats, dict)
+            assert isinstance(stats['uptime'], int)
+
+    def test_namespace(self):
+        for stats in self.as_connection.info_all_parsed('namespace/test').values():
+            assert isinstance(stats['objects'], int)
+            assert stats['objects'] >= 0
+
+    def test_namespaces_list(self):
+        for namespaces in self.as_connection.info_all_parsed('namespaces').values():
+            if isinstance(namespaces, list):
+                assert 'test' in namespaces
+            else:
+                assert namespaces == 'test'
+
+    def test_sets_records(self):
+        for sets in self.as_connection.info_all_parsed('sets/test/info_parsed').values():
+            assert isinstance(sets, list)
+            assert all(isinstance(record, dict) for record in sets)
+            assert sets[0]['ns'] == 'test'
+            assert sets[0]['set'] == 'info_parsed'
+
+    def test_matches_info_all(self):
+        raw = self.as_connection.info_all('build')
+        parsed = self.as_connection.info_all_parsed('build')
+        for node, (_, response) in raw.items():
+            assert str(parsed[node]) == response.strip()
+
+    def test_ttl_cache(self):
+        first = self.as_connection.info_all_parsed('statistics', ttl=60)
+        second = self.as_connection.info_all_parsed('statistics', ttl=60)
+        # cached responses are parsed again for each call
+        assert first == second
+        assert all(first[node] is not second[node] for node in first)
+
+    def test_ttl_expires(self):
+        first = self.as_connection.info_all_parsed('statistics', ttl=0.5)
+        time.sleep(1.5)
+        second = self.as_connection.info_all_parsed('statistics', ttl=0.5)
+        assert all(second[node]['uptime'] > first[node]['uptime'] for node in first)
+
+    def test_ttl_concurrent(self):
+        results = []
+
+        def poll():
+            results.append(self.as_connection.info_all_parsed('statistics', ttl=60))
+
+        threads = [threading.Thread(target=poll) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 8
+        assert all(result == results[0] for result in results)
+
+    def test_ttl_concurrent_commands(self):
+        results = {}
+        commands = ['statistics', 'build', 'namespaces', 'namespace/test']
+
+        def poll(command):
+            results[command] = self.as_connection.info_all_parsed(command, ttl=60)
+
+        threads = [threading.Thread(target=poll, args=(command,)) for command in commands * 4]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(results) == sorted(commands)
+        assert results['build'] == self.as_connection.info_all_parsed('build')
+
+    def test_ttl_many_commands(self):
+        for i in range(1100):
+            self.as_connection.info_all_parsed('sets/test/info_cache_%d' % i, ttl=60)
+
+        assert len(self.as_connection.info_all_parsed('statistics', ttl=60)) > 0
+
+    def test_policy(self):
+        response = self.as_connection.info_all_parsed('statistics', {'timeout': 1000})
+        assert len(response) > 0
+
+    def test_invalid_command(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.info_all_parsed(5)
+
+    def test_negative_ttl(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.info_all_parsed('statistics', ttl=-1)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestInternTable(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.keys = [('test', 'intern', i) for i in range(10)]
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {'name': 'name%d' % i, u'bïn': i,
+                                         'map': {'field': i, 'other': [i]}})
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    def test_bin_names_are_shared(self):
+        records = self.as_connection.get_many(self.keys)
+        names = [sorted(bins) for _, _, bins in records]
+        for other in names[1:]:
+            assert all(a is b for a, b in zip(names[0], other))
+        assert records[3][2] == {'name': 'name3', u'bïn': 3, 'map': {'field': 3, 'other': [3]}}
+
+    def test_namespace_and_set_are_shared(self):
+        first, _, _ = self.as_connection.get(self.keys[0])
+        second, _, _ = self.as_connection.get(self.keys[1])
+        assert first[0] == 'test' and first[1] == 'intern'
+        assert first[0] is second[0]
+        assert first[1] is second[1]
+
+    @pytest.mark.parametrize("cdt_mode", ['default', 'direct', 'lazy'])
+    def test_map_keys_are_shared(self, cdt_mode):
+        _, _, first = self.as_connection.get(self.keys[0], {'cdt_mode': cdt_mode})
+        _, _, second = self.as_connection.get(self.keys[1], {'cdt_mode': cdt_mode})
+        first_keys = sorted(first['map'].keys())
+        second_keys = sorted(second['map'].keys())
+        assert first_keys == ['field', 'other']
+        assert all(a is b for a, b in zip(first_keys, second_keys))
+
+    def test_scan(self):
+        records = self.as_connection.scan('test', 'intern').results()
+        assert sorted(bins['name'] for _, _, bins in records) == sorted('name%d' % i for i in range(10))
+
+    def test_disabled(self):
+        client = TestBaseClass.get_new_connection({'intern_table_size': 0})
+        try:
+            _, _, bins = client.get(self.keys[0])
+            assert bins['map'] == {'field': 0, 'other': [0]}
+        finally:
+            client.close()
+
+    def test_small_table(self):
+        client = TestBaseClass.get_new_connection({'intern_table_size': 1})
+        try:
+            records = client.get_many(self.keys)
+            assert [bins[u'bïn'] for _, _, bins in records] == list(range(10))
+        finally:
+            client.close()
+
+    @pytest.mark.parametrize("size", [-1, '1024', 2 ** 40])
+    def test_invalid_size(self, size):
+        config = TestBaseClass.get_connection_config()
+        config['intern_table_size'] = size
+        with pytest.raises(e.ParamError):
+            aerospike.client(config)
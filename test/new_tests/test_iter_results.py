@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+from aerospike import predicates as p
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestIterResults(object):
+
+    def setup_class(cls):
+        client = TestBaseClass.get_new_connection()
+        try:
+            client.index_integer_create('test', 'iter', 'age', 'iter_age_index')
+        except e.IndexFoundError:
+            pass
+        client.close()
+
+    def teardown_class(cls):
+        client = TestBaseClass.get_new_connection()
+        try:
+            client.index_remove('test', 'iter_age_index', {})
+        except e.IndexNotFound:
+            pass
+        client.close()
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.keys = [('test', 'iter', i) for i in range(50)]
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {'age': i, 'name': 'name%d' % i})
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    def test_scan_iter_results(self):
+        scan = self.as_connection.scan('test', 'iter')
+        results = scan.iter_results()
+
+        assert isinstance(results, aerospike.ResultIterator)
+        ages = sorted(bins['age'] for _, _, bins in results)
+        assert ages == list(range(50))
+
+    def test_scan_iter_results_small_queue(self):
+        scan = self.as_connection.scan('test', 'iter')
+        scan.select('age')
+        records = list(scan.iter_results(queue_size=1))
+
+        assert len(records) == 50
+        assert all(list(bins.keys()) == ['age'] for _, _, bins in records)
+
+    def test_scan_iter_results_close_early(self):
+        scan = self.as_connection.scan('test', 'iter')
+        results = scan.iter_results(queue_size=2)
+
+        next(results)
+        results.close()
+        with pytest.raises(StopIteration):
+            next(results)
+
+    def test_scan_iter_results_abandoned(self):
+        scan = self.as_connection.scan('test', 'iter')
+        for _ in scan.iter_results(queue_size=2):
+            break
+        # the scan is still usable once the iterator is gone
+        assert len(list(scan.iter_results())) == 50
+
+    def test_scan_iter_results_with_policy(self):
+        scan = self.as_connection.scan('test', 'iter')
+        records = list(scan.iter_results({'total_timeout': 10000}))
+        assert len(records) == 50
+
+    def test_query_iter_results(self):
+        query = self.as_connection.query('test', 'iter')
+        query.where(p.between('age', 10, 19))
+        ages = sorted(bins['age'] for _, _, bins in query.iter_results())
+
+        assert ages == list(range(10, 20))
+
+    def test_query_iter_results_error(self):
+        query = self.as_connection.query('test', 'iter')
+        query.where(p.equals('name', 'name1'))
+
+        with pytest.raises(e.AerospikeError):
+            list(query.iter_results())
+
+    @pytest.mark.parametrize("queue_size", [0, -1, "10", 2 ** 25])
+    def test_iter_results_invalid_queue_size(self, queue_size):
+        scan = self.as_connection.scan('test', 'iter')
+        with pytest.raises(e.ParamError):
+            scan.iter_results(queue_size=queue_size)
+
+    def test_scan_iter_results_invalid_policy(self):
+        scan = self.as_connection.scan('test', 'iter')
+        with pytest.raises(e.ParamError):
+            scan.iter_results(policy=5)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+import array
+import pytest
+import sys
+from aerospike import exception as e
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestKeyBatch(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.keys = [('test', 'key_batch', i) for i in range(20)]
+        self.keys.append(('test', 'key_batch', 'str_key'))
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {'i': i, 'name': 'name%d' % i})
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    def test_key_batch_attributes(self):
+        keys = aerospike.KeyBatch('test', 'key_batch', range(20))
+        assert len(keys) == 20
+        assert keys.ns == 'test'
+        assert keys.set == 'key_batch'
+        assert aerospike.KeyBatch('test', None, []).set is None
+
+    def test_get_many(self):
+        keys = aerospike.KeyBatch('test', 'key_batch', list(range(20)) + ['str_key', 'missing'])
+        records = self.as_connection.get_many(keys)
+
+        assert len(records) == 22
+        assert [bins['i'] for _, _, bins in records[:21]] == list(range(21))
+        assert records[20][0][:3] == ('test', 'key_batch', 'str_key')
+        assert records[21][1] is None and records[21][2] is None
+
+    def test_get_many_matches_key_tuples(self):
+        keys = aerospike.KeyBatch('test', 'key_batch', range(20))
+        assert self.as_connection.get_many(keys) == self.as_connection.get_many(self.keys[:20])
+
+    def test_get_many_integer_buffer(self):
+        keys = aerospike.KeyBatch('test', 'key_batch', array.array('q', range(5)))
+        records = self.as_connection.get_many(keys)
+        assert [bins['i'] for _, _, bins in records] == list(range(5))
+
+    def test_get_many_numpy(self):
+        numpy = pytest.importorskip("numpy")
+        keys = aerospike.KeyBatch('test', 'key_batch', numpy.arange(0, 20, 2, dtype='int64'))
+        records = self.as_connection.get_many(keys)
+        assert [bins['i'] for _, _, bins in records] == list(range(0, 20, 2))
+
+        keys = aerospike.KeyBatch('test', 'key_batch', numpy.array([b'str_key'], dtype='S10'))
+        _, _, bins = self.as_connection.get_many(keys)[0]
+        assert bins['i'] == 20
+
+    def test_get_many_columnar(self):
+        pytest.importorskip("numpy")
+        keys = aerospike.KeyBatch('test', 'key_batch', range(20))
+        columns = self.as_connection.get_many(keys, columnar=['i'])
+        assert list(columns['i']) == list(range(20))
+
+    def test_exists_many(self):
+        keys = aerospike.KeyBatch('test', 'key_batch', [0, 1, 'missing'])
+        records = self.as_connection.exists_many(keys)
+
+        assert len(records) == 3
+        assert records[0][1]['gen'] == 1
+        assert records[2][1] is None
+
+    def test_select_many(self):
+        keys = aerospike.KeyBatch('test', 'key_batch', range(3))
+        records = self.as_connection.select_many(keys, ['name'])
+        assert [bins for _, _, bins in records] == [{'name': 'name%d' % i} for i in range(3)]
+
+    def test_keys_are_copied(self):
+        values = [0, 1]
+        keys = aerospike.KeyBatch('test', 'key_batch', values)
+        values.append(2)
+        assert len(self.as_connection.get_many(keys)) == 2
+
+    def test_empty(self):
+        keys = aerospike.KeyBatch('test', 'key_batch', [])
+        assert self.as_connection.get_many(keys) == []
+
+    @pytest.mark.parametrize("ns, set_name, keys", [
+        (1, 'key_batch', [1]),
+        ('test', 1, [1]),
+        ('test', 'key_batch', 'keys'),
+        ('test', 'key_batch', 5),
+        ('test', 'key_batch', [1.5]),
+        ('test', 'key_batch', [None]),
+        ('test', 'key_batch', [2 ** 70]),
+    ])
+    def test_invalid_key_batch(self, ns, set_name, keys):
+        with pytest.raises(e.ParamError):
+            aerospike.KeyBatch(ns, set_name, keys)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+from aerospike_helpers import cdt_ctx
+from aerospike_helpers.operations import operations, list_operations, map_operations
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestOperationList(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.key = ('test', 'operation_list', 1)
+        self.as_connection.put(self.key, {
+            'count': 1,
+            'name': 'name',
+            'list': [1, 2, 3],
+            'map': {'a': {'x': 1}, 'b': {'x': 2}},
+        })
+
+        yield
+
+        try:
+            self.as_connection.remove(self.key)
+        except e.AerospikeError:
+            pass
+
+    def test_constant_operations(self):
+        ops = aerospike.OperationList([
+            operations.increment('count', 2),
+            operations.append('name', '_suffix'),
+            operations.read('count'),
+        ])
+        assert len(ops) == 3
+        assert ops.placeholders == 0
+
+        _, _, bins = self.as_connection.operate(self.key, ops)
+        assert bins == {'count': 3}
+        _, _, bins = self.as_connection.operate(self.key, ops)
+        assert bins == {'count': 5}
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins['name'] == 'name_suffix_suffix'
+
+    def test_bind(self):
+        ops = aerospike.OperationList([
+            operations.increment('count', aerospike.Placeholder(0)),
+            operations.write('name', aerospike.Placeholder(1)),
+            list_operations.list_append('list', aerospike.Placeholder(0)),
+            operations.read('count'),
+        ])
+        assert ops.placeholders == 2
+
+        for i in range(1, 4):
+            _, _, bins = self.as_connection.operate(self.key, ops.bind(i, 'name%d' % i))
+        assert bins == {'count': 7}
+
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins['name'] == 'name3'
+        assert bins['list'] == [1, 2, 3, 1, 2, 3]
+
+    def test_bind_float_increment(self):
+        self.as_connection.put(self.key, {'float': 1.5})
+        ops = aerospike.OperationList([operations.increment('float', aerospike.Placeholder(0))])
+        self.as_connection.operate(self.key, ops.bind(1.0))
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins['float'] == 2.5
+
+    def test_bind_ctx(self):
+        ops = aerospike.OperationList([
+            map_operations.map_increment('map', 'x', aerospike.Placeholder(0),
+                                         ctx=[cdt_ctx.cdt_ctx_map_key('b')]),
+            map_operations.map_get_by_key('map', 'b', aerospike.MAP_RETURN_VALUE),
+        ])
+        for i in range(3):
+            self.as_connection.operate(self.key, ops.bind(i))
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins['map'] == {'a': {'x': 1}, 'b': {'x': 5}}
+
+    def test_operate_ordered(self):
+        ops = aerospike.OperationList([
+            operations.increment('count', aerospike.Placeholder(0)),
+            operations.read('count'),
+            operations.read('name'),
+        ])
+        _, _, bins = self.as_connection.operate_ordered(self.key, ops.bind(10))
+        assert bins == [('count', 11), ('name', 'name')]
+
+    def test_matches_operation_dicts(self):
+        dicts = [
+            list_operations.list_get_by_index('list', 1, aerospike.LIST_RETURN_VALUE),
+            map_operations.map_get_by_key('map', 'b', aerospike.MAP_RETURN_VALUE),
+            operations.read('name'),
+        ]
+        assert (self.as_connection.operate_ordered(self.key, aerospike.OperationList(dicts))[2] ==
+                self.as_connection.operate_ordered(self.key, dicts)[2])
+
+    def test_touch_ttl(self):
+        ops = aerospike.OperationList([{'op': aerospike.OPERATOR_TOUCH, 'val': 1000}])
+        self.as_connection.operate(self.key, ops)
+        _, meta = self.as_connection.exists(self.key)
+        assert 900 < meta['ttl'] <= 1000
+
+    def test_dicts_are_copied(self):
+        op = operations.increment('count', aerospike.Placeholder(0))
+        ops = aerospike.OperationList([op])
+        op['bin'] = 'other'
+        self.as_connection.operate(self.key, ops.bind(1))
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins['count'] == 2
+        assert 'other' not in bins
+
+    def test_several_clients(self):
+        ops = aerospike.OperationList([operations.increment('count', aerospike.Placeholder(0))])
+        client = TestBaseClass.get_new_connection()
+        try:
+            self.as_connection.operate(self.key, ops.bind(1))
+            client.operate(self.key, ops.bind(1))
+            self.as_connection.operate(self.key, ops.bind(1))
+        finally:
+            client.close()
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins['count'] == 4
+
+    def test_unbound_placeholders(self):
+        ops = aerospike.OperationList([operations.increment('count', aerospike.Placeholder(0))])
+        with pytest.raises(e.ParamError):
+            self.as_connection.operate(self.key, ops)
+
+    def test_bind_wrong_number_of_values(self):
+        ops = aerospike.OperationList([operations.increment('count', aerospike.Placeholder(1))])
+        assert ops.placeholders == 2
+        with pytest.raises(e.ParamError):
+            ops.bind(1)
+
+    def test_invalid_bound_value(self):
+        ops = aerospike.OperationList([operations.increment('count', aerospike.Placeholder(0))])
+        with pytest.raises(e.ParamError):
+            self.as_connection.operate(self.key, ops.bind('one'))
+
+    def test_invalid_operation(self):
+        ops = aerospike.OperationList([{'bin': 'count', 'val': 1}])
+        with pytest.raises(e.ParamError):
+            self.as_connection.operate(self.key, ops)
+
+    @pytest.mark.parametrize("operations_list", [
+        'ops',
+        5,
+        [1],
+        [{'op': aerospike.Placeholder(0), 'bin': 'count'}],
+    ])
+    def test_invalid_operation_list(self, operations_list):
+        with pytest.raises(e.ParamError):
+            aerospike.OperationList(operations_list)
+
+    def test_too_many_operations(self):
+        with pytest.raises(e.ParamError):
+            aerospike.OperationList([operations.read('count')] * 65536)
+
+    def test_placeholder(self):
+        assert aerospike.Placeholder(2).index == 2
+        with pytest.raises(e.ParamError):
+            aerospike.Placeholder(-1)
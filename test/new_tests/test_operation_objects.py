@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+import pickle
+import pytest
+import sys
+from aerospike import exception as e
+from aerospike_helpers.operations import Operation
+from aerospike_helpers.operations import bitwise_operations
+from aerospike_helpers.operations import hll_operations
+from aerospike_helpers.operations import list_operations
+from aerospike_helpers.operations import map_operations
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestOperationObjects(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.key = ('test', 'operation_objects', 1)
+        self.as_connection.put(self.key, {
+            'list': [1, 2, 3, [4, 5]],
+            'map': {'a': 1, 'b': 2},
+            'blob': bytearray([0] * 4),
+        })
+
+        yield
+
+        try:
+            self.as_connection.remove(self.key)
+        except e.AerospikeError:
+            pass
+
+    def test_helpers_return_operations(self):
+        ops = [
+            list_operations.list_append('list', 6),
+            map_operations.map_put('map', 'c', 3),
+            bitwise_operations.bit_count('blob', 0, 8),
+            hll_operations.hll_get_count('hll'),
+        ]
+        for op in ops:
+            assert isinstance(op, Operation)
+
+    def test_mapping_behaviour(self):
+        op = list_operations.list_get_by_index('list', 0, aerospike.LIST_RETURN_VALUE, ctx=None)
+
+        assert op == {'op': aerospike.OP_LIST_GET_BY_INDEX, 'bin': 'list', 'index': 0,
+                      'return_type': aerospike.LIST_RETURN_VALUE}
+        assert op['bin'] == 'list'
+        assert 'ctx' not in op
+        assert len(op) == 4
+        with pytest.raises(KeyError):
+            op['ctx']
+        with pytest.raises(KeyError):
+            op['unknown'] = 1
+
+        op['index'] = 1
+        assert op.index == 1
+        copy = op.copy()
+        del op['index']
+        assert 'index' not in op
+        assert copy['index'] == 1
+        assert pickle.loads(pickle.dumps(copy)) == copy
+
+    def test_operate(self):
+        ops = [
+            list_operations.list_append('list', 6),
+            list_operations.list_get_by_index('list', -1, aerospike.LIST_RETURN_VALUE),
+            map_operations.map_get_by_key('map', 'b', aerospike.MAP_RETURN_VALUE),
+            bitwise_operations.bit_set('blob', 0, 8, 1, bytearray([255])),
+            bitwise_operations.bit_count('blob', 0, 32),
+        ]
+        _, _, bins = self.as_connection.operate(self.key, ops)
+        assert bins == {'list': 6, 'map': 2, 'blob': 8}
+
+    def test_operate_matches_dicts(self):
+        ops = [
+            list_operations.list_get_by_value_range('list', aerospike.LIST_RETURN_VALUE, 2, 4, inverted=True),
+            map_operations.map_get_by_rank_range('map', 0, 1, aerospike.MAP_RETURN_KEY),
+        ]
+        dict_ops = [dict(op) for op in ops]
+        assert self.as_connection.operate_ordered(self.key, ops) == \
+            self.as_connection.operate_ordered(self.key, dict_ops)
+
+    def test_mixed_with_dicts(self):
+        ops = [
+            {'op': aerospike.OPERATOR_INCR, 'bin': 'i', 'val': 1},
+            list_operations.list_size('list'),
+        ]
+        _, _, bins = self.as_connection.operate(self.key, ops)
+        assert bins == {'list': 4}
+
+    def test_nested_ctx(self):
+        from aerospike_helpers import cdt_ctx
+        ops = [
+            list_operations.list_size('list', ctx=[cdt_ctx.cdt_ctx_list_index(3)]),
+        ]
+        _, _, bins = self.as_connection.operate(self.key, ops)
+        assert bins == {'list': 2}
+
+    def test_operation_list(self):
+        ops = aerospike.OperationList([list_operations.list_size('list')])
+        _, _, bins = self.as_connection.operate(self.key, ops)
+        assert bins == {'list': 4}
+
+    def test_missing_required_entry(self):
+        op = list_operations.list_append('list', 6)
+        del op['val']
+        with pytest.raises(e.ParamError):
+            self.as_connection.operate(self.key, [op])
+
+    def test_unknown_entry(self):
+        op = Operation(aerospike.OPERATOR_WRITE, 'name')
+        op.val = 'value'
+        op.count = 1
+        with pytest.raises(e.ParamError):
+            self.as_connection.operate(self.key, [op])
+
+        with pytest.raises(e.ParamError):
+            self.as_connection.operate(self.key, [dict(op)])
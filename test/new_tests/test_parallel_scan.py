@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+from aerospike_helpers import parallel
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+def get_i(record):
+    return record[2]['i']
+
+
+def add(total, value):
+    return total + value
+
+
+def odd_only(record):
+    i = record[2]['i']
+    return i if i % 2 else None
+
+
+def fail(record):
+    raise KeyError('fail')
+
+
+class TestParallelScan(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.config = TestBaseClass.get_connection_config()
+        _, self.user, self.password = TestBaseClass().get_hosts()
+        self.keys = [('test', 'par_scan', i) for i in range(300)]
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {'i': i, 'pad': 'x' * (i % 13) * 100})
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    def scan(self, **kwargs):
+        return parallel.scan('test', 'par_scan', self.config, user=self.user, password=self.password, **kwargs)
+
+    @pytest.mark.parametrize("processes", [1, 3, 8])
+    def test_scan_reducer(self, processes):
+        assert self.scan(processes=processes, fn=get_i, reducer=add, initial=0) == sum(range(300))
+
+    def test_scan_returns_records(self):
+        records = self.scan(processes=2)
+        assert sorted(bins['i'] for _, _, bins in records) == list(range(300))
+
+    def test_scan_drops_none(self):
+        assert sorted(self.scan(processes=2, fn=odd_only)) == list(range(1, 300, 2))
+
+    def test_scan_small_ring(self):
+        values = self.scan(processes=2, fn=get_i, batch_size=100, ring_size=1024, slot_size=256)
+        assert sorted(values) == list(range(300))
+
+    def test_scan_many_small_batches(self):
+        keys = [('test', 'par_scan_many', i) for i in range(5000)]
+        for i, key in enumerate(keys):
+            self.as_connection.put(key, {'i': i})
+        try:
+            values = parallel.scan('test', 'par_scan_many', self.config, user=self.user,
+                                   password=self.password, processes=2, fn=get_i, batch_size=3)
+            assert len(values) == 5000
+            assert sorted(values) == list(range(5000))
+        finally:
+            for key in keys:
+                self.as_connection.remove(key)
+
+    def test_scan_fn_error(self):
+        with pytest.raises(KeyError):
+            self.scan(processes=2, fn=fail)
+
+    def test_partition_ranges(self):
+        ranges = parallel.partition_ranges(3)
+        assert [r['count'] for r in ranges] == [1366, 1365, 1365]
+        assert ranges[1]['begin'] == 1366
+        assert sum(r['count'] for r in parallel.partition_ranges(4096)) == 4096
+
+    @pytest.mark.parametrize("processes", [0, 4097])
+    def test_invalid_processes(self, processes):
+        with pytest.raises(ValueError):
+            self.scan(processes=processes)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestPartitionMap(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.node_names = set(node['node_name'] for node in self.as_connection.get_node_names())
+
+    def test_partition_map(self):
+        partition_map = self.as_connection.partition_map()
+        assert 'test' in partition_map
+
+        nodes, owners = partition_map['test']
+        assert set(nodes) <= self.node_names
+        assert owners.format == 'h'
+        assert owners.shape[1] == 4096
+        masters = [owners[0, pid] for pid in range(4096)]
+        assert all(0 <= index < len(nodes) for index in masters)
+
+    def test_partition_map_namespace(self):
+        nodes, owners = self.as_connection.partition_map('test')
+        assert self.as_connection.partition_map()['test'][0] == nodes
+
+    def test_partition_map_reused_when_unchanged(self):
+        first = self.as_connection.partition_map('test')
+        second = self.as_connection.partition_map('test')
+        assert first[0] is second[0]
+        assert first[1] is second[1]
+
+    def test_partition_map_unknown_namespace(self):
+        with pytest.raises(e.NamespaceNotFound):
+            self.as_connection.partition_map('no_such_namespace')
+
+    def test_partition_map_invalid_namespace(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.partition_map(1)
+
+    def test_route(self):
+        keys = [('test', 'demo', i) for i in range(200)]
+        routes = self.as_connection.route(keys)
+
+        assert set(routes) <= self.node_names
+        assert sorted(k[2] for node_keys in routes.values() for k in node_keys) == list(range(200))
+
+        nodes, owners = self.as_connection.partition_map('test')
+        digests, partition_ids, _ = aerospike.calc_digests('test', 'demo', range(200))
+        for node, node_keys in routes.items():
+            for key in node_keys:
+                assert nodes[owners[0, partition_ids[key[2]]]] == node
+
+    def test_route_keeps_key_order(self):
+        keys = [('test', 'demo', i) for i in range(50)]
+        for node_keys in self.as_connection.route(keys).values():
+            assert node_keys == sorted(node_keys, key=lambda k: k[2])
+
+    def test_route_digest_keys(self):
+        digest = aerospike.calc_digest('test', 'demo', 1)
+        routes = self.as_connection.route([('test', 'demo', None, digest)])
+        assert [key[3] for node_keys in routes.values() for key in node_keys] == [digest]
+
+    def test_route_unknown_namespace(self):
+        routes = self.as_connection.route([('no_such_namespace', 'demo', 1)])
+        assert list(routes) == [None]
+
+    @pytest.mark.parametrize("keys", [1, [('test', 'demo')], ['key']])
+    def test_route_invalid_keys(self, keys):
+        with pytest.raises(e.ParamError):
+            self.as_connection.route(keys)
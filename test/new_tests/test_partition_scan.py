@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+import pickle
+import pytest
+import sys
+from aerospike import exception as e
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+def partition_id(digest):
+    return (digest[0] | (digest[1] << 8)) & 4095
+
+
+class TestPartitionScan(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.keys = [('test', 'part_scan', i) for i in range(200)]
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {'i': i})
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    def scanned_ids(self, records):
+        return sorted(bins['i'] for _, _, bins in records)
+
+    def test_results_partition_ranges_cover_the_set(self):
+        scan = self.as_connection.scan('test', 'part_scan')
+        records = []
+        for begin in range(0, 4096, 1024):
+            part = scan.results(partition_filter={'begin': begin, 'count': 1024})
+            assert all(begin <= partition_id(key[3]) < begin + 1024 for key, _, _ in part)
+            records.extend(part)
+
+        assert self.scanned_ids(records) == list(range(200))
+
+    def test_results_partition_filter_defaults(self):
+        scan = self.as_connection.scan('test', 'part_scan')
+        records = scan.results(partition_filter={})
+        assert self.scanned_ids(records) == list(range(200))
+
+    def test_results_partition_filter_batched(self):
+        scan = self.as_connection.scan('test', 'part_scan')
+        records = scan.results(options={'callback_batch_size': 16},
+                               partition_filter={'begin': 2048})
+        assert all(partition_id(key[3]) >= 2048 for key, _, _ in records)
+
+    def test_foreach_complete_returns_none(self):
+        records = []
+        scan = self.as_connection.scan('test', 'part_scan')
+        assert scan.foreach(records.append, partition_filter={'begin': 0, 'count': 4096}) is None
+        assert scan.cursor() is None
+        assert self.scanned_ids(records) == list(range(200))
+
+    @pytest.mark.parametrize("options", [{}, {'callback_batch_size': 8}])
+    def test_foreach_resumes_from_cursor(self, options):
+        records = []
+
+        def take(limit):
+            def callback(record):
+                records.append(record)
+                return len(records) % limit != 0
+            return callback
+
+        scan = self.as_connection.scan('test', 'part_scan')
+        cursor = scan.foreach(take(30), options=options, partition_filter={'begin': 0, 'count': 4096})
+        assert isinstance(cursor, dict)
+        assert scan.cursor() == cursor
+
+        while cursor is not None:
+            cursor = scan.foreach(take(30), options=options, partition_filter=pickle.loads(pickle.dumps(cursor)))
+
+        assert self.scanned_ids(records) == list(range(200))
+
+    def test_foreach_cursor_after_exception(self):
+        records = []
+
+        def callback(record):
+            if len(records) == 10:
+                raise ValueError()
+            records.append(record)
+
+        scan = self.as_connection.scan('test', 'part_scan')
+        with pytest.raises(e.ClientError):
+            scan.foreach(callback, partition_filter={})
+
+        scan.foreach(records.append, partition_filter=scan.cursor())
+        assert self.scanned_ids(records) == list(range(200))
+
+    @pytest.mark.parametrize("partition_filter", [
+        5,
+        {'begin': -1},
+        {'begin': 4096},
+        {'begin': '1'},
+        {'begin': 4000, 'count': 100},
+        {'count': 0},
+        {'after': []},
+        {'after': {0: bytearray(3)}},
+        {'begin': 10, 'count': 1, 'after': {11: bytearray(20)}},
+    ])
+    def test_invalid_partition_filter(self, partition_filter):
+        scan = self.as_connection.scan('test', 'part_scan')
+        with pytest.raises(e.ParamError):
+            scan.results(partition_filter=partition_filter)
+        with pytest.raises(e.ParamError):
+            scan.foreach(lambda record: None, partition_filter=partition_filter)
+
+    def test_partition_filter_with_nodename(self):
+        scan = self.as_connection.scan('test', 'part_scan')
+        with pytest.raises(e.ParamError):
+            scan.results(nodename='BB9', partition_filter={'begin': 0})
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+from aerospike_helpers import expressions as exp
+from aerospike_helpers.operations import operations
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestPolicyObjects(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.keys = []
+        for i in range(3):
+            key = ('test', 'demo', 'policy_obj_%d' % i)
+            self.as_connection.put(key, {'age': i})
+            self.keys.append(key)
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    @pytest.mark.parametrize("policy_type", [
+        aerospike.ApplyPolicy,
+        aerospike.BatchPolicy,
+        aerospike.OperatePolicy,
+        aerospike.QueryPolicy,
+        aerospike.ReadPolicy,
+        aerospike.RemovePolicy,
+        aerospike.ScanPolicy,
+        aerospike.WritePolicy,
+    ])
+    def test_policy_types_derive_from_policy(self, policy_type):
+        policy = policy_type(total_timeout=1000)
+        assert isinstance(policy, aerospike.Policy)
+
+    def test_read_policy_reused(self):
+        policy = aerospike.ReadPolicy(total_timeout=1000, max_retries=1)
+        for key in self.keys:
+            _, _, bins = self.as_connection.get(key, policy=policy)
+            assert 'age' in bins
+
+    def test_write_policy_from_dict_and_kwargs(self):
+        policy = aerospike.WritePolicy({'key': aerospike.POLICY_KEY_SEND}, total_timeout=1000)
+        self.as_connection.put(self.keys[0], {'age': 10}, policy=policy)
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['age'] == 10
+
+    def test_write_policy_exists(self):
+        policy = aerospike.WritePolicy(exists=aerospike.POLICY_EXISTS_CREATE)
+        with pytest.raises(e.RecordExistsError):
+            self.as_connection.put(self.keys[0], {'age': 10}, policy=policy)
+
+    def test_operate_policy(self):
+        policy = aerospike.OperatePolicy(total_timeout=1000)
+        _, _, bins = self.as_connection.operate(
+            self.keys[1], [operations.increment('age', 5), operations.read('age')], policy=policy)
+        assert bins['age'] == 6
+
+    def test_read_policy_with_expression(self):
+        expr = self.as_connection.compile_expression(exp.Eq(exp.IntBin('age'), 1).compile())
+        policy = aerospike.ReadPolicy(expressions=expr)
+        _, _, bins = self.as_connection.get(self.keys[1], policy=policy)
+        assert bins['age'] == 1
+        with pytest.raises(e.FilteredOut):
+            self.as_connection.get(self.keys[0], policy=policy)
+
+    def test_policy_of_wrong_kind(self):
+        policy = aerospike.WritePolicy(total_timeout=1000)
+        with pytest.raises(e.ParamError):
+            self.as_connection.get(self.keys[0], policy=policy)
+
+    def test_unknown_policy_field(self):
+        with pytest.raises(e.ParamError):
+            aerospike.ReadPolicy(exists=aerospike.POLICY_EXISTS_CREATE)
+
+    def test_invalid_policy_value(self):
+        with pytest.raises(e.ParamError):
+            aerospike.ReadPolicy(total_timeout="1000")
+
+    def test_expressions_must_be_compiled(self):
+        with pytest.raises(e.ParamError):
+            aerospike.ReadPolicy(expressions=exp.Eq(exp.IntBin('age'), 1).compile())
+
+    def test_policy_base_cannot_be_instantiated(self):
+        with pytest.raises(TypeError):
+            aerospike.Policy()
+
+    def test_policy_cannot_be_initialized_again(self):
+        policy = aerospike.ReadPolicy({'total_timeout': 1000})
+        with pytest.raises(TypeError):
+            policy.__init__({'total_timeout': 1})
+        assert repr(policy) == "aerospike.ReadPolicy({'total_timeout': 1000})"
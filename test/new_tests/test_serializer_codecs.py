@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class Point(object):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other):
+        return (self.x, self.y) == (other.x, other.y)
+
+
+class TestSerializerCodecs(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.key = ('test', 'demo', 'serializer_codecs')
+        self.codec_clients = []
+
+        yield
+
+        for client in self.codec_clients:
+            client.close()
+        try:
+            self.as_connection.remove(self.key)
+        except e.AerospikeError:
+            pass
+
+    def codec_client(self, codec):
+        config = TestBaseClass.get_connection_config()
+        config['serialization'] = codec
+        client = aerospike.client(config)
+        _, user, password = TestBaseClass().get_hosts()
+        if user is None and password is None:
+            client.connect()
+        else:
+            client.connect(user, password)
+        self.codec_clients.append(client)
+        return client
+
+    def test_pickle_round_trip(self):
+        record = {'point': Point(1, 2), 'pair': (1, 'a'), 'set': {1, 2}}
+        for _ in range(3):
+            self.as_connection.put(self.key, record)
+            _, _, bins = self.as_connection.get(self.key)
+            assert bins == record
+
+    def test_json_put_serializer(self):
+        self.as_connection.put(self.key, {'pair': (1, 'a')}, serializer=aerospike.SERIALIZER_JSON)
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins['pair'] == bytearray(b'\xc1ASJ[1, "a"]')
+        _, _, bins = self.codec_client(aerospike.SERIALIZER_JSON).get(self.key)
+        assert bins['pair'] == [1, 'a']
+
+    def test_json_codec_client(self):
+        client = self.codec_client(aerospike.SERIALIZER_JSON)
+        client.put(self.key, {'pair': (1, 'a'), 'blob': bytearray(b'\x00\x01'), 'i': 1})
+        _, _, bins = client.get(self.key)
+        assert bins == {'pair': [1, 'a'], 'blob': bytearray(b'\x00\x01'), 'i': 1}
+
+    def test_json_unsupported_value(self):
+        with pytest.raises(e.AerospikeError):
+            self.as_connection.put(self.key, {'point': Point(1, 2)}, serializer=aerospike.SERIALIZER_JSON)
+
+    def test_msgpack_codec_client(self):
+        client = self.codec_client(aerospike.SERIALIZER_MSGPACK)
+        client.put(self.key, {'pair': (1, 'a', (2.5, None))})
+        _, _, bins = client.get(self.key)
+        assert bins == {'pair': [1, 'a', [2.5, None]]}
+
+    @pytest.mark.parametrize("codec", [aerospike.SERIALIZER_JSON, aerospike.SERIALIZER_MSGPACK])
+    def test_codec_client_raw_blobs(self, codec):
+        client = self.codec_client(codec)
+        record = {'number': bytearray(b'123'), 'packed': bytearray(b'\x00\x01'), 'list': bytearray(b'[1]')}
+        client.put(self.key, record)
+        _, _, bins = client.get(self.key)
+        assert bins == record
+
+    def test_msgpack_trailing_bytes(self):
+        client = self.codec_client(aerospike.SERIALIZER_MSGPACK)
+        blob = bytearray(b'\xc1ASM\x00\x01')
+        client.put(self.key, {'blob': blob})
+        _, _, bins = client.get(self.key)
+        assert bins['blob'] == blob
+
+    def test_msgpack_unsupported_value(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.put(self.key, {'point': Point(1, 2)}, serializer=aerospike.SERIALIZER_MSGPACK)
+
+    @pytest.mark.parametrize("codec", [aerospike.SERIALIZER_PYTHON, aerospike.SERIALIZER_USER, 100])
+    def test_invalid_codec(self, codec):
+        config = TestBaseClass.get_connection_config()
+        config['serialization'] = codec
+        with pytest.raises(e.ParamError):
+            aerospike.client(config)
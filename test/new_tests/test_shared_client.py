@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+import threading
+from aerospike import exception as e
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestSharedClient(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.config = TestBaseClass.get_connection_config()
+        _, self.user, self.password = TestBaseClass().get_hosts()
+        self.clients = []
+        self.key = ('test', 'shared', 1)
+
+        yield
+
+        for client in self.clients:
+            client.close()
+        try:
+            self.as_connection.remove(self.key)
+        except e.AerospikeError:
+            pass
+
+    def shared_client(self, config=None):
+        config = self.config if config is None else config
+        if self.user is None and self.password is None:
+            client = aerospike.shared_client(config)
+        else:
+            client = aerospike.shared_client(config, self.user, self.password)
+        self.clients.append(client)
+        return client
+
+    def test_shared_client_is_connected(self):
+        client = self.shared_client()
+        assert isinstance(client, aerospike.Client)
+        assert client.is_connected()
+        client.put(self.key, {'i': 1})
+        assert client.get(self.key)[2] == {'i': 1}
+
+    def test_shared_client_leaves_config(self):
+        config = dict(self.config)
+        self.shared_client(config)
+        assert 'use_shared_connection' not in config
+
+    def test_shared_clients_share_the_cluster(self):
+        config = dict(self.config, shm={'shm_max_nodes': 5})
+        first = self.shared_client(config)
+        second = self.shared_client(config)
+        assert first.shm_key() == second.shm_key()
+
+    def test_close_keeps_other_clients_connected(self):
+        first = self.shared_client()
+        second = self.shared_client()
+        first.close()
+        self.clients.remove(first)
+
+        assert not first.is_connected()
+        assert second.is_connected()
+        second.put(self.key, {'i': 2})
+        assert second.get(self.key)[2] == {'i': 2}
+
+    def test_reconnect_after_last_close(self):
+        client = self.shared_client()
+        client.close()
+        self.clients.remove(client)
+
+        client = self.shared_client()
+        client.put(self.key, {'i': 3})
+        assert client.get(self.key)[2] == {'i': 3}
+
+    def test_shared_clients_from_threads(self):
+        errors = []
+
+        def connect():
+            try:
+                client = self.shared_client()
+                client.put(self.key, {'i': 4})
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=connect) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert all(client.is_connected() for client in self.clients)
+
+    def test_dropped_client_releases_the_cluster(self):
+        client = self.shared_client()
+        self.clients.remove(client)
+        del client
+
+        client = self.shared_client()
+        assert client.is_connected()
+
+    @pytest.mark.parametrize("config", [None, [], "hosts"])
+    def test_invalid_config(self, config):
+        with pytest.raises(e.ParamError):
+            aerospike.shared_client(config)
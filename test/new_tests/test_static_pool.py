@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+from aerospike_helpers.operations import list_operations
+from aerospike_helpers.operations import operations
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestStaticPool(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.key = ('test', 'demo', 'static_pool')
+
+        yield
+
+        try:
+            self.as_connection.remove(self.key)
+        except e.AerospikeError:
+            pass
+
+    @pytest.mark.parametrize("count", [1, 64, 65, 5000])
+    def test_put_many_blobs(self, count):
+        blobs = [bytearray([i % 256, 1]) for i in range(count)]
+        self.as_connection.put(self.key, {'blobs': blobs})
+
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins['blobs'] == blobs
+
+    def test_put_many_blob_bins(self):
+        record = {'b%d' % i: bytearray([i % 256]) for i in range(200)}
+        self.as_connection.put(self.key, record)
+
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins == record
+
+    def test_operate_many_blobs(self):
+        blobs = [bytearray([i % 256]) for i in range(5000)]
+        ops = [list_operations.list_append_items('blobs', blobs), operations.read('blobs')]
+        _, _, bins = self.as_connection.operate(self.key, ops)
+        assert bins['blobs'] == blobs
+
+    def test_repeated_puts_reuse_pool(self):
+        for i in range(100):
+            self.as_connection.put(self.key, {'blobs': [bytearray([i])] * 100})
+
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins['blobs'] == [bytearray([99])] * 100
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+import pytest
+import sys
+from aerospike import exception as e
+from aerospike import predicates as p
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+pa = pytest.importorskip("pyarrow")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestToArrow(object):
+
+    def setup_class(cls):
+        client = TestBaseClass.get_new_connection()
+        try:
+            client.index_integer_create('test', 'arrow', 'age', 'arrow_age_index')
+        except e.IndexFoundError:
+            pass
+        client.close()
+
+    def teardown_class(cls):
+        client = TestBaseClass.get_new_connection()
+        try:
+            client.index_remove('test', 'arrow_age_index', {})
+        except e.IndexNotFound:
+            pass
+        client.close()
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.keys = [('test', 'arrow', i) for i in range(50)]
+        for i, key in enumerate(self.keys):
+            bins = {'age': i, 'score': i * 1.5, 'name': 'name%d' % i,
+                    'blob': bytearray([i]), 'tags': [i, 'x']}
+            if i % 10 == 0:
+                del bins['score']
+            self.as_connection.put(key, bins)
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    def test_scan_to_arrow(self):
+        scan = self.as_connection.scan('test', 'arrow')
+        batches = list(scan.to_arrow(batch_size=7))
+
+        assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+        assert all(batch.num_rows <= 7 for batch in batches)
+        table = pa.Table.from_batches(batches)
+        assert table.num_rows == 50
+        assert table.schema.field('age').type == pa.int64()
+        assert table.schema.field('name').type == pa.string()
+        assert table.schema.field('blob').type == pa.binary()
+        assert sorted(table.column('age').to_pylist()) == list(range(50))
+
+    def test_scan_to_arrow_nulls(self):
+        scan = self.as_connection.scan('test', 'arrow')
+        table = pa.Table.from_batches(list(scan.to_arrow()))
+
+        rows = dict(zip(table.column('age').to_pylist(), table.column('score').to_pylist()))
+        assert table.schema.field('score').type == pa.float64()
+        assert rows[10] is None
+        assert rows[3] == 4.5
+
+    def test_scan_to_arrow_schema(self):
+        schema = pa.schema([('age', pa.float64()), ('name', pa.string()), ('missing', pa.int64())])
+        scan = self.as_connection.scan('test', 'arrow')
+        batches = list(scan.to_arrow(schema, batch_size=20))
+        table = pa.Table.from_batches(batches)
+
+        assert table.schema.names == ['age', 'name', 'missing']
+        assert table.schema.field('age').type == pa.float64()
+        assert sorted(table.column('age').to_pylist()) == [float(i) for i in range(50)]
+        assert table.column('missing').null_count == 50
+
+    def test_scan_to_arrow_schema_type_mismatch(self):
+        schema = pa.schema([('age', pa.int64()), ('score', pa.int64())])
+        scan = self.as_connection.scan('test', 'arrow')
+
+        with pytest.raises(e.ClientError):
+            list(scan.to_arrow(schema))
+
+    def test_scan_to_arrow_inferred_type_mismatch(self):
+        keys = [('test', 'arrow_mixed', i) for i in range(10)]
+        for i, key in enumerate(keys):
+            self.as_connection.put(key, {'value': i if i % 2 else 'value%d' % i})
+
+        try:
+            scan = self.as_connection.scan('test', 'arrow_mixed')
+            with pytest.raises(e.ClientError):
+                list(scan.to_arrow(batch_size=1))
+        finally:
+            for key in keys:
+                self.as_connection.remove(key)
+
+    def test_query_to_arrow(self):
+        query = self.as_connection.query('test', 'arrow')
+        query.where(p.between('age', 0, 9))
+        table = pa.Table.from_batches(list(query.to_arrow()))
+
+        assert sorted(table.column('age').to_pylist()) == list(range(10))
+
+    def test_to_arrow_close_early(self):
+        scan = self.as_connection.scan('test', 'arrow')
+        batches = scan.to_arrow(batch_size=1)
+
+        assert next(batches).num_rows == 1
+        batches.close()
+        with pytest.raises(StopIteration):
+            next(batches)
+
+    def test_to_arrow_empty(self):
+        scan = self.as_connection.scan('test', 'arrow_empty')
+        assert list(scan.to_arrow()) == []
+
+    @pytest.mark.parametrize("batch_size", [0, -1, "10", 2 ** 25])
+    def test_to_arrow_invalid_batch_size(self, batch_size):
+        scan = self.as_connection.scan('test', 'arrow')
+        with pytest.raises(e.ParamError):
+            scan.to_arrow(batch_size=batch_size)
+
+    @pytest.mark.parametrize("schema", [
+        "age",
+        pa.schema([('age', pa.list_(pa.int64()))]),
+        pa.schema([('a' * 16, pa.int64())]),
+    ])
+    def test_to_arrow_invalid_schema(self, schema):
+        scan = self.as_connection.scan('test', 'arrow')
+        with pytest.raises(e.ParamError):
+            scan.to_arrow(schema)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+import array
+import mmap
+import pytest
+import sys
+from aerospike import exception as e
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestZeroCopyBlobs(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        """
+        Setup Method
+        """
+        self.keys = [('test', 'demo', 'zero_copy_%d' % i) for i in range(3)]
+        self.payload = bytes(range(256)) * 1024
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    @pytest.mark.parametrize("make_value", [
+        bytes,
+        bytearray,
+        memoryview,
+    ])
+    def test_put_buffer_is_stored_as_blob(self, make_value):
+        self.as_connection.put(self.keys[0], {'blob': make_value(self.payload)})
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['blob'] == bytearray(self.payload)
+
+    def test_put_array_is_pickled(self):
+        value = array.array('B', self.payload)
+        self.as_connection.put(self.keys[0], {'array': value})
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert isinstance(bins['array'], array.array)
+        assert bins['array'] == value
+
+    def test_put_memoryview_slice(self):
+        view = memoryview(self.payload)[10:20]
+        self.as_connection.put(self.keys[0], {'blob': view})
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['blob'] == bytearray(self.payload[10:20])
+
+    def test_put_non_contiguous_buffer(self):
+        view = memoryview(self.payload)[::2]
+        self.as_connection.put(self.keys[0], {'blob': view})
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['blob'] == bytearray(self.payload[::2])
+
+    def test_put_mmap(self):
+        buf = mmap.mmap(-1, len(self.payload))
+        buf.write(self.payload)
+        self.as_connection.put(self.keys[0], {'blob': buf})
+        buf.close()
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['blob'] == bytearray(self.payload)
+
+    def test_put_buffer_in_list(self):
+        self.as_connection.put(self.keys[0], {'l': [memoryview(b'abc'), 1]})
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['l'] == [bytearray(b'abc'), 1]
+
+    def test_batch_write_buffers(self):
+        records = [(key, {'blob': memoryview(self.payload)}) for key in self.keys]
+        self.as_connection.batch_write(records)
+
+        for key in self.keys:
+            _, _, bins = self.as_connection.get(key)
+            assert bins['blob'] == bytearray(self.payload)
+
+    def test_get_read_blob_as_memoryview(self):
+        self.as_connection.put(self.keys[0], {'blob': self.payload, 'i': 1})
+
+        _, _, bins = self.as_connection.get(self.keys[0], {'read_blob_as': 'memoryview'})
+        assert isinstance(bins['blob'], memoryview)
+        assert bins['blob'] == self.payload
+        assert bins['i'] == 1
+
+    def test_memoryview_outlives_record(self):
+        self.as_connection.put(self.keys[0], {'blob': self.payload})
+
+        _, _, bins = self.as_connection.select(self.keys[0], ['blob'], {'read_blob_as': 'memoryview'})
+        view = bins['blob'][1:4]
+        del bins
+        assert view.tobytes() == self.payload[1:4]
+
+    def test_empty_blob_as_memoryview(self):
+        self.as_connection.put(self.keys[0], {'blob': bytearray()})
+
+        _, _, bins = self.as_connection.get(self.keys[0], {'read_blob_as': 'memoryview'})
+        assert len(bins['blob']) == 0
+
+    def test_get_many_read_blob_as_memoryview(self):
+        for key in self.keys:
+            self.as_connection.put(key, {'blob': self.payload})
+
+        records = self.as_connection.get_many(self.keys, {'read_blob_as': 'memoryview'})
+        assert all(isinstance(bins['blob'], memoryview) for _, _, bins in records)
+
+        records = self.as_connection.select_many(self.keys, ['blob'], {'read_blob_as': 'memoryview'})
+        assert all(bins['blob'] == self.payload for _, _, bins in records)
+
+    def test_read_policy_object(self):
+        self.as_connection.put(self.keys[0], {'blob': self.payload})
+
+        policy = aerospike.ReadPolicy(read_blob_as='memoryview')
+        _, _, bins = self.as_connection.get(self.keys[0], policy=policy)
+        assert isinstance(bins['blob'], memoryview)
+
+    def test_default_is_bytearray(self):
+        self.as_connection.put(self.keys[0], {'blob': self.payload})
+
+        self.as_connection.get(self.keys[0], {'read_blob_as': 'memoryview'})
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert isinstance(bins['blob'], bytearray)
+
+    @pytest.mark.parametrize("read_blob_as", ['bytes', 1, None])
+    def test_invalid_read_blob_as(self, read_blob_as):
+        with pytest.raises(e.ParamError):
+            self.as_connection.get(self.keys[0], {'read_blob_as': read_blob_as})
+
+        with pytest.raises(e.ParamError):
+            aerospike.BatchPolicy(read_blob_as=read_blob_as)